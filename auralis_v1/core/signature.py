@@ -2,15 +2,21 @@ from __future__ import annotations
 
 import os
 import re
+import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from nacl.signing import SigningKey
 
 _RE_HASH = re.compile(r"^[0-9a-fA-F]{64}$")
 
+# a key file modified this recently may be rewritten again within the same
+# mtime tick (same size, same inode): don't trust the cached key yet
+_RACY_NS = 2_000_000_000
+
 
 @dataclass(frozen=True)
 class SignatureConfig:
@@ -86,6 +92,98 @@ def _load_signing_key(priv_path: str) -> SigningKey:
     raise SystemExit(f"SIG_PRIV_BAD_FORMAT: bytes={len(raw)}")
 
 
+def _key_identity(p: Path) -> Tuple[int, int, int, int]:
+    st = p.stat()
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _signed_at() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def _check_hash(hash_hex: Any) -> None:
+    if not isinstance(hash_hex, str) or not _RE_HASH.fullmatch(hash_hex):
+        raise SystemExit("SIG_HASH_INVALID: expected 64-hex digest")
+
+
+class Ed25519Signer:
+    """
+    Signer bound to one SignatureConfig; the private key is parsed once.
+
+    Every sign call stats the key file and reloads it when (dev, inode, size,
+    mtime_ns) changed, so a rotated/replaced key is picked up without restart
+    (a file modified within the last 2s is re-read on every call).
+    Output is byte-identical to sign_hash_hex (ed25519 is deterministic).
+    """
+
+    def __init__(self, cfg: SignatureConfig) -> None:
+        if cfg.enabled:
+            if not cfg.key_id:
+                raise SystemExit("SIG_KEY_ID_MISSING: SIG_KEY_ID")
+            if cfg.algorithm != "ed25519":
+                raise SystemExit(f"SIG_ALGO_UNSUPPORTED: {cfg.algorithm}")
+        self.cfg = cfg
+        self._lock = threading.Lock()
+        self._key: Optional[SigningKey] = None
+        self._key_id: Optional[Tuple[int, int, int, int]] = None
+
+    def signing_key(self) -> SigningKey:
+        priv_path = self.cfg.priv_path
+        if not priv_path:
+            raise SystemExit("SIG_PRIV_MISSING: SIG_PRIV")
+        p = Path(priv_path).expanduser()
+        try:
+            ident = _key_identity(p)
+        except FileNotFoundError:
+            raise SystemExit(f"SIG_PRIV_NOT_FOUND: {p}")
+        with self._lock:
+            if self._key is None or ident != self._key_id:
+                self._key = _load_signing_key(priv_path)
+                self._key_id = ident if time.time_ns() - ident[3] > _RACY_NS else None
+            return self._key
+
+    def _payload(self, sig_hex: str, signed_at: str) -> Dict[str, Any]:
+        return {
+            "signature": sig_hex,
+            "algorithm": "ed25519",
+            "key_id": self.cfg.key_id,
+            "signed_at": signed_at,
+            "signed_digest": "hash",
+        }
+
+    def sign(self, hash_hex: str) -> Dict[str, Any]:
+        if not self.cfg.enabled:
+            return {}
+        _check_hash(hash_hex)
+        sig_hex = self.signing_key().sign(bytes.fromhex(hash_hex)).signature.hex()
+        return self._payload(sig_hex, _signed_at())
+
+    def sign_many(self, hashes: Iterable[str]) -> List[Dict[str, Any]]:
+        """One key lookup + one signed_at for the whole batch; all hashes are validated first."""
+        hashes = list(hashes)
+        if not self.cfg.enabled:
+            return [{} for _ in hashes]
+        for h in hashes:
+            _check_hash(h)
+        sign = self.signing_key().sign
+        signed_at = _signed_at()
+        return [self._payload(sign(bytes.fromhex(h)).signature.hex(), signed_at) for h in hashes]
+
+
+_SIGNERS: Dict[SignatureConfig, Ed25519Signer] = {}
+_SIGNERS_LOCK = threading.Lock()
+
+
+def get_signer(cfg_like: Any) -> Ed25519Signer:
+    """Process-wide signer per config (shares the parsed key across calls)."""
+    cfg = _coerce_cfg(cfg_like)
+    with _SIGNERS_LOCK:
+        signer = _SIGNERS.get(cfg)
+        if signer is None:
+            signer = _SIGNERS[cfg] = Ed25519Signer(cfg)
+    return signer
+
+
 def sign_hash_hex(a: Any, b: Any) -> Dict[str, Any]:
     cfg, hash_hex = _split_args(a, b)
 
@@ -95,15 +193,10 @@ def sign_hash_hex(a: Any, b: Any) -> Dict[str, Any]:
         raise SystemExit("SIG_KEY_ID_MISSING: SIG_KEY_ID")
     if cfg.algorithm != "ed25519":
         raise SystemExit(f"SIG_ALGO_UNSUPPORTED: {cfg.algorithm}")
-    if not isinstance(hash_hex, str) or not _RE_HASH.fullmatch(hash_hex):
-        raise SystemExit("SIG_HASH_INVALID: expected 64-hex digest")
+    _check_hash(hash_hex)
+
+    return get_signer(cfg).sign(hash_hex)
+
 
-    signing_key = _load_signing_key(cfg.priv_path)
-    sig_hex = signing_key.sign(bytes.fromhex(hash_hex)).signature.hex()
-    return {
-        "signature": sig_hex,
-        "algorithm": "ed25519",
-        "key_id": cfg.key_id,
-        "signed_at": datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z"),
-        "signed_digest": "hash",
-    }
+def sign_many(cfg_like: Any, hashes: Iterable[str]) -> List[Dict[str, Any]]:
+    return get_signer(cfg_like).sign_many(hashes)
@@ -8,15 +8,19 @@ Card stats from Vault (v0.3.1)
 ✅ quarantine handling (same as daily_report):
    - default: EXCLUDE quarantined runs (paths containing /quarantine/ or /_quarantine/)
    - opt-in:  --include-quarantine
+✅ reads only the date partitions in range (vault/run_index.py) and the per-day
+   columnar summaries instead of every execution/outcome/exception file
 """
 
 from __future__ import annotations
 
 import argparse
-import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
+
+from vault.join_engine import DEFAULT_WORKERS, default_engine
+from vault.run_index import RunIndex
 
 VAULT_ROOT = Path("vault")
 RUNS_INDEX = VAULT_ROOT / "manifests" / "runs_index.jsonl"
@@ -35,30 +39,6 @@ def utc_today_ymd() -> str:
 
 # ---------- io helpers ----------
 
-def safe_read_json(path: Path) -> Optional[Dict[str, Any]]:
-    try:
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
-        return None
-
-
-def parse_jsonl(path: Path) -> List[Dict[str, Any]]:
-    if not path.exists():
-        return []
-    out: List[Dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                out.append(json.loads(line))
-            except Exception:
-                pass
-    return out
-
-
 def is_quarantined_path(p: str) -> bool:
     return ("/quarantine/" in p) or ("/_quarantine/" in p)
 
@@ -92,27 +72,6 @@ def exec_path_to_run_date(exec_path: str) -> Optional[datetime]:
         return None
 
 
-def exec_path_to_date_path(exec_path: str) -> Optional[str]:
-    parts = extract_exec_date_parts(exec_path)
-    if not parts:
-        return None
-    y, m, d = parts
-    return f"{y}/{m}/{d}"
-
-
-def load_exception_for_run(date_path: str, run_id: str) -> Optional[Dict[str, Any]]:
-    ex_dir = VAULT_ROOT / "exceptions" / date_path
-    if not ex_dir.exists():
-        return None
-    # match: exception_<RUN_ID>__*.json
-    for p in sorted(ex_dir.glob(f"exception_{run_id}__*.json")):
-        d = safe_read_json(p)
-        if d:
-            d["_path"] = str(p)
-            return d
-    return None
-
-
 # ---------- logic helpers ----------
 
 def is_valid_card_id(cid: Optional[str]) -> bool:
@@ -162,6 +121,8 @@ def main() -> int:
         action="store_true",
         help="Include quarantined runs (paths containing /quarantine/ or /_quarantine/)",
     )
+    ap.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Parallel file reads for stale runs")
+    ap.add_argument("--disk-cache", action="store_true", help="Reuse parsed artifacts across runs (SQLite)")
     args = ap.parse_args()
 
     # --- date window (inclusive) ---
@@ -176,7 +137,10 @@ def main() -> int:
     if d_from > d_to:
         d_from, d_to = d_to, d_from
 
-    rows = parse_jsonl(RUNS_INDEX)
+    engine = default_engine(VAULT_ROOT, workers=args.workers, disk_cache=args.disk_cache)
+    index = RunIndex(VAULT_ROOT, joiner=engine)
+    index.sync()
+    rows = index.rows(d_from.date(), d_to.date())
 
     # dedupe by run_id, keep last (later lines overwrite)
     by_run: Dict[str, Dict[str, Any]] = {}
@@ -210,46 +174,24 @@ def main() -> int:
     fail_trend_strategy: Dict[str, Dict[str, int]] = {}
     fail_trend_judgment: Dict[str, Dict[str, int]] = {}
 
-    for r in runs:
-        run_id = str(r["run_id"])
-        exec_path = str(r.get("exec_path", "") or "")
-
-        exec_doc = safe_read_json(Path(exec_path)) or {}
-        run_meta = (exec_doc.get("run", {}) or {})
+    for _, rec in index.iter_records(runs):
 
-        sid = str(run_meta.get("strategy_card_id", "unknown"))
-        jid = str(run_meta.get("judgment_card_id", "unknown"))
+        sid = rec.strategy_card_id
+        jid = rec.judgment_card_id
 
         # drop fully-unknown runs unless include-unknown
         if not args.include_unknown:
             if (not is_valid_card_id(sid)) and (not is_valid_card_id(jid)):
                 continue
 
-        out_path = str(r.get("outcome_path", "") or "")
-        outcome = safe_read_json(Path(out_path)) if out_path else None
-
-        result = "UNKNOWN"
-        reason = ""
-        realized = 0.0
-        mae = None
-        mfe = None
-
-        if outcome:
-            labels = outcome.get("labels", {}) or {}
-            result = str(labels.get("result", "UNKNOWN")).upper()
-            reason = str(labels.get("reason", ""))
+        result = rec.result.upper()
+        reason = rec.reason
+        realized = rec.realized
+        mae = rec.mae
+        mfe = rec.mfe
 
-            pnl = outcome.get("pnl", {}) or {}
-            realized = float(pnl.get("realized", 0.0) or 0.0)
-
-            ex = outcome.get("excursions", {}) or {}
-            mae = ex.get("mae")
-            mfe = ex.get("mfe")
-
-        date_path = exec_path_to_date_path(exec_path) or ""
-        exr = load_exception_for_run(date_path, run_id) if date_path else None
-        is_hard_fail = bool(exr and str(exr.get("severity", "")).upper() == "HARD_FAIL")
-        fail_code = str(exr.get("code", "")) if exr else ""
+        is_hard_fail = rec.is_hard_fail
+        fail_code = rec.exc_code if rec.exc_code is not None else ""
 
         def apply(b: Dict[str, Any]) -> None:
             b["runs"] += 1
@@ -294,6 +236,8 @@ def main() -> int:
             if is_hard_fail and fail_code:
                 inc_fail_trend(fail_trend_judgment, jid, fail_code)
 
+    engine.close()
+
     # ---------- print ----------
 
     print(f"🧠 Card Stats — {d_from.date()} → {d_to.date()} (UTC)")
@@ -12,9 +12,15 @@ def main() -> None:
     ap.add_argument("--channel", default=None)
     ap.add_argument("--limit", type=int, default=50)
     ap.add_argument("--base-dir", default="logs/queues")
+    ap.add_argument("--queue-db", default=None, help="SQLite action queue (default: file queue under --base-dir)")
     args = ap.parse_args()
 
-    out = consume_pending(channel=args.channel, limit=args.limit, base_dir=args.base_dir)
+    queue = None
+    if args.queue_db:
+        from core.C_action.queue_store import SQLiteActionQueue
+
+        queue = SQLiteActionQueue(args.queue_db)
+    out = consume_pending(channel=args.channel, limit=args.limit, base_dir=args.base_dir, queue=queue)
     print(json.dumps({"consumed": len(out), "processed_paths": out}, ensure_ascii=False, indent=2, sort_keys=True))
 
 
@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 """
 Daily report for Trading OS Vault
-- reads: vault/manifests/runs_index.jsonl
-- joins: executions/, outcomes/, exceptions/
+- reads: vault/manifests/runs_index.jsonl (via the date partition, vault/run_index.py)
+- joins: executions/, outcomes/, exceptions/ (cached in the day's columnar summary)
 - prints: summary + top reasons + fails
 - default: EXCLUDE quarantined runs (paths containing /quarantine/ or /_quarantine/)
 """
@@ -10,10 +10,12 @@ Daily report for Trading OS Vault
 from __future__ import annotations
 
 import argparse
-import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Tuple
+
+from vault.join_engine import DEFAULT_WORKERS, default_engine
+from vault.run_index import RunIndex
 
 VAULT_ROOT = Path("vault")
 RUNS_INDEX = VAULT_ROOT / "manifests" / "runs_index.jsonl"
@@ -28,47 +30,10 @@ def ymd_to_slash(ymd: str) -> str:
     return ymd.replace("-", "/")
 
 
-def safe_read_json(path: Path) -> Optional[Dict[str, Any]]:
-    try:
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
-        return None
-
-
-def parse_jsonl(path: Path) -> List[Dict[str, Any]]:
-    if not path.exists():
-        return []
-    rows: List[Dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                rows.append(json.loads(line))
-            except Exception:
-                continue
-    return rows
-
-
 def is_quarantined_path(p: str) -> bool:
     return ("/quarantine/" in p) or ("/_quarantine/" in p)
 
 
-def load_exception_for_run(date_path: str, run_id: str) -> Optional[Dict[str, Any]]:
-    ex_dir = VAULT_ROOT / "exceptions" / date_path
-    if not ex_dir.exists():
-        return None
-    # match: exception_<RUN_ID>__*.json
-    for p in sorted(ex_dir.glob(f"exception_{run_id}__*.json")):
-        data = safe_read_json(p)
-        if data:
-            data["_path"] = str(p)
-            return data
-    return None
-
-
 def main() -> int:
     ap = argparse.ArgumentParser(description="Daily report from Vault")
     ap.add_argument("--date", default=utc_today_ymd(), help="UTC date: YYYY-MM-DD (default: today UTC)")
@@ -77,12 +42,18 @@ def main() -> int:
         action="store_true",
         help="Include quarantined runs (paths containing /quarantine/ or /_quarantine/)",
     )
+    ap.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Parallel file reads for stale runs")
+    ap.add_argument("--disk-cache", action="store_true", help="Reuse parsed artifacts across runs (SQLite)")
     args = ap.parse_args()
 
     date_ymd = args.date
     date_path = ymd_to_slash(date_ymd)
 
-    rows = parse_jsonl(RUNS_INDEX)
+    engine = default_engine(VAULT_ROOT, workers=args.workers, disk_cache=args.disk_cache)
+    index = RunIndex(VAULT_ROOT, joiner=engine)
+    index.sync()
+    day = datetime.strptime(date_ymd, "%Y-%m-%d").date()
+    rows = index.rows(day, day)
 
     # Filter runs by date AND dedupe by run_id (keep last occurrence)
     last_by_run: Dict[str, Dict[str, Any]] = {}
@@ -117,30 +88,15 @@ def main() -> int:
     hard_fails: List[Tuple[str, str, str]] = []  # (run_id, code, path)
     per_run_lines: List[str] = []
 
-    for r in day_rows:
+    for r, rec in index.iter_records(day_rows):
         run_id = r.get("run_id", "n/a")
-        out_path = str(r.get("outcome_path", "") or "")
-        outcome = safe_read_json(Path(out_path)) if out_path else None
-
-        result = "UNKNOWN"
-        reason = ""
-        realized = 0.0
-        ccy = None
-        mae = None
-        mfe = None
 
-        if outcome:
-            labels = outcome.get("labels", {}) or {}
-            result = str(labels.get("result", "UNKNOWN"))
-            reason = str(labels.get("reason", ""))
-
-            pnl = outcome.get("pnl", {}) or {}
-            realized = float(pnl.get("realized", 0.0) or 0.0)
-            ccy = pnl.get("ccy", None) or pnl.get("currency", None)
-
-            ex = outcome.get("excursions", {}) or {}
-            mae = ex.get("mae", None)
-            mfe = ex.get("mfe", None)
+        result = rec.result
+        reason = rec.reason
+        realized = rec.realized
+        ccy = rec.ccy
+        mae = rec.mae
+        mfe = rec.mfe
 
         # Result buckets
         r_upper = result.upper()
@@ -173,16 +129,17 @@ def main() -> int:
         if reason:
             reasons[reason] = reasons.get(reason, 0) + 1
 
-        # HARD_FAIL check: look for exception for this run_id today
-        exr = load_exception_for_run(date_path, str(run_id))
-        if exr and str(exr.get("severity", "")).upper() == "HARD_FAIL":
-            code = str(exr.get("code", "UNKNOWN"))
-            hard_fails.append((str(run_id), code, str(exr.get("_path", ""))))
+        # HARD_FAIL check: exception for this run_id today
+        if rec.is_hard_fail:
+            code = rec.exc_code if rec.exc_code is not None else "UNKNOWN"
+            hard_fails.append((str(run_id), code, str(rec.exc_path or "")))
 
         per_run_lines.append(
             f"- {run_id} | {r_upper:<9} | pnl={realized:+.2f} {pnl_ccy or ''} | reason={reason}"
         )
 
+    engine.close()
+
     # Print report
     print(f"📊 Daily Report — {date_ymd} (UTC)")
     print("")
@@ -12,6 +12,7 @@ import ulid
 from vault.schemas_py.execution import ExecutionLog  # LOCK2_ALLOW_EXEC
 from vault.schemas_py.outcome import OutcomeRecord
 from vault.schemas_py.registry import validate_schema
+from vault.run_index import RunIndex
 
 
 def utc_now() -> datetime:
@@ -60,6 +61,13 @@ def append_index(run_id: str, status: str, exec_path: Path, outcome_path: Path,
     }
     append_jsonl(idx, entry)
 
+    # keep the date partitions + per-day summary current (best-effort: runs_index.jsonl
+    # is the source of truth and reports re-sync from it)
+    try:
+        RunIndex(VAULT_ROOT).sync()
+    except Exception:
+        pass
+
 
 def main() -> int:
     p = argparse.ArgumentParser(prog="trade_logger", description="Trading OS write-only logger (v0.1)")
@@ -8,11 +8,14 @@ import os
 import time
 from dataclasses import asdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from core.C_action.contracts import DeliveryPlan
 from core.C_action.execution_gate import enforce_execution_gate_for_queue_item  # ✅ Gate 2 enforcement
 
+if TYPE_CHECKING:
+    from core.C_action.queue_store import SQLiteActionQueue
+
 
 def _load_json(path: str) -> Dict[str, Any]:
     with open(path, "r", encoding="utf-8") as f:
@@ -58,17 +61,18 @@ def _stable_idempotency_seed(queue_item_path: str) -> str:
         return os.path.splitext(os.path.basename(queue_item_path))[0]
 
 
-def _safe_id(plan_id: Optional[str], queue_item_path: str) -> str:
+def _safe_id(plan_id: Optional[str], queue_item_path: str, basis: Optional[str] = None) -> str:
     """
     Ensure processed filename never collides:
     - if plan_id exists and not "unknown": use it
-    - else derive from queue filename + mtime
+    - else derive from queue filename + mtime (or the given basis when there is no file)
     """
     pid = (plan_id or "").strip()
     if pid and pid.lower() != "unknown":
         return pid
-    st = os.stat(queue_item_path)
-    basis = f"{os.path.basename(queue_item_path)}:{int(st.st_mtime)}:{st.st_size}"
+    if basis is None:
+        st = os.stat(queue_item_path)
+        basis = f"{os.path.basename(queue_item_path)}:{int(st.st_mtime)}:{st.st_size}"
     return f"unknown_{_sha8(basis)}"
 
 
@@ -95,16 +99,13 @@ def _plan_from_queue_item(q: Dict[str, Any]) -> DeliveryPlan:
     )
 
 
-def consume_one(queue_item_path: str, base_dir: str = "logs/queues") -> str:
-    """
-    Consume a pending queue item:
-      - emit processed artifact:
-        logs/queues/<channel>/processed/<safe_plan_id>.json
-      - does NOT execute any external actions (read-only)
-    Returns processed artifact path.
-    """
-    q = _load_json(queue_item_path)
-
+def _process_item(
+    q: Dict[str, Any],
+    queue_item_path: str,
+    base_dir: str,
+    safe_id_basis: Optional[str] = None,
+) -> Tuple[str, Dict[str, Any]]:
+    """Gate check + processed artifact for one queue item. Returns (processed_path, processed)."""
     # 🔒 Gate 2: Execution Authorization enforcement (execution-class channels only)
     # If channel is in EXECUTION_CHANNELS, q must include a valid execution_request_path
     enforce_execution_gate_for_queue_item(q)
@@ -112,7 +113,7 @@ def consume_one(queue_item_path: str, base_dir: str = "logs/queues") -> str:
     plan = _plan_from_queue_item(q)
 
     channel = (plan.channel or q.get("channel") or "unknown")
-    safe_plan_id = _safe_id(plan.plan_id or q.get("plan_id"), queue_item_path)
+    safe_plan_id = _safe_id(plan.plan_id or q.get("plan_id"), queue_item_path, safe_id_basis)
 
     processed_path = os.path.join(base_dir, channel, "processed", f"{safe_plan_id}.json")
 
@@ -136,6 +137,20 @@ def consume_one(queue_item_path: str, base_dir: str = "logs/queues") -> str:
             "idempotency_key": _sha8(_stable_idempotency_seed(queue_item_path)),
         }
     )
+    return processed_path, processed
+
+
+def consume_one(queue_item_path: str, base_dir: str = "logs/queues") -> str:
+    """
+    Consume a pending queue item:
+      - emit processed artifact:
+        logs/queues/<channel>/processed/<safe_plan_id>.json
+      - does NOT execute any external actions (read-only)
+    Returns processed artifact path.
+    """
+    q = _load_json(queue_item_path)
+
+    processed_path, processed = _process_item(q, queue_item_path, base_dir)
 
     _save_json(processed_path, processed)
 
@@ -149,7 +164,15 @@ def consume_one(queue_item_path: str, base_dir: str = "logs/queues") -> str:
     return processed_path
 
 
-def consume_pending(channel: Optional[str] = None, limit: int = 50, base_dir: str = "logs/queues") -> List[str]:
+def consume_pending(
+    channel: Optional[str] = None,
+    limit: int = 50,
+    base_dir: str = "logs/queues",
+    queue: Optional["SQLiteActionQueue"] = None,
+) -> List[str]:
+    if queue is not None:
+        return _consume_from_queue(queue, channel, limit, base_dir)
+
     if channel:
         pattern = os.path.join(base_dir, channel, "pending", "*.json")
     else:
@@ -160,3 +183,24 @@ def consume_pending(channel: Optional[str] = None, limit: int = 50, base_dir: st
     for p in paths:
         out.append(consume_one(p, base_dir=base_dir))
     return out
+
+
+def _consume_from_queue(queue: "SQLiteActionQueue", channel: Optional[str], limit: int, base_dir: str) -> List[str]:
+    """
+    SQLite backend: claim → process → ack. processed artifacts stay in the queue
+    (queue.export_files() writes them in the file layout for audit).
+    A failing item (e.g. Gate 2 block) is nack'ed for retry and dead-lettered
+    after max_attempts instead of aborting the rest of the batch.
+    """
+    out: List[str] = []
+    for lease in queue.claim(channel=channel, limit=max(0, int(limit))):
+        try:
+            processed_path, processed = _process_item(
+                lease.payload, lease.item_path, base_dir, safe_id_basis=f"{lease.item_path}:{lease.item_id}"
+            )
+        except Exception as e:
+            queue.nack(lease, f"{type(e).__name__}: {e}")
+            continue
+        if queue.ack(lease, processed_path, processed):
+            out.append(processed_path)
+    return out
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from core.C_action.contracts import DeliveryPlan
 from core.C_action.execution_gate import enforce_execution_gate_for_queue_item
 
+if TYPE_CHECKING:
+    from core.C_action.queue_store import SQLiteActionQueue
+
 
 def _save_json(path: str, obj: Any) -> None:
     os.makedirs(os.path.dirname(path), exist_ok=True)
@@ -50,10 +53,13 @@ def route_to_queue(
     plan: DeliveryPlan,
     plan_path: str,
     base_dir: str = "logs/queues",
+    queue: Optional["SQLiteActionQueue"] = None,
 ) -> str:
     """
     Action-free queue artifact:
       logs/queues/<channel>/pending/<plan_id>.json
+    With queue=SQLiteActionQueue the item is enqueued there instead of written;
+    the returned path is the same logical pending path (not created on disk).
 
     NOTE:
     - unknown queue disabled: channel is mandatory.
@@ -106,6 +112,10 @@ def route_to_queue(
         } if exec_req_path else {},
     }
 
+    if queue is not None:
+        queue.enqueue(channel, plan.plan_id, out_path, payload)
+        return out_path
+
     _save_json(out_path, payload)
     return out_path
 
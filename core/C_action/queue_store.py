@@ -0,0 +1,253 @@
+# core/C_action/queue_store.py
+"""
+SQLite-backed action queue (alternative to logs/queues/<channel>/pending/*.json)
+
+- one row per (channel, plan_id); re-routing the same plan resets it to PENDING
+  with the new payload (same as overwriting the pending file)
+- claim(): BEGIN IMMEDIATE → pick the oldest visible PENDING rows → lease them
+  (lease_token, visible_at = now + visibility timeout, attempts += 1). Several
+  consumer processes can claim concurrently without getting the same row.
+- ack(): PROCESSED + the processed artifact, only while the caller still holds
+  the lease (an expired lease may have been re-claimed by someone else)
+- nack(): back to PENDING after a backoff; once attempts reach max_attempts the
+  row goes to DEAD (dead-letter) instead
+- a crashed consumer's lease simply expires and the row becomes claimable again
+
+item_path is the logical file-layout path (<base_dir>/<channel>/pending/<plan_id>.json),
+so idempotency keys and processed names match the file backend, and
+export_files() writes the same pending/processed layout (+ dead/) for audit.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from core.C_action.queue_router import _save_json
+
+STATE_PENDING = "PENDING"
+STATE_PROCESSED = "PROCESSED"
+STATE_DEAD = "DEAD"
+
+DEFAULT_VISIBILITY_TIMEOUT_S = 300.0
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_RETRY_DELAY_S = 30.0
+DEFAULT_BUSY_TIMEOUT_S = 30.0
+
+
+@dataclass(frozen=True)
+class QueueLease:
+    item_id: int
+    channel: str
+    plan_id: str
+    item_path: str
+    payload: Dict[str, Any]
+    attempts: int
+    lease_token: str
+
+
+def _dumps(obj: Any) -> str:
+    return json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+class SQLiteActionQueue:
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        visibility_timeout_s: float = DEFAULT_VISIBILITY_TIMEOUT_S,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        retry_delay_s: float = DEFAULT_RETRY_DELAY_S,
+        timeout: float = DEFAULT_BUSY_TIMEOUT_S,
+        consumer_id: Optional[str] = None,
+    ) -> None:
+        self.path = Path(path)
+        self.visibility_timeout_s = visibility_timeout_s
+        self.max_attempts = max_attempts
+        self.retry_delay_s = retry_delay_s
+        self.consumer_id = consumer_id or f"{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # isolation_level=None: transactions are explicit (BEGIN IMMEDIATE for writers)
+        self._db = sqlite3.connect(str(self.path), timeout=timeout, isolation_level=None, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS queue_items ("
+            " id INTEGER PRIMARY KEY,"
+            " channel TEXT NOT NULL, plan_id TEXT NOT NULL, item_path TEXT NOT NULL,"
+            " payload TEXT NOT NULL,"
+            " state TEXT NOT NULL,"
+            " attempts INTEGER NOT NULL DEFAULT 0,"
+            " visible_at REAL NOT NULL,"
+            " lease_owner TEXT, lease_token TEXT,"
+            " enqueued_at REAL NOT NULL,"
+            " processed_path TEXT, processed TEXT,"
+            " last_error TEXT,"
+            " UNIQUE (channel, plan_id))"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS queue_items_claim ON queue_items (state, visible_at, id)")
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS queue_items_claim_channel ON queue_items (channel, state, visible_at, id)"
+        )
+
+    # ---- transactions ----
+    def _begin(self) -> None:
+        self._db.execute("BEGIN IMMEDIATE")
+
+    def _write(self, fn, *args):
+        with self._lock:
+            self._begin()
+            try:
+                out = fn(*args)
+                self._db.execute("COMMIT")
+                return out
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+
+    # ---- producer ----
+    def _enqueue_rows(self, rows: Iterable[Tuple[str, str, str, Dict[str, Any]]], now: float) -> int:
+        n = 0
+        for channel, plan_id, item_path, payload in rows:
+            self._db.execute(
+                "INSERT INTO queue_items (channel, plan_id, item_path, payload, state, attempts, visible_at, enqueued_at)"
+                " VALUES (?,?,?,?,?,0,?,?)"
+                " ON CONFLICT(channel, plan_id) DO UPDATE SET"
+                "  item_path=excluded.item_path, payload=excluded.payload, state=excluded.state, attempts=0,"
+                "  visible_at=excluded.visible_at, enqueued_at=excluded.enqueued_at,"
+                "  lease_owner=NULL, lease_token=NULL, processed_path=NULL, processed=NULL, last_error=NULL",
+                (channel, plan_id, item_path, _dumps(payload), STATE_PENDING, now, now),
+            )
+            n += 1
+        return n
+
+    def enqueue(self, channel: str, plan_id: str, item_path: str, payload: Dict[str, Any]) -> None:
+        self._write(self._enqueue_rows, [(channel, plan_id, item_path, payload)], time.time())
+
+    def enqueue_many(self, rows: Iterable[Tuple[str, str, str, Dict[str, Any]]]) -> int:
+        """rows: (channel, plan_id, item_path, payload) — one transaction"""
+        return self._write(self._enqueue_rows, rows, time.time())
+
+    # ---- consumer ----
+    def _claim(self, channel: Optional[str], limit: int, now: float) -> List[QueueLease]:
+        if channel:
+            rows = self._db.execute(
+                "SELECT id, channel, plan_id, item_path, payload, attempts FROM queue_items"
+                " WHERE channel=? AND state=? AND visible_at<=? ORDER BY visible_at, id LIMIT ?",
+                (channel, STATE_PENDING, now, limit),
+            ).fetchall()
+        else:
+            rows = self._db.execute(
+                "SELECT id, channel, plan_id, item_path, payload, attempts FROM queue_items"
+                " WHERE state=? AND visible_at<=? ORDER BY visible_at, id LIMIT ?",
+                (STATE_PENDING, now, limit),
+            ).fetchall()
+
+        leases: List[QueueLease] = []
+        for item_id, ch, plan_id, item_path, payload, attempts in rows:
+            if attempts >= self.max_attempts:
+                # lease expired on the last allowed attempt (consumer died): dead-letter
+                self._db.execute(
+                    "UPDATE queue_items SET state=?, lease_owner=NULL, lease_token=NULL,"
+                    " last_error=COALESCE(last_error, 'lease expired') WHERE id=?",
+                    (STATE_DEAD, item_id),
+                )
+                continue
+            token = uuid.uuid4().hex
+            self._db.execute(
+                "UPDATE queue_items SET attempts=attempts+1, visible_at=?, lease_owner=?, lease_token=? WHERE id=?",
+                (now + self.visibility_timeout_s, self.consumer_id, token, item_id),
+            )
+            leases.append(QueueLease(item_id, ch, plan_id, item_path, json.loads(payload), attempts + 1, token))
+        return leases
+
+    def claim(self, channel: Optional[str] = None, limit: int = 50) -> List[QueueLease]:
+        if limit <= 0:
+            return []
+        return self._write(self._claim, channel, int(limit), time.time())
+
+    def _ack(self, lease: QueueLease, processed_path: str, processed: Dict[str, Any]) -> bool:
+        cur = self._db.execute(
+            "UPDATE queue_items SET state=?, processed_path=?, processed=?, lease_owner=NULL, lease_token=NULL,"
+            " last_error=NULL WHERE id=? AND lease_token=? AND state=?",
+            (STATE_PROCESSED, processed_path, _dumps(processed), lease.item_id, lease.lease_token, STATE_PENDING),
+        )
+        return cur.rowcount == 1
+
+    def ack(self, lease: QueueLease, processed_path: str, processed: Dict[str, Any]) -> bool:
+        """False if the lease was lost (expired and re-claimed) — the result is dropped."""
+        return self._write(self._ack, lease, processed_path, processed)
+
+    def _nack(self, lease: QueueLease, error: str, delay_s: float, now: float) -> str:
+        dead = lease.attempts >= self.max_attempts
+        state = STATE_DEAD if dead else STATE_PENDING
+        cur = self._db.execute(
+            "UPDATE queue_items SET state=?, visible_at=?, lease_owner=NULL, lease_token=NULL, last_error=?"
+            " WHERE id=? AND lease_token=? AND state=?",
+            (state, now + delay_s, error, lease.item_id, lease.lease_token, STATE_PENDING),
+        )
+        return state if cur.rowcount == 1 else ""
+
+    def nack(self, lease: QueueLease, error: str, delay_s: Optional[float] = None) -> str:
+        """Returns the new state (PENDING / DEAD), or "" if the lease was lost."""
+        delay = self.retry_delay_s if delay_s is None else delay_s
+        return self._write(self._nack, lease, error, delay, time.time())
+
+    # ---- inspection / audit ----
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._db.execute("SELECT state, COUNT(*) FROM queue_items GROUP BY state").fetchall()
+        return {state: n for state, n in rows}
+
+    def dead_letters(self, channel: Optional[str] = None) -> List[Dict[str, Any]]:
+        sql = "SELECT channel, plan_id, attempts, last_error, payload FROM queue_items WHERE state=?"
+        args: Tuple[Any, ...] = (STATE_DEAD,)
+        if channel:
+            sql += " AND channel=?"
+            args += (channel,)
+        with self._lock:
+            rows = self._db.execute(sql + " ORDER BY id", args).fetchall()
+        return [
+            {"channel": ch, "plan_id": pid, "attempts": a, "last_error": err, "payload": json.loads(p)}
+            for ch, pid, a, err, p in rows
+        ]
+
+    def export_files(self, base_dir: str = "logs/queues") -> List[str]:
+        """
+        Write the queue in the file layout:
+          <base_dir>/<channel>/pending/<plan_id>.json     (PENDING, leased or not)
+          <base_dir>/<channel>/processed/<safe_id>.json   (PROCESSED, the processed artifact)
+          <base_dir>/<channel>/dead/<plan_id>.json        (DEAD, payload + attempts/last_error)
+        """
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT channel, plan_id, state, payload, processed_path, processed, attempts, last_error"
+                " FROM queue_items ORDER BY id"
+            ).fetchall()
+        written: List[str] = []
+        for channel, plan_id, state, payload, processed_path, processed, attempts, last_error in rows:
+            if state == STATE_PROCESSED:
+                path = os.path.join(base_dir, channel, "processed", os.path.basename(processed_path))
+                obj = json.loads(processed)
+            elif state == STATE_DEAD:
+                path = os.path.join(base_dir, channel, "dead", f"{plan_id}.json")
+                obj = {**json.loads(payload), "status": STATE_DEAD, "attempts": attempts, "last_error": last_error}
+            else:
+                path = os.path.join(base_dir, channel, "pending", f"{plan_id}.json")
+                obj = json.loads(payload)
+            _save_json(path, obj)
+            written.append(path)
+        return written
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
@@ -7,6 +7,7 @@ from typing import Any
 _ALLOWED_MODES = {"ok", "mismatch", "timeout", "ambiguous"}
 _CAPABILITIES_PATH = Path(__file__).resolve().parents[1] / "contracts" / "adapter_capabilities_v1.json"
 _CACHE: dict[str, Any] | None = None
+_INDEX: dict[str, dict] | None = None  # adapter_name -> row (first row wins, as the linear scan did)
 
 
 def _validate_row(row: Any) -> None:
@@ -66,10 +67,20 @@ def load_adapter_capabilities_v1() -> dict:
     return data
 
 
-def get_adapter_capability(adapter_name: str) -> dict | None:
+def adapter_capability_index() -> dict[str, dict]:
+    global _INDEX
     data = load_adapter_capabilities_v1()
-    adapters = data.get("adapters", [])
-    for row in adapters:
-        if isinstance(row, dict) and row.get("adapter_name") == adapter_name:
-            return row
-    return None
+    if _INDEX is None or _CACHE is not data:
+        index: dict[str, dict] = {}
+        for row in data.get("adapters", []):
+            if isinstance(row, dict):
+                index.setdefault(row.get("adapter_name"), row)
+        _INDEX = index
+    return _INDEX
+
+
+def get_adapter_capability(adapter_name: str) -> dict | None:
+    try:
+        return adapter_capability_index().get(adapter_name)
+    except TypeError:  # unhashable name: no row can match
+        return None
@@ -1,26 +1,204 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import itertools
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
 
+from .capabilities import adapter_capability_index
 from .mock_adapter import MockAdapter
 
+ENTRY_POINT_GROUP = "proto_v2_engine.adapters"
+_SCOPES = {"singleton", "pool", "transient"}
+
+AdapterFactory = Callable[[], Any]
+
 
 class AdapterRegistryError(RuntimeError):
     pass
 
 
-@dataclass(frozen=True)
+def _normalize(adapter_name: Any) -> str:
+    return str(adapter_name).strip().lower()
+
+
+@dataclass
+class AdapterHealth:
+    healthy: bool = True
+    failures: int = 0  # consecutive
+    last_error: str | None = None
+    unhealthy_since: float | None = None
+    probe_started: float | None = None  # half-open: the one resolve let through after the cooldown
+
+
+@dataclass
+class _Registration:
+    name: str
+    factory: AdapterFactory
+    scope: str
+    pool_size: int
+    max_failures: int | None
+    cooldown_s: float
+    health: AdapterHealth = field(default_factory=AdapterHealth)
+    instances: list[Any] = field(default_factory=list)
+    cursor: Any = None  # itertools.cycle over the pool, once filled
+
+
 class AdapterRegistry:
-    def resolve(self, adapter_name: str | None):
+    """
+    Adapter factories by name (aliases included), fail-closed.
+    - scope "singleton": one instance, created on first resolve
+    - scope "pool": pool_size instances, handed out round-robin
+    - scope "transient": a new instance per resolve (the previous behaviour)
+    - health: record_failure / record_success; with max_failures set, that many
+      consecutive failures make resolve() fail closed until cooldown_s has passed.
+      Then a single probe resolve is let through (half-open) while every other
+      resolve still fails closed: record_success closes the breaker, record_failure
+      re-opens it for another cooldown. A probe with no outcome recorded within
+      cooldown_s is given up and the next resolve probes again.
+    """
+
+    def __init__(self, *, builtins: bool = True) -> None:
+        self._lock = threading.RLock()  # discover_entry_points registers while holding it
+        self._regs: dict[str, _Registration] = {}
+        self._aliases: dict[str, str] = {}
+        if builtins:
+            self.register("mock", MockAdapter, aliases=("mock_adapter",))
+
+    def register(
+        self,
+        adapter_name: str,
+        factory: AdapterFactory,
+        *,
+        aliases: Iterable[str] = (),
+        scope: str = "singleton",
+        pool_size: int = 1,
+        max_failures: int | None = None,
+        cooldown_s: float = 30.0,
+        replace: bool = False,
+    ) -> None:
+        if not adapter_name:
+            raise AdapterRegistryError("adapter_name is required (fail-closed)")
+        if not callable(factory):
+            raise AdapterRegistryError(f"adapter factory is not callable: {adapter_name}")
+        if scope not in _SCOPES:
+            raise AdapterRegistryError(f"invalid adapter scope: {scope}")
+        if pool_size < 1:
+            raise AdapterRegistryError("pool_size must be >= 1")
+        name = _normalize(adapter_name)
+        keys = [name, *(_normalize(a) for a in aliases)]
+        with self._lock:
+            for key in keys:
+                owner = self._aliases.get(key)
+                if owner is not None and not (replace and owner == name):
+                    raise AdapterRegistryError(f"adapter already registered: {key}")
+            if replace:
+                for key in [k for k, owner in self._aliases.items() if owner == name]:
+                    del self._aliases[key]
+            self._regs[name] = _Registration(
+                name=name,
+                factory=factory,
+                scope=scope,
+                pool_size=pool_size if scope == "pool" else 1,
+                max_failures=max_failures,
+                cooldown_s=cooldown_s,
+            )
+            for key in keys:
+                self._aliases[key] = name
+
+    def names(self) -> list[str]:
+        with self._lock:
+            return sorted(self._regs)
+
+    def _registration(self, adapter_name: str | None) -> _Registration:
         if not adapter_name:
             raise AdapterRegistryError("adapter_name is required (fail-closed)")
+        reg = self._regs.get(self._aliases.get(_normalize(adapter_name), ""))
+        if reg is None:
+            raise AdapterRegistryError(f"unknown adapter: {adapter_name}")
+        return reg
+
+    def resolve(self, adapter_name: str | None):
+        reg = self._registration(adapter_name)
+        if not reg.health.healthy:
+            self._admit_probe(reg, adapter_name)
+        if reg.scope == "transient":
+            return reg.factory()
+        cursor = reg.cursor
+        if cursor is None:
+            with self._lock:
+                if reg.cursor is None:
+                    reg.instances = [reg.factory() for _ in range(reg.pool_size)]
+                    reg.cursor = itertools.cycle(reg.instances)
+                cursor = reg.cursor
+        # next() on itertools.cycle is a single C call: no lock needed on the hot path
+        return next(cursor)
+
+    def _admit_probe(self, reg: _Registration, adapter_name: str | None) -> None:
+        with self._lock:
+            h = reg.health
+            if h.healthy:
+                return
+            now = time.monotonic()
+            in_cooldown = now - (h.unhealthy_since or 0.0) < reg.cooldown_s
+            probing = h.probe_started is not None and now - h.probe_started < reg.cooldown_s
+            if in_cooldown or probing:
+                raise AdapterRegistryError(f"adapter unhealthy: {adapter_name} ({h.last_error})")
+            h.probe_started = now
+
+    def capability(self, adapter_name: str | None) -> dict | None:
+        """Capability row (core/contracts/adapter_capabilities_v1.json) of the canonical name; None if absent."""
+        return adapter_capability_index().get(self._registration(adapter_name).name)
+
+    def health(self, adapter_name: str | None) -> AdapterHealth:
+        h = self._registration(adapter_name).health
+        return AdapterHealth(h.healthy, h.failures, h.last_error, h.unhealthy_since, h.probe_started)
+
+    def record_failure(self, adapter_name: str | None, error: BaseException | str) -> None:
+        reg = self._registration(adapter_name)
+        with self._lock:
+            h = reg.health
+            h.failures += 1
+            h.last_error = str(error)
+            if reg.max_failures is not None and h.failures >= reg.max_failures:
+                h.healthy = False
+                h.unhealthy_since = time.monotonic()
+                h.probe_started = None
+
+    def record_success(self, adapter_name: str | None) -> None:
+        reg = self._registration(adapter_name)
+        if reg.health.failures or not reg.health.healthy:
+            with self._lock:
+                reg.health = AdapterHealth()
+
+    def discover_entry_points(self, group: str = ENTRY_POINT_GROUP) -> list[str]:
+        """
+        Register every entry point of `group` (name -> adapter factory), singleton scope.
+        Opt-in: nothing outside the built-ins is resolvable until this is called.
+        Names already registered are left as they are; returns the names added.
+        """
+        from importlib import metadata
+
+        eps = metadata.entry_points()
+        found = eps.select(group=group) if hasattr(eps, "select") else eps.get(group, ())
+        added: list[str] = []
+        for ep in found:
+            name = _normalize(ep.name)
+            with self._lock:
+                if name in self._aliases:
+                    continue
+                self.register(name, ep.load())
+            added.append(name)
+        return added
+
+
+_DEFAULT = AdapterRegistry()
 
-        normalized = str(adapter_name).strip().lower()
-        if normalized in {"mock", "mock_adapter"}:
-            return MockAdapter()
 
-        raise AdapterRegistryError(f"unknown adapter: {adapter_name}")
+def default_registry() -> AdapterRegistry:
+    return _DEFAULT
 
 
 def resolve_adapter(adapter_name: str | None):
-    return AdapterRegistry().resolve(adapter_name)
+    return _DEFAULT.resolve(adapter_name)
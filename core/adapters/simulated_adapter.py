@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict
+
+from .mock_adapter import AdapterError
+
+
+@dataclass
+class SimulatedAdapter:
+    """
+    Local simulated adapter for load tests.
+    - No side effects; same ok-response shape as MockAdapter
+    - Configurable latency (+ uniform jitter) and error rate, seeded
+    - Not registered by default: register it on a registry explicitly
+    """
+
+    name: str = "simulated"
+    version: str = "v1"
+    latency_ms: float = 5.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    seed: int = 0
+    calls: int = 0
+    _rng: random.Random = field(init=False, repr=False)
+    _lock: threading.Lock = field(init=False, repr=False, default_factory=threading.Lock)
+
+    def __post_init__(self) -> None:
+        self._rng = random.Random(self.seed)
+
+    def call(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            self.calls += 1
+            delay = self.latency_ms + (self._rng.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0)
+            fail = self.error_rate > 0 and self._rng.random() < self.error_rate
+        if delay > 0:
+            time.sleep(delay / 1000.0)
+        if fail:
+            raise AdapterError("ADAPTER_GENERIC_ERROR")
+
+        payload = json.dumps(request, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        return {
+            "ok": True,
+            "engine_output": {
+                "meta": {
+                    "adapter": {"name": self.name, "version": self.version},
+                    "request_hash": hashlib.sha256(payload).hexdigest(),
+                },
+                "decision": {"status": "ALLOW", "reason": "simulated_ok"},
+                "signals": [],
+            },
+        }
@@ -4,11 +4,12 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple
 
-from core.analytics.weekly import rollup_weekly
+from core.analytics.weekly import WeeklyRollup, rollup_weekly
 from core.analytics.explainability import (
     top_scenes_by_severity,
     top_scenes_by_decisions,
 )
+from core.analytics.rolling import SceneAggregateStore
 
 BASE_API_URL = "http://127.0.0.1:8000"  # UI/배포 시 ENV로 교체 가능
 
@@ -66,7 +67,32 @@ def build_weekly_insight_card(
     evidence_per_scene: int = 10,
 ) -> InsightCard:
     r = rollup_weekly(scene_summaries, days=days)
+    top_sev = top_scenes_by_severity(scene_summaries, k=5)
+    top_dec = top_scenes_by_decisions(scene_summaries, k=5)
+    return _assemble_card(r, top_sev, top_dec, days, scene_to_snapshot_ids, evidence_per_scene)
+
 
+def build_weekly_insight_card_from_store(
+    store: SceneAggregateStore,
+    days: int = 7,
+    scene_to_snapshot_ids: Optional[Dict[str, List[str]]] = None,
+    evidence_per_scene: int = 10,
+) -> InsightCard:
+    """Same card as build_weekly_insight_card, served from the rolling day buckets."""
+    r = store.rollup(days=days)
+    top_sev = store.top_by_severity(k=5)
+    top_dec = store.top_by_decisions(k=5)
+    return _assemble_card(r, top_sev, top_dec, days, scene_to_snapshot_ids, evidence_per_scene)
+
+
+def _assemble_card(
+    r: WeeklyRollup,
+    top_sev: List[dict],
+    top_dec: List[dict],
+    days: int,
+    scene_to_snapshot_ids: Optional[Dict[str, List[str]]],
+    evidence_per_scene: int,
+) -> InsightCard:
     if scene_to_snapshot_ids is None:
         scene_to_snapshot_ids = {}
 
@@ -84,9 +110,6 @@ def build_weekly_insight_card(
             "audit_snapshots": f"{BASE_API_URL}/v1/audit/snapshots/by_scene/{sid}",
         }
 
-    top_sev = top_scenes_by_severity(scene_summaries, k=5)
-    top_dec = top_scenes_by_decisions(scene_summaries, k=5)
-
     if r.total_scenes == 0:
         bullets.append("No closed scenes in this window.")
         return InsightCard(
@@ -0,0 +1,423 @@
+from __future__ import annotations
+
+import heapq
+import json
+import os
+import threading
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from core.analytics import weekly
+from core.analytics.weekly import WeeklyRollup, _parse_iso, _sev_rank
+
+# Bounded top-k capacity kept per day bucket.
+# Callers (insight cards) ask for k=5; anything above this must use the batch functions.
+DEFAULT_TOP_K = 10
+
+_SEV_KEYS = ("low", "medium", "high", "critical")
+_SAMPLE_TAIL = 10
+_TOP_CODES = 10
+
+
+class _SceneRow(NamedTuple):
+    """
+    Compact per-scene projection of one scene_summaries.jsonl line.
+    seq is the append position; it reproduces the file order the batch functions rely on.
+    """
+    seq: int
+    dt_end: Optional[datetime]
+    channel: Any          # rollup_weekly: context.get("channel", "unknown")
+    ctx_channel: Any      # explainability: context.get("channel")
+    peak: str
+    td_raw: Any
+    td_float: Optional[float]
+    td_key: float         # top-k ordering: td_float, non-numeric/NaN -> -inf (always comparable)
+    rationale_codes: Tuple[str, ...]
+    childcare_human: bool
+    scene_id: Any
+    ts_end: Any
+
+
+def _to_row(seq: int, s: dict) -> _SceneRow:
+    ctx = s.get("context", {}) or {}
+    ctx2 = s.get("context") or {}
+
+    dt_end: Optional[datetime] = None
+    ts_end = s.get("ts_end")
+    if ts_end:
+        try:
+            dt_end = _parse_iso(ts_end)
+        except Exception:
+            dt_end = None
+        # naive timestamps cannot be placed on the UTC window; treat as undated
+        if dt_end is not None and dt_end.tzinfo is None:
+            dt_end = None
+
+    td_raw = s.get("total_decisions") or 0
+    try:
+        td_float: Optional[float] = float(td_raw)
+    except Exception:
+        td_float = None
+    td_key = td_float if td_float is not None and td_float == td_float else float("-inf")
+
+    rcs = s.get("key_rationale_codes") or []
+    return _SceneRow(
+        seq=seq,
+        dt_end=dt_end,
+        channel=ctx.get("channel", "unknown"),
+        ctx_channel=ctx2.get("channel"),
+        peak=(s.get("peak_severity") or "unknown"),
+        td_raw=td_raw,
+        td_float=td_float,
+        td_key=td_key,
+        rationale_codes=tuple(rc for rc in rcs if isinstance(rc, str)),
+        childcare_human="CHILDCARE_HUMAN_REVIEW_REQUIRED" in set(rcs),
+        scene_id=s.get("scene_id"),
+        ts_end=ts_end,
+    )
+
+
+class DayBucket:
+    """
+    Aggregates for one UTC day of closed scenes.
+    - counters are mergeable (sum + earliest seq for first-seen ordering)
+    - top-k heaps are bounded min-heaps keyed like the batch sort (ties -> earlier seq wins),
+      on the numeric total_decisions so that mixed-type feeds never break ingest
+    """
+
+    def __init__(self, top_k: int = DEFAULT_TOP_K) -> None:
+        self.top_k = top_k
+        self.rows: List[_SceneRow] = []
+
+        self.total = 0
+        self.by_channel: Dict[Any, List[int]] = {}       # ch -> [count, first_seq]
+        self.severity: Dict[str, int] = {k: 0 for k in _SEV_KEYS}
+        self.td_sum = 0.0
+        self.rationale: Dict[str, List[int]] = {}        # code -> [count, first_seq]
+        self.childcare_total = 0
+        self.childcare_human = 0
+        self.tail: List[Tuple[int, Any]] = []            # last N (seq, scene_id)
+
+        self.top_sev: List[Tuple[Tuple[int, Any], int, dict]] = []
+        self.top_dec: List[Tuple[Any, int, dict]] = []
+
+    def add(self, r: _SceneRow) -> None:
+        self.rows.append(r)
+        self._count(r)
+        self._rank(r)
+
+    def _count(self, r: _SceneRow) -> None:
+        self.total += 1
+
+        c = self.by_channel.get(r.channel)
+        if c is None:
+            self.by_channel[r.channel] = [1, r.seq]
+        else:
+            c[0] += 1
+            c[1] = min(c[1], r.seq)
+
+        if r.peak in self.severity:
+            self.severity[r.peak] += 1
+
+        if r.td_float is not None:
+            self.td_sum += r.td_float
+
+        for rc in r.rationale_codes:
+            c = self.rationale.get(rc)
+            if c is None:
+                self.rationale[rc] = [1, r.seq]
+            else:
+                c[0] += 1
+                c[1] = min(c[1], r.seq)
+
+        if r.channel == "childcare":
+            self.childcare_total += 1
+            if r.childcare_human:
+                self.childcare_human += 1
+
+        # rows arrive in seq order, so the tail stays sorted
+        self.tail.append((r.seq, r.scene_id))
+        if len(self.tail) > _SAMPLE_TAIL:
+            del self.tail[0]
+
+    def _rank(self, r: _SceneRow) -> None:
+        if not r.scene_id:
+            return
+        sev_item = {
+            "scene_id": r.scene_id,
+            "channel": r.ctx_channel,
+            "peak_severity": r.peak,
+            "total_decisions": r.td_raw,
+            "ts_end": r.ts_end,
+        }
+        _push_bounded(self.top_sev, ((_sev_rank(r.peak), r.td_key), -r.seq, sev_item), self.top_k)
+
+        dec_item = {
+            "scene_id": r.scene_id,
+            "channel": r.ctx_channel,
+            "total_decisions": r.td_raw,
+            "peak_severity": r.peak,
+            "ts_end": r.ts_end,
+        }
+        _push_bounded(self.top_dec, (r.td_key, -r.seq, dec_item), self.top_k)
+
+    def filtered(self, start: datetime, end: datetime) -> "DayBucket":
+        """Sub-bucket for a partially covered day (window edges)."""
+        b = DayBucket(top_k=self.top_k)
+        for r in self.rows:
+            if r.dt_end is not None and start <= r.dt_end <= end:
+                b._count(r)
+        return b
+
+
+def _push_bounded(heap: list, entry: tuple, k: int) -> None:
+    if len(heap) < k:
+        heapq.heappush(heap, entry)
+    elif entry[:2] > heap[0][:2]:
+        heapq.heapreplace(heap, entry)
+
+
+def _merge_top(heaps: Iterable[list], k: int) -> List[dict]:
+    merged = heapq.nlargest(k, (e for h in heaps for e in h), key=lambda e: e[:2])
+    return [dict(e[2]) for e in merged]
+
+
+class SceneAggregateStore:
+    """
+    Streaming per-day aggregates over scene summaries.
+
+    Append-only, like the L2 JSONL it mirrors:
+      - append(summary) updates exactly one day bucket
+      - rollup(days) merges the covered buckets (edge days are re-filtered per row)
+      - top_* merge the bounded per-bucket heaps
+
+    Results are identical to rollup_weekly / top_scenes_by_* on the same input order.
+    top_* rank total_decisions numerically (non-numeric values last), where the
+    batch sort would raise on a feed mixing numbers and strings.
+    Scenes without a usable tz-aware ts_end live in an undated bucket: they never
+    enter a rollup window but still compete in the top-k lists (as in the batch path).
+    """
+
+    def __init__(self, top_k: int = DEFAULT_TOP_K) -> None:
+        self.top_k = top_k
+        self._buckets: Dict[date, DayBucket] = {}
+        self._undated = DayBucket(top_k=top_k)
+        self._seq = 0
+        self._lock = threading.RLock()
+
+        # JSONL tail state (see refresh)
+        self.path: Optional[str] = None
+        self._offset = 0
+        self._ino: Optional[int] = None
+
+    # ---- ingest ----
+    def append(self, summary: dict) -> None:
+        with self._lock:
+            r = _to_row(self._seq, summary)
+            self._seq += 1
+            if r.dt_end is None:
+                self._undated.add(r)
+                return
+            day = r.dt_end.astimezone(timezone.utc).date()
+            b = self._buckets.get(day)
+            if b is None:
+                b = DayBucket(top_k=self.top_k)
+                self._buckets[day] = b
+            b.add(r)
+
+    def extend(self, summaries: Iterable[dict]) -> None:
+        for s in summaries:
+            self.append(s)
+
+    @classmethod
+    def from_jsonl(cls, path: str, top_k: int = DEFAULT_TOP_K) -> "SceneAggregateStore":
+        st = cls(top_k=top_k)
+        st.path = path
+        st.refresh()
+        return st
+
+    def refresh(self) -> int:
+        """
+        Consume lines appended to self.path since the last call.
+        Rebuilds from scratch if the file was truncated or replaced.
+        Returns the number of summaries ingested.
+        """
+        if not self.path:
+            return 0
+        with self._lock:
+            try:
+                stat = os.stat(self.path)
+            except FileNotFoundError:
+                return 0
+            if stat.st_size < self._offset or (self._ino is not None and stat.st_ino != self._ino):
+                self._reset()
+            self._ino = stat.st_ino
+            if stat.st_size == self._offset:
+                return 0
+
+            with open(self.path, "rb") as f:
+                f.seek(self._offset)
+                chunk = f.read()
+
+            # the offset moves past each line before it is ingested: a line whose
+            # append raises is consumed once, never re-ingested by later refreshes
+            base = self._offset
+            n = 0
+            pos = 0
+            while pos < len(chunk):
+                nl = chunk.find(b"\n", pos)
+                if nl < 0:
+                    # trailing line without newline: consume only if complete JSON
+                    # (a writer may be mid-append)
+                    obj = _parse_line(chunk[pos:])
+                    if obj is _PARTIAL:
+                        break
+                    pos = len(chunk)
+                else:
+                    obj = _parse_line(chunk[pos:nl])
+                    pos = nl + 1
+                self._offset = base + pos
+                if obj is not None and obj is not _PARTIAL:
+                    self.append(obj)
+                    n += 1
+            return n
+
+    def _reset(self) -> None:
+        self._buckets = {}
+        self._undated = DayBucket(top_k=self.top_k)
+        self._seq = 0
+        self._offset = 0
+        self._ino = None
+
+    # ---- queries ----
+    def __len__(self) -> int:
+        return self._seq
+
+    def days(self) -> List[date]:
+        return sorted(self._buckets)
+
+    def rollup(self, days: int = 7, now: Optional[datetime] = None) -> WeeklyRollup:
+        """Equivalent to rollup_weekly(all_summaries, days) evaluated at `now`."""
+        with self._lock:
+            # same clock as rollup_weekly
+            now = now or weekly._now_utc()
+            start = now - timedelta(days=days)
+            d0 = start.astimezone(timezone.utc).date()
+            d1 = now.astimezone(timezone.utc).date()
+
+            parts: List[DayBucket] = []
+            for day, b in self._buckets.items():
+                if day < d0 or day > d1:
+                    continue
+                if day == d0 or day == d1:
+                    parts.append(b.filtered(start, now))
+                else:
+                    parts.append(b)
+            return _merge_rollup(parts, start=start, now=now, days=days)
+
+    def top_by_severity(self, k: int = 5) -> List[dict]:
+        """Equivalent to top_scenes_by_severity(all_summaries, k)."""
+        self._check_k(k)
+        with self._lock:
+            return _merge_top(self._heaps("top_sev"), k)
+
+    def top_by_decisions(self, k: int = 5) -> List[dict]:
+        """Equivalent to top_scenes_by_decisions(all_summaries, k)."""
+        self._check_k(k)
+        with self._lock:
+            return _merge_top(self._heaps("top_dec"), k)
+
+    def _heaps(self, attr: str) -> List[list]:
+        return [getattr(b, attr) for b in self._buckets.values()] + [getattr(self._undated, attr)]
+
+    def _check_k(self, k: int) -> None:
+        if k > self.top_k:
+            raise ValueError(f"k={k} exceeds store top_k={self.top_k}")
+
+
+_PARTIAL = object()
+
+
+def _parse_line(raw: bytes) -> Any:
+    ln = raw.decode("utf-8", errors="replace").strip()
+    if not ln:
+        return None
+    try:
+        return json.loads(ln)
+    except Exception:
+        return _PARTIAL
+
+
+def _merge_rollup(parts: List[DayBucket], start: datetime, now: datetime, days: int) -> WeeklyRollup:
+    total = 0
+    td_sum = 0.0
+    by_channel: Dict[Any, List[int]] = {}
+    sev_dist: Dict[str, int] = {k: 0 for k in _SEV_KEYS}
+    rationale: Dict[str, List[int]] = {}
+    childcare_total = 0
+    childcare_human = 0
+    tail: List[Tuple[int, Any]] = []
+
+    for b in parts:
+        total += b.total
+        td_sum += b.td_sum
+        for ch, (cnt, first) in b.by_channel.items():
+            _merge_counter(by_channel, ch, cnt, first)
+        for k in _SEV_KEYS:
+            sev_dist[k] += b.severity[k]
+        for rc, (cnt, first) in b.rationale.items():
+            _merge_counter(rationale, rc, cnt, first)
+        childcare_total += b.childcare_total
+        childcare_human += b.childcare_human
+        tail.extend(b.tail)
+
+    # first-seen order == dict insertion order of the batch loop
+    by_channel_out = {ch: v[0] for ch, v in sorted(by_channel.items(), key=lambda x: x[1][1])}
+    codes_in_order = [(rc, v[0]) for rc, v in sorted(rationale.items(), key=lambda x: x[1][1])]
+    top_codes = sorted(codes_in_order, key=lambda x: x[1], reverse=True)[:_TOP_CODES]
+
+    avg = (td_sum / total) if total else 0.0
+    ratio = (childcare_human / childcare_total) if childcare_total > 0 else None
+
+    tail.sort()
+    sample_ids = [sid for _, sid in tail[-_SAMPLE_TAIL:] if sid]
+
+    return WeeklyRollup(
+        window_start=start.isoformat(),
+        window_end=now.isoformat(),
+        days=days,
+        total_scenes=total,
+        by_channel=by_channel_out,
+        severity_distribution=sev_dist,
+        avg_decisions_per_scene=round(avg, 4),
+        top_rationale_codes=top_codes,
+        childcare_human_review_ratio=(round(ratio, 4) if ratio is not None else None),
+        sample_scene_ids=sample_ids,
+    )
+
+
+def _merge_counter(acc: Dict[Any, List[int]], key: Any, cnt: int, first: int) -> None:
+    c = acc.get(key)
+    if c is None:
+        acc[key] = [cnt, first]
+    else:
+        c[0] += cnt
+        c[1] = min(c[1], first)
+
+
+# ---- process-wide stores for API routes / jobs (one per JSONL path) ----
+_STORES: Dict[str, SceneAggregateStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_scene_aggregate_store(path: str) -> SceneAggregateStore:
+    """Return the cached store for `path`, tailing any lines appended since last use."""
+    key = os.path.abspath(path)
+    with _STORES_LOCK:
+        st = _STORES.get(key)
+        if st is None:
+            st = SceneAggregateStore()
+            st.path = key
+            _STORES[key] = st
+    st.refresh()
+    return st
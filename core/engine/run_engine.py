@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, List
+from functools import lru_cache
+from typing import Any, Callable, Iterable, List, Optional
 
 from adapters.prelude_adapter import (
 
@@ -19,11 +20,12 @@ from core.engine.recommendations_v0_1 import make_recommendations_v0_1
 from core.policy.policy_v0_2 import compute_policy_v0_2
 from core.policy.policy_v0_3 import compute_policy_v0_3
 
-# policy memory (process-wide, smoke/local)
-from core.policy.memory.in_memory import InMemoryPolicyMemory
-from core.policy.memory.ports import PolicyMemoryKey
+# policy memory (process-wide; META_POLICY_MEMORY=sqlite:<path> → durable/shared, 기본은 in-memory)
+from core.policy.memory.factory import policy_memory_from_env
+from core.policy.memory.ports import PolicyMemoryConflict, PolicyMemoryKey, PolicyMemoryPort
 
-_POLICY_MEMORY = InMemoryPolicyMemory()
+_POLICY_MEMORY = policy_memory_from_env()
+_CAS_MAX_ATTEMPTS = 16
 
 _SEVERITY_RANK = {
     Severity.LOW: 0,
@@ -37,53 +39,79 @@ def _max_severity(a: Severity, b: Severity) -> Severity:
 
 import inspect
 
+@lru_cache(maxsize=None)
+def _policy_caller(fn) -> Callable[..., Any]:
+    """fn의 signature를 한 번만 읽어, 받을 수 있는 키만 골라 호출하는 adapter를 만든다"""
+    params = frozenset(inspect.signature(fn).parameters)
+
+    def call(**candidates):
+        return fn(**{k: v for k, v in candidates.items() if k in params})
+
+    return call
+
+@lru_cache(maxsize=None)
+def _is_versioned(memory_type: type) -> bool:
+    """runtime Protocol isinstance는 매번 attribute를 훑으므로 type별로 한 번만 판정"""
+    return all(callable(getattr(memory_type, m, None)) for m in ("load_versioned", "compare_and_set"))
+
 def _call_policy(fn, **candidates):
     """정확한 인자명이 뭐든 간에, signature에 있는 키만 골라 호출"""
-    params = inspect.signature(fn).parameters
-    kwargs = {k: v for k, v in candidates.items() if k in params}
-    return fn(**kwargs)
-
-def run_engine(prelude_output: Any, *, strict: bool = True) -> EngineOutput:
-    # 1) Adapter: prelude output -> EngineInput
-    inp = adapt_prelude_output_to_engine_input(prelude_output, strict=strict)
-    # 2) Minimal base output (prelude 기반)
-    base = make_minimal_engine_output(inp)
-    # 3) emotion_os signals
-    emotion_signals: List[EngineSignal] = emit_emotion_signals(inp)
-    # 4) signals 결합 (frozen 대응: 새 리스트)
-    merged_signals: List[EngineSignal] = list(base.signals) + emotion_signals
-    # 5) (기존 bump 로직 유지) emotion high-risk 신호가 있으면 severity 상향
-    bump = any(
-        (s.type == SignalType.EMOTION) and (s.severity in (Severity.HIGH, Severity.CRITICAL))
-        for s in emotion_signals
+    return _policy_caller(fn)(**candidates)
+
+def run_engine(
+    prelude_output: Any,
+    *,
+    strict: bool = True,
+    memory: Optional[PolicyMemoryPort] = None,
+) -> EngineOutput:
+    """prelude output 하나를 처리한다. memory를 주지 않으면 process-wide _POLICY_MEMORY를 쓴다."""
+    return _run_one(
+        prelude_output,
+        strict=strict,
+        memory=_POLICY_MEMORY if memory is None else memory,
+        policy_v0_3=_policy_caller(compute_policy_v0_3),
+        policy_v0_2=_policy_caller(compute_policy_v0_2),
     )
-    new_decision = base.decision
-    if bump:
-        new_decision = EngineDecision(
-            mode=base.decision.mode,  # v0.1: mode는 아직 prelude 기반 유지
-            severity=_max_severity(base.decision.severity, Severity.HIGH),
-            rationale=base.decision.rationale + ["emotion_os detected high-risk pattern"],
-        )
-    # 6) ✅ v0.1 policy가 최종 결정을 한다 (override 가능)
-    # 7) ✅ recommendations 생성
-    # 8) ✅ scene_state v0.1 생성 (UI/Orchestrator에 바로 쓸 요약 상태)
+
+def run_engine_batch(
+    prelude_outputs: Iterable[Any],
+    *,
+    strict: bool = True,
+    memory: Optional[PolicyMemoryPort] = None,
+) -> List[EngineOutput]:
+    """
+    prelude output 여러 개를 입력 순서대로 한 번에 처리한다.
+    - policy call adapter는 batch 시작 시 한 번만 resolve
+    - policy memory는 item마다 load → save (다음 item이 이전 item의 scene_state를 본다)
+      → 같은 순서로 run_engine을 반복 호출한 결과와 동일
+    """
+    mem = _POLICY_MEMORY if memory is None else memory
+    policy_v0_3 = _policy_caller(compute_policy_v0_3)
+    policy_v0_2 = _policy_caller(compute_policy_v0_2)
+    return [
+        _run_one(p, strict=strict, memory=mem, policy_v0_3=policy_v0_3, policy_v0_2=policy_v0_2)
+        for p in prelude_outputs
+    ]
+
+def _apply_policies(
+    inp: Any,
+    decision: EngineDecision,
+    merged_signals: List[EngineSignal],
+    prev_state: Optional[dict],
+    policy_v0_3: Callable[..., Any],
+    policy_v0_2: Callable[..., Any],
+):
+    """prev_state → (decision, scene_state). memory와 무관한 순수 계산이라 CAS 충돌 시 그대로 다시 부른다."""
     scene_state = build_scene_state_v0_2(inp, merged_signals)
-    # --- Policy v0.3 with Memory (load → apply → save) ---
-    mem_key = PolicyMemoryKey(
-        org_id=inp.meta.org_id,
-        site_id=inp.meta.site_id,
-        channel=inp.meta.channel or "unknown",
-    )
-    prev_state = _POLICY_MEMORY.load_last_scene_state(mem_key)
-    pol3 = compute_policy_v0_3(
+    pol3 = policy_v0_3(
         channel=inp.meta.channel,
-        current_decision=new_decision,
+        current_decision=decision,
         signals=merged_signals,
         prev_scene_state=prev_state,
         now_ts_iso=inp.meta.ts_end_iso,
     )
     # decision update (if changed)
-    new_decision = pol3.decision
+    decision = pol3.decision
     # temporal merge
     try:
         scene_state["temporal"] = {
@@ -92,19 +120,17 @@ def run_engine(prelude_output: Any, *, strict: bool = True) -> EngineOutput:
         }
     except Exception:
         pass
-    # save for next window
-    _POLICY_MEMORY.save_scene_state(mem_key, scene_state)
     # --- Policy v0.2 (PURE) : accumulation / cooldown scaffold ---
     # prev_scene_state는 아직 메모리 레이어가 없으므로 None (smoke에서는 temporal이 초기값으로 시작)
-    pol2 = compute_policy_v0_2(
+    pol2 = policy_v0_2(
         channel=inp.meta.channel,
-        current_decision=new_decision,
+        current_decision=decision,
         signals=merged_signals,
         prev_scene_state=None,
         now_ts_iso=inp.meta.ts_end_iso,
     )
     # decision severity bump (if any)
-    new_decision = pol2.decision
+    decision = pol2.decision
     # scene_state.temporal patch (merge)
     try:
         scene_state["temporal"] = {
@@ -114,6 +140,63 @@ def run_engine(prelude_output: Any, *, strict: bool = True) -> EngineOutput:
     except Exception:
         # fail-safe: never break engine for temporal enrichment
         pass
+    # v0.2 patch까지 반영된 최종 scene_state가 저장 대상
+    return decision, scene_state
+
+def _run_one(
+    prelude_output: Any,
+    *,
+    strict: bool,
+    memory: PolicyMemoryPort,
+    policy_v0_3: Callable[..., Any],
+    policy_v0_2: Callable[..., Any],
+) -> EngineOutput:
+    # 1) Adapter: prelude output -> EngineInput
+    inp = adapt_prelude_output_to_engine_input(prelude_output, strict=strict)
+    # 2) Minimal base output (prelude 기반)
+    base = make_minimal_engine_output(inp)
+    # 3) emotion_os signals
+    emotion_signals: List[EngineSignal] = emit_emotion_signals(inp)
+    # 4) signals 결합 (frozen 대응: 새 리스트)
+    merged_signals: List[EngineSignal] = list(base.signals) + emotion_signals
+    # 5) (기존 bump 로직 유지) emotion high-risk 신호가 있으면 severity 상향
+    bump = any(
+        (s.type == SignalType.EMOTION) and (s.severity in (Severity.HIGH, Severity.CRITICAL))
+        for s in emotion_signals
+    )
+    base_decision = base.decision
+    if bump:
+        base_decision = EngineDecision(
+            mode=base.decision.mode,  # v0.1: mode는 아직 prelude 기반 유지
+            severity=_max_severity(base.decision.severity, Severity.HIGH),
+            rationale=base.decision.rationale + ["emotion_os detected high-risk pattern"],
+        )
+    # 6) ✅ v0.1 policy가 최종 결정을 한다 (override 가능)
+    # 7) ✅ recommendations 생성
+    # 8) ✅ scene_state v0.1 생성 (UI/Orchestrator에 바로 쓸 요약 상태)
+    # --- Policy v0.3 with Memory (load → apply → save) ---
+    mem_key = PolicyMemoryKey(
+        org_id=inp.meta.org_id,
+        site_id=inp.meta.site_id,
+        channel=inp.meta.channel or "unknown",
+    )
+    if _is_versioned(type(memory)):
+        # versioned backend: compare_and_set, 다른 writer가 먼저 저장했으면 새 prev_state로 다시 계산
+        for _ in range(_CAS_MAX_ATTEMPTS):
+            version, prev_state = memory.load_versioned(mem_key)
+            new_decision, scene_state = _apply_policies(
+                inp, base_decision, merged_signals, prev_state, policy_v0_3, policy_v0_2
+            )
+            if memory.compare_and_set(mem_key, version, scene_state):
+                break
+        else:
+            raise PolicyMemoryConflict(f"policy memory busy after {_CAS_MAX_ATTEMPTS} attempts: {mem_key}")
+    else:
+        prev_state = memory.load_last_scene_state(mem_key)
+        new_decision, scene_state = _apply_policies(
+            inp, base_decision, merged_signals, prev_state, policy_v0_3, policy_v0_2
+        )
+        memory.save_scene_state(mem_key, scene_state)
     # 9) EngineOutput 재구성 (frozen 대응)
         # --- safety: ensure final_decision is always defined ---
     try:
@@ -7,7 +7,7 @@ from pathlib import Path
 from typing import Optional, Sequence, Any
 
 from core.adapters.mock_adapter import AdapterError
-from core.adapters.registry import AdapterRegistryError, resolve_adapter
+from core.adapters.registry import AdapterRegistryError, default_registry, resolve_adapter
 from core.contracts.actions import ExecutionAction
 from core.contracts.errors import (
     ContractMalformedError,
@@ -135,8 +135,10 @@ def run_shadow_adapter(*, adapter_name: str | None, request: dict[str, Any]) ->
     try:
         response = adapter.call(request)
     except AdapterError as exc:
+        default_registry().record_failure(adapter_name, exc)
         emit_shadow_observation(outcome="deny", reason_code="ADAPTER_CALL_FAILED", adapter_name=adapter_name)
         raise ShadowAdapterError(f"adapter call failed: {exc}") from exc
+    default_registry().record_success(adapter_name)
 
     if not isinstance(response, dict):
         emit_shadow_observation(outcome="deny", reason_code="RESPONSE_TYPE_MISMATCH", adapter_name=adapter_name)
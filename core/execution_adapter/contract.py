@@ -58,6 +58,15 @@ class ApprovalArtifact:
         return exp <= now_dt
 
 
+@dataclass(frozen=True)
+class ExecutionRequestArtifact:
+    """
+    Execution request as read by validator.validate_execution_preconditions
+    (only `evidence` is consulted; dicts with the same key are accepted too).
+    """
+    evidence: List[str]
+
+
 @dataclass(frozen=True)
 class ExecutionEnvelope:
     """
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, Sequence
+from typing import Any, Collection, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
 
 from .contract import (
     ApprovalArtifact,
@@ -51,3 +52,83 @@ def validate_execution_preconditions(
         return ExecutionBlocked("MISSING_EVIDENCE", "execution evidence required")
 
     return ExecutionAllowed()
+
+
+# ---- batch form ----
+
+_ALLOWED = ExecutionAllowed()  # frozen: one shared instance per batch result is safe
+
+
+class _ApprovalRecord(NamedTuple):
+    approval: Any  # kept so the id() cache key cannot be reused within a batch
+    block: Optional[Tuple[str, str]]  # (reason_code, reason_detail) decided by the approval alone
+
+
+@dataclass(frozen=True)
+class BatchValidation:
+    decisions: List[ExecutionDecision]
+    allowed: int = 0
+    blocked_by_reason: Dict[str, int] = field(default_factory=dict)
+
+
+def _capability_set(caps: Any) -> Collection[Any]:
+    # set lookup when that cannot change `in` semantics (str items); anything else is probed as given
+    if isinstance(caps, (list, tuple, set, frozenset)) and all(type(c) is str for c in caps):
+        return frozenset(caps)
+    return caps
+
+
+def _approval_record(approval: Any, now_utc: datetime, required_capability: str) -> _ApprovalRecord:
+    # same checks, same order as validate_execution_preconditions
+    if approval is None:
+        return _ApprovalRecord(approval, ("MISSING_APPROVAL", "no approval record present"))
+    expires_at = _get(approval, "expires_at")
+    if expires_at is None:
+        return _ApprovalRecord(approval, ("INVALID_APPROVAL", "approval missing expires_at"))
+    if not isinstance(expires_at, datetime):
+        return _ApprovalRecord(approval, ("INVALID_APPROVAL", "expires_at must be datetime"))
+    if expires_at < now_utc:
+        return _ApprovalRecord(approval, ("APPROVAL_EXPIRED", "approval expired"))
+    caps = _capability_set(_get(approval, "capabilities", []) or [])
+    if required_capability not in caps:
+        return _ApprovalRecord(
+            approval,
+            ("CAPABILITY_MISSING", f"required capability '{required_capability}' not granted"),
+        )
+    return _ApprovalRecord(approval, None)
+
+
+def validate_execution_preconditions_batch(
+    pairs: Iterable[Tuple[Any, Any]],
+    *,
+    now_utc: datetime,
+    required_capability: str,
+) -> BatchValidation:
+    """
+    validate_execution_preconditions over many (execution_request, approval) pairs.
+
+    Each distinct approval object is normalized once into a record (now_utc and
+    required_capability are fixed for the batch); requests only contribute the
+    evidence check. decisions[i] equals the single-call decision for pairs[i];
+    an error the single call would raise (e.g. naive vs aware expires_at) is raised.
+    """
+    records: Dict[int, _ApprovalRecord] = {}
+    decisions: List[ExecutionDecision] = []
+    append = decisions.append
+    blocked: Dict[str, int] = {}
+    allowed = 0
+    for request, approval in pairs:
+        rec = records.get(id(approval))
+        if rec is None or rec.approval is not approval:
+            rec = records[id(approval)] = _approval_record(approval, now_utc, required_capability)
+        block = rec.block
+        if block is None:
+            evidence = request.get("evidence") if type(request) is dict else _get(request, "evidence")
+            if evidence:
+                append(_ALLOWED)
+                allowed += 1
+                continue
+            block = ("MISSING_EVIDENCE", "execution evidence required")
+        append(ExecutionBlocked(*block))
+        blocked[block[0]] = blocked.get(block[0], 0) + 1
+    return BatchValidation(decisions, allowed, blocked)
@@ -13,7 +13,7 @@ from .proposal_schema import PolicyProposal
 from .proposal_validator import validate_proposal_prequeue
 from .human_gate import evaluate_human_gate
 from .queue_outcomes import QueueOutcome, QueueResult
-from .queue_evaluator import QueueDeps, evaluate_proposal_constitutional
+from .queue_evaluator import QueueDeps, evaluate_proposal_constitutional, evaluate_proposals_constitutional
 
 __all__ = [
     "OP_CANON_VERSION",
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Callable, Optional, Tuple
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
 
 from .queue_outcomes import QueueOutcome, QueueResult
 from .proposal_schema import PolicyProposal
@@ -32,11 +32,63 @@ def evaluate_proposal_constitutional(
     3) mismatch
     4) apply or skip
     """
-    policy_hash_before = deps.get_current_policy_hash()
+    return _evaluate(
+        proposal,
+        deps.get_current_policy_hash(),
+        is_noop=deps.is_noop,
+        baseline_applied=deps.has_policy_hash_been_applied,
+        apply_patch=deps.apply_patch,
+    )
+
+
+def evaluate_proposals_constitutional(
+    proposals: Sequence[PolicyProposal],
+    *,
+    deps: QueueDeps,
+    applied_policy_hashes: Iterable[str],
+) -> List[QueueOutcome]:
+    """
+    Batch form of evaluate_proposal_constitutional for an ordered queue.
+
+    Same QueueOutcome sequence as evaluating the proposals one at a time, in order,
+    against a queue whose applied-hash set is `applied_policy_hashes`:
+    - the current policy hash is read once, then carried forward
+      (policy_hash_after of each outcome becomes the next policy_hash_before)
+    - the applied-hash set is snapshotted once; an APPLIED proposal adds its
+      baseline hash (what makes a later proposal on that baseline a DUPLICATE)
+    - is_noop / apply_patch are still called per proposal, in the same order;
+      has_policy_hash_been_applied is not called
+    """
+    applied = set(applied_policy_hashes)
+    current = deps.get_current_policy_hash()
+    outcomes: List[QueueOutcome] = []
+    for proposal in proposals:
+        out = _evaluate(
+            proposal,
+            current,
+            is_noop=deps.is_noop,
+            baseline_applied=applied.__contains__,
+            apply_patch=deps.apply_patch,
+        )
+        if out.result is QueueResult.APPLIED:
+            applied.add(out.baseline_policy_hash)
+        current = out.policy_hash_after
+        outcomes.append(out)
+    return outcomes
+
+
+def _evaluate(
+    proposal: PolicyProposal,
+    policy_hash_before: str,
+    *,
+    is_noop: Callable[[PolicyProposal], bool],
+    baseline_applied: Callable[[str], bool],
+    apply_patch: Callable[[PolicyProposal], Tuple[bool, str, Optional[str], str]],
+) -> QueueOutcome:
     baseline = proposal.baseline.policy_hash
 
     # 1) NOOP
-    if deps.is_noop(proposal):
+    if is_noop(proposal):
         return QueueOutcome(
             proposal_id=proposal.proposal_id,
             baseline_policy_hash=baseline,
@@ -48,7 +100,7 @@ def evaluate_proposal_constitutional(
         )
 
     # 2) DUPLICATE
-    if deps.has_policy_hash_been_applied(baseline):
+    if baseline_applied(baseline):
         return QueueOutcome(
             proposal_id=proposal.proposal_id,
             baseline_policy_hash=baseline,
@@ -72,7 +124,7 @@ def evaluate_proposal_constitutional(
         )
 
     # 4) APPLY or SKIP
-    applied, policy_hash_after, applied_patch_id, reason_code = deps.apply_patch(proposal)
+    applied, policy_hash_after, applied_patch_id, reason_code = apply_patch(proposal)
 
     return QueueOutcome(
         proposal_id=proposal.proposal_id,
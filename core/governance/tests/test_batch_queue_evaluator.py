@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import hashlib
+import random
+
+from core.governance.proposal_schema import PolicyProposal
+from core.governance.queue_evaluator import (
+    QueueDeps,
+    evaluate_proposal_constitutional,
+    evaluate_proposals_constitutional,
+)
+from core.governance.tests.test_noop_duplicate_mismatch_order import _proposal_with_baseline
+
+
+class _Queue:
+    """In-memory queue: applying on the current hash records that baseline and moves the hash."""
+
+    def __init__(self, current: str, applied: set, noop_ids: set, skip_ids: set) -> None:
+        self.current = current
+        self.applied = set(applied)
+        self.noop_ids = noop_ids
+        self.skip_ids = skip_ids
+        self.calls: list = []
+
+    def deps(self) -> QueueDeps:
+        return QueueDeps(
+            get_current_policy_hash=self.get_current,
+            has_policy_hash_been_applied=self.has_applied,
+            apply_patch=self.apply,
+            is_noop=self.is_noop,
+        )
+
+    def get_current(self) -> str:
+        self.calls.append("current_hash")
+        return self.current
+
+    def has_applied(self, h: str) -> bool:
+        self.calls.append("duplicate")
+        return h in self.applied
+
+    def is_noop(self, p: PolicyProposal) -> bool:
+        self.calls.append(("noop", p.proposal_id))
+        return p.proposal_id in self.noop_ids
+
+    def apply(self, p: PolicyProposal):
+        self.calls.append(("apply", p.proposal_id))
+        if p.proposal_id in self.skip_ids:
+            return False, "", None, ""
+        before = self.current
+        self.applied.add(before)
+        self.current = hashlib.sha256(f"{before}:{p.proposal_id}".encode()).hexdigest()[:8]
+        return True, self.current, f"patch-{p.proposal_id}", "APPLIED"
+
+
+def _case(rng: random.Random):
+    template = _proposal_with_baseline("H0")
+    hashes = ["H0", "H1", "H2"]
+    proposals = []
+    for i in range(rng.randint(0, 25)):
+        # baselines drawn from a few fixed hashes plus hashes the queue will actually reach
+        p = template.model_copy(deep=True, update={"proposal_id": f"p{i}"})
+        p.baseline.policy_hash = rng.choice(hashes)
+        proposals.append(p)
+        hashes.append(hashlib.sha256(f"{rng.choice(hashes)}:p{rng.randrange(i + 1)}".encode()).hexdigest()[:8])
+    ids = [p.proposal_id for p in proposals]
+    noop_ids = {i for i in ids if rng.random() < 0.15}
+    skip_ids = {i for i in ids if rng.random() < 0.15}
+    applied = {h for h in ("H1", "H2") if rng.random() < 0.5}
+    return proposals, "H0", applied, noop_ids, skip_ids
+
+
+def test_batch_evaluator_matches_one_at_a_time_loop():
+    rng = random.Random(20261019)
+    seen = set()
+    for _ in range(500):
+        proposals, current, applied, noop_ids, skip_ids = _case(rng)
+
+        loop_q = _Queue(current, applied, noop_ids, skip_ids)
+        expected = [evaluate_proposal_constitutional(p, deps=loop_q.deps()) for p in proposals]
+
+        batch_q = _Queue(current, applied, noop_ids, skip_ids)
+        got = evaluate_proposals_constitutional(proposals, deps=batch_q.deps(), applied_policy_hashes=applied)
+
+        assert got == expected
+        assert (batch_q.current, batch_q.applied) == (loop_q.current, loop_q.applied)
+        # same noop / apply calls in the same order; current hash read once, no per-proposal duplicate probe
+        assert [c for c in batch_q.calls if c != "current_hash"] == [
+            c for c in loop_q.calls if c not in ("current_hash", "duplicate")
+        ]
+        assert batch_q.calls.count("current_hash") == 1 and "duplicate" not in batch_q.calls
+        seen.update(o.result.value for o in expected)
+    assert seen == {"NOOP", "DUPLICATE", "MISMATCH", "APPLIED", "SKIPPED"}
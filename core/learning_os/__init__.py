@@ -10,11 +10,11 @@ Learning may run continuously, but proposal emission is conditional and rate-lim
 """
 from .config import LearningCanonConfig
 from .observation_store import ObservationStore, Observation
-from .windowing import select_window
+from .windowing import ObservationWindow, select_window
 from .sampling import check_sample_sufficiency
-from .stability import StabilityResult, check_stability_v1
+from .stability import StabilityResult, StreamingStability, check_stability_v1
 from .evidence import EvidenceRef, EvidenceStore
-from .rate_limiter import RateLimiter, RateLimitDecision
+from .rate_limiter import RateLimiter, RateLimitDecision, TokenBucketRateLimiter
 from .proposal_builder import build_policy_proposal
 
 __all__ = [
@@ -22,13 +22,16 @@ __all__ = [
     "ObservationStore",
     "Observation",
     "select_window",
+    "ObservationWindow",
     "check_sample_sufficiency",
     "StabilityResult",
     "check_stability_v1",
+    "StreamingStability",
     "EvidenceRef",
     "EvidenceStore",
     "RateLimiter",
     "RateLimitDecision",
+    "TokenBucketRateLimiter",
     "build_policy_proposal",
 ]
 
@@ -1,5 +1,6 @@
+from collections import deque
 from dataclasses import dataclass
-from typing import Dict
+from typing import Deque, Dict, Set, Tuple
 import time
 
 @dataclass(frozen=True)
@@ -12,20 +13,77 @@ class RateLimiter:
     Simple deterministic limiter:
     - limit_x emissions per period_seconds
     - cooldown/rest are represented as additional blocks (v1: not fully time-parsed)
+
+    Sliding log per key (deque, in record order). While a key's timestamps are
+    non-decreasing, expired ones form a prefix and pruning pops from the left,
+    so each timestamp is dropped once (O(1) amortized). Once a `now` goes
+    backwards the key falls back to the full filter until its log empties.
     """
     def __init__(self, period_seconds: int, limit_x: int):
         self.period_seconds = period_seconds
         self.limit_x = limit_x
-        self._events: Dict[str, list] = {}  # key -> list of timestamps
+        self._events: Dict[str, Deque[float]] = {}  # key -> timestamps
+        self._unordered: Set[str] = set()  # keys whose log is not sorted
 
-    def check_and_record(self, key: str, now: float) -> RateLimitDecision:
-        ts = self._events.setdefault(key, [])
-        # prune
+    def _prune(self, key: str, now: float) -> Deque[float]:
+        ts = self._events.get(key)
+        if ts is None:
+            ts = self._events[key] = deque()
         cutoff = now - self.period_seconds
-        ts[:] = [t for t in ts if t >= cutoff]
+        if key not in self._unordered:
+            while ts and ts[0] < cutoff:
+                ts.popleft()
+        else:
+            ts = self._events[key] = deque(t for t in ts if t >= cutoff)
+            if not ts:
+                self._unordered.discard(key)
+        return ts
+
+    def check_and_record(self, key: str, now: float) -> RateLimitDecision:
+        ts = self._prune(key, now)
 
         if len(ts) >= self.limit_x:
             return RateLimitDecision(False, "RATE_LIMIT_EXCEEDED")
 
+        if ts and now < ts[-1]:
+            self._unordered.add(key)
         ts.append(now)
         return RateLimitDecision(True, "OK")
+
+    def allow(self, key: str, now: float) -> bool:
+        return self.check_and_record(key, now).allowed
+
+
+class TokenBucketRateLimiter:
+    """
+    Token bucket: capacity limit_x, refilled at limit_x / period_seconds per second.
+    O(1) time and memory per key (tokens, last refill ts).
+
+    Same long-run rate as RateLimiter but not the same decisions: a bucket
+    admits a partial burst as soon as tokens refill, the sliding log waits for
+    whole timestamps to leave the window. Use RateLimiter where emissions must
+    match the canon window exactly.
+    """
+    def __init__(self, period_seconds: float, limit_x: int):
+        if period_seconds <= 0 or limit_x <= 0:
+            raise ValueError("period_seconds and limit_x must be > 0")
+        self.period_seconds = period_seconds
+        self.limit_x = limit_x
+        self.rate = limit_x / period_seconds
+        self._buckets: Dict[str, Tuple[float, float]] = {}  # key -> (tokens, last ts)
+
+    def allow(self, key: str, now: float) -> bool:
+        tokens, last = self._buckets.get(key, (float(self.limit_x), now))
+        if now > last:
+            tokens = min(float(self.limit_x), tokens + (now - last) * self.rate)
+            last = now
+        if tokens >= 1.0:
+            self._buckets[key] = (tokens - 1.0, last)
+            return True
+        self._buckets[key] = (tokens, last)
+        return False
+
+    def check_and_record(self, key: str, now: float) -> RateLimitDecision:
+        if self.allow(key, now):
+            return RateLimitDecision(True, "OK")
+        return RateLimitDecision(False, "RATE_LIMIT_EXCEEDED")
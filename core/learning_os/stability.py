@@ -1,5 +1,6 @@
+from collections import deque
 from dataclasses import dataclass
-from typing import List
+from typing import Deque, Dict, List, Optional
 from .observation_store import Observation
 
 @dataclass(frozen=True)
@@ -38,3 +39,118 @@ def check_stability_v1(observations: List[Observation], *, k_confirmations: int,
     ok = k_ok and (disagreement_rate <= epsilon_max)
     summary = f"majority={majority}, tail={tail[-1] if tail else 'n/a'}, disagreement_rate={disagreement_rate:.3f}"
     return StabilityResult(ok, k_confirmations, epsilon_max, disagreement_rate, summary)
+
+
+class StreamingStability:
+    """
+    check_stability_v1 over a sliding window, updated per observation.
+
+    Pair with ObservationWindow (as a tracker) or call add()/evict() yourself —
+    evict() must be given the oldest observation still in the window.
+
+    - counts per direction + counts-of-counts → current max count in O(1)
+    - the majority on a tie is resolved the way max(set(dirs), key=dirs.count)
+      resolves it (set built in first-occurrence order), over the handful of
+      distinct directions only
+    - tail run length → K-confirmation check in O(1)
+    - flips: adjacent direction changes inside the window
+    result() equals check_stability_v1(window, ...) on the same window.
+    """
+
+    def __init__(self, *, k_confirmations: int, epsilon_max: float) -> None:
+        if k_confirmations <= 0:
+            raise ValueError("k_confirmations must be > 0")
+        self.k_confirmations = k_confirmations
+        self.epsilon_max = epsilon_max
+        self.n_observations = 0
+        self.flips = 0
+        self._dirs: Deque[str] = deque()
+        self._counts: Dict[str, int] = {}
+        self._count_freq: Dict[int, int] = {}
+        self._max_count = 0
+        # per direction: window positions (absolute sequence numbers), oldest first
+        self._positions: Dict[str, Deque[int]] = {}
+        self._seq = 0
+        self._run = 0
+
+    def _bump(self, c_old: int, c_new: int) -> None:
+        if c_old:
+            self._count_freq[c_old] -= 1
+            if not self._count_freq[c_old]:
+                del self._count_freq[c_old]
+        if c_new:
+            self._count_freq[c_new] = self._count_freq.get(c_new, 0) + 1
+        if c_new > self._max_count:
+            self._max_count = c_new
+        elif c_old == self._max_count and c_old not in self._count_freq:
+            self._max_count = c_new
+
+    def add(self, obs: Observation) -> None:
+        self.n_observations += 1
+        d = obs.direction
+        if not d:
+            return
+        if self._dirs:
+            if self._dirs[-1] == d:
+                self._run += 1
+            else:
+                self.flips += 1
+                self._run = 1
+        else:
+            self._run = 1
+        self._dirs.append(d)
+        c = self._counts.get(d, 0)
+        self._counts[d] = c + 1
+        self._bump(c, c + 1)
+        self._positions.setdefault(d, deque()).append(self._seq)
+        self._seq += 1
+
+    def evict(self, obs: Observation) -> None:
+        self.n_observations -= 1
+        if not obs.direction:
+            return
+        d = self._dirs.popleft()
+        if d != obs.direction:
+            raise ValueError("evict() must be given the oldest observation in the window")
+        if self._dirs and self._dirs[0] != d:
+            self.flips -= 1
+        self._run = min(self._run, len(self._dirs))
+        c = self._counts[d]
+        if c == 1:
+            del self._counts[d]
+            del self._positions[d]
+        else:
+            self._counts[d] = c - 1
+            self._positions[d].popleft()
+        self._bump(c, c - 1)
+
+    def majority(self) -> Optional[str]:
+        if not self._dirs:
+            return None
+        tied = [d for d, c in self._counts.items() if c == self._max_count]
+        if len(tied) == 1:
+            return tied[0]
+        # same tie-break as max(set(dirs), key=dirs.count): set iteration order
+        # of the distinct directions inserted in first-occurrence order
+        first_seen = sorted(self._counts, key=lambda x: self._positions[x][0])
+        counts = self._counts
+        return max(set(first_seen), key=counts.__getitem__)
+
+    def result(self) -> StabilityResult:
+        k, eps = self.k_confirmations, self.epsilon_max
+        if not self.n_observations:
+            return StabilityResult(False, k, eps, 1.0, "no observations")
+        n = len(self._dirs)
+        if not n:
+            return StabilityResult(False, k, eps, 1.0, "no valid direction signals")
+
+        majority = self.majority()
+        disagreement_rate = (n - self._max_count) / max(1, n)
+
+        has_tail = n >= k
+        last = self._dirs[-1]
+        k_ok = has_tail and self._run >= k and last != "neutral"
+
+        ok = k_ok and (disagreement_rate <= eps)
+        summary = f"majority={majority}, tail={last if has_tail else 'n/a'}, disagreement_rate={disagreement_rate:.3f}"
+        return StabilityResult(ok, k, eps, disagreement_rate, summary)
@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+from core.learning_os.observation_store import Observation
+from core.learning_os.rate_limiter import RateLimiter, TokenBucketRateLimiter
+from core.learning_os.stability import StreamingStability, check_stability_v1
+from core.learning_os.windowing import ObservationWindow, parse_duration, select_window
+
+DIRECTIONS = ["up", "down", "neutral", "", "flat", "x1", "x2"]
+
+
+def _stream(rng, n, n_dirs):
+    ts = 1000.0
+    out = []
+    for _ in range(n):
+        ts += rng.choice([0.0, 1.0, 5.0, 30.0])
+        out.append(Observation(ts=ts, direction=rng.choice(DIRECTIONS[:n_dirs])))
+    return out
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_streaming_window_and_stability_match_batch(seed):
+    rng = random.Random(seed)
+    obs = _stream(rng, 600, 3 + seed % 5)
+    k, eps = 1 + seed % 4, 0.35
+    for mode, kwargs in (("events", {"n_events": 1 + seed * 7}), ("time", {"t_window": "1m"})):
+        st = StreamingStability(k_confirmations=k, epsilon_max=eps)
+        win = ObservationWindow(mode=mode, trackers=[st], **kwargs)
+        for i, o in enumerate(obs):
+            win.push(o)
+            expected = select_window(obs[: i + 1], mode=mode, n_events=kwargs.get("n_events", 0), t_window=kwargs.get("t_window"))
+            assert win.items() == expected
+            assert st.result() == check_stability_v1(expected, k_confirmations=k, epsilon_max=eps)
+            dirs = [x.direction for x in expected if x.direction]
+            assert st.flips == sum(1 for a, b in zip(dirs, dirs[1:]) if a != b)
+
+
+def test_time_window_advance_and_order():
+    win = ObservationWindow(mode="time", t_window="10s")
+    for t in (0, 4, 8, 12):
+        win.push(Observation(ts=float(t), direction="up"))
+    assert [o.ts for o in win.items()] == [4.0, 8.0, 12.0]
+    win.advance(21.0)
+    assert [o.ts for o in win.items()] == [12.0]
+    with pytest.raises(ValueError):
+        win.push(Observation(ts=1.0, direction="up"))
+    assert parse_duration("7d") == 7 * 86400 and parse_duration(90) == 90.0
+    # no t_window: time mode keeps everything, like select_window
+    assert len(select_window(win.items(), mode="time", n_events=0)) == 1
+
+
+def test_rate_limiter_deque_matches_sliding_log():
+    rng = random.Random(3)
+    limiter = RateLimiter(period_seconds=60, limit_x=3)
+    log = {}
+    now = 0.0
+    for _ in range(3000):
+        now += rng.choice([-20.0, 0.0, 1.0, 7.0, 25.0])
+        key = rng.choice("abc")
+        ts = [t for t in log.get(key, []) if t >= now - 60]
+        expected = len(ts) < 3
+        if expected:
+            ts.append(now)
+        log[key] = ts
+        assert limiter.allow(key, now) is expected
+
+
+def test_token_bucket_rate_and_burst():
+    tb = TokenBucketRateLimiter(period_seconds=60, limit_x=3)
+    assert [tb.allow("k", 0.0) for _ in range(4)] == [True, True, True, False]
+    assert not tb.allow("k", 19.0)
+    assert tb.allow("k", 20.0)
+    assert tb.check_and_record("other", 20.0).allowed
+    admitted = sum(tb.allow("k", 20.0 + t) for t in range(1, 6001))
+    assert admitted == 300
@@ -1,10 +1,43 @@
-from typing import List
+import re
+from collections import deque
+from typing import Deque, Iterable, List, Optional
 from .observation_store import Observation
 
-def select_window(observations: List[Observation], *, mode: str, n_events: int) -> List[Observation]:
+_DURATION_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([smhdw]?)\s*$")
+_DURATION_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def parse_duration(spec) -> float:
+    """
+    "90" / "90s" / "15m" / "6h" / "7d" / "2w" -> seconds (numbers pass through).
+    Canon config carries windows/periods in this form (t_window, period, cooldown).
+    """
+    if isinstance(spec, (int, float)) and not isinstance(spec, bool):
+        seconds = float(spec)
+    else:
+        m = _DURATION_RE.match(str(spec))
+        if not m:
+            raise ValueError(f"invalid duration: {spec!r}")
+        seconds = float(m.group(1)) * _DURATION_UNITS[m.group(2)]
+    if seconds <= 0:
+        raise ValueError("duration must be > 0")
+    return seconds
+
+
+def select_window(
+    observations: List[Observation],
+    *,
+    mode: str,
+    n_events: int,
+    t_window=None,
+    now: Optional[float] = None,
+) -> List[Observation]:
     """
-    v1 windowing: event-based selection only (deterministic and testable).
-    time-based windowing can be added later with explicit parsing rules.
+    v1 windowing:
+    - events: last n_events observations
+    - time: observations with ts >= now - t_window (now defaults to the newest ts).
+      Without t_window the caller is expected to pass already-filtered observations
+      and they are returned as-is (v1 placeholder behaviour).
     """
     if mode not in {"events", "time"}:
         raise ValueError("mode must be 'events' or 'time'")
@@ -12,5 +45,77 @@ def select_window(observations: List[Observation], *, mode: str, n_events: int)
         if n_events <= 0:
             raise ValueError("n_events must be > 0")
         return observations[-n_events:]
-    # time mode placeholder: caller must provide already-filtered observations or implement time parsing.
-    return observations
+    if t_window is None:
+        return observations
+    if not observations:
+        return []
+    t_now = now if now is not None else max(o.ts for o in observations)
+    cutoff = t_now - parse_duration(t_window)
+    return [o for o in observations if o.ts >= cutoff]
+
+
+class ObservationWindow:
+    """
+    Streaming form of select_window over an append-only, ts-ordered stream.
+
+    Ring buffer (deque): push() is O(1) amortized — events mode drops the oldest
+    once n_events are held, time mode evicts everything older than
+    newest ts - t_window (advance(now) evicts against a wall clock).
+    items() equals select_window(all pushed observations, ...) at the same now.
+
+    trackers (e.g. StreamingStability) see every add/evict, so derived
+    statistics stay in step with the window without rescanning it.
+    """
+
+    def __init__(
+        self,
+        *,
+        mode: str,
+        n_events: int = 0,
+        t_window=None,
+        trackers: Iterable = (),
+    ) -> None:
+        if mode not in {"events", "time"}:
+            raise ValueError("mode must be 'events' or 'time'")
+        if mode == "events" and n_events <= 0:
+            raise ValueError("n_events must be > 0")
+        self.mode = mode
+        self.n_events = n_events
+        self.t_window_seconds = parse_duration(t_window) if (mode == "time" and t_window is not None) else None
+        self.trackers = list(trackers)
+        self._buf: Deque[Observation] = deque()
+
+    def _evict_left(self) -> None:
+        old = self._buf.popleft()
+        for t in self.trackers:
+            t.evict(old)
+
+    def advance(self, now: float) -> None:
+        if self.t_window_seconds is None:
+            return
+        cutoff = now - self.t_window_seconds
+        buf = self._buf
+        while buf and buf[0].ts < cutoff:
+            self._evict_left()
+
+    def push(self, obs: Observation) -> None:
+        if self._buf and obs.ts < self._buf[-1].ts and self.t_window_seconds is not None:
+            raise ValueError("time window requires non-decreasing ts")
+        self._buf.append(obs)
+        for t in self.trackers:
+            t.add(obs)
+        if self.mode == "events":
+            if len(self._buf) > self.n_events:
+                self._evict_left()
+        else:
+            self.advance(obs.ts)
+
+    def extend(self, observations: Iterable[Observation]) -> None:
+        for obs in observations:
+            self.push(obs)
+
+    def __len__(self) -> int:
+        return len(self._buf)
+
+    def items(self) -> List[Observation]:
+        return list(self._buf)
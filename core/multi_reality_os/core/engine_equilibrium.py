@@ -1,7 +1,6 @@
 import math
 from typing import Dict, List
 
-from .intervention_effects import apply_intervention_to_persona
 from ..models.equilibrium_state import AgentState, EquilibriumStep, EquilibriumResult
 
 
@@ -22,6 +21,7 @@ def compute_equilibrium(scene, actors, intervention=None):
     persona_map = {aid: actors[aid].copy() for aid in actors}
 
     if intervention:
+        from .intervention_effects import apply_intervention_to_persona
         target = intervention["target_actor"]
         persona_map[target] = apply_intervention_to_persona(
             persona_map[target],
@@ -34,36 +34,38 @@ def compute_equilibrium(scene, actors, intervention=None):
     stable_counter = 0
     equilibrium_point = None
 
+    # persona 속성은 스텝마다 바뀌지 않으므로 actor 순서대로 열(column)로 한 번만 펼친다.
+    # anxiety_t = coeff * (baseline + t * rate) — 곱셈 순서가 기존 식과 같아 결과가 동일하다.
+    aids = list(persona_map.keys())
+    personas = [persona_map[aid] for aid in aids]
+    base_pressure = scene.structural_pressure
+    coeff = [
+        base_pressure
+        * (1 + p.emotional_reactivity.anxiety_sensitivity)
+        * (1 + p.biases.catastrophizing)
+        for p in personas
+    ]
+    baseline = [p.stress_profile.baseline_stress for p in personas]
+    rate = [p.stress_profile.stress_accumulation_rate for p in personas]
+    cooperation = [p.social_traits.cooperation for p in personas]
+    avoidance = [p.social_traits.conflict_avoidance for p in personas]
+    overwhelm = [p.emotional_reactivity.overwhelm_threshold for p in personas]
+
     for t in range(MAX_STEPS):
 
         agents_state = {}
 
         # 1) 각 Actor의 다음 상태 계산
-        for aid, persona in persona_map.items():
-
-            base_pressure = scene.structural_pressure
+        for i, aid in enumerate(aids):
 
             # anxiety 모델
-            anxiety = (
-                base_pressure
-                * (1 + persona.emotional_reactivity.anxiety_sensitivity)
-                * (1 + persona.biases.catastrophizing)
-                * (persona.stress_profile.baseline_stress
-                   + t * persona.stress_profile.stress_accumulation_rate)
-            )
+            anxiety = coeff[i] * (baseline[i] + t * rate[i])
 
             # alignment 증가/감소 모델
-            alignment = max(
-                0.0,
-                min(
-                    1.0,
-                    persona.social_traits.cooperation
-                    - persona.social_traits.conflict_avoidance * anxiety * 0.1
-                )
-            )
+            alignment = max(0.0, min(1.0, cooperation[i] - avoidance[i] * anxiety * 0.1))
 
             # decision tendency
-            if anxiety > persona.emotional_reactivity.overwhelm_threshold:
+            if anxiety > overwhelm[i]:
                 decision = "avoid"
             elif alignment > 0.5:
                 decision = "consider"
@@ -1,51 +1,146 @@
 # proto-v2-engine/multi_reality_os/core/engine_mesh.py
 
+from collections.abc import Sequence
 from math import fabs
-from typing import Dict, List
+from operator import sub
+from typing import Dict, List, Optional, Tuple
 from ..models.scene_base import SceneBase
 from ..models.perspective_layer import PerspectiveLayer
 from ..models.reality_link import RealityLink
 from ..models.reality_mesh import RealityMesh
 
+# global_conflict / global_alignment come from column sums instead of the
+# mean over materialized links: they agree with the per-link average to
+# within this absolute tolerance (links themselves are bit-identical).
+GLOBAL_TOLERANCE = 1e-9
+
+_one_minus = (1.0).__sub__  # d -> 1 - d
+
+
+def _pressure_matrix(scene: SceneBase, layers: List[PerspectiveLayer]) -> List[List[float]]:
+    # dense actors x pressures, scene key order, missing perceptions -> 0
+    keys = list(scene.structural_pressures.keys())
+    return [[pl.perceived_pressures.get(k, 0) for k in keys] for pl in layers]
+
+
+def _pairwise_abs_sum(col: Sequence[float]) -> float:
+    # sum_{i<j} |x_i - x_j| in O(n log n): each sorted value minus all smaller ones
+    total = 0.0
+    prefix = 0.0
+    for i, x in enumerate(sorted(col)):
+        total += x * i - prefix
+        prefix += x
+    return total
+
+
+class MeshLinks(list):
+    """
+    The pairwise RealityLinks of a mesh, (i, j>i) in actor order, built on
+    first access. Same values as the eager per-pair loop; nothing in the
+    engines reads links, so most meshes never pay the O(actors^2) cost.
+
+    A real list (RealityMesh.links: List[RealityLink]): every list method
+    materializes first, and MeshLinks(iterable) is an ordinary eager list, so
+    dataclasses.asdict / copy / pickle see all links. C code that reads list
+    storage directly (json's encoder on the raw field) sees [] until the
+    first access: serialize through asdict() or list().
+    """
+
+    def __init__(self, iterable=(), /) -> None:
+        super().__init__(iterable)
+        self._pending: Optional[Tuple[List[str], List[List[float]], int]] = None
+
+    @classmethod
+    def lazy(cls, pl_ids: List[str], rows: List[List[float]], n_pressures: int) -> "MeshLinks":
+        links = cls()
+        if len(pl_ids) > 1:
+            links._pending = (pl_ids, rows, max(n_pressures, 1))
+        return links
+
+    def _materialize(self) -> "MeshLinks":
+        if self._pending is not None:
+            ids, rows, div = self._pending
+            self._pending = None
+            append = super().append
+            for i in range(len(ids)):
+                ra = rows[i]
+                for j in range(i + 1, len(ids)):
+                    diffs = list(map(fabs, map(sub, ra, rows[j])))
+                    append(
+                        RealityLink(
+                            from_pl=ids[i],
+                            to_pl=ids[j],
+                            conflict_level=sum(diffs) / div,
+                            benefit_alignment=sum(map(_one_minus, diffs)) / div,
+                        )
+                    )
+        return self
+
+    def __len__(self) -> int:
+        if self._pending is not None:
+            n = len(self._pending[0])
+            return n * (n - 1) // 2
+        return super().__len__()
+
+    def __eq__(self, other):
+        if isinstance(other, MeshLinks):
+            other._materialize()
+        return super(MeshLinks, self._materialize()).__eq__(other)
+
+    def __ne__(self, other):
+        if isinstance(other, MeshLinks):
+            other._materialize()
+        return super(MeshLinks, self._materialize()).__ne__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def clear(self) -> None:
+        self._pending = None
+        super().clear()
+
+    def __reduce_ex__(self, protocol):
+        return (type(self), (list(self._materialize()),))
+
+
+def _forward(name: str):
+    base = getattr(list, name)
+
+    def method(self, *args, **kwargs):
+        return base(self._materialize(), *args, **kwargs)
+
+    method.__name__ = method.__qualname__ = name
+    return method
+
+
+for _name in (
+    "__getitem__", "__iter__", "__reversed__", "__contains__", "__repr__",
+    "__lt__", "__le__", "__gt__", "__ge__", "__add__", "__mul__", "__rmul__",
+    "__setitem__", "__delitem__", "__iadd__", "__imul__",
+    "append", "extend", "insert", "pop", "remove", "reverse", "sort",
+    "count", "index", "copy",
+):
+    setattr(MeshLinks, _name, _forward(_name))
+del _name
+
 
 def build_reality_mesh(scene: SceneBase,
                        pls: Dict[str, PerspectiveLayer]) -> RealityMesh:
 
-    links = []
-    actors = list(pls.keys())
-
-    for i in range(len(actors)):
-        for j in range(i + 1, len(actors)):
-            a = actors[i]
-            b = actors[j]
-
-            pl_a = pls[a]
-            pl_b = pls[b]
-
-            conflict = 0
-            align = 0
-
-            for k in scene.structural_pressures.keys():
-                pa = pl_a.perceived_pressures.get(k, 0)
-                pb = pl_b.perceived_pressures.get(k, 0)
-                diff = fabs(pa - pb)
-                conflict += diff
-                align += 1 - diff
-
-            conflict /= max(len(scene.structural_pressures), 1)
-            align /= max(len(scene.structural_pressures), 1)
-
-            links.append(
-                RealityLink(
-                    from_pl=pl_a.pl_id,
-                    to_pl=pl_b.pl_id,
-                    conflict_level=conflict,
-                    benefit_alignment=align,
-                )
-            )
-
-    avg_conflict = sum(l.conflict_level for l in links) / max(len(links), 1)
-    avg_align = sum(l.benefit_alignment for l in links) / max(len(links), 1)
+    layers = list(pls.values())
+    n_pressures = len(scene.structural_pressures)
+    rows = _pressure_matrix(scene, layers)
+    links = MeshLinks.lazy([pl.pl_id for pl in layers], rows, n_pressures)
+
+    n_pairs = len(links)
+    if n_pairs and n_pressures:
+        conflict_total = sum(_pairwise_abs_sum(col) for col in zip(*rows))
+        avg_conflict = conflict_total / n_pressures / n_pairs
+        # per link: alignment == 1 - conflict
+        avg_align = 1 - avg_conflict
+    else:
+        # no pairs -> 0/1; no pressures -> every link is 0/1 on both
+        avg_conflict = 0.0
+        avg_align = 0.0
 
     collapse_risk = (avg_conflict * 0.7) + (1 - avg_align) * 0.3
 
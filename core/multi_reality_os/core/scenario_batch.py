@@ -0,0 +1,414 @@
+# proto-v2-engine/multi_reality_os/core/scenario_batch.py
+"""
+Monte-Carlo scenario batch runner.
+
+하나의 base scenario(dict)에 seed 기반 perturbation을 걸어 N개의 variant를 만들고,
+각 variant에 대해 mesh → cognitive flow → consensus / conflict forecast /
+equilibrium 을 돌린다. variant 결과는 순서대로 JSONL로 흘려보내고,
+마지막 줄에 summary(분위수, 수렴률, steps-to-equilibrium)를 쓴다.
+
+- variant i 의 난수는 random.Random(f"{seed}:{i}") 하나에서만 나온다.
+  → worker 수 / chunksize와 무관하게 같은 seed면 같은 결과.
+- workers > 1 이면 ProcessPoolExecutor.map (순서 보존) 으로 분산한다.
+
+Scenario spec:
+
+  {
+    "scene_id": "demo:batch",
+    "description": "...",
+    "pressures": {"staffing_risk": 0.8, ...},
+    "structural_pressure": 0.6,          # 생략 시 pressures 평균
+    "timeline_length": 5,
+    "actors": [
+      {"actor_id": "owner", "value_weights": {...},
+       "persona": {"anxiety_sensitivity": .., "overwhelm_threshold": .., "catastrophizing": ..,
+                   "baseline_stress": .., "stress_accumulation_rate": ..,
+                   "cooperation": .., "conflict_avoidance": ..}}
+    ]
+  }
+
+Perturbations: dotted path → distribution. "actors.*" 는 모든 actor에 개별 샘플.
+
+  {"pressures.staffing_risk": {"dist": "normal", "sigma": 0.1, "clamp": [0, 1]},
+   "actors.*.persona.baseline_stress": {"dist": "uniform", "low": -0.1, "high": 0.1}}
+
+  normal / uniform 은 base 값에 더하는 값, "scale" 은 base 값에 곱하는 값(uniform low..high).
+
+  python -m core.multi_reality_os.core.scenario_batch --scenario spec.json --perturb perturb.json \\
+      --n 1000 --seed 7 --workers 4 --out /tmp/scenario_batch.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+from ..models.actor_profile import ActorProfile
+from .builder_perspective import build_perspective_layers
+from .builder_scene import build_scene
+from .conflict_forecast_engine import compute_conflict_forecast
+from .engine_cognitive_flow import generate_cognitive_flow
+from .engine_consensus import compute_consensus
+from .engine_equilibrium import compute_equilibrium
+from .engine_mesh import build_reality_mesh
+
+QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+# summary 에서 분위수를 내는 variant 필드
+SUMMARY_FIELDS = (
+    "global_conflict",
+    "collapse_risk",
+    "consensus_confidence",
+    "overall_risk",
+    "final_conflict",
+)
+
+PERSONA_DEFAULTS: Dict[str, float] = {
+    "anxiety_sensitivity": 0.5,
+    "overwhelm_threshold": 1.0,
+    "catastrophizing": 0.3,
+    "baseline_stress": 0.4,
+    "stress_accumulation_rate": 0.0,
+    "cooperation": 0.6,
+    "conflict_avoidance": 0.4,
+}
+
+DEMO_SCENARIO: Dict[str, Any] = {
+    "scene_id": "demo:kana_second_manager",
+    "description": "통합 매니저 퇴사 이후, 세컨 매니저에게 책임과 백키친 업무까지 전가되는 상황.",
+    "pressures": {"staffing_risk": 0.8, "training_load": 0.7, "uncertainty": 0.6},
+    "timeline_length": 5,
+    "actors": [
+        {
+            "actor_id": "second_manager",
+            "value_weights": {"stability": 0.9, "workload": 0.8, "staffing_risk": 0.9, "training_load": 0.8},
+            "persona": {"anxiety_sensitivity": 0.7, "baseline_stress": 0.6, "cooperation": 0.5},
+        },
+        {
+            "actor_id": "owner",
+            "value_weights": {"store_stability": 0.9, "cost_control": 0.7, "staffing_risk": 0.4, "uncertainty": 0.3},
+            "persona": {"anxiety_sensitivity": 0.3, "baseline_stress": 0.4, "cooperation": 0.7},
+        },
+    ],
+}
+
+DEMO_PERTURBATIONS: Dict[str, Any] = {
+    "pressures.staffing_risk": {"dist": "normal", "sigma": 0.1, "clamp": [0.0, 1.0]},
+    "pressures.training_load": {"dist": "normal", "sigma": 0.1, "clamp": [0.0, 1.0]},
+    "actors.*.value_weights.staffing_risk": {"dist": "normal", "sigma": 0.15, "clamp": [0.0, 1.0]},
+    "actors.*.persona.baseline_stress": {"dist": "uniform", "low": -0.1, "high": 0.1, "clamp": [0.0, 1.0]},
+    "actors.*.persona.stress_accumulation_rate": {"dist": "uniform", "low": 0.0, "high": 0.02},
+}
+
+
+# ---------------------------------------------------------
+# perturbation
+# ---------------------------------------------------------
+def _sample(rng: random.Random, base: float, spec: Dict[str, Any]) -> float:
+    dist = spec.get("dist", "normal")
+    if dist == "normal":
+        value = base + rng.gauss(spec.get("mu", 0.0), spec.get("sigma", 0.0))
+    elif dist == "uniform":
+        value = base + rng.uniform(spec.get("low", 0.0), spec.get("high", 0.0))
+    elif dist == "scale":
+        value = base * rng.uniform(spec.get("low", 1.0), spec.get("high", 1.0))
+    else:
+        raise ValueError(f"unknown perturbation dist: {dist!r}")
+    clamp = spec.get("clamp")
+    if clamp is not None:
+        value = max(float(clamp[0]), min(float(clamp[1]), value))
+    return value
+
+
+def _apply(rng: random.Random, node: Any, parts: Sequence[str], spec: Dict[str, Any], path: str) -> None:
+    head, rest = parts[0], parts[1:]
+    if head == "*":
+        if not isinstance(node, list):
+            raise ValueError(f"perturbation path {path!r}: '*' needs a list")
+        for item in node:
+            _apply(rng, item, rest, spec, path)
+        return
+    if isinstance(node, list):
+        matches = [item for item in node if isinstance(item, dict) and item.get("actor_id") == head]
+        if not matches:
+            raise ValueError(f"perturbation path {path!r}: no actor {head!r}")
+        for item in matches:
+            _apply(rng, item, rest, spec, path)
+        return
+    if not isinstance(node, dict):
+        raise ValueError(f"perturbation path {path!r}: cannot descend into {type(node).__name__}")
+    if rest:
+        _apply(rng, node.setdefault(head, {}), rest, spec, path)
+        return
+    base = node.get(head)
+    if base is None and path.split(".")[-2:-1] == ["persona"]:
+        base = PERSONA_DEFAULTS.get(head)
+    if not isinstance(base, (int, float)) or isinstance(base, bool):
+        raise ValueError(f"perturbation path {path!r}: base value is not a number")
+    node[head] = _sample(rng, float(base), spec)
+
+
+def perturb_scenario(base: Dict[str, Any], perturbations: Dict[str, Any], rng: random.Random) -> Dict[str, Any]:
+    """
+    base 를 깊은 복사한 뒤 perturbation 을 key 정렬 순서로 적용한다.
+    (정렬 순서로 난수를 소비해야 spec 의 dict 순서가 달라도 같은 variant 가 나온다.)
+    """
+    scenario = copy.deepcopy(base)
+    for path in sorted(perturbations):
+        _apply(rng, scenario, path.split("."), perturbations[path], path)
+    return scenario
+
+
+def variant_rng(seed: int, index: int) -> random.Random:
+    return random.Random(f"{seed}:{index}")
+
+
+# ---------------------------------------------------------
+# 단일 variant 실행
+# ---------------------------------------------------------
+def _persona(spec: Dict[str, Any]) -> SimpleNamespace:
+    v = {**PERSONA_DEFAULTS, **(spec or {})}
+    p = SimpleNamespace(
+        emotional_reactivity=SimpleNamespace(
+            anxiety_sensitivity=v["anxiety_sensitivity"],
+            overwhelm_threshold=v["overwhelm_threshold"],
+        ),
+        biases=SimpleNamespace(catastrophizing=v["catastrophizing"]),
+        stress_profile=SimpleNamespace(
+            baseline_stress=v["baseline_stress"],
+            stress_accumulation_rate=v["stress_accumulation_rate"],
+        ),
+        social_traits=SimpleNamespace(
+            cooperation=v["cooperation"],
+            conflict_avoidance=v["conflict_avoidance"],
+        ),
+    )
+    # equilibrium 엔진은 persona 를 바꾸지 않는다 (intervention 없음)
+    p.copy = lambda: p
+    return p
+
+
+def run_scenario(scenario: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    scenario 하나를 전체 엔진에 통과시키고 JSON 으로 쓸 수 있는 결과만 돌려준다.
+    """
+    pressures = dict(scenario.get("pressures") or {})
+    actors = list(scenario.get("actors") or [])
+    scene = build_scene(
+        scene_id=scenario.get("scene_id", "scenario"),
+        title=scenario.get("title", scenario.get("scene_id", "scenario")),
+        description=scenario.get("description", ""),
+        actors=[a["actor_id"] for a in actors],
+        pressures=pressures,
+        constraints=scenario.get("constraints"),
+    )
+    profiles = [
+        ActorProfile(actor_id=a["actor_id"], name=a.get("name", a["actor_id"]), value_weights=dict(a.get("value_weights") or {}))
+        for a in actors
+    ]
+    pls = build_perspective_layers(scene, profiles)
+    mesh = build_reality_mesh(scene, pls)
+    cfm = generate_cognitive_flow(scene, pls, mesh, timeline_length=int(scenario.get("timeline_length", 5)))
+    consensus = compute_consensus(mesh)
+    forecast = compute_conflict_forecast(mesh, cfm)
+
+    structural = scenario.get("structural_pressure")
+    if structural is None:
+        structural = sum(pressures.values()) / len(pressures) if pressures else 0.0
+    personas = {a["actor_id"]: _persona(a.get("persona")) for a in actors}
+    if personas:
+        eq = compute_equilibrium(SimpleNamespace(structural_pressure=structural), personas)
+        eq_point = eq.equilibrium_point
+        final_conflict = eq.trajectory[-1].global_conflict
+        pattern = eq.pattern_type
+        steps_run = len(eq.trajectory)
+    else:
+        eq_point, final_conflict, pattern, steps_run = None, 0.0, None, 0
+
+    return {
+        "global_conflict": mesh.global_conflict,
+        "global_alignment": mesh.global_alignment,
+        "collapse_risk": mesh.collapse_risk,
+        "consensus_confidence": consensus.confidence,
+        "recommended_actions": list(consensus.recommended_actions),
+        "overall_risk": forecast.overall_risk,
+        "hotspots": len(forecast.hotspots),
+        "converged": eq_point is not None,
+        "steps_to_equilibrium": eq_point["timestep"] if eq_point is not None else None,
+        "steps_run": steps_run,
+        "final_conflict": final_conflict,
+        "pattern_type": pattern,
+    }
+
+
+def _run_variant(job: Tuple[Dict[str, Any], Dict[str, Any], int, int]) -> Dict[str, Any]:
+    base, perturbations, seed, index = job
+    scenario = perturb_scenario(base, perturbations, variant_rng(seed, index))
+    return {"type": "variant", "variant": index, "seed": seed, **run_scenario(scenario)}
+
+
+# ---------------------------------------------------------
+# summary
+# ---------------------------------------------------------
+def _quantile(sorted_values: Sequence[float], q: float) -> float:
+    # 선형 보간 (numpy 기본값과 같은 방식)
+    pos = (len(sorted_values) - 1) * q
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    frac = pos - lo
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * frac
+
+
+def quantiles(values: Iterable[float], qs: Sequence[float] = QUANTILES) -> Optional[Dict[str, float]]:
+    s = sorted(values)
+    if not s:
+        return None
+    return {f"p{round(q * 100):02d}": _quantile(s, q) for q in qs}
+
+
+class BatchSummary:
+    """variant 결과를 스트리밍으로 모아 summary 를 만든다 (분위수 계산용 값만 보관)."""
+
+    def __init__(self) -> None:
+        self.n = 0
+        self.converged = 0
+        self.steps: List[int] = []
+        self.patterns: Dict[str, int] = {}
+        self.values: Dict[str, List[float]] = {k: [] for k in SUMMARY_FIELDS}
+
+    def add(self, rec: Dict[str, Any]) -> None:
+        self.n += 1
+        if rec["converged"]:
+            self.converged += 1
+            self.steps.append(rec["steps_to_equilibrium"])
+        if rec["pattern_type"] is not None:
+            self.patterns[rec["pattern_type"]] = self.patterns.get(rec["pattern_type"], 0) + 1
+        for k in SUMMARY_FIELDS:
+            self.values[k].append(rec[k])
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "type": "summary",
+            "n": self.n,
+            "converged": self.converged,
+            "convergence_rate": self.converged / self.n if self.n else 0.0,
+            "steps_to_equilibrium": {
+                "mean": sum(self.steps) / len(self.steps) if self.steps else None,
+                **(quantiles(self.steps) or {}),
+            },
+            "pattern_counts": dict(sorted(self.patterns.items())),
+            "quantiles": {k: quantiles(v) for k, v in self.values.items()},
+        }
+
+
+# ---------------------------------------------------------
+# batch
+# ---------------------------------------------------------
+def iter_variants(
+    base: Dict[str, Any],
+    perturbations: Dict[str, Any],
+    n: int,
+    seed: int,
+    workers: int = 1,
+    chunksize: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """variant 결과를 index 순서대로 yield 한다 (workers 와 무관하게 같은 순서/값)."""
+    jobs = ((base, perturbations, seed, i) for i in range(n))
+    if workers <= 1 or n <= 1:
+        yield from map(_run_variant, jobs)
+        return
+    if chunksize is None:
+        chunksize = max(1, n // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_run_variant, jobs, chunksize=chunksize)
+
+
+def run_batch(
+    base: Dict[str, Any],
+    perturbations: Dict[str, Any],
+    n: int,
+    seed: int,
+    out: Optional[TextIO] = None,
+    workers: int = 1,
+    chunksize: Optional[int] = None,
+    on_variant: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """
+    N 개 variant 를 실행하고 summary 를 돌려준다.
+    out 이 주어지면 variant 마다 한 줄씩 바로 쓰고, 마지막에 summary 한 줄을 쓴다.
+    summary 의 elapsed_s / scenarios_per_s 만 실행마다 달라진다.
+    """
+    summary = BatchSummary()
+    t0 = time.perf_counter()
+    for rec in iter_variants(base, perturbations, n, seed, workers=workers, chunksize=chunksize):
+        summary.add(rec)
+        if out is not None:
+            out.write(json.dumps(rec, ensure_ascii=False, sort_keys=True) + "\n")
+        if on_variant is not None:
+            on_variant(rec)
+    elapsed = time.perf_counter() - t0
+
+    result = summary.to_dict()
+    result["seed"] = seed
+    result["workers"] = workers
+    result["elapsed_s"] = elapsed
+    result["scenarios_per_s"] = n / elapsed if elapsed > 0 else None
+    if out is not None:
+        out.write(json.dumps(result, ensure_ascii=False, sort_keys=True) + "\n")
+        out.flush()
+    return result
+
+
+def _load_json(path: Optional[str], default: Dict[str, Any]) -> Dict[str, Any]:
+    if not path:
+        return default
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--scenario", default=None, help="base scenario JSON (default: demo scene)")
+    ap.add_argument("--perturb", default=None, help="perturbation spec JSON (default: demo perturbations)")
+    ap.add_argument("--n", type=int, default=1000)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--chunksize", type=int, default=None)
+    ap.add_argument("--out", default=None, help="JSONL output (default: stdout)")
+    args = ap.parse_args()
+
+    if args.n <= 0:
+        print("FAIL: --n must be > 0", file=sys.stderr)
+        return 1
+
+    base = _load_json(args.scenario, DEMO_SCENARIO)
+    perturbations = _load_json(args.perturb, DEMO_PERTURBATIONS)
+
+    try:
+        if args.out:
+            with open(args.out, "w", encoding="utf-8") as f:
+                res = run_batch(base, perturbations, args.n, args.seed, out=f, workers=args.workers, chunksize=args.chunksize)
+        else:
+            res = run_batch(base, perturbations, args.n, args.seed, out=sys.stdout, workers=args.workers, chunksize=args.chunksize)
+    except ValueError as exc:
+        print(f"FAIL: {exc}", file=sys.stderr)
+        return 1
+
+    print(
+        f"THROUGHPUT: scenarios={res['n']} workers={res['workers']} elapsed_s={res['elapsed_s']:.3f}"
+        f" scenarios_per_s={res['scenarios_per_s']:.1f} convergence_rate={res['convergence_rate']:.3f}",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
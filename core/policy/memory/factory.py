@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import os
+from typing import Optional
+
+from core.policy.memory.in_memory import InMemoryPolicyMemory
+from core.policy.memory.ports import VersionedPolicyMemoryPort
+
+
+def policy_memory_from_spec(spec: Optional[str]) -> VersionedPolicyMemoryPort:
+    """
+    "" / "memory"         -> InMemoryPolicyMemory (process-local)
+    "sqlite:<path>"       -> SQLitePolicyMemory (durable, shared between processes)
+    """
+    spec = (spec or "").strip()
+    if not spec or spec == "memory":
+        return InMemoryPolicyMemory()
+    if spec.startswith("sqlite:"):
+        from core.policy.memory.sqlite import SQLitePolicyMemory
+
+        path = spec[len("sqlite:"):]
+        if not path:
+            raise ValueError("policy memory spec 'sqlite:' needs a path")
+        return SQLitePolicyMemory(path)
+    raise ValueError(f"unknown policy memory spec: {spec!r}")
+
+
+def policy_memory_from_env() -> VersionedPolicyMemoryPort:
+    return policy_memory_from_spec(os.getenv("META_POLICY_MEMORY"))
@@ -1,23 +1,54 @@
 from __future__ import annotations
 
+import threading
+from collections import deque
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
-from core.policy.memory.ports import PolicyMemoryKey, PolicyMemoryPort
+from core.policy.memory.ports import PolicyMemoryKey, VersionedPolicyMemoryPort
+
+DEFAULT_HISTORY_LIMIT = 16
 
 
 @dataclass
-class InMemoryPolicyMemory(PolicyMemoryPort):
+class InMemoryPolicyMemory(VersionedPolicyMemoryPort):
     _store: Dict[str, Dict[str, Any]]
 
-    def __init__(self) -> None:
+    def __init__(self, history_limit: int = DEFAULT_HISTORY_LIMIT) -> None:
         self._store = {}
+        self._versions: Dict[str, int] = {}
+        self._history: Dict[str, Deque[Dict[str, Any]]] = {}
+        self.history_limit = history_limit
+        self._lock = threading.Lock()
 
     def _k(self, key: PolicyMemoryKey) -> str:
         return f"{key.org_id}::{key.site_id}::{key.channel}"
 
+    def _put(self, k: str, scene_state: Dict[str, Any]) -> None:
+        self._store[k] = scene_state
+        self._versions[k] = self._versions.get(k, 0) + 1
+        self._history.setdefault(k, deque(maxlen=self.history_limit)).append(scene_state)
+
     def load_last_scene_state(self, key: PolicyMemoryKey) -> Optional[Dict[str, Any]]:
         return self._store.get(self._k(key))
 
     def save_scene_state(self, key: PolicyMemoryKey, scene_state: Dict[str, Any]) -> None:
-        self._store[self._k(key)] = scene_state
+        with self._lock:
+            self._put(self._k(key), scene_state)
+
+    def load_versioned(self, key: PolicyMemoryKey) -> Tuple[int, Optional[Dict[str, Any]]]:
+        k = self._k(key)
+        with self._lock:
+            return self._versions.get(k, 0), self._store.get(k)
+
+    def compare_and_set(self, key: PolicyMemoryKey, expected_version: int, scene_state: Dict[str, Any]) -> bool:
+        k = self._k(key)
+        with self._lock:
+            if self._versions.get(k, 0) != expected_version:
+                return False
+            self._put(k, scene_state)
+            return True
+
+    def history(self, key: PolicyMemoryKey) -> List[Dict[str, Any]]:
+        """최근 history_limit개, 최신이 마지막"""
+        return list(self._history.get(self._k(key), ()))
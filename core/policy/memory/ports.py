@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Optional, Protocol, Tuple, Any
+from typing import Dict, List, Optional, Protocol, Tuple, Any
 
 
 @dataclass(frozen=True)
@@ -17,3 +17,23 @@ class PolicyMemoryPort(Protocol):
 
     def save_scene_state(self, key: PolicyMemoryKey, scene_state: Dict[str, Any]) -> None:
         ...
+
+
+class PolicyMemoryConflict(RuntimeError):
+    """compare_and_set이 재시도 한도 안에 성공하지 못함 (fail-closed: 덮어쓰지 않는다)"""
+
+
+class VersionedPolicyMemoryPort(PolicyMemoryPort, Protocol):
+    """
+    version: key별 저장 횟수 (없으면 0). save_scene_state는 무조건 version+1,
+    compare_and_set은 현재 version이 expected_version일 때만 저장한다.
+    """
+
+    def load_versioned(self, key: PolicyMemoryKey) -> Tuple[int, Optional[Dict[str, Any]]]:
+        ...
+
+    def compare_and_set(self, key: PolicyMemoryKey, expected_version: int, scene_state: Dict[str, Any]) -> bool:
+        ...
+
+    def history(self, key: PolicyMemoryKey) -> List[Dict[str, Any]]:
+        ...
@@ -0,0 +1,124 @@
+"""
+SQLite policy memory (durable, shared between processes)
+
+- WAL journal: readers never block the single writer
+- policy_memory: one row per key (org::site::channel) with a version counter
+- policy_memory_history: last `history_limit` scene states per key
+- save_scene_state / compare_and_set run in BEGIN IMMEDIATE transactions, so
+  concurrent writers from several processes serialize on the db lock and a
+  compare_and_set only lands if nobody else wrote the key in between
+
+Scene states are stored as JSON; a reopened memory returns the same dicts the
+engine saved, so a restarted engine resumes with the same decisions.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from core.policy.memory.in_memory import DEFAULT_HISTORY_LIMIT
+from core.policy.memory.ports import PolicyMemoryKey, VersionedPolicyMemoryPort
+
+DEFAULT_BUSY_TIMEOUT_S = 30.0
+
+
+class SQLitePolicyMemory(VersionedPolicyMemoryPort):
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        history_limit: int = DEFAULT_HISTORY_LIMIT,
+        timeout: float = DEFAULT_BUSY_TIMEOUT_S,
+    ) -> None:
+        self.path = Path(path)
+        self.history_limit = history_limit
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # isolation_level=None: transactions are explicit (BEGIN IMMEDIATE below)
+        self._db = sqlite3.connect(str(self.path), timeout=timeout, isolation_level=None, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS policy_memory ("
+            " key TEXT PRIMARY KEY, version INTEGER NOT NULL, scene_state TEXT NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS policy_memory_history ("
+            " key TEXT NOT NULL, version INTEGER NOT NULL, scene_state TEXT NOT NULL,"
+            " PRIMARY KEY (key, version))"
+        )
+
+    def _k(self, key: PolicyMemoryKey) -> str:
+        return f"{key.org_id}::{key.site_id}::{key.channel}"
+
+    @staticmethod
+    def _dumps(scene_state: Dict[str, Any]) -> str:
+        return json.dumps(scene_state, ensure_ascii=False, separators=(",", ":"))
+
+    def _version(self, k: str) -> int:
+        row = self._db.execute("SELECT version FROM policy_memory WHERE key=?", (k,)).fetchone()
+        return row[0] if row else 0
+
+    def _write(self, k: str, version: int, body: str) -> None:
+        self._db.execute(
+            "INSERT INTO policy_memory (key, version, scene_state) VALUES (?,?,?)"
+            " ON CONFLICT(key) DO UPDATE SET version=excluded.version, scene_state=excluded.scene_state",
+            (k, version, body),
+        )
+        self._db.execute("INSERT OR REPLACE INTO policy_memory_history VALUES (?,?,?)", (k, version, body))
+        self._db.execute(
+            "DELETE FROM policy_memory_history WHERE key=? AND version<=?",
+            (k, version - self.history_limit),
+        )
+
+    def _transact(self, k: str, body: str, expected_version: Optional[int]) -> bool:
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                current = self._version(k)
+                if expected_version is not None and current != expected_version:
+                    self._db.execute("ROLLBACK")
+                    return False
+                self._write(k, current + 1, body)
+                self._db.execute("COMMIT")
+                return True
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+
+    # ---- PolicyMemoryPort ----
+    def load_last_scene_state(self, key: PolicyMemoryKey) -> Optional[Dict[str, Any]]:
+        return self.load_versioned(key)[1]
+
+    def save_scene_state(self, key: PolicyMemoryKey, scene_state: Dict[str, Any]) -> None:
+        self._transact(self._k(key), self._dumps(scene_state), None)
+
+    # ---- VersionedPolicyMemoryPort ----
+    def load_versioned(self, key: PolicyMemoryKey) -> Tuple[int, Optional[Dict[str, Any]]]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT version, scene_state FROM policy_memory WHERE key=?", (self._k(key),)
+            ).fetchone()
+        if row is None:
+            return 0, None
+        return row[0], json.loads(row[1])
+
+    def compare_and_set(self, key: PolicyMemoryKey, expected_version: int, scene_state: Dict[str, Any]) -> bool:
+        return self._transact(self._k(key), self._dumps(scene_state), expected_version)
+
+    def history(self, key: PolicyMemoryKey) -> List[Dict[str, Any]]:
+        """최근 history_limit개, 최신이 마지막"""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT scene_state FROM policy_memory_history WHERE key=? ORDER BY version",
+                (self._k(key),),
+            ).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+import hashlib
+import os
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, List, Tuple
 import yaml
 
 def load_rules(path: str):
@@ -75,3 +78,232 @@ def evaluate(dry, ruleset):
         "policy_version": ruleset.get("version") or "1.0",
     }
 
+
+
+# --- Compiled form -----------------------------------------------------------
+#
+# Same decisions as evaluate(), minus the per-input walk over every rule:
+# - each rule becomes one predicate closure (risk_level / confidence_lt /
+#   generic exact match, checked in the same order as evaluate)
+# - risk_level and generic exact-match values are indexed in hash tables and
+#   numeric confidence_lt thresholds are kept sorted, so an input only runs
+#   the predicates of rules that can still beat the best match so far
+# Rulesets or inputs evaluate() would treat irregularly (non-dict rules,
+# non-numeric confidence, ...) go through the plain ordered walk instead, so
+# errors surface exactly where evaluate() raises them.
+
+_KNOWN = {"risk_level", "confidence_lt"}
+_NUMERIC = (int, float)
+
+
+def _decision(rule, version):
+    action = rule.get("action", {})
+    return {
+        "decision": action["decision"],
+        "reason_codes": [action.get("reason_code", "RULE_MATCH")],
+        "override_required": action.get("override_required", True),
+        "policy_id": rule["id"],
+        "policy_version": version,
+    }
+
+
+def _hashable(v: Any) -> bool:
+    try:
+        hash(v)
+    except TypeError:
+        return False
+    return True
+
+
+def _regular_number(v: Any) -> bool:
+    return type(v) in (int, float, bool) and v == v  # excludes NaN
+
+
+def _predicate(cond: Dict[str, Any]):
+    has_risk = "risk_level" in cond
+    risk = cond.get("risk_level")
+    has_conf = "confidence_lt" in cond
+    conf_lt = cond.get("confidence_lt")
+    generic = [(k, cond[k]) for k in cond.keys() if k not in _KNOWN]
+
+    def check(dry) -> bool:
+        if has_risk and dry.get("risk_level") == risk:
+            return True
+        if has_conf and dry.get("confidence", 1.0) < conf_lt:
+            return True
+        if generic:
+            for k, v in generic:
+                if dry.get(k) != v:
+                    return False
+            return True
+        return False
+
+    return check
+
+
+class CompiledPolicy:
+    def __init__(self, ruleset, sha256: str | None = None) -> None:
+        self.ruleset = ruleset
+        self.sha256 = sha256
+        self._linear = not self._compilable(ruleset)
+        if self._linear:
+            return
+
+        self.version = ruleset.get("version") or "1.0"
+        defaults = ruleset.get("defaults", {})
+        self._default = {
+            "decision": defaults.get("decision", "APPROVE"),
+            "reason_codes": ["DEFAULT_APPROVE"],
+            "override_required": defaults.get("override_required", False),
+            "policy_id": "DEFAULT",
+            "policy_version": self.version,
+        }
+
+        rules = ruleset.get("rules", [])
+        self._rules = rules
+        self._checks = []
+        self._templates = []
+        self._risk: Dict[Any, int] = {}
+        conf: list = []
+        generic: Dict[str, Dict[Any, list]] = {}
+        scan = []
+
+        for i, rule in enumerate(rules):
+            cond = rule.get("condition", {})
+            self._checks.append(_predicate(cond))
+            try:
+                self._templates.append(_decision(rule, self.version))
+            except Exception:
+                self._templates.append(None)  # raise from evaluate(), on match only
+
+            if "risk_level" in cond:
+                v = cond["risk_level"]
+                if _hashable(v):
+                    self._risk.setdefault(v, i)
+                else:
+                    scan.append(i)
+            if "confidence_lt" in cond:
+                thr = cond["confidence_lt"]
+                if _regular_number(thr):
+                    conf.append((thr, i))
+                else:
+                    scan.append(i)
+            keys = [k for k in cond.keys() if k not in _KNOWN]
+            if keys:
+                key = next((k for k in keys if _hashable(cond[k])), None)
+                if key is None:
+                    scan.append(i)
+                else:
+                    generic.setdefault(key, {}).setdefault(cond[key], []).append(i)
+
+        # confidence < thr  <=>  thr > confidence: sorted thresholds + suffix minimum of rule index
+        conf.sort(key=lambda t: t[0])
+        self._conf_thr = [t for t, _ in conf]
+        self._conf_first = [0] * len(conf)
+        best = len(rules)
+        for j in range(len(conf) - 1, -1, -1):
+            best = min(best, conf[j][1])
+            self._conf_first[j] = best
+        self._has_conf = any("confidence_lt" in r.get("condition", {}) for r in rules)
+        self._generic = [(k, table) for k, table in generic.items()]
+        self._scan = sorted(set(scan))
+
+    @staticmethod
+    def _compilable(ruleset) -> bool:
+        if not isinstance(ruleset, dict):
+            return False
+        if not isinstance(ruleset.get("defaults", {}), dict):
+            return False
+        rules = ruleset.get("rules", [])
+        if not isinstance(rules, list):
+            return False
+        return all(isinstance(r, dict) and isinstance(r.get("condition", {}), dict) for r in rules)
+
+    def _result(self, i: int):
+        t = self._templates[i]
+        if t is None:
+            return _decision(self._rules[i], self.version)
+        out = dict(t)
+        out["reason_codes"] = list(t["reason_codes"])
+        return out
+
+    def _walk(self, dry):
+        for i, check in enumerate(self._checks):
+            if check(dry):
+                return self._result(i)
+        out = dict(self._default)
+        out["reason_codes"] = ["DEFAULT_APPROVE"]
+        return out
+
+    def evaluate(self, dry):
+        if self._linear:
+            return evaluate(dry, self.ruleset)
+        if not isinstance(dry, dict):
+            return self._walk(dry)
+        c = dry.get("confidence", 1.0)
+        regular = _regular_number(c)
+        if not regular and self._has_conf:
+            return self._walk(dry)
+
+        best = len(self._checks)
+        rl = dry.get("risk_level")
+        if _hashable(rl):
+            i = self._risk.get(rl)
+            if i is not None:
+                best = i
+        if regular and self._conf_thr:
+            j = bisect_right(self._conf_thr, c)
+            if j < len(self._conf_thr) and self._conf_first[j] < best:
+                best = self._conf_first[j]
+
+        checks = self._checks
+        for key, table in self._generic:
+            v = dry.get(key)
+            if not _hashable(v):
+                continue
+            for i in table.get(v, ()):
+                if i >= best:
+                    break
+                if checks[i](dry):
+                    best = i
+                    break
+        for i in self._scan:
+            if i >= best:
+                break
+            if checks[i](dry):
+                best = i
+                break
+
+        if best < len(checks):
+            return self._result(best)
+        out = dict(self._default)
+        out["reason_codes"] = ["DEFAULT_APPROVE"]
+        return out
+
+    def evaluate_many(self, drys: Iterable[Any]) -> List[dict]:
+        ev = self.evaluate
+        return [ev(d) for d in drys]
+
+
+def compile_rules(ruleset, sha256: str | None = None) -> CompiledPolicy:
+    return CompiledPolicy(ruleset, sha256=sha256)
+
+
+_COMPILED: Dict[Tuple[str, int, int], CompiledPolicy] = {}
+
+
+def load_compiled(path: str) -> CompiledPolicy:
+    """Parse + compile a policy file once per (path, mtime_ns, size); `.sha256` is over the raw bytes."""
+    p = os.path.abspath(str(path))
+    st = os.stat(p)
+    key = (p, st.st_mtime_ns, st.st_size)
+    hit = _COMPILED.get(key)
+    if hit is not None:
+        return hit
+    with open(p, "rb") as f:
+        raw = f.read()
+    compiled = CompiledPolicy(yaml.safe_load(raw.decode("utf-8")), sha256=hashlib.sha256(raw).hexdigest())
+    for k in [k for k in _COMPILED if k[0] == p]:
+        del _COMPILED[k]
+    _COMPILED[key] = compiled
+    return compiled
@@ -4,12 +4,18 @@ import json
 import os
 import re
 import hashlib
+import threading
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, Tuple, List
+from typing import Any, Dict, Optional, Tuple, List
 
 
 VERSION_RE = re.compile(r"policy_v(\d{4})\.json$")
 
+# A directory listing / file whose mtime is this recent is not trusted as a
+# cache key: another write in the same timestamp tick would not change it.
+_RACY_NS = 2_000_000_000
+
 
 def _canonical_json_bytes(obj: Any) -> bytes:
     return json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
@@ -27,17 +33,59 @@ class PolicySnapshot:
     sha256: str
 
 
+FileKey = Tuple[str, int, int]  # (path, mtime_ns, size)
+
+
+def _stable(mtime_ns: int) -> bool:
+    return time.time_ns() - mtime_ns > _RACY_NS
+
+
+class _VersionCatalog:
+    """
+    Per-directory cache shared by every PolicyStore on that directory:
+    - version list, re-listed only when the directory's mtime changes
+    - parsed policy + sha256 per version, keyed by (path, mtime_ns, size)
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.dir_mtime_ns: Optional[int] = None
+        self.paths: Dict[int, str] = {}
+        self.latest_version: Optional[int] = None
+        self.entries: Dict[int, Tuple[FileKey, PolicySnapshot]] = {}
+
+
+_CATALOGS: Dict[Tuple[str, str], _VersionCatalog] = {}
+_CATALOGS_LOCK = threading.Lock()
+
+
+def _catalog_for(dirpath: str) -> _VersionCatalog:
+    # snapshot paths are built from dirpath as given, so key on it too
+    key = (dirpath, os.path.abspath(dirpath))
+    with _CATALOGS_LOCK:
+        cat = _CATALOGS.get(key)
+        if cat is None:
+            cat = _CATALOGS[key] = _VersionCatalog()
+        return cat
+
+
 class PolicyStore:
     """
     File-based policy store:
       data/policies/policy_v0001.json
       data/policies/policy_v0002.json
       ...
+
+    Snapshots are cached per (path, mtime_ns, size): a warm get()/latest() is a
+    stat of the directory and of the policy file. A changed file gets a new key
+    and is re-read and re-hashed. Snapshot.policy is shared between callers:
+    treat it as read-only (apply_patch and friends copy before editing).
     """
 
     def __init__(self, dirpath: str = "data/policies") -> None:
         self.dirpath = dirpath
         os.makedirs(self.dirpath, exist_ok=True)
+        self._catalog = _catalog_for(dirpath)
 
     def _list_versions(self) -> List[Tuple[int, str]]:
         items: List[Tuple[int, str]] = []
@@ -50,20 +98,55 @@ class PolicyStore:
         items.sort(key=lambda x: x[0])
         return items
 
-    def latest(self) -> PolicySnapshot:
+    def _refresh_versions(self) -> _VersionCatalog:
+        cat = self._catalog
+        mtime_ns = os.stat(self.dirpath).st_mtime_ns
+        with cat.lock:
+            if cat.dir_mtime_ns is not None and cat.dir_mtime_ns == mtime_ns:
+                return cat
         versions = self._list_versions()
-        if not versions:
-            raise FileNotFoundError(f"No policy versions found in {self.dirpath}. Create policy_v0001.json first.")
-        v, path = versions[-1]
+        with cat.lock:
+            cat.paths = dict(versions)
+            cat.latest_version = versions[-1][0] if versions else None
+            cat.dir_mtime_ns = mtime_ns if _stable(mtime_ns) else None
+            for v in [v for v in cat.entries if v not in cat.paths]:
+                del cat.entries[v]
+        return cat
+
+    def versions(self) -> List[int]:
+        return sorted(self._refresh_versions().paths)
+
+    def get(self, version: int) -> PolicySnapshot:
+        cat = self._catalog
+        path = cat.paths.get(version) or os.path.join(self.dirpath, f"policy_v{version:04d}.json")
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            with cat.lock:
+                cat.entries.pop(version, None)
+            raise FileNotFoundError(path) from None
+        key = (path, st.st_mtime_ns, st.st_size)
+        with cat.lock:
+            hit = cat.entries.get(version)
+        if hit is not None and hit[0] == key:
+            return hit[1]
+
         policy = self._load_json(path)
-        return PolicySnapshot(version=v, path=path, policy=policy, sha256=sha256_of_obj(policy))
+        snap = PolicySnapshot(version=version, path=path, policy=policy, sha256=sha256_of_obj(policy))
+        if _stable(st.st_mtime_ns):
+            with cat.lock:
+                cat.entries[version] = (key, snap)
+        return snap
+
+    def latest(self) -> PolicySnapshot:
+        cat = self._refresh_versions()
+        v = cat.latest_version
+        if v is None:
+            raise FileNotFoundError(f"No policy versions found in {self.dirpath}. Create policy_v0001.json first.")
+        return self.get(v)
 
     def load_version(self, version: int) -> PolicySnapshot:
-        path = os.path.join(self.dirpath, f"policy_v{version:04d}.json")
-        if not os.path.exists(path):
-            raise FileNotFoundError(path)
-        policy = self._load_json(path)
-        return PolicySnapshot(version=version, path=path, policy=policy, sha256=sha256_of_obj(policy))
+        return self.get(version)
 
     def save_new_version(self, policy: Dict[str, Any]) -> PolicySnapshot:
         latest = self.latest()
@@ -0,0 +1,36 @@
+"""add execution_run claim columns for the batched worker (sqlite-compatible)
+
+Revision ID: worker_0001
+Revises: ensure_execution_runs_0001
+Create Date: 2026-10-19
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "worker_0001"
+down_revision: Union[str, Sequence[str], None] = "ensure_execution_runs_0001"
+branch_labels = None
+depends_on = None
+
+
+def _col_exists(table: str, name: str) -> bool:
+    bind = op.get_bind()
+    rows = bind.exec_driver_sql(f"PRAGMA table_info({table});").fetchall()
+    return name in {r[1] for r in rows}
+
+
+def upgrade() -> None:
+    # add-only-if-missing (ensure_execution_runs_0001 may have created the table from the ORM)
+    with op.batch_alter_table("execution_runs") as b:
+        if not _col_exists("execution_runs", "claim_token"):
+            b.add_column(sa.Column("claim_token", sa.String(36), nullable=True))
+        if not _col_exists("execution_runs", "claimed_at"):
+            b.add_column(sa.Column("claimed_at", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    # SQLite DROP COLUMN is limited; keep downgrade no-op
+    pass
@@ -3,6 +3,7 @@ from __future__ import annotations
 import subprocess  # tests monkeypatch infra.api.app.subprocess.run
 from fastapi import FastAPI
 
+from infra.api.audit_sink import audit_sink_from_env, configure_audit_sink, shutdown_audit_sink
 from infra.api.endpoints.approvals import router as approvals_router
 from infra.api.endpoints.execution import router as execution_router  # LOCK2_ALLOW_EXEC
 from infra.api.endpoints.ui_status import router as ui_status_router
@@ -33,6 +34,12 @@ def resolve_lock4_sig_mode(env: dict) -> str:
 def create_app() -> FastAPI:
     app = FastAPI()
 
+    # audit JSONL off the request path when METAOS_AUDIT_SINK=background
+    sink = audit_sink_from_env()
+    if sink is not None:
+        configure_audit_sink(sink)
+        app.add_event_handler("shutdown", shutdown_audit_sink)
+
     # API v1
     app.include_router(execution_router, prefix="/api/v1")
     app.include_router(approvals_router, prefix="/api/v1")
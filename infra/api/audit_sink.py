@@ -1,15 +1,242 @@
 from __future__ import annotations
 
+import atexit
 import json
+import os
+import queue
 import sys
+import threading
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, TextIO
+
+OVERFLOW_BLOCK = "block"
+OVERFLOW_DROP = "drop"
+OVERFLOW_SPILL = "spill"
+_OVERFLOW_POLICIES = (OVERFLOW_BLOCK, OVERFLOW_DROP, OVERFLOW_SPILL)
+
+DEFAULT_QUEUE_MAX = 10_000
+DEFAULT_BATCH_MAX = 512
+DEFAULT_SPILL_PATH = "var/metaos/audit_spill.jsonl"
+
+_STOP = object()
 
 
 def _utc_now() -> str:
     return datetime.utcnow().isoformat() + "Z"
 
 
+def _write_fallback(error: Exception, **extra: Any) -> None:
+    fallback = {
+        "event": "audit_error",
+        "outcome": "deny",
+        "error": str(error),
+        "recorded_at": _utc_now(),
+        **extra,
+    }
+    try:
+        sys.stderr.write(json.dumps(fallback) + "\n")
+        sys.stderr.flush()
+    except Exception:
+        pass
+
+
+def _serialize(event: Dict[str, Any]) -> str:
+    payload = dict(event)
+    payload.setdefault("recorded_at", _utc_now())
+    return json.dumps(payload, ensure_ascii=False)
+
+
+class BackgroundAuditSink:
+    """
+    Audit JSONL writer off the request path.
+
+    - emit() stamps + serializes the event in the caller (snapshot of the dict),
+      then enqueues the line on a bounded queue; nothing touches stdout there
+    - one writer thread drains the queue in batches (up to batch_max lines per
+      write + flush), so lines come out in emit order
+    - queue full → overflow policy:
+        block : wait for room (back-pressure, nothing lost)
+        drop  : discard the event, count it in `dropped`
+        spill : append the line to spill_path instead (its own emit order)
+    - flush() waits until everything enqueued so far is written;
+      close() flushes and stops the writer (registered with atexit). The closed
+      check + enqueue in emit() and all of close() share one lock, so no line
+      lands behind the stop marker, and an emit after close() is written only
+      once the writer has drained (emit order kept through shutdown)
+    - a failing stream never raises into emit(): the batch is reported on
+      stderr as audit_error, same as the synchronous path
+    """
+
+    def __init__(
+        self,
+        stream: Optional[TextIO] = None,
+        *,
+        maxsize: int = DEFAULT_QUEUE_MAX,
+        overflow: str = OVERFLOW_BLOCK,
+        spill_path: Optional[str] = None,
+        batch_max: int = DEFAULT_BATCH_MAX,
+    ) -> None:
+        if overflow not in _OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {_OVERFLOW_POLICIES}")
+        if maxsize <= 0 or batch_max <= 0:
+            raise ValueError("maxsize and batch_max must be > 0")
+        self._stream = stream  # None: sys.stdout at write time
+        self.overflow = overflow
+        self.spill_path = spill_path or DEFAULT_SPILL_PATH
+        self.batch_max = batch_max
+        self.dropped = 0
+        self.spilled = 0
+        self._q: "queue.Queue[Any]" = queue.Queue(maxsize=maxsize)
+        self._spill_lock = threading.Lock()
+        self._lock = threading.Lock()  # _closed + enqueue vs close()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="audit-sink", daemon=True)
+        self._thread.start()
+
+    # ---- producer ----
+    def emit(self, event: Dict[str, Any]) -> None:
+        try:
+            line = _serialize(event)
+        except Exception as e:
+            _write_fallback(e)
+            return
+        with self._lock:
+            closed = self._closed
+            if not closed:
+                if self.overflow == OVERFLOW_BLOCK:
+                    # the writer never takes self._lock, so a full queue still drains
+                    self._q.put(line)
+                    return
+                try:
+                    self._q.put_nowait(line)
+                    return
+                except queue.Full:
+                    pass
+        if closed:
+            _write_line(self._stream, line)
+        elif self.overflow == OVERFLOW_DROP:
+            with self._spill_lock:
+                self.dropped += 1
+        else:
+            self._spill(line)
+
+    def _spill(self, line: str) -> None:
+        with self._spill_lock:
+            try:
+                d = os.path.dirname(self.spill_path)
+                if d:
+                    os.makedirs(d, exist_ok=True)
+                with open(self.spill_path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+                self.spilled += 1
+            except Exception as e:
+                self.dropped += 1
+                _write_fallback(e, spill_path=self.spill_path)
+
+    # ---- writer ----
+    def _run(self) -> None:
+        q = self._q
+        while True:
+            item = q.get()
+            batch: List[str] = []
+            stop = item is _STOP
+            if not stop:
+                batch.append(item)
+            while not stop and len(batch) < self.batch_max:
+                try:
+                    item = q.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                else:
+                    batch.append(item)
+            if batch:
+                try:
+                    stream = self._stream or sys.stdout
+                    stream.write("\n".join(batch) + "\n")
+                    stream.flush()
+                except Exception as e:
+                    _write_fallback(e, lost=len(batch))
+            for _ in range(len(batch) + (1 if stop else 0)):
+                q.task_done()
+            if stop:
+                return
+
+    # ---- lifecycle ----
+    def flush(self) -> None:
+        if self._thread.is_alive():
+            self._q.join()
+
+    def close(self) -> None:
+        # later emits write synchronously, after the writer has drained what is queued
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._q.put(_STOP)
+            self._thread.join()
+            leftovers: List[str] = []
+            while True:
+                try:
+                    item = self._q.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not _STOP:
+                    leftovers.append(item)
+                self._q.task_done()
+            for line in leftovers:
+                _write_line(self._stream, line)
+
+
+def _write_line(stream: Optional[TextIO], line: str) -> None:
+    try:
+        out = stream or sys.stdout
+        out.write(line + "\n")
+        out.flush()
+    except Exception as e:
+        _write_fallback(e)
+
+
+_SINK: Optional[BackgroundAuditSink] = None
+_SINK_LOCK = threading.Lock()
+
+
+def configure_audit_sink(sink: Optional[BackgroundAuditSink]) -> Optional[BackgroundAuditSink]:
+    """Install (or with None remove) the process-wide background sink; the previous one is closed."""
+    global _SINK
+    with _SINK_LOCK:
+        prev, _SINK = _SINK, sink
+    if prev is not None and prev is not sink:
+        prev.close()
+    return sink
+
+
+def audit_sink_from_env() -> Optional[BackgroundAuditSink]:
+    """
+    METAOS_AUDIT_SINK=background enables the background sink
+      METAOS_AUDIT_OVERFLOW   block | drop | spill   (default block)
+      METAOS_AUDIT_QUEUE_MAX  queue bound            (default 10000)
+      METAOS_AUDIT_SPILL_PATH spill file             (default var/metaos/audit_spill.jsonl)
+    Anything else keeps the synchronous stdout write.
+    """
+    if os.getenv("METAOS_AUDIT_SINK", "sync").lower() != "background":
+        return None
+    return BackgroundAuditSink(
+        maxsize=int(os.getenv("METAOS_AUDIT_QUEUE_MAX", str(DEFAULT_QUEUE_MAX))),
+        overflow=os.getenv("METAOS_AUDIT_OVERFLOW", OVERFLOW_BLOCK).lower(),
+        spill_path=os.getenv("METAOS_AUDIT_SPILL_PATH") or None,
+    )
+
+
+def shutdown_audit_sink() -> None:
+    """Flush and stop the background sink (FastAPI shutdown / atexit)."""
+    configure_audit_sink(None)
+
+
+atexit.register(shutdown_audit_sink)
+
+
 def emit_audit_event(event: Dict[str, Any]) -> None:
     """
     Emit a single audit event as JSONL.
@@ -17,6 +244,10 @@ def emit_audit_event(event: Dict[str, Any]) -> None:
     This function must NEVER raise in a way that
     flips deny -> allow semantics upstream.
     """
+    sink = _SINK
+    if sink is not None:
+        sink.emit(event)
+        return
     try:
         payload = dict(event)
         payload.setdefault("recorded_at", _utc_now())
@@ -24,14 +255,7 @@ def emit_audit_event(event: Dict[str, Any]) -> None:
         sys.stdout.write(line + "\n")
         sys.stdout.flush()
     except Exception as e:
-        fallback = {
-            "event": "audit_error",
-            "outcome": "deny",
-            "error": str(e),
-            "recorded_at": _utc_now(),
-        }
-        sys.stderr.write(json.dumps(fallback) + "\n")
-        sys.stderr.flush()
+        _write_fallback(e)
 
 
 # Backward-compatible placeholder (if other modules call it)
@@ -40,6 +40,10 @@ class ExecutionRun(Base):
     started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     ended_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
+    # batched worker claim (worker_0001): owner token + claim time for lease expiry
+    claim_token: Mapped[Optional[str]] = mapped_column(String(36), nullable=True)
+    claimed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
     status: Mapped[str] = mapped_column(
         String(24),
         nullable=False,
@@ -4,7 +4,7 @@ import os
 from fastapi import APIRouter, Depends, Query
 
 from infra.api.deps import get_l2
-from core.analytics.weekly import load_scene_summaries_jsonl, rollup_weekly
+from core.analytics.rolling import get_scene_aggregate_store
 
 router = APIRouter(prefix="/v1/analytics", tags=["analytics"])
 
@@ -15,6 +15,6 @@ def weekly(days: int = Query(7, ge=1, le=90), l2=Depends(get_l2)) -> dict:
     if not path or not os.path.exists(path):
         return {"ok": True, "days": days, "note": "scene_summaries.jsonl not found", "rollup": None}
 
-    items = load_scene_summaries_jsonl(path)
-    rollup = rollup_weekly(items, days=days)
+    # day buckets are kept per process and only tail newly appended lines
+    rollup = get_scene_aggregate_store(path).rollup(days=days)
     return {"ok": True, "days": days, "rollup": rollup.__dict__}
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import json
 import os
-from typing import List, Optional
+from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from infra.api.deps import get_l2
+from infra.storage.scene_segments import SceneSegmentStore
 
 router = APIRouter(prefix="/v1/scenes", tags=["scenes"])
 
@@ -15,31 +15,27 @@ router = APIRouter(prefix="/v1/scenes", tags=["scenes"])
 def list_closed(
     limit: int = Query(50, ge=1, le=500),
     channel: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
     l2=Depends(get_l2),
 ) -> dict:
     path = getattr(l2, "scene_summaries_path", None)
     if not path:
-        return {"count": 0, "items": [], "note": "scene_summaries_path not configured"}
+        return {"count": 0, "items": [], "next_cursor": None, "note": "scene_summaries_path not configured"}
 
     if not os.path.exists(path):
-        return {"count": 0, "items": [], "note": "scene_summaries.jsonl not found yet"}
-
-    with open(path, "r", encoding="utf-8") as f:
-        lines = [ln.strip() for ln in f.readlines() if ln.strip()]
-
-    # latest first
-    lines.reverse()
-
-    items: List[dict] = []
-    for ln in lines:
-        try:
-            obj = json.loads(ln)
-        except Exception:
-            continue
-        if channel and obj.get("context", {}).get("channel") != channel:
-            continue
-        items.append(obj)
-        if len(items) >= limit:
-            break
-
-    return {"count": len(items), "items": items}
+        return {"count": 0, "items": [], "next_cursor": None, "note": "scene_summaries.jsonl not found yet"}
+
+    # read-only: writers segment on append (sync_legacy); a GET only re-reads the manifest
+    segments = getattr(l2, "scene_segments", None)
+    if segments is None:
+        segments = SceneSegmentStore(os.path.dirname(path), legacy_path=path, sync=False)
+    else:
+        segments.refresh()
+
+    # latest first; with a channel only that channel's newest segment(s) are read
+    try:
+        items, next_cursor = segments.page(channel, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail={"code": "INVALID_CURSOR", "message": str(e)})
+
+    return {"count": len(items), "items": items, "next_cursor": next_cursor}
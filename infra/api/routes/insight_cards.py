@@ -4,8 +4,11 @@ import os
 from fastapi import APIRouter, Depends, Query
 
 from infra.api.deps import get_l2
-from core.analytics.weekly import load_scene_summaries_jsonl
-from core.analytics.insight_cards import build_weekly_insight_card
+from core.analytics.rolling import get_scene_aggregate_store
+from core.analytics.insight_cards import (
+    build_weekly_insight_card,
+    build_weekly_insight_card_from_store,
+)
 from core.analytics.evidence import (
     load_decision_snapshots_jsonl,
     build_scene_to_snapshot_ids,
@@ -28,7 +31,7 @@ def insight_cards(
         card = build_weekly_insight_card([], days=days)
         return {"ok": True, "days": days, "cards": [card.__dict__], "note": "scene_summaries.jsonl not found"}
 
-    summaries = load_scene_summaries_jsonl(summaries_path)
+    store = get_scene_aggregate_store(summaries_path)
 
     scene_to_snapshot_ids = None
     if include_evidence:
@@ -39,8 +42,8 @@ def insight_cards(
         else:
             scene_to_snapshot_ids = {}
 
-    card = build_weekly_insight_card(
-        summaries,
+    card = build_weekly_insight_card_from_store(
+        store,
         days=days,
         scene_to_snapshot_ids=scene_to_snapshot_ids,
         evidence_per_scene=evidence_per_scene,
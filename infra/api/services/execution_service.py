@@ -1,29 +1,73 @@
+import weakref
+from typing import Any, Dict, Optional
+
 from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.exc import IntegrityError, OperationalError
 from infra.api.endpoints.models.execution_run import ExecutionRun
 
 class ExecutionBlocked(Exception):
     def __init__(self, reason: str):
         self.reason = reason
 
+# engines where the single-statement upsert is unavailable: SQLite < 3.35 (no RETURNING)
+# or a schema without the (project_id, idempotency_key) unique index
+_UPSERT_UNSUPPORTED: "weakref.WeakSet[Any]" = weakref.WeakSet()
+_UNSUPPORTED_MARKERS = ("ON CONFLICT clause does not match", "syntax error")
+
+async def _upsert_returning(session: AsyncSession, values: Dict[str, Any]) -> Optional[ExecutionRun]:
+    """
+    One round-trip: INSERT ... ON CONFLICT (project_id, idempotency_key) DO UPDATE (no-op) RETURNING.
+    The no-op update makes RETURNING yield the existing row on a duplicate (DO NOTHING returns no row).
+    None → caller uses the insert / re-select path.
+    """
+    bind = session.get_bind()
+    if bind.dialect.name != "sqlite" or bind in _UPSERT_UNSUPPORTED:
+        return None
+    stmt = sqlite_insert(ExecutionRun).values(**values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ExecutionRun.project_id, ExecutionRun.idempotency_key],
+        set_={"idempotency_key": stmt.excluded.idempotency_key},
+    ).returning(ExecutionRun)
+    try:
+        res = await session.execute(stmt, execution_options={"populate_existing": True})
+    except OperationalError as e:
+        if not any(m in str(e) for m in _UNSUPPORTED_MARKERS):
+            raise  # e.g. "database is locked": same failure the insert path would report
+        await session.rollback()
+        _UPSERT_UNSUPPORTED.add(bind)
+        return None
+    except IntegrityError:
+        # e.g. ck_execution_runs_scope: let the insert path fail exactly as before
+        await session.rollback()
+        return None
+    er = res.scalar_one()
+    await session.commit()
+    if session.sync_session.expire_on_commit:
+        await session.refresh(er)
+    return er
+
 async def create_execution_run(session: AsyncSession, *, project_id: str, decision_card_id, execution_scope: str, idempotency_key: str) -> ExecutionRun:
-    er = ExecutionRun(
+    values = dict(
         project_id=project_id,
         decision_card_id=decision_card_id,
         execution_scope=execution_scope,
         idempotency_key=idempotency_key,
     )
-    session.add(er)
-    try:
-        await session.commit()
-    except IntegrityError:
-        await session.rollback()
-        row = await session.execute(
-            select(ExecutionRun).where(ExecutionRun.idempotency_key == idempotency_key)
-        )
-        er = row.scalar_one()
-    await session.refresh(er)
+    er = await _upsert_returning(session, values)
+    if er is None:
+        er = ExecutionRun(**values)
+        session.add(er)
+        try:
+            await session.commit()
+        except IntegrityError:
+            await session.rollback()
+            row = await session.execute(
+                select(ExecutionRun).where(ExecutionRun.idempotency_key == idempotency_key)
+            )
+            er = row.scalar_one()
+        await session.refresh(er)
     if er.status != "RUN":
         raise ExecutionBlocked(er.blocked_reason or "unknown")
     return er
@@ -1,7 +1,13 @@
+import asyncio
+import math
+import uuid
+from dataclasses import dataclass
 from uuid import UUID
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from sqlalchemy import and_, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from infra.api.endpoints.models.execution_run import ExecutionRun
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 async def execute_job(execution_id: UUID, session: AsyncSession):
     er = await session.get(ExecutionRun, execution_id)
@@ -10,3 +16,193 @@ async def execute_job(execution_id: UUID, session: AsyncSession):
     er.ended_at = datetime.now(timezone.utc)
     er.status = "HALTED"
     await session.commit()
+
+
+# ---- batched worker ----
+# RUN -> EXECUTING (claim_token, claimed_at) -> HALTED | BLOCKED(execution_timeout / execution_error:*)
+# A claim older than the lease belongs to a dead worker and is claimed again with a new token;
+# the finishing UPDATE is guarded by the token, so a late worker never overwrites the new owner.
+
+STATUS_EXECUTING = "EXECUTING"
+
+
+@dataclass(frozen=True)
+class ClaimedRun:
+    execution_id: str
+    project_id: str
+    decision_card_id: Optional[str]
+    execution_scope: str
+    idempotency_key: str
+
+
+# handler(run) -> None: the job itself; returning normally → HALTED (same as execute_job)
+JobHandler = Callable[[ClaimedRun], Awaitable[None]]
+
+
+async def halt_handler(run: ClaimedRun) -> None:
+    return None
+
+
+def _utcnow_naive() -> datetime:
+    # SQLite(naive datetime) 일관성 유지 (claimed_at 비교용)
+    return datetime.utcnow()
+
+
+async def claim_batch(
+    session: AsyncSession,
+    *,
+    limit: int,
+    lease_seconds: float,
+    token: Optional[str] = None,
+) -> Tuple[str, List[ClaimedRun]]:
+    """
+    One UPDATE ... RETURNING: up to `limit` RUN executions (oldest first), plus
+    EXECUTING ones whose claim is older than the lease, move to EXECUTING under a
+    fresh claim token. Committed before returning.
+    """
+    token = token or str(uuid.uuid4())
+    now = _utcnow_naive()
+    claimable = (
+        select(ExecutionRun.execution_id)
+        .where(
+            or_(
+                ExecutionRun.status == "RUN",
+                and_(
+                    ExecutionRun.status == STATUS_EXECUTING,
+                    ExecutionRun.claimed_at < now - timedelta(seconds=lease_seconds),
+                ),
+            )
+        )
+        .order_by(ExecutionRun.created_at)
+        .limit(limit)
+    )
+    res = await session.execute(
+        update(ExecutionRun)
+        .where(ExecutionRun.execution_id.in_(claimable.scalar_subquery()))
+        .values(status=STATUS_EXECUTING, claim_token=token, claimed_at=now)
+        .returning(
+            ExecutionRun.execution_id,
+            ExecutionRun.project_id,
+            ExecutionRun.decision_card_id,
+            ExecutionRun.execution_scope,
+            ExecutionRun.idempotency_key,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    runs = [ClaimedRun(*row) for row in res.all()]
+    await session.commit()
+    return token, runs
+
+
+async def run_claimed(
+    runs: List[ClaimedRun],
+    handler: JobHandler,
+    *,
+    concurrency: int,
+    job_timeout: float,
+) -> Dict[str, Tuple[str, Optional[str]]]:
+    """execution_id -> (final status, blocked_reason); at most `concurrency` handlers at a time."""
+    sem = asyncio.Semaphore(max(1, concurrency))
+    out: Dict[str, Tuple[str, Optional[str]]] = {}
+
+    async def one(run: ClaimedRun) -> None:
+        async with sem:
+            try:
+                await asyncio.wait_for(handler(run), timeout=job_timeout)
+                out[run.execution_id] = ("HALTED", None)
+            except asyncio.TimeoutError:
+                out[run.execution_id] = ("BLOCKED", "execution_timeout")
+            except Exception as e:
+                # fail-closed: a failing job never goes back to RUN
+                out[run.execution_id] = ("BLOCKED", f"execution_error:{type(e).__name__}")
+
+    await asyncio.gather(*(one(r) for r in runs))
+    return out
+
+
+async def finish_batch(
+    session: AsyncSession,
+    token: str,
+    outcomes: Dict[str, Tuple[str, Optional[str]]],
+) -> int:
+    """Bulk status transition: one UPDATE per distinct (status, reason), only for rows still held by `token`."""
+    groups: Dict[Tuple[str, Optional[str]], List[str]] = {}
+    for execution_id, outcome in outcomes.items():
+        groups.setdefault(outcome, []).append(execution_id)
+    now = datetime.now(timezone.utc)
+    done = 0
+    for (status, reason), ids in groups.items():
+        values = {"status": status, "ended_at": now, "claim_token": None}
+        if reason is not None:
+            values["blocked_reason"] = reason
+        res = await session.execute(
+            update(ExecutionRun)
+            .where(ExecutionRun.execution_id.in_(ids), ExecutionRun.claim_token == token)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        done += res.rowcount or 0
+    await session.commit()
+    return done
+
+
+async def process_batch(
+    session_maker,
+    *,
+    handler: JobHandler = halt_handler,
+    batch_size: int = 64,
+    concurrency: int = 8,
+    job_timeout: float = 30.0,
+    lease_seconds: float = 300.0,
+) -> int:
+    """Claim, run and finish one batch; returns the number of executions claimed (0: queue empty)."""
+    # claimed_at is stamped once per batch and jobs queue on the semaphore, so the last job of a
+    # full batch finishes (at worst) ceil(batch_size / concurrency) * job_timeout after the claim
+    waves = math.ceil(batch_size / max(1, concurrency))
+    if lease_seconds <= waves * job_timeout:
+        raise ValueError(
+            "lease_seconds must exceed ceil(batch_size / concurrency) * job_timeout "
+            "(a live claim must not look dead)"
+        )
+    async with session_maker() as session:
+        token, runs = await claim_batch(session, limit=batch_size, lease_seconds=lease_seconds)
+    if not runs:
+        return 0
+    outcomes = await run_claimed(runs, handler, concurrency=concurrency, job_timeout=job_timeout)
+    async with session_maker() as session:
+        await finish_batch(session, token, outcomes)
+    return len(runs)
+
+
+async def worker_loop(
+    session_maker,
+    *,
+    handler: JobHandler = halt_handler,
+    batch_size: int = 64,
+    concurrency: int = 8,
+    job_timeout: float = 30.0,
+    lease_seconds: float = 300.0,
+    idle_seconds: float = 1.0,
+    stop: Optional[asyncio.Event] = None,
+    exit_when_idle: bool = False,
+) -> int:
+    """
+    session_maker: async session factory (예: async_sessionmaker)
+    Runs until `stop` is set (or the queue is empty with exit_when_idle); returns executions claimed.
+    """
+    total = 0
+    while stop is None or not stop.is_set():
+        n = await process_batch(
+            session_maker,
+            handler=handler,
+            batch_size=batch_size,
+            concurrency=concurrency,
+            job_timeout=job_timeout,
+            lease_seconds=lease_seconds,
+        )
+        total += n
+        if n == 0:
+            if exit_when_idle:
+                break
+            await asyncio.sleep(idle_seconds)
+    return total
@@ -9,6 +9,7 @@ from typing import Dict, Sequence
 from core.contracts.ports import L2AuditRepoPort
 from core.contracts.scene import SceneRef, SceneSummary
 from core.utils.ids import new_id
+from infra.storage.scene_segments import SceneSegmentStore
 
 
 class FileBackedL2AuditRepo(L2AuditRepoPort):
@@ -17,6 +18,8 @@ class FileBackedL2AuditRepo(L2AuditRepoPort):
     - No update/delete.
     - Each decision snapshot is one JSON line.
     - Each scene summary is one JSON line.
+    - Scene summaries are also partitioned by channel/day (scene_segments/)
+      for paginated listing and lookup by scene_id.
     """
 
     def __init__(self, base_dir: str) -> None:
@@ -26,6 +29,8 @@ class FileBackedL2AuditRepo(L2AuditRepoPort):
         self.snapshots_path = os.path.join(self.base_dir, "decision_snapshots.jsonl")
         self.scene_summaries_path = os.path.join(self.base_dir, "scene_summaries.jsonl")
 
+        # typed summaries appended by this process; everything on disk is reached
+        # through the segment store's scene_id index (no full load at startup)
         self._scene_index: Dict[str, SceneSummary] = {}
         self._load_scene_index()
 
@@ -38,20 +43,7 @@ class FileBackedL2AuditRepo(L2AuditRepoPort):
             f.write(line + "\n")
 
     def _load_scene_index(self) -> None:
-        if not os.path.exists(self.scene_summaries_path):
-            return
-        with open(self.scene_summaries_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    data = json.loads(line)
-                    # Best-effort load; typed reconstruction can be tightened later.
-                    # Keep it simple for v0.1.
-                    self._scene_index[data["scene_id"]] = data  # type: ignore
-                except Exception:
-                    continue
+        self.scene_segments = SceneSegmentStore(self.base_dir, legacy_path=self.scene_summaries_path)
 
     def append_decision_snapshot(self, snapshot: dict) -> str:
         snapshot_id = new_id("snap")
@@ -79,12 +71,13 @@ class FileBackedL2AuditRepo(L2AuditRepoPort):
         return out
 
     def append_scene_summary(self, summary: SceneSummary) -> str:
-        if isinstance(self._scene_index.get(summary.scene_id), dict) or summary.scene_id in self._scene_index:
+        if summary.scene_id in self._scene_index or summary.scene_id in self.scene_segments:
             raise RuntimeError("L2 is append-only: scene_summary already exists for this scene_id")
 
         obj = asdict(summary)
         obj["ts_written"] = self._now_iso()
         self._append_jsonl(self.scene_summaries_path, obj)
+        self.scene_segments.sync_legacy()
 
         self._scene_index[summary.scene_id] = summary
         return summary.scene_id
@@ -95,11 +88,11 @@ class FileBackedL2AuditRepo(L2AuditRepoPort):
 
     def read_scene_summary(self, scene_id: str) -> SceneSummary:
         v = self._scene_index.get(scene_id)
-        if v is None:
+        if v is None and scene_id not in self.scene_segments:
             raise KeyError(f"scene_summary not found: {scene_id}")
         # If loaded as dict (best-effort), return raw dict is not compatible.
         # For v0.1 we don't call this in E2E path.
-        if isinstance(v, dict):
+        if v is None:
             raise RuntimeError("scene_summary loaded as raw dict; typed read not implemented in v0.1")
         return v
 
@@ -109,6 +102,7 @@ class FileBackedL2AuditRepo(L2AuditRepoPort):
         # Create file lazily
         os.makedirs(self.base_dir, exist_ok=True)
         self._append_jsonl(self.scene_summaries_path, summary_obj)
+        self.scene_segments.sync_legacy()
         return summary_obj.get("scene_id", "")
 
 # Backward-friendly alias (in case you used this name elsewhere)
@@ -2,13 +2,41 @@ from __future__ import annotations
 
 import json
 import os
+import threading
+import zlib
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from core.contracts.scene import SceneContext, SceneRef, SceneStatus
 from core.utils.ids import new_id
 
 
+def _ref_from_item(item: dict) -> SceneRef:
+    return SceneRef(
+        scene_id=item["scene_id"],
+        status=SceneStatus(item["status"]),
+        context=SceneContext(**item["context"]),
+        ts_start=item["ts_start"],
+        ts_end=item.get("ts_end"),
+    )
+
+
+def _item_from_ref(ref: SceneRef, ts_updated: str) -> dict:
+    return {
+        "scene_id": ref.scene_id,
+        "status": ref.status.value,
+        "context": {
+            "org_id": ref.context.org_id,
+            "site_id": ref.context.site_id,
+            "channel": (ref.context.channel.value if hasattr(ref.context.channel, "value") else ref.context.channel),
+            "context_key": ref.context.context_key,
+        },
+        "ts_start": ref.ts_start,
+        "ts_end": ref.ts_end,
+        "ts_updated": ts_updated,
+    }
+
+
 class FileBackedSceneRepo:
     """
     Stores ACTIVE scenes index by context_key.
@@ -47,28 +75,10 @@ class FileBackedSceneRepo:
         item = self._index.get(context_key)
         if not item:
             return None
-        return SceneRef(
-            scene_id=item["scene_id"],
-            status=SceneStatus(item["status"]),
-            context=SceneContext(**item["context"]),
-            ts_start=item["ts_start"],
-            ts_end=item.get("ts_end"),
-        )
+        return _ref_from_item(item)
 
     def upsert_active(self, ref: SceneRef) -> None:
-        self._index[ref.context.context_key] = {
-            "scene_id": ref.scene_id,
-            "status": ref.status.value,
-            "context": {
-                "org_id": ref.context.org_id,
-                "site_id": ref.context.site_id,
-                "channel": (ref.context.channel.value if hasattr(ref.context.channel, "value") else ref.context.channel),
-                "context_key": ref.context.context_key,
-            },
-            "ts_start": ref.ts_start,
-            "ts_end": ref.ts_end,
-            "ts_updated": self._now_iso(),
-        }
+        self._index[ref.context.context_key] = _item_from_ref(ref, self._now_iso())
         self._save()
 
     def clear_active(self, context_key: str) -> None:
@@ -90,3 +100,226 @@ class FileBackedSceneRepo:
         )
         self.upsert_active(ref)
         return ref
+
+
+class LogStructuredSceneRepo:
+    """
+    Same interface as FileBackedSceneRepo, but upserts append to a log instead of
+    rewriting the whole index.
+
+    Layout (under base_dir):
+      active_log.jsonl   one record per line: "<crc32 hex8> <json>\n"
+                         {"op": "put", "k": context_key, "v": item} | {"op": "del", "k": context_key}
+
+    - open: replay the log into the in-memory index (get/list never touch disk).
+      Replay stops at the first torn/corrupt record (a write killed mid-line)
+      and the log is truncated there, so the index is always a prefix of the
+      upserts that were issued.
+    - upsert/clear: one appended line, flushed (fsync=True also fsyncs) → O(1)
+    - compaction: once dead records exceed max(compact_min_records, live keys),
+      a background thread writes the live index to a new log and swaps it in
+      with os.replace; records appended meanwhile are carried over.
+    - an existing active_index.json (FileBackedSceneRepo) seeds a new log once.
+    """
+
+    LOG_NAME = "active_log.jsonl"
+    DEFAULT_COMPACT_MIN_RECORDS = 1024
+
+    def __init__(
+        self,
+        base_dir: str = "data/scene",
+        *,
+        fsync: bool = False,
+        compact_min_records: int = DEFAULT_COMPACT_MIN_RECORDS,
+        background_compaction: bool = True,
+    ) -> None:
+        self.base_dir = base_dir
+        os.makedirs(self.base_dir, exist_ok=True)
+        self.log_path = os.path.join(self.base_dir, self.LOG_NAME)
+        self.legacy_index_path = os.path.join(self.base_dir, "active_index.json")
+        self.fsync = fsync
+        self.compact_min_records = compact_min_records
+        self.background_compaction = background_compaction
+
+        self._index: Dict[str, dict] = {}
+        self._records = 0
+        self._lock = threading.Lock()
+        self._compact_lock = threading.Lock()
+        self._compacting: Optional[threading.Thread] = None
+        # records appended while a compaction is writing its snapshot
+        self._carry: Optional[List[bytes]] = None
+
+        self._open()
+
+    def _now_iso(self) -> str:
+        return datetime.now(timezone.utc).isoformat()
+
+    # ---- log format ----
+    @staticmethod
+    def _encode(rec: dict) -> bytes:
+        body = json.dumps(rec, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return b"%08x " % zlib.crc32(body) + body + b"\n"
+
+    @staticmethod
+    def _decode(line: bytes) -> Optional[dict]:
+        if len(line) < 10 or not line.endswith(b"\n") or line[8:9] != b" ":
+            return None
+        body = line[9:-1]
+        try:
+            if int(line[:8], 16) != zlib.crc32(body):
+                return None
+            rec = json.loads(body.decode("utf-8"))
+        except ValueError:
+            return None
+        if not isinstance(rec, dict) or rec.get("op") not in ("put", "del") or not isinstance(rec.get("k"), str):
+            return None
+        return rec
+
+    def _apply(self, rec: dict) -> None:
+        if rec["op"] == "put":
+            self._index[rec["k"]] = rec["v"]
+        else:
+            self._index.pop(rec["k"], None)
+
+    # ---- open / replay ----
+    def _open(self) -> None:
+        if not os.path.exists(self.log_path):
+            self._seed_from_legacy_index()
+
+        good_end = 0
+        with open(self.log_path, "rb") as f:
+            for line in f:
+                rec = self._decode(line)
+                if rec is None:
+                    break
+                self._apply(rec)
+                self._records += 1
+                good_end += len(line)
+        if good_end != os.path.getsize(self.log_path):
+            # torn tail from an interrupted write: drop it
+            with open(self.log_path, "r+b") as f:
+                f.truncate(good_end)
+        self._fh = open(self.log_path, "ab")
+
+    def _seed_from_legacy_index(self) -> None:
+        legacy: Dict[str, dict] = {}
+        if os.path.exists(self.legacy_index_path):
+            try:
+                with open(self.legacy_index_path, "r", encoding="utf-8") as f:
+                    legacy = json.load(f) or {}
+            except Exception:
+                legacy = {}
+        self._write_log_file(self.log_path, [self._encode({"op": "put", "k": k, "v": v}) for k, v in legacy.items()])
+
+    def _write_log_file(self, path: str, lines: List[bytes]) -> None:
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    # ---- append ----
+    def _append(self, rec: dict) -> None:
+        line = self._encode(rec)
+        with self._lock:
+            self._fh.write(line)
+            self._fh.flush()
+            if self.fsync:
+                os.fsync(self._fh.fileno())
+            self._apply(rec)
+            self._records += 1
+            if self._carry is not None:
+                self._carry.append(line)
+            due = self._compacting is None and self._records - len(self._index) > max(
+                self.compact_min_records, len(self._index)
+            )
+        if due:
+            if self.background_compaction:
+                self._start_compaction()
+            else:
+                self.compact()
+
+    # ---- compaction ----
+    def _start_compaction(self) -> None:
+        with self._lock:
+            if self._compacting is not None:
+                return
+            t = threading.Thread(target=self.compact, name="scene-log-compaction", daemon=True)
+            self._compacting = t
+        t.start()
+
+    def compact(self) -> None:
+        """Rewrite the log as one put per live key (safe to call at any time)."""
+        with self._compact_lock:
+            self._compact()
+
+    def _compact(self) -> None:
+        with self._lock:
+            snapshot = [self._encode({"op": "put", "k": k, "v": v}) for k, v in self._index.items()]
+            self._carry = []
+        try:
+            tmp = self.log_path + ".compact"
+            with open(tmp, "wb") as f:
+                f.writelines(snapshot)
+                f.flush()
+                os.fsync(f.fileno())
+            with self._lock:
+                carry = self._carry or []
+                with open(tmp, "ab") as f:
+                    f.writelines(carry)
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._fh.close()
+                os.replace(tmp, self.log_path)
+                self._fh = open(self.log_path, "ab")
+                self._records = len(snapshot) + len(carry)
+        finally:
+            with self._lock:
+                self._carry = None
+                if self._compacting is threading.current_thread():
+                    self._compacting = None
+
+    def wait_for_compaction(self) -> None:
+        t = self._compacting
+        if t is not None:
+            t.join()
+
+    def close(self) -> None:
+        self.wait_for_compaction()
+        with self._lock:
+            self._fh.close()
+
+    # ---- repo interface ----
+    def get(self, context_key: str) -> Optional[dict]:
+        item = self._index.get(context_key)
+        return dict(item) if item else None
+
+    def get_active_by_context(self, context_key: str) -> Optional[SceneRef]:
+        item = self._index.get(context_key)
+        if not item:
+            return None
+        return _ref_from_item(item)
+
+    def upsert_active(self, ref: SceneRef) -> None:
+        self._append({"op": "put", "k": ref.context.context_key, "v": _item_from_ref(ref, self._now_iso())})
+
+    def clear_active(self, context_key: str) -> None:
+        if context_key in self._index:
+            self._append({"op": "del", "k": context_key})
+
+    def list_active(self) -> Dict[str, dict]:
+        with self._lock:
+            return self._index.copy()
+
+    def open_new_scene(self, context: SceneContext, ts_start: str) -> SceneRef:
+        scene_id = new_id("scene")
+        ref = SceneRef(
+            scene_id=scene_id,
+            status=SceneStatus.OPEN,
+            context=context,
+            ts_start=ts_start,
+            ts_end=None,
+        )
+        self.upsert_active(ref)
+        return ref
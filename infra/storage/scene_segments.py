@@ -0,0 +1,369 @@
+from __future__ import annotations
+
+import base64
+import json
+import os
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import quote
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX: single-writer only
+    fcntl = None  # type: ignore[assignment]
+
+# channel-less summaries get their own partition; quote() never emits a bare "@"
+_NO_CHANNEL = "@none"
+_LEGACY_DAY = "0000-00-00"
+_REVERSE_BLOCK = 64 * 1024
+
+
+def _now_day() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+
+def _day_of(obj: dict) -> str:
+    for k in ("ts_written", "ts_end"):
+        v = obj.get(k)
+        if isinstance(v, str) and len(v) >= 10 and v[4] == "-" and v[7] == "-":
+            return v[:10]
+    return _LEGACY_DAY
+
+
+def _channel_of(obj: dict) -> Optional[str]:
+    ch = (obj.get("context") or {}).get("channel")
+    ch = getattr(ch, "value", ch)
+    return ch if isinstance(ch, str) else None
+
+
+def _channel_key(channel: Optional[str]) -> str:
+    return _NO_CHANNEL if channel is None else quote(channel, safe="")
+
+
+def encode_cursor(partition: str, day: str, pos: int) -> str:
+    raw = json.dumps({"p": partition, "d": day, "o": pos}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str, int]:
+    """Raises ValueError on anything that is not a cursor we issued."""
+    try:
+        pad = "=" * (-len(cursor) % 4)
+        obj = json.loads(base64.urlsafe_b64decode(cursor + pad).decode("utf-8"))
+        p, d, o = obj["p"], obj["d"], obj["o"]
+    except Exception as e:
+        raise ValueError(f"invalid cursor: {cursor!r}") from e
+    if not isinstance(p, str) or not isinstance(d, str) or not isinstance(o, int) or o < 0:
+        raise ValueError(f"invalid cursor: {cursor!r}")
+    return p, d, o
+
+
+class SceneSegmentStore:
+    """
+    Channel/day partitioned copy of L2 scene summaries.
+
+    Layout (under <base_dir>/scene_segments):
+      <channel>/<YYYY-MM-DD>.jsonl   one summary per line, append order
+      scene_ids.tsv                  scene_id \\t channel \\t day \\t byte offset
+      manifest.json                  {"legacy_offset": n, "channels": {ch: {day: count}}}
+      .lock                          flock held by sync_legacy
+
+    scene_summaries.jsonl stays the append-only source of truth; segments are
+    caught up from its tail (sync_legacy) on open and after every L2 append, so
+    lines from other writers are never lost.
+    sync_legacy re-reads the manifest under the lock, so stores in other
+    processes never ingest the same legacy lines twice. Before appending it
+    records the pre-append size of every file it touches ("pending"); a sync
+    that finds pending sizes (crash between segment write and manifest save)
+    truncates back to them and ingests those lines again.
+    Days (ts_written, else ts_end) are clamped to be non-decreasing, so segment
+    order == append order.
+    """
+
+    def __init__(self, base_dir: str, legacy_path: Optional[str] = None, *, sync: bool = True) -> None:
+        self.root = os.path.join(base_dir, "scene_segments")
+        os.makedirs(self.root, exist_ok=True)
+        self.legacy_path = legacy_path
+        self.manifest_path = os.path.join(self.root, "manifest.json")
+        self.ids_path = os.path.join(self.root, "scene_ids.tsv")
+        self.lock_path = os.path.join(self.root, ".lock")
+
+        self._manifest = self._load_manifest()
+        self._ids: Optional[Dict[str, Tuple[str, str, int]]] = None
+        self._ids_size = 0  # bytes of scene_ids.tsv reflected in self._ids
+        if sync:
+            self.sync_legacy()
+
+    def refresh(self) -> None:
+        """Read-only catch-up: pick up what other stores have segmented (no ingest, no lock)."""
+        self._manifest = self._load_manifest()
+        self._drop_stale_ids()
+
+    # ---- manifest ----
+    def _load_manifest(self) -> dict:
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                m = json.load(f) or {}
+        except Exception:
+            m = {}
+        m.setdefault("legacy_offset", 0)
+        m.setdefault("last_day", _LEGACY_DAY)
+        m.setdefault("channels", {})
+        return m
+
+    def _save_manifest(self) -> None:
+        tmp = self.manifest_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._manifest, f, ensure_ascii=False, sort_keys=True)
+        os.replace(tmp, self.manifest_path)
+
+    def _segment_path(self, key: str, day: str) -> str:
+        return os.path.join(self.root, key, f"{day}.jsonl")
+
+    def _days(self, key: str) -> List[str]:
+        return sorted((self._manifest["channels"].get(key) or {}).keys())
+
+    # ---- write ----
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with open(self.lock_path, "a") as lf:
+            if fcntl is not None:
+                fcntl.flock(lf.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lf.fileno(), fcntl.LOCK_UN)
+
+    def _recover(self) -> None:
+        pending = self._manifest.pop("pending", None)
+        if not pending:
+            return
+        for rel, size in pending.items():
+            path = os.path.join(self.root, rel)
+            try:
+                if os.path.getsize(path) > size:
+                    with open(path, "r+b") as f:
+                        f.truncate(size)
+            except FileNotFoundError:
+                continue
+        self._save_manifest()
+        self._ids = None
+
+    def _drop_stale_ids(self) -> None:
+        try:
+            size = os.path.getsize(self.ids_path)
+        except OSError:
+            size = 0
+        if size != self._ids_size:
+            self._ids = None
+
+    def _place(self, obj: dict, day: str) -> Tuple[str, str]:
+        day = max(min(day, _now_day()), self._manifest["last_day"])
+        self._manifest["last_day"] = day
+        return _channel_key(_channel_of(obj)), day
+
+    def _write(self, obj: dict, key: str, day: str) -> None:
+        seg = self._segment_path(key, day)
+        os.makedirs(os.path.dirname(seg), exist_ok=True)
+
+        line = json.dumps(obj, ensure_ascii=False) + "\n"
+        with open(seg, "ab") as f:
+            off = f.tell()
+            f.write(line.encode("utf-8"))
+
+        sid = obj.get("scene_id")
+        if isinstance(sid, str) and sid and "\t" not in sid and "\n" not in sid:
+            rec = f"{sid}\t{key}\t{day}\t{off}\n".encode("utf-8")
+            with open(self.ids_path, "ab") as f:
+                f.write(rec)
+            if self._ids is not None:
+                self._ids[sid] = (key, day, off)
+                self._ids_size += len(rec)
+
+        days = self._manifest["channels"].setdefault(key, {})
+        days[day] = days.get(day, 0) + 1
+
+    def _read_legacy_tail(self, start: int) -> Tuple[List[dict], int]:
+        objs: List[dict] = []
+        with open(self.legacy_path, "rb") as f:  # type: ignore[arg-type]
+            f.seek(start)
+            pos = start
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # writer mid-append; pick it up next time
+                pos += len(raw)
+                ln = raw.decode("utf-8", errors="replace").strip()
+                if not ln:
+                    continue
+                try:
+                    obj = json.loads(ln)
+                except Exception:
+                    continue
+                if isinstance(obj, dict):
+                    objs.append(obj)
+        return objs, pos
+
+    def sync_legacy(self) -> int:
+        """Partition any legacy JSONL lines not yet in a segment. Returns lines ingested."""
+        if not self.legacy_path or not os.path.exists(self.legacy_path):
+            return 0
+        with self._locked():
+            self._manifest = self._load_manifest()
+            self._recover()
+            self._drop_stale_ids()
+            start = int(self._manifest["legacy_offset"])
+            if os.path.getsize(self.legacy_path) <= start:
+                return 0
+
+            objs, pos = self._read_legacy_tail(start)
+            placed = [(obj, *self._place(obj, _day_of(obj))) for obj in objs]
+            if placed:
+                pending: Dict[str, int] = {}
+                for rel in {os.path.join(key, f"{day}.jsonl") for _, key, day in placed} | {"scene_ids.tsv"}:
+                    try:
+                        pending[rel] = os.path.getsize(os.path.join(self.root, rel))
+                    except FileNotFoundError:
+                        pending[rel] = 0
+                self._manifest["pending"] = pending
+                self._save_manifest()
+                for obj, key, day in placed:
+                    self._write(obj, key, day)
+                self._manifest.pop("pending", None)
+            self._manifest["legacy_offset"] = pos
+            self._save_manifest()
+            return len(placed)
+
+    # ---- scene id lookup ----
+    def _load_ids(self) -> Dict[str, Tuple[str, str, int]]:
+        if self._ids is None:
+            ids: Dict[str, Tuple[str, str, int]] = {}
+            size = 0
+            if os.path.exists(self.ids_path):
+                with open(self.ids_path, "rb") as f:
+                    for raw in f:
+                        if not raw.endswith(b"\n"):
+                            break  # partial record of a writer mid-append
+                        size += len(raw)
+                        parts = raw.decode("utf-8", errors="replace").rstrip("\n").split("\t")
+                        if len(parts) != 4:
+                            continue
+                        try:
+                            ids[parts[0]] = (parts[1], parts[2], int(parts[3]))
+                        except ValueError:
+                            continue
+            self._ids_size = size
+            self._ids = ids
+        return self._ids
+
+    def __contains__(self, scene_id: str) -> bool:
+        return scene_id in self._load_ids()
+
+    def read(self, scene_id: str) -> Optional[dict]:
+        loc = self._load_ids().get(scene_id)
+        if loc is None:
+            return None
+        key, day, off = loc
+        with open(self._segment_path(key, day), "rb") as f:
+            f.seek(off)
+            return json.loads(f.readline().decode("utf-8"))
+
+    # ---- listing ----
+    def page(
+        self, channel: Optional[str], limit: int, cursor: Optional[str] = None
+    ) -> Tuple[List[dict], Optional[str]]:
+        """Latest-first page. With a channel, only that channel's newest segments are opened."""
+        if channel is None:
+            return self._page_all(limit, cursor)
+
+        key = _channel_key(channel)
+        days = self._days(key)
+        if cursor:
+            p, day, pos = decode_cursor(cursor)
+            if p != key:
+                raise ValueError("cursor belongs to a different channel")
+        else:
+            day, pos = (days[-1], -1) if days else ("", -1)
+
+        # pos: number of lines of `day` not yet returned (-1 = whole segment)
+        items: List[dict] = []
+        while day:
+            if pos != 0:
+                lines = self._segment_lines(key, day)
+                if pos < 0 or pos > len(lines):
+                    pos = len(lines)
+                while pos > 0 and len(items) < limit:
+                    pos -= 1
+                    obj = _loads(lines[pos])
+                    if obj is not None:
+                        items.append(obj)
+            older = [d for d in days if d < day]
+            if len(items) >= limit:
+                if pos > 0 or older:
+                    return items, encode_cursor(key, day, pos)
+                return items, None
+            day, pos = (older[-1], -1) if older else ("", -1)
+        return items, None
+
+    def _segment_lines(self, key: str, day: str) -> List[bytes]:
+        try:
+            with open(self._segment_path(key, day), "rb") as f:
+                return [ln for ln in f.read().split(b"\n") if ln.strip()]
+        except FileNotFoundError:
+            return []
+
+    def _page_all(self, limit: int, cursor: Optional[str]) -> Tuple[List[dict], Optional[str]]:
+        # Cross-channel order lives in the legacy JSONL; read it backwards from the cursor.
+        if not self.legacy_path or not os.path.exists(self.legacy_path):
+            return [], None
+        end = os.path.getsize(self.legacy_path)
+        if cursor:
+            p, _, pos = decode_cursor(cursor)
+            if p != "*":
+                raise ValueError("cursor belongs to a channel listing")
+            end = min(pos, end)
+
+        items: List[dict] = []
+        for start, raw in _reverse_lines(self.legacy_path, end):
+            obj = _loads(raw)
+            if obj is None:
+                continue
+            items.append(obj)
+            if len(items) >= limit:
+                return items, (encode_cursor("*", "", start) if start > 0 else None)
+        return items, None
+
+
+def _loads(raw: bytes) -> Optional[dict]:
+    ln = raw.strip()
+    if not ln:
+        return None
+    try:
+        obj = json.loads(ln.decode("utf-8"))
+    except Exception:
+        return None
+    return obj if isinstance(obj, dict) else None
+
+
+def _reverse_lines(path: str, end: int) -> Iterator[Tuple[int, bytes]]:
+    """Yield (line_start_offset, line) from `end` backwards, reading fixed-size blocks."""
+    with open(path, "rb") as f:
+        pos = end
+        buf = b""
+        while pos > 0:
+            step = min(_REVERSE_BLOCK, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+            lines = buf.split(b"\n")
+            buf = lines[0]
+            off = pos + len(buf) + 1
+            tail: List[Tuple[int, bytes]] = []
+            for ln in lines[1:]:
+                tail.append((off, ln))
+                off += len(ln) + 1
+            for item in reversed(tail):
+                yield item
+        if buf:
+            yield 0, buf
@@ -4,8 +4,11 @@ import os
 import json
 import argparse
 
-from core.analytics.weekly import load_scene_summaries_jsonl
-from core.analytics.insight_cards import build_weekly_insight_card
+from core.analytics.rolling import SceneAggregateStore
+from core.analytics.insight_cards import (
+    build_weekly_insight_card,
+    build_weekly_insight_card_from_store,
+)
 
 
 def main() -> int:
@@ -19,8 +22,8 @@ def main() -> int:
         print(json.dumps(card.__dict__, indent=2))
         return 0
 
-    items = load_scene_summaries_jsonl(args.path)
-    card = build_weekly_insight_card(items, days=args.days)
+    store = SceneAggregateStore.from_jsonl(args.path)
+    card = build_weekly_insight_card_from_store(store, days=args.days)
     print(json.dumps(card.__dict__, indent=2))
     return 0
 
@@ -4,7 +4,7 @@ import os
 import json
 import argparse
 
-from core.analytics.weekly import load_scene_summaries_jsonl, rollup_weekly
+from core.analytics.rolling import SceneAggregateStore
 
 
 def main() -> int:
@@ -17,8 +17,8 @@ def main() -> int:
         print(json.dumps({"ok": False, "error": "file not found", "path": args.path}, indent=2))
         return 1
 
-    items = load_scene_summaries_jsonl(args.path)
-    rollup = rollup_weekly(items, days=args.days)
+    store = SceneAggregateStore.from_jsonl(args.path)
+    rollup = store.rollup(days=args.days)
     print(json.dumps(rollup.__dict__, indent=2))
     return 0
 
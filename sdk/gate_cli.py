@@ -4,10 +4,8 @@ import json
 import hashlib
 from pathlib import Path
 
-import yaml
-
 from sdk.validate_v1 import validate_gate_decision_v1
-from core.policy_engine import load_rules, evaluate
+from core.policy_engine import load_compiled
 
 
 def sha256_file(path: str) -> str:
@@ -20,35 +18,50 @@ def _canonical_sha256(obj) -> str:
     return hashlib.sha256(b).hexdigest()
 
 
+def _finalize(decision, policy, include_capsule: bool):
+    # Attach deterministic policy fingerprints
+    decision["policy_sha256"] = policy.sha256
+    # Attach policy capsule + digest (optional; back-compat flag)
+    if include_capsule:
+        decision["policy_capsule"] = policy.ruleset
+        decision["policy_capsule_sha256"] = _canonical_sha256(policy.ruleset)
+
+    # Validate against v1 schema checks (python validator)
+    validate_gate_decision_v1(decision)
+    return decision
+
+
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--input", required=True, help="normalized input json OR raw features json")
     ap.add_argument("--policy", required=True, help="policy yaml path")
     ap.add_argument("--out", required=True, help="output gate decision json")
     ap.add_argument("--include-policy-capsule", action="store_true", help="include policy_capsule in output (back-compat)")
+    ap.add_argument("--batch", action="store_true", help="--input/--out are JSONL, one input/decision per line")
     args = ap.parse_args()
 
     inp_path = Path(args.input)
     policy_path = Path(args.policy)
     out_path = Path(args.out)
 
+    # parsed + compiled once per policy file version
+    policy = load_compiled(str(policy_path))
+
+    if args.batch:
+        raws = [json.loads(ln) for ln in inp_path.read_text(encoding="utf-8").splitlines() if ln.strip()]
+        decisions = policy.evaluate_many([raw.get("features", raw) for raw in raws])
+        with out_path.open("w", encoding="utf-8") as f:
+            for decision in decisions:
+                _finalize(decision, policy, args.include_policy_capsule)
+                f.write(json.dumps(decision, ensure_ascii=False) + "\n")
+        print(f"OK: wrote {out_path} decisions={len(decisions)}")
+        return
+
     raw = json.loads(inp_path.read_text(encoding="utf-8"))
     # Accept either normalized_input.v1 (features nested) or raw feature dict
     dry = raw.get("features", raw)
 
-    ruleset = load_rules(str(policy_path))
-    decision = evaluate(dry, ruleset)
-
-    # Attach deterministic policy fingerprints
-    decision["policy_sha256"] = sha256_file(str(policy_path))
-    # Attach policy capsule + digest (optional; back-compat flag)
-    if args.include_policy_capsule:
-        policy_capsule = yaml.safe_load(policy_path.read_text(encoding="utf-8"))
-        decision["policy_capsule"] = policy_capsule
-        decision["policy_capsule_sha256"] = _canonical_sha256(policy_capsule)
-
-    # Validate against v1 schema checks (python validator)
-    validate_gate_decision_v1(decision)
+    decision = _finalize(policy.evaluate(dry), policy, args.include_policy_capsule)
 
     out_path.write_text(json.dumps(decision, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
     print(f"OK: wrote {out_path}")
@@ -4,6 +4,29 @@ import json
 import sys
 from pathlib import Path
 
+SCHEMA_PATH = Path(__file__).resolve().parent / "schemas" / "domain_event.v1.json"
+
+_SCHEMA: dict | None = None
+
+
+def validation_error(event: object) -> str | None:
+    """In-process check for callers that already hold the event; None when valid."""
+    global _SCHEMA
+    try:
+        import jsonschema
+    except Exception:
+        return "jsonschema dependency is missing"
+    if _SCHEMA is None:
+        try:
+            _SCHEMA = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+        except Exception as e:
+            return f"cannot load input/schema: {e}"
+    try:
+        jsonschema.validate(instance=event, schema=_SCHEMA)
+    except jsonschema.ValidationError as e:
+        return f"domain_event.v1 validation error: {e.message}"
+    return None
+
 
 def main() -> int:
     if len(sys.argv) != 2:
@@ -11,7 +34,7 @@ def main() -> int:
         return 2
 
     event_path = Path(sys.argv[1])
-    schema_path = Path(__file__).resolve().parent / "schemas" / "domain_event.v1.json"
+    schema_path = SCHEMA_PATH
 
     try:
         import jsonschema
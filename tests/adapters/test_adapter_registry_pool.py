@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from core.adapters import registry as registry_mod
+from core.adapters.mock_adapter import AdapterError, MockAdapter
+from core.adapters.registry import AdapterRegistry, AdapterRegistryError, resolve_adapter
+from core.adapters.simulated_adapter import SimulatedAdapter
+
+
+def test_builtin_mock_is_a_singleton_and_aliases_share_it():
+    reg = AdapterRegistry()
+    a = reg.resolve("mock")
+    assert isinstance(a, MockAdapter)
+    assert reg.resolve(" MOCK ") is a
+    assert reg.resolve("mock_adapter") is a
+    assert resolve_adapter("mock") is resolve_adapter("mock")
+
+
+def test_unknown_and_missing_names_fail_closed():
+    reg = AdapterRegistry()
+    with pytest.raises(AdapterRegistryError, match="adapter_name is required"):
+        reg.resolve(None)
+    with pytest.raises(AdapterRegistryError, match="unknown adapter: simulated"):
+        reg.resolve("simulated")  # not registered by default
+    with pytest.raises(AdapterRegistryError, match="unknown adapter"):
+        reg.capability("nope")
+    assert AdapterRegistry(builtins=False).names() == []
+
+
+def test_pool_round_robin_and_transient_scope():
+    reg = AdapterRegistry(builtins=False)
+    reg.register("sim", lambda: SimulatedAdapter(latency_ms=0), scope="pool", pool_size=3)
+    got = [reg.resolve("sim") for _ in range(6)]
+    assert len({id(a) for a in got}) == 3
+    assert got[:3] == got[3:]
+
+    reg.register("fresh", lambda: SimulatedAdapter(latency_ms=0), scope="transient")
+    assert reg.resolve("fresh") is not reg.resolve("fresh")
+
+
+def test_register_rejects_duplicates_and_bad_scope():
+    reg = AdapterRegistry()
+    with pytest.raises(AdapterRegistryError, match="already registered"):
+        reg.register("other", SimulatedAdapter, aliases=("mock_adapter",))
+    with pytest.raises(AdapterRegistryError, match="invalid adapter scope"):
+        reg.register("sim", SimulatedAdapter, scope="threadlocal")
+    reg.register("mock", SimulatedAdapter, replace=True)
+    assert isinstance(reg.resolve("mock"), SimulatedAdapter)
+    with pytest.raises(AdapterRegistryError, match="unknown adapter"):
+        reg.resolve("mock_adapter")  # alias went with the old registration
+
+
+def test_capability_lookup_uses_canonical_name():
+    reg = AdapterRegistry()
+    row = reg.capability("mock_adapter")
+    assert row is not None and row["adapter_name"] == "mock"
+    reg.register("sim", SimulatedAdapter)
+    assert reg.capability("sim") is None
+
+
+def test_health_trips_after_max_failures_and_recovers_after_cooldown():
+    reg = AdapterRegistry(builtins=False)
+    reg.register("sim", SimulatedAdapter, max_failures=2, cooldown_s=0.05)
+    reg.record_failure("sim", AdapterError("ADAPTER_TIMEOUT"))
+    assert reg.resolve("sim") is not None
+    reg.record_failure("sim", AdapterError("ADAPTER_TIMEOUT"))
+    assert reg.health("sim").healthy is False
+    with pytest.raises(AdapterRegistryError, match="adapter unhealthy: sim \\(ADAPTER_TIMEOUT\\)"):
+        reg.resolve("sim")
+
+    time.sleep(0.06)
+    assert reg.resolve("sim") is not None  # half-open: a single probe after the cooldown
+    with pytest.raises(AdapterRegistryError, match="adapter unhealthy"):
+        reg.resolve("sim")  # everyone else still fails closed while the probe is out
+    reg.record_failure("sim", "still down")  # probe failed: open for another cooldown
+    with pytest.raises(AdapterRegistryError, match="still down"):
+        reg.resolve("sim")
+
+    time.sleep(0.06)
+    assert reg.resolve("sim") is not None
+    reg.record_success("sim")
+    h = reg.health("sim")
+    assert h.healthy is True and h.failures == 0 and h.last_error is None and h.probe_started is None
+    assert reg.resolve("sim") is reg.resolve("sim")
+
+
+def test_unreported_probe_expires_after_cooldown():
+    reg = AdapterRegistry(builtins=False)
+    reg.register("sim", SimulatedAdapter, max_failures=1, cooldown_s=0.05)
+    reg.record_failure("sim", "down")
+    time.sleep(0.06)
+    reg.resolve("sim")  # probe whose caller never reports back
+    with pytest.raises(AdapterRegistryError):
+        reg.resolve("sim")
+    time.sleep(0.06)
+    assert reg.resolve("sim") is not None
+
+
+def test_failures_without_max_failures_never_block():
+    reg = AdapterRegistry()
+    for _ in range(10):
+        reg.record_failure("mock", "boom")
+    assert reg.health("mock").failures == 10
+    assert reg.resolve("mock") is not None
+
+
+def test_simulated_adapter_latency_and_errors():
+    ok = SimulatedAdapter(latency_ms=20).call({"ping": 1})
+    assert ok["ok"] is True
+    assert ok["engine_output"]["meta"]["adapter"] == {"name": "simulated", "version": "v1"}
+    assert ok["engine_output"]["meta"]["request_hash"] == MockAdapter().call({"ping": 1})["engine_output"]["meta"]["request_hash"]
+
+    t0 = time.perf_counter()
+    SimulatedAdapter(latency_ms=20).call({})
+    assert time.perf_counter() - t0 >= 0.019
+
+    bad = SimulatedAdapter(latency_ms=0, error_rate=1.0)
+    with pytest.raises(AdapterError, match="ADAPTER_GENERIC_ERROR"):
+        bad.call({})
+    assert bad.calls == 1
+
+
+def test_discover_entry_points_registers_new_names(monkeypatch):
+    eps = [
+        SimpleNamespace(name="Sim", load=lambda: SimulatedAdapter),
+        SimpleNamespace(name="mock", load=lambda: pytest.fail("built-in must not be replaced")),
+    ]
+
+    class _Selectable:
+        def select(self, *, group):
+            assert group == registry_mod.ENTRY_POINT_GROUP
+            return eps
+
+    monkeypatch.setattr("importlib.metadata.entry_points", lambda: _Selectable())
+    reg = AdapterRegistry()
+    assert reg.discover_entry_points() == ["sim"]
+    assert isinstance(reg.resolve("sim"), SimulatedAdapter)
+    assert isinstance(reg.resolve("mock"), MockAdapter)
@@ -13,3 +13,50 @@ def test_lock2_gate_allows_execution_refs_in_approval_path(tmp_path: Path):
     ap.write_text("from infra.api.endpoints import execution\n", encoding="utf-8")
     findings = scan_tree(tmp_path)
     assert findings == []
+
+
+def _per_line(text: str) -> list:
+    from tools.gates.lock2_gate import ALLOW_MARKERS, DENY_PATTERNS
+
+    hits = []
+    for i, line in enumerate(text.splitlines(), start=1):
+        if any(m in line for m in ALLOW_MARKERS):
+            continue
+        for rule_id, rx in DENY_PATTERNS:
+            if rx.search(line):
+                hits.append([rule_id, i, rx.pattern, line.strip()[:200]])
+    return hits
+
+
+def test_lock2_buffer_scan_matches_per_line_scan():
+    from tools.gates.lock2_gate import _scan_text
+
+    samples = [
+        "",
+        "import os\nplace_order()\n",
+        # several rules on one line, and an import match whose .* covers execute_trade
+        "import x; execute_trade(); y.execution\n",
+        "x = 1  # LOCK2_ALLOW_EXEC execute_trade\nsend_order()",
+        # \s in EXEC_IMPORT must not join lines in the buffer
+        "from\nexecution import y\nfrom a.execution import b\n",
+        # every str.splitlines() boundary counts as a new line
+        "a\r\nplace_order\rsubmit_order\x0bb\x0cexecution.py\x1c/execution\x85c send_order ",
+        "\x1fexecute_trade\x1f  endpoints.execution",
+    ]
+    for text in samples:
+        assert _scan_text(text) == _per_line(text), repr(text)
+
+
+def test_lock2_gate_reports_line_numbers_from_buffer(tmp_path: Path):
+    (tmp_path / "x.py").write_text("a = 1\r\n\r\nb = 2\nsubmit_order()\n", encoding="utf-8")
+    findings = scan_tree(tmp_path)
+    assert [(f.rule_id, f.line) for f in findings] == [("EXEC_CALL", 4)]
+
+
+def test_lock2_prefilter_falls_back_when_match_start_is_unbounded():
+    from tools.gates.lock2_gate import _match_start
+
+    assert _match_start(r"\b(execute_trade|place_order)\b") == ({"e", "p"}, True)
+    assert _match_start(r"(foo|\bbar)") == ({"f", "b"}, False)
+    assert _match_start(r".*execution") is None
+    assert _match_start(r"(?i)execution") is None
@@ -0,0 +1,96 @@
+import os
+import time
+from pathlib import Path
+
+from tools.gates import lock2_gate, scan_engine, static_scan, zone_static_gate
+from tools.gates.scan_engine import ScanEngine
+
+_OLD = time.time() - 3600
+
+
+def _write(p: Path, text: str) -> None:
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_text(text, encoding="utf-8")
+    os.utime(p, (_OLD, _OLD))
+
+
+def _tree(root: Path) -> None:
+    _write(root / "svc" / "a.py", "import os\nplace_order()\nx = 1  # LOCK2_ALLOW_EXEC execute_trade\n")
+    _write(root / "svc" / "approval_gate.py", "from infra.api.endpoints import execution\n")
+    _write(root / "orchestrator" / "o.py", "import vault.store\n")
+    _write(root / "docs" / "notes.md", "broker.connect\n")
+    _write(root / ".venv" / "x.py", "execute_trade()\n")
+
+
+def _rules():
+    return [static_scan.STATIC_SCAN_RULE, lock2_gate.LOCK2_RULE, zone_static_gate.ZONE_RULE]
+
+
+def test_warm_run_is_stat_only_and_identical(tmp_path: Path) -> None:
+    cache = tmp_path / "cache.json"
+    root = tmp_path / "repo"
+    _tree(root)
+    cold = ScanEngine(root, cache_path=cache, workers=1)
+    first = cold.run(_rules())
+    assert cold.stats["scanned"] == cold.stats["files"] == 4
+
+    warm = ScanEngine(root, cache_path=cache, workers=1)
+    second = warm.run(_rules())
+    assert warm.stats["stat_hits"] == 4 and warm.stats["hashed"] == 0 and warm.stats["scanned"] == 0
+    assert second == first
+
+    assert [(f.file, f.line) for f in static_scan.findings_from_results(second["static_scan"])] == [
+        (str(root / "docs" / "notes.md"), 1),
+        (str(root / "svc" / "a.py"), 2),
+    ]
+    # approval path hint suppresses the import; the allow marker suppresses line 3
+    assert [(f.rule_id, f.line) for f in lock2_gate.findings_from_results(second["lock2"])] == [("EXEC_CALL", 2)]
+    assert static_scan.scan_tree(root, cache_path=cache) == static_scan.scan_tree(root)
+    assert lock2_gate.scan_tree(root, cache_path=cache) == lock2_gate.scan_tree(root)
+
+
+def test_changed_content_is_rescanned(tmp_path: Path) -> None:
+    _tree(tmp_path)
+    cache = tmp_path / "cache.json"
+    ScanEngine(tmp_path, cache_path=cache).run(_rules())
+
+    # same size, new content, new (old) mtime
+    _write(tmp_path / "svc" / "a.py", "import os\nsafe_call()\nx = 1  # LOCK2_ALLOW_EXEC execute_trade\n")
+    os.utime(tmp_path / "svc" / "a.py", (_OLD + 7, _OLD + 7))
+    engine = ScanEngine(tmp_path, cache_path=cache)
+    out = engine.run(_rules())
+    assert engine.stats["hashed"] == 1 and engine.stats["scanned"] == 1
+    assert lock2_gate.findings_from_results(out["lock2"]) == []
+
+    # content seen before under a fresh mtime: hashed, not rescanned
+    _write(tmp_path / "svc" / "a.py", "import os\nplace_order()\nx = 1  # LOCK2_ALLOW_EXEC execute_trade\n")
+    os.utime(tmp_path / "svc" / "a.py", (_OLD + 9, _OLD + 9))
+    engine = ScanEngine(tmp_path, cache_path=cache)
+    engine.run([lock2_gate.LOCK2_RULE])
+    assert engine.stats["hashed"] == 1
+
+
+def test_pool_matches_in_process(tmp_path: Path, monkeypatch) -> None:
+    for i in range(30):
+        _write(tmp_path / "pkg" / f"m{i}.py", "import vault.x\n" + ("submit_order()\n" if i % 3 == 0 else ""))
+    monkeypatch.setattr(scan_engine, "MIN_POOL_FILES", 1)
+    pooled = ScanEngine(tmp_path, workers=2).run(_rules())
+    assert pooled == ScanEngine(tmp_path, workers=1).run(_rules())
+    assert len(lock2_gate.findings_from_results(pooled["lock2"])) == 10
+
+
+def test_rule_version_tracks_scan_logic_source(tmp_path: Path) -> None:
+    src = tmp_path / "rule.py"
+    src.write_text("def _scan_text(text):\n    return []\n", encoding="utf-8")
+    v1 = scan_engine.rule_version(str(src), ["EXEC_CALL", "x"])
+    assert scan_engine.rule_version(str(src), ["EXEC_CALL", "x"]) == v1
+    assert scan_engine.rule_version(str(src), ["EXEC_CALL", "y"]) != v1
+    # same patterns, different scan logic: cached results must not be reused
+    src.write_text("def _scan_text(text):\n    return [1]\n", encoding="utf-8")
+    assert scan_engine.rule_version(str(src), ["EXEC_CALL", "x"]) != v1
+
+    assert lock2_gate.LOCK2_RULE.version == scan_engine.rule_version(
+        lock2_gate.__file__,
+        [[r, rx.pattern] for r, rx in lock2_gate.DENY_PATTERNS],
+        lock2_gate.ALLOW_MARKERS,
+    )
@@ -0,0 +1,66 @@
+import random
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from core.execution_adapter.contract import ExecutionAllowed, ExecutionBlocked, ExecutionRequestArtifact
+from core.execution_adapter.validator import (
+    validate_execution_preconditions,
+    validate_execution_preconditions_batch,
+)
+
+NOW = datetime(2026, 1, 22, tzinfo=timezone.utc)
+CAP = "PLACE_ORDER"
+
+
+def _key(d):
+    if isinstance(d, ExecutionAllowed):
+        return ("ALLOW",)
+    assert isinstance(d, ExecutionBlocked)
+    return (d.reason_code, d.reason_detail)
+
+
+def _approval(rng):
+    expires = rng.choice([None, "2099-01-01", NOW - timedelta(seconds=1), NOW, NOW + timedelta(days=1)])
+    caps = rng.choice([[], [CAP], ["CANCEL_ORDER", CAP], ("CANCEL_ORDER",), {CAP}, "PLACE_ORDER_X", {CAP: 1}, None])
+    fields = {"expires_at": expires, "capabilities": caps}
+    if rng.random() < 0.1:
+        fields.pop(rng.choice(["expires_at", "capabilities"]))
+    return rng.choice([dict, lambda **kw: SimpleNamespace(**kw)])(**fields) if rng.random() < 0.95 else None
+
+
+def _request(rng):
+    evidence = rng.choice([None, [], ["e1"], "", "ev"])
+    return rng.choice(
+        [{"evidence": evidence}, {}, SimpleNamespace(evidence=evidence), ExecutionRequestArtifact(evidence=evidence)]
+    )
+
+
+def test_batch_decisions_equal_single_call():
+    rng = random.Random(49)
+    approvals = [_approval(rng) for _ in range(60)]  # shared across many requests
+    pairs = [(_request(rng), rng.choice(approvals)) for _ in range(5000)]
+
+    out = validate_execution_preconditions_batch(pairs, now_utc=NOW, required_capability=CAP)
+    single = [
+        validate_execution_preconditions(execution_request=r, approval=a, now_utc=NOW, required_capability=CAP)
+        for r, a in pairs
+    ]
+    assert [_key(d) for d in out.decisions] == [_key(d) for d in single]
+
+    counts = {}
+    for d in single:
+        if isinstance(d, ExecutionBlocked):
+            counts[d.reason_code] = counts.get(d.reason_code, 0) + 1
+    assert out.blocked_by_reason == counts
+    assert out.allowed == sum(isinstance(d, ExecutionAllowed) for d in single) > 0
+    assert set(counts) == {
+        "MISSING_APPROVAL", "INVALID_APPROVAL", "APPROVAL_EXPIRED", "CAPABILITY_MISSING", "MISSING_EVIDENCE"
+    }
+
+
+def test_batch_raises_like_single_call_on_naive_expiry():
+    pairs = [({"evidence": ["e1"]}, {"expires_at": datetime(2099, 1, 1), "capabilities": [CAP]})]
+    with pytest.raises(TypeError):
+        validate_execution_preconditions_batch(pairs, now_utc=NOW, required_capability=CAP)
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+
+from core.C_action.contracts import DeliveryPlan
+from core.C_action.plan_from_receipt import save_delivery_plan
+from core.C_action.queue_consumer import consume_pending
+from core.C_action.queue_router import route_to_queue
+from core.C_action.queue_store import SQLiteActionQueue
+
+
+def _plan(plan_id: str, channel: str = "fnb") -> DeliveryPlan:
+    return DeliveryPlan(
+        plan_id=plan_id,
+        ts_iso="2026-01-01T00:00:00Z",
+        proposal_id=f"prop_{plan_id}",
+        channel=channel,
+        receipt_path="",
+        receipt_hash="",
+        policy_version=1,
+        policy_sha256="0" * 64,
+        status="READY",
+        summary="s",
+        rationale="r",
+        warnings=[],
+        evidence={},
+        evidence_sample_ids=[],
+        evidence_scene_ids=[],
+        evidence_snapshot_ids=[],
+        patch_ops=[],
+        approvers_used=[],
+        applier=None,
+        strategy=None,
+        noop_apply=True,
+        recommended_actions=[],
+    )
+
+
+def _read_tree(root) -> dict:
+    out = {}
+    for dirpath, _, files in os.walk(root):
+        for f in files:
+            p = os.path.join(dirpath, f)
+            with open(p, encoding="utf-8") as fh:
+                out[os.path.relpath(p, root)] = json.load(fh)
+    return out
+
+
+def test_sqlite_backend_matches_file_layout(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("METAOS_CI_DETERMINISTIC_CONSUMER", "1")
+    files_dir = str(tmp_path / "files")
+    q = SQLiteActionQueue(tmp_path / "q.db")
+
+    def route(ids):
+        for i in ids:
+            plan = _plan(f"dp_{i}")
+            plan_path = save_delivery_plan(plan, str(tmp_path / "plans"))
+            assert route_to_queue(plan, plan_path, base_dir=files_dir) == route_to_queue(
+                plan, plan_path, base_dir=files_dir, queue=q
+            )
+
+    route(range(4))
+    file_out = consume_pending(base_dir=files_dir)
+    db_out = consume_pending(base_dir=files_dir, queue=q)
+    assert sorted(db_out) == sorted(file_out)
+    route(range(4, 6))
+    assert q.counts() == {"PENDING": 2, "PROCESSED": 4}
+
+    export_dir = str(tmp_path / "export")
+    q.export_files(base_dir=export_dir)
+    assert _read_tree(export_dir) == _read_tree(files_dir)
+
+
+def test_failures_retry_then_dead_letter(tmp_path) -> None:
+    q = SQLiteActionQueue(tmp_path / "q.db", max_attempts=2, retry_delay_s=0.0)
+    # execution-class channel without an execution request: Gate 2 blocks at consume time
+    q.enqueue("trading", "dp_x", "logs/queues/trading/pending/dp_x.json", {"channel": "trading", "plan_id": "dp_x"})
+
+    assert consume_pending(base_dir=str(tmp_path), queue=q) == []
+    assert q.counts() == {"PENDING": 1}
+    assert consume_pending(base_dir=str(tmp_path), queue=q) == []
+    assert q.counts() == {"DEAD": 1}
+    (dead,) = q.dead_letters()
+    assert dead["plan_id"] == "dp_x" and dead["attempts"] == 2 and dead["last_error"]
+    assert consume_pending(base_dir=str(tmp_path), queue=q) == []
+
+
+def test_expired_lease_is_reclaimed_and_stale_ack_rejected(tmp_path) -> None:
+    q = SQLiteActionQueue(tmp_path / "q.db", visibility_timeout_s=0.0)
+    q.enqueue("fnb", "dp_1", "p/dp_1.json", {"plan_id": "dp_1"})
+    (first,) = q.claim()
+    (second,) = q.claim()
+    assert second.item_id == first.item_id and second.attempts == 2
+    assert not q.ack(first, "x.json", {})
+    assert q.ack(second, "x.json", {})
+    assert q.claim() == []
+
+
+def _claim_all(path: str, result_q) -> None:
+    q = SQLiteActionQueue(path, timeout=60.0)
+    got = []
+    while True:
+        leases = q.claim(limit=7)
+        if not leases:
+            break
+        for lease in leases:
+            q.ack(lease, f"{lease.plan_id}.json", {})
+            got.append(lease.plan_id)
+    result_q.put(got)
+
+
+def test_concurrent_consumers_claim_without_duplicates(tmp_path) -> None:
+    db = str(tmp_path / "q.db")
+    q = SQLiteActionQueue(db)
+    q.enqueue_many((f"ch{i % 3}", f"dp_{i}", f"p/dp_{i}.json", {"i": i}) for i in range(600))
+
+    results = multiprocessing.Queue()
+    procs = [multiprocessing.Process(target=_claim_all, args=(db, results)) for _ in range(4)]
+    for p in procs:
+        p.start()
+    claimed = [pid for _ in procs for pid in results.get(timeout=60)]
+    for p in procs:
+        p.join(60)
+
+    assert len(claimed) == 600 and len(set(claimed)) == 600
+    assert q.counts() == {"PROCESSED": 600}
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+import random
+from datetime import datetime, timedelta, timezone
+
+from core.analytics import insight_cards, weekly
+from core.analytics.explainability import top_scenes_by_decisions, top_scenes_by_severity
+from core.analytics.rolling import SceneAggregateStore
+
+NOW = datetime(2026, 3, 10, 13, 30, tzinfo=timezone.utc)
+
+
+def _summaries(n: int, seed: int = 7) -> list[dict]:
+    rng = random.Random(seed)
+    out = []
+    for i in range(n):
+        s = {
+            "scene_id": f"scene_{i}" if rng.random() > 0.05 else None,
+            "context": {"channel": rng.choice(["childcare", "retail", "ops", "unknown"])},
+            "peak_severity": rng.choice(["low", "medium", "high", "critical", None, "weird"]),
+            "total_decisions": rng.randint(0, 6),
+            "key_rationale_codes": rng.sample(
+                ["CHILDCARE_HUMAN_REVIEW_REQUIRED", "RC_A", "RC_B", "RC_C", "RC_D"], rng.randint(0, 3)
+            ),
+        }
+        r = rng.random()
+        if r < 0.05:
+            pass  # no ts_end
+        elif r < 0.08:
+            s["ts_end"] = "not-a-timestamp"
+        else:
+            ts = NOW - timedelta(minutes=rng.randint(-600, 20 * 24 * 60))
+            s["ts_end"] = ts.isoformat().replace("+00:00", "Z" if rng.random() < 0.5 else "+00:00")
+        out.append(s)
+    return out
+
+
+def test_rollup_matches_batch(monkeypatch) -> None:
+    monkeypatch.setattr(weekly, "_now_utc", lambda: NOW)
+    items = _summaries(2000)
+    store = SceneAggregateStore()
+    store.extend(items)
+
+    for days in (1, 3, 7, 14, 30):
+        assert store.rollup(days=days, now=NOW) == weekly.rollup_weekly(items, days=days)
+
+
+def test_top_k_matches_batch() -> None:
+    items = _summaries(1500, seed=11)
+    store = SceneAggregateStore()
+    store.extend(items)
+
+    for k in (1, 5, 10):
+        assert store.top_by_severity(k) == top_scenes_by_severity(items, k=k)
+        assert store.top_by_decisions(k) == top_scenes_by_decisions(items, k=k)
+
+
+def test_jsonl_tail_refresh_and_insight_card(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(weekly, "_now_utc", lambda: NOW)
+    monkeypatch.setattr(insight_cards, "_now_iso", lambda: NOW.isoformat())
+    items = _summaries(300, seed=3)
+    path = tmp_path / "scene_summaries.jsonl"
+
+    with path.open("w", encoding="utf-8") as f:
+        for s in items[:200]:
+            f.write(json.dumps(s) + "\n")
+    store = SceneAggregateStore.from_jsonl(str(path))
+    assert len(store) == 200
+
+    with path.open("a", encoding="utf-8") as f:
+        f.write("not json\n")
+        for s in items[200:]:
+            f.write(json.dumps(s) + "\n")
+    assert store.refresh() == 100
+
+    batch = insight_cards.build_weekly_insight_card(items, days=7)
+    rolled = insight_cards.build_weekly_insight_card_from_store(store, days=7)
+    assert rolled == batch
+
+    # truncation/rewrite triggers a rebuild
+    path.write_text(json.dumps(items[0]) + "\n", encoding="utf-8")
+    store.refresh()
+    assert len(store) == 1
+
+
+def test_mixed_type_total_decisions_ingest_once(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(weekly, "_now_utc", lambda: NOW)
+    ts = (NOW - timedelta(hours=1)).isoformat()
+    items = [
+        {"scene_id": "a", "peak_severity": "high", "total_decisions": 3, "ts_end": ts},
+        {"scene_id": "b", "peak_severity": "high", "total_decisions": "4", "ts_end": ts},
+        {"scene_id": "c", "peak_severity": "low", "total_decisions": "n/a", "ts_end": ts},
+    ]
+    path = tmp_path / "scene_summaries.jsonl"
+    path.write_text("".join(json.dumps(s) + "\n" for s in items[:2]), encoding="utf-8")
+
+    store = SceneAggregateStore.from_jsonl(str(path))
+    assert store.refresh() == 0
+    assert len(store) == 2
+    with path.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(items[2]) + "\n")
+    assert store.refresh() == 1
+    assert len(store) == 3
+
+    assert store.rollup(days=7, now=NOW) == weekly.rollup_weekly(items, days=7)
+    assert [s["scene_id"] for s in store.top_by_decisions(5)] == ["b", "a", "c"]
+    assert [s["scene_id"] for s in store.top_by_severity(5)] == ["b", "a", "c"]
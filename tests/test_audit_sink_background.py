@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import io
+import json
+import threading
+import time
+
+from infra.api import audit_sink
+from infra.api.audit_sink import BackgroundAuditSink, configure_audit_sink, emit_audit_event
+
+
+class _GatedStream(io.StringIO):
+    """write() blocks until the gate opens (a stalled stdout consumer)."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.gate = threading.Event()
+        self.entered = threading.Event()
+
+    def write(self, s: str) -> int:
+        self.entered.set()
+        self.gate.wait(10)
+        return super().write(s)
+
+
+def _ids(text: str) -> list:
+    return [json.loads(line)["i"] for line in text.splitlines()]
+
+
+def test_order_preserved_and_flushed_on_close() -> None:
+    out = io.StringIO()
+    sink = BackgroundAuditSink(out, maxsize=8, batch_max=5)
+    for i in range(500):
+        sink.emit({"event": "e", "i": i})
+    sink.close()
+    assert _ids(out.getvalue()) == list(range(500))
+    assert all("recorded_at" in json.loads(line) for line in out.getvalue().splitlines())
+
+    sink.emit({"event": "late", "i": 500})  # after close: written synchronously
+    assert _ids(out.getvalue())[-1] == 500
+
+
+def test_drop_policy_counts_and_never_blocks() -> None:
+    out = _GatedStream()
+    sink = BackgroundAuditSink(out, maxsize=4, overflow="drop")
+    sink.emit({"i": 0})
+    assert out.entered.wait(5)  # writer is stuck on the first line
+    for i in range(1, 21):
+        sink.emit({"i": i})
+    assert sink.dropped == 16
+    out.gate.set()
+    sink.close()
+    assert _ids(out.getvalue()) == list(range(5))
+
+
+def test_spill_policy_keeps_overflow_in_order(tmp_path) -> None:
+    out = _GatedStream()
+    spill = tmp_path / "spill.jsonl"
+    sink = BackgroundAuditSink(out, maxsize=3, overflow="spill", spill_path=str(spill))
+    sink.emit({"i": 0})
+    assert out.entered.wait(5)
+    for i in range(1, 11):
+        sink.emit({"i": i})
+    out.gate.set()
+    sink.close()
+    assert _ids(out.getvalue()) == [0, 1, 2, 3]
+    assert _ids(spill.read_text(encoding="utf-8")) == list(range(4, 11))
+    assert sink.spilled == 7 and sink.dropped == 0
+
+
+def test_broken_stream_reports_on_stderr(capfd) -> None:
+    class _Broken(io.StringIO):
+        def write(self, s: str) -> int:
+            raise RuntimeError("stdout broken")
+
+    sink = BackgroundAuditSink(_Broken())
+    sink.emit({"i": 1})
+    sink.flush()
+    sink.close()
+    _, err = capfd.readouterr()
+    payload = json.loads(err.strip().splitlines()[-1])
+    assert payload["event"] == "audit_error" and payload["lost"] == 1
+
+
+def test_emit_audit_event_routes_through_configured_sink(monkeypatch) -> None:
+    out = io.StringIO()
+    monkeypatch.setattr(audit_sink, "_SINK", None)
+    configure_audit_sink(BackgroundAuditSink(out))
+    try:
+        event = {"event": "enforce", "outcome": "deny", "i": 7}
+        emit_audit_event(event)
+        event["outcome"] = "allow"  # emitted snapshot is not affected
+        audit_sink._SINK.flush()
+        assert json.loads(out.getvalue())["outcome"] == "deny"
+    finally:
+        configure_audit_sink(None)
+
+
+class _EntryOrderStream(_GatedStream):
+    """_GatedStream that records the ids of each write() as it starts (before the gate)."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.started: list = []
+
+    def write(self, s: str) -> int:
+        self.started.append(_ids(s))
+        return super().write(s)
+
+
+def test_emit_racing_close_is_neither_lost_nor_reordered() -> None:
+    out = _EntryOrderStream()
+    sink = BackgroundAuditSink(out, maxsize=4, overflow="block")
+    sink.emit({"i": 0})
+    assert out.entered.wait(5)  # writer stalled inside write([0])
+    for i in range(1, 5):
+        sink.emit({"i": i})  # queue now full
+
+    closer = threading.Thread(target=sink.close)
+    closer.start()
+    deadline = time.monotonic() + 5
+    while not sink._closed and time.monotonic() < deadline:  # close() is now stuck enqueuing the stop
+        time.sleep(0.001)
+    late = threading.Thread(target=sink.emit, args=({"i": 5},))
+    late.start()
+    late.join(0.1)
+    assert late.is_alive()  # waits for the drain instead of writing ahead of it
+
+    out.gate.set()
+    closer.join(5)
+    late.join(5)
+    assert not closer.is_alive() and not late.is_alive()
+    assert out.started == [[0], [1, 2, 3, 4], [5]]
+    assert _ids(out.getvalue()) == [0, 1, 2, 3, 4, 5]
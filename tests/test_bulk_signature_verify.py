@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import hashlib
+import json
+
+import pytest
+
+nacl_signing = pytest.importorskip("nacl.signing")
+
+from tools.audits.bulk_verify import GENESIS_HASH, verify_log
+
+
+def _event(prev: str, i: int) -> dict:
+    core = {"schema": "judgment_event.v1", "prev_hash": prev, "event_id": f"j{i}", "n": i}
+    core["hash"] = hashlib.sha256(json.dumps(core, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+    return core
+
+
+def _signed_chain(sk, n: int) -> list:
+    rows, prev = [], GENESIS_HASH
+    for i in range(n):
+        e = _event(prev, i)
+        e["signature"] = {"signature": sk.sign(bytes.fromhex(e["hash"])).signature.hex(), "algorithm": "ed25519"}
+        rows.append(e)
+        prev = e["hash"]
+    return rows
+
+
+def _write(path, rows, blank_every: int = 0) -> None:
+    lines = []
+    for i, r in enumerate(rows):
+        lines.append(json.dumps(r, separators=(",", ":")) if isinstance(r, dict) else r)
+        if blank_every and i % blank_every == 0:
+            lines.append("   ")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+@pytest.fixture(scope="module")
+def sk():
+    return nacl_signing.SigningKey(b"\x07" * 32)
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_valid_log_and_line_numbering(tmp_path, sk, workers) -> None:
+    p = tmp_path / "log.jsonl"
+    _write(p, _signed_chain(sk, 200), blank_every=7)
+    pub = bytes(sk.verify_key)
+    res = verify_log(p, pub, layout="judgment", chain=True, workers=workers, chunk_bytes=512)
+    assert res.ok and res.lines == 200
+
+    rows = _signed_chain(sk, 200)
+    rows[150]["signature"]["signature"] = "00" * 64
+    rows[40] = "{not json"
+    rows[90].pop("signature")
+    _write(p, rows, blank_every=7)
+    for w in (1, workers):
+        res = verify_log(p, pub, layout="judgment", sig_required=True, workers=w, chunk_bytes=300)
+        assert (res.error, res.detail) == ("BAD_JSON", "line=41")
+
+    rows[40] = _signed_chain(sk, 41)[40]
+    _write(p, rows)
+    res = verify_log(p, pub, layout="judgment", sig_required=True, workers=workers, chunk_bytes=300)
+    assert (res.error, res.detail) == ("MISSING_SIGNATURE", "line=91")
+    res = verify_log(p, pub, layout="judgment", workers=workers, chunk_bytes=300)
+    assert res.error == "SIGNATURE_VERIFY_FAIL" and res.detail.startswith("line=151 ")
+
+
+def test_chain_break_across_chunk_boundary(tmp_path, sk) -> None:
+    rows = _signed_chain(sk, 120)
+    del rows[60]  # removing an event breaks the link at (new) line 61
+    p = tmp_path / "log.jsonl"
+    _write(p, rows)
+    pub = bytes(sk.verify_key)
+    results = {
+        (w, cb): verify_log(p, pub, layout="judgment", chain=True, workers=w, chunk_bytes=cb)
+        for w in (1, 2)
+        for cb in (64, 333, 1 << 20)
+    }
+    assert {(r.error, r.detail.split(" ")[0]) for r in results.values()} == {("CHAIN_BREAK", "line=61")}
+    # signature-only mode does not look at the chain
+    assert verify_log(p, pub, layout="judgment", workers=2, chunk_bytes=333).ok
+
+
+def test_observer_layout_and_empty_log(tmp_path, sk) -> None:
+    h = hashlib.sha256(b"obs").hexdigest()
+    row = {"schema_version": "v1", "chain": {"hash": h}, "signature": sk.sign(bytes.fromhex(h)).signature.hex()}
+    p = tmp_path / "obs.jsonl"
+    _write(p, [row, {"schema_version": "v1", "hash": h}])
+    pub = bytes(sk.verify_key)
+    assert verify_log(p, pub, layout="observer", workers=1).ok
+    assert verify_log(p, pub, layout="observer", sig_required=True, workers=1).detail == "line=2"
+
+    empty = tmp_path / "empty.jsonl"
+    empty.write_text("\n  \n", encoding="utf-8")
+    assert verify_log(empty, pub, layout="observer").error == "EMPTY_LOG"
+    assert verify_log(tmp_path / "missing", pub, layout="observer").error == "FILE_NOT_FOUND"
@@ -0,0 +1,72 @@
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from infra.api.endpoints.models.base import Base
+from infra.api.endpoints.models.execution_run import ExecutionRun
+from infra.api.services import execution_service
+from infra.api.services.execution_service import ExecutionBlocked, create_execution_run
+
+pytestmark = pytest.mark.anyio
+
+
+async def _sessions(tmp_path, *, unique_index: bool):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'runs.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda c: Base.metadata.create_all(c, tables=[ExecutionRun.__table__]))
+        if unique_index:
+            # same dedup anchor as alembic run_0001
+            await conn.execute(
+                text(
+                    "CREATE UNIQUE INDEX ux_execution_runs_project_id_idempotency_key "
+                    "ON execution_runs (project_id, idempotency_key)"
+                )
+            )
+    return engine, sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+
+async def _create(maker, key: str, project_id: str = "p1"):
+    async with maker() as s:
+        return await create_execution_run(
+            s, project_id=project_id, decision_card_id=None, execution_scope="automation", idempotency_key=key
+        )
+
+
+async def _count(maker) -> int:
+    async with maker() as s:
+        return (await s.execute(select(func.count()).select_from(ExecutionRun))).scalar_one()
+
+
+@pytest.mark.parametrize("unique_index", [True, False])
+async def test_create_execution_run_blocks_non_run_status(tmp_path, unique_index):
+    engine, maker = await _sessions(tmp_path, unique_index=unique_index)
+    with pytest.raises(ExecutionBlocked) as ei:
+        await _create(maker, "k1")
+    assert ei.value.reason == "unknown"  # new rows start as 'created'
+    assert (engine.sync_engine in execution_service._UPSERT_UNSUPPORTED) is (not unique_index)
+    await engine.dispose()
+
+
+async def test_create_execution_run_returns_existing_row_on_duplicate(tmp_path):
+    engine, maker = await _sessions(tmp_path, unique_index=True)
+    with pytest.raises(ExecutionBlocked):
+        await _create(maker, "k1")
+    async with maker() as s:
+        await s.execute(text("update execution_runs set status='RUN'"))
+        await s.commit()
+
+    first = await _create(maker, "k1")
+    again = await _create(maker, "k1")
+    assert first.execution_id == again.execution_id and again.status == "RUN"
+    assert again.created_at is not None and again.execution_scope == "automation"
+    assert await _count(maker) == 1
+
+    async with maker() as s:
+        await s.execute(text("update execution_runs set status='BLOCKED', blocked_reason='approval_expired'"))
+        await s.commit()
+    with pytest.raises(ExecutionBlocked) as ei:
+        await _create(maker, "k1")
+    assert ei.value.reason == "approval_expired"
+    assert await _count(maker) == 1
+    await engine.dispose()
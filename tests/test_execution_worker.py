@@ -0,0 +1,120 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from infra.api.endpoints.models.base import Base
+from infra.api.endpoints.models.execution_run import ExecutionRun
+from infra.api.workers.executor import claim_batch, finish_batch, process_batch, worker_loop
+
+pytestmark = pytest.mark.anyio
+
+
+async def _maker(tmp_path, statuses):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'runs.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda c: Base.metadata.create_all(c, tables=[ExecutionRun.__table__]))
+        for i, status in enumerate(statuses):
+            await conn.execute(
+                text("INSERT INTO execution_runs (id, project_id, idempotency_key, status) VALUES (:i, 'p1', :k, :s)"),
+                {"i": f"run-{i}", "k": f"k-{i}", "s": status},
+            )
+    return engine, sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+
+async def _rows(maker):
+    async with maker() as s:
+        res = await s.execute(text("select id, status, blocked_reason, ended_at, claim_token from execution_runs order by id"))
+        return {r[0]: r[1:] for r in res.all()}
+
+
+async def test_worker_halts_run_executions_like_execute_job(tmp_path):
+    engine, maker = await _maker(tmp_path, ["RUN"] * 5 + ["BLOCKED", "HALTED"])
+    assert await worker_loop(maker, batch_size=2, concurrency=2, exit_when_idle=True) == 5
+    rows = await _rows(maker)
+    for i in range(5):
+        status, reason, ended_at, token = rows[f"run-{i}"]
+        assert (status, reason, token) == ("HALTED", None, None) and ended_at is not None
+    assert rows["run-5"][:2] == ("BLOCKED", None) and rows["run-6"][0] == "HALTED"
+    await engine.dispose()
+
+
+async def test_worker_times_out_and_fails_closed(tmp_path):
+    engine, maker = await _maker(tmp_path, ["RUN", "RUN", "RUN"])
+
+    async def handler(run):
+        if run.execution_id == "run-0":
+            await asyncio.sleep(5)
+        if run.execution_id == "run-1":
+            raise RuntimeError("boom")
+
+    assert await process_batch(maker, handler=handler, job_timeout=0.05, lease_seconds=60) == 3
+    rows = await _rows(maker)
+    assert rows["run-0"][:2] == ("BLOCKED", "execution_timeout")
+    assert rows["run-1"][:2] == ("BLOCKED", "execution_error:RuntimeError")
+    assert rows["run-2"][:2] == ("HALTED", None)
+    await engine.dispose()
+
+
+async def test_dead_worker_claim_is_reclaimed_and_stale_owner_cannot_finish(tmp_path):
+    engine, maker = await _maker(tmp_path, ["RUN", "RUN"])
+    async with maker() as s:
+        dead_token, runs = await claim_batch(s, limit=10, lease_seconds=60)
+    assert len(runs) == 2
+    async with maker() as s:  # live claim: nothing to take
+        assert (await claim_batch(s, limit=10, lease_seconds=60))[1] == []
+        await s.execute(
+            text("update execution_runs set claimed_at=:t where id='run-0'"),
+            {"t": datetime.utcnow() - timedelta(seconds=120)},
+        )
+        await s.commit()
+    async with maker() as s:
+        token, reclaimed = await claim_batch(s, limit=10, lease_seconds=60)
+    assert [r.execution_id for r in reclaimed] == ["run-0"] and token != dead_token
+
+    async with maker() as s:  # the dead worker comes back: only run-1 is still its own
+        assert await finish_batch(s, dead_token, {"run-0": ("HALTED", None), "run-1": ("HALTED", None)}) == 1
+    rows = await _rows(maker)
+    assert rows["run-0"][0] == "EXECUTING" and rows["run-0"][3] == token
+    assert rows["run-1"][0] == "HALTED"
+    await engine.dispose()
+
+
+async def test_process_batch_rejects_lease_shorter_than_timeout(tmp_path):
+    engine, maker = await _maker(tmp_path, [])
+    with pytest.raises(ValueError):
+        await process_batch(maker, job_timeout=30, lease_seconds=10)
+    # lease > job_timeout alone is not enough: queued jobs of the batch start later
+    with pytest.raises(ValueError):
+        await process_batch(maker, batch_size=64, concurrency=1, job_timeout=30, lease_seconds=300)
+    await engine.dispose()
+
+
+async def test_two_workers_with_slow_jobs_execute_each_run_once(tmp_path):
+    engine, maker = await _maker(tmp_path, ["RUN"] * 8)
+    executed = []
+
+    async def slow(run):
+        executed.append(run.execution_id)
+        await asyncio.sleep(0.05)
+
+    # worker A holds one batch of 8 run one at a time; worker B polls meanwhile and must not
+    # reclaim A's queued jobs (the lease has to cover the whole batch, not one job)
+    opts = dict(handler=slow, batch_size=8, concurrency=1, job_timeout=0.1, lease_seconds=0.9)
+    stop = asyncio.Event()
+
+    async def worker_a():
+        try:
+            return await process_batch(maker, **opts)
+        finally:
+            stop.set()
+
+    counts = await asyncio.gather(worker_a(), worker_loop(maker, idle_seconds=0.02, stop=stop, **opts))
+    assert counts == [8, 0]
+    assert sorted(executed) == [f"run-{i}" for i in range(8)]
+    rows = await _rows(maker)
+    assert {r[0] for r in rows.values()} == {"HALTED"}
+    await engine.dispose()
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import copy
+import dataclasses
+import json
+import pickle
+import random
+from datetime import datetime
+from math import fabs
+from types import SimpleNamespace
+
+import pytest
+
+from core.multi_reality_os.core.engine_equilibrium import compute_equilibrium
+from core.multi_reality_os.core.engine_mesh import GLOBAL_TOLERANCE, build_reality_mesh
+from core.multi_reality_os.models.perspective_layer import PerspectiveLayer
+from core.multi_reality_os.models.reality_link import RealityLink
+from core.multi_reality_os.models.scene_base import SceneBase
+
+
+def _scene(n_pressures: int) -> SceneBase:
+    return SceneBase(
+        scene_id="s1",
+        title="t",
+        description="d",
+        timepoint=datetime(2026, 1, 1),
+        structural_pressures={f"p{k}": 0.1 * k for k in range(n_pressures)},
+    )
+
+
+def _layers(rng: random.Random, n: int, n_pressures: int) -> dict:
+    pls = {}
+    for i in range(n):
+        # some perceptions missing on purpose (-> 0)
+        perceived = {f"p{k}": rng.random() for k in range(n_pressures) if rng.random() < 0.9}
+        pls[f"a{i}"] = PerspectiveLayer(pl_id=f"s1:a{i}", actor_id=f"a{i}", perceived_pressures=perceived)
+    return pls
+
+
+def _legacy_links(scene, pls) -> list:
+    links = []
+    actors = list(pls.keys())
+    for i in range(len(actors)):
+        for j in range(i + 1, len(actors)):
+            pl_a, pl_b = pls[actors[i]], pls[actors[j]]
+            conflict = 0
+            align = 0
+            for k in scene.structural_pressures.keys():
+                diff = fabs(pl_a.perceived_pressures.get(k, 0) - pl_b.perceived_pressures.get(k, 0))
+                conflict += diff
+                align += 1 - diff
+            conflict /= max(len(scene.structural_pressures), 1)
+            align /= max(len(scene.structural_pressures), 1)
+            links.append(RealityLink(pl_a.pl_id, pl_b.pl_id, conflict, align))
+    return links
+
+
+@pytest.mark.parametrize("n,n_pressures", [(0, 3), (1, 3), (2, 0), (2, 3), (17, 5), (60, 12)])
+def test_mesh_matches_pairwise_loop(n, n_pressures) -> None:
+    scene = _scene(n_pressures)
+    pls = _layers(random.Random(n * 31 + n_pressures), n, n_pressures)
+    mesh = build_reality_mesh(scene, pls)
+
+    legacy = _legacy_links(scene, pls)
+    assert len(mesh.links) == len(legacy)
+    assert list(mesh.links) == legacy
+
+    avg_conflict = sum(l.conflict_level for l in legacy) / max(len(legacy), 1)
+    avg_align = sum(l.benefit_alignment for l in legacy) / max(len(legacy), 1)
+    assert mesh.global_conflict == pytest.approx(avg_conflict, abs=GLOBAL_TOLERANCE)
+    assert mesh.global_alignment == pytest.approx(avg_align, abs=GLOBAL_TOLERANCE)
+    assert mesh.collapse_risk == pytest.approx(avg_conflict * 0.7 + (1 - avg_align) * 0.3, abs=GLOBAL_TOLERANCE)
+
+
+def test_mesh_links_is_a_list_and_serializes() -> None:
+    scene = _scene(4)
+    pls = _layers(random.Random(9), 6, 4)
+    legacy = _legacy_links(scene, pls)
+
+    mesh = build_reality_mesh(scene, pls)
+    assert isinstance(mesh.links, list) and len(mesh.links) == 15
+    assert mesh.links._pending is not None  # nothing built yet
+
+    # asdict + JSON round trip, straight from an untouched mesh
+    obj = json.loads(json.dumps(dataclasses.asdict(mesh)))
+    assert [RealityLink(**l) for l in obj["links"]] == legacy
+    assert obj["global_conflict"] == mesh.global_conflict
+
+    fresh = build_reality_mesh(scene, pls).links
+    assert [] != fresh and fresh == legacy and legacy == fresh
+    assert copy.deepcopy(build_reality_mesh(scene, pls).links) == legacy
+    assert pickle.loads(pickle.dumps(build_reality_mesh(scene, pls).links)) == legacy
+
+    links = build_reality_mesh(scene, pls).links
+    links.append(RealityLink("x", "y", 0.0, 1.0))
+    assert len(links) == 16 and links[:15] == legacy and links[-1].from_pl == "x"
+    links.clear()
+    assert links == [] and len(links) == 0
+
+
+def _persona(rng: random.Random) -> SimpleNamespace:
+    p = SimpleNamespace(
+        emotional_reactivity=SimpleNamespace(anxiety_sensitivity=rng.random(), overwhelm_threshold=rng.uniform(0.5, 2.0)),
+        biases=SimpleNamespace(catastrophizing=rng.random()),
+        stress_profile=SimpleNamespace(baseline_stress=rng.random(), stress_accumulation_rate=rng.uniform(0, 0.01)),
+        social_traits=SimpleNamespace(cooperation=rng.random(), conflict_avoidance=rng.random()),
+    )
+    p.copy = lambda: p
+    return p
+
+
+def test_equilibrium_unchanged() -> None:
+    rng = random.Random(3)
+    actors = {f"a{i}": _persona(rng) for i in range(25)}
+    scene = SimpleNamespace(structural_pressure=0.6)
+    res = compute_equilibrium(scene, actors)
+
+    for step in res.trajectory:
+        t = step.t
+        for aid, p in actors.items():
+            anxiety = (
+                0.6
+                * (1 + p.emotional_reactivity.anxiety_sensitivity)
+                * (1 + p.biases.catastrophizing)
+                * (p.stress_profile.baseline_stress + t * p.stress_profile.stress_accumulation_rate)
+            )
+            alignment = max(0.0, min(1.0, p.social_traits.cooperation - p.social_traits.conflict_avoidance * anxiety * 0.1))
+            assert step.agents[aid].anxiety == anxiety
+            assert step.agents[aid].alignment == alignment
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import io
+import json
+import random
+
+import pytest
+
+from core.multi_reality_os.core.scenario_batch import (
+    DEMO_PERTURBATIONS,
+    DEMO_SCENARIO,
+    perturb_scenario,
+    quantiles,
+    run_batch,
+    run_scenario,
+)
+
+_RUN_DEPENDENT = ("elapsed_s", "scenarios_per_s", "workers")
+
+
+def _lines(buf: io.StringIO) -> list:
+    return [json.loads(ln) for ln in buf.getvalue().splitlines()]
+
+
+def _stable(summary: dict) -> dict:
+    return {k: v for k, v in summary.items() if k not in _RUN_DEPENDENT}
+
+
+def test_batch_reproducible_from_seed_across_workers() -> None:
+    serial, pooled, other = io.StringIO(), io.StringIO(), io.StringIO()
+    a = run_batch(DEMO_SCENARIO, DEMO_PERTURBATIONS, 40, seed=5, out=serial, workers=1)
+    b = run_batch(DEMO_SCENARIO, DEMO_PERTURBATIONS, 40, seed=5, out=pooled, workers=2, chunksize=3)
+    run_batch(DEMO_SCENARIO, DEMO_PERTURBATIONS, 40, seed=6, out=other, workers=1)
+
+    rows_a, rows_b = _lines(serial), _lines(pooled)
+    assert rows_a[:-1] == rows_b[:-1]
+    assert [r["variant"] for r in rows_a[:-1]] == list(range(40))
+    assert _stable(rows_a[-1]) == _stable(rows_b[-1]) == _stable(a) == _stable(b)
+    assert rows_a[-1]["type"] == "summary" and a["scenarios_per_s"] > 0
+    assert _lines(other)[:-1] != rows_a[:-1]
+
+
+def test_summary_matches_variants() -> None:
+    buf = io.StringIO()
+    summary = run_batch(DEMO_SCENARIO, DEMO_PERTURBATIONS, 25, seed=1, out=buf)
+    rows = _lines(buf)[:-1]
+
+    converged = [r for r in rows if r["converged"]]
+    assert summary["converged"] == len(converged)
+    assert summary["convergence_rate"] == len(converged) / 25
+    assert summary["quantiles"]["overall_risk"]["p50"] == pytest.approx(
+        sorted(r["overall_risk"] for r in rows)[12]
+    )
+    for r in rows:
+        assert r["converged"] == (r["steps_to_equilibrium"] is not None)
+
+
+def test_perturbation_does_not_touch_base_and_unperturbed_run_is_plain_engine() -> None:
+    before = json.dumps(DEMO_SCENARIO, sort_keys=True)
+    variant = perturb_scenario(DEMO_SCENARIO, DEMO_PERTURBATIONS, random.Random(0))
+    assert json.dumps(DEMO_SCENARIO, sort_keys=True) == before
+    assert variant["pressures"]["uncertainty"] == DEMO_SCENARIO["pressures"]["uncertainty"]
+    assert variant["pressures"]["staffing_risk"] != DEMO_SCENARIO["pressures"]["staffing_risk"]
+    assert 0.0 <= variant["pressures"]["staffing_risk"] <= 1.0
+
+    rec = run_batch(DEMO_SCENARIO, {}, 3, seed=0)
+    assert rec["quantiles"]["global_conflict"]["p05"] == run_scenario(DEMO_SCENARIO)["global_conflict"]
+
+    with pytest.raises(ValueError):
+        perturb_scenario(DEMO_SCENARIO, {"pressures.missing": {"dist": "normal", "sigma": 0.1}}, random.Random(0))
+
+
+def test_quantiles_linear_interpolation() -> None:
+    assert quantiles([]) is None
+    assert quantiles([3.0, 1.0, 2.0, 4.0], (0.0, 0.5, 1.0)) == {"p00": 1.0, "p50": 2.5, "p100": 4.0}
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+import random
+import subprocess
+import sys
+
+import pytest
+
+from core.policy_engine import compile_rules, evaluate, load_compiled, load_rules
+
+
+def _ruleset(rng: random.Random, n: int) -> dict:
+    rules = []
+    for i in range(n):
+        cond: dict = {}
+        kind = rng.random()
+        if kind < 0.3:
+            cond["risk_level"] = rng.choice(["LOW", "MEDIUM", "HIGH", None])
+        if 0.2 < kind < 0.5:
+            cond["confidence_lt"] = rng.choice([0.2, 0.5, 0.55, 0.9, 1, True])
+        if kind > 0.4:
+            for k in rng.sample(["venue", "side", "funding", "open_interest"], rng.randint(1, 2)):
+                cond[k] = rng.choice(["bybit", "binance", "long", 0.0, 0, 1, None, ["a"]])
+        action = {"decision": rng.choice(["APPROVE", "REJECT", "HOLD"])}
+        if rng.random() < 0.5:
+            action["reason_code"] = f"R{i}"
+        if rng.random() < 0.3:
+            action["override_required"] = False
+        rules.append({"id": f"RULE_{i}", "condition": cond, "action": action})
+    return {"version": "2.0", "rules": rules, "defaults": {"decision": "APPROVE", "override_required": False}}
+
+
+def _input(rng: random.Random) -> dict:
+    dry = {}
+    for k, vals in (
+        ("risk_level", ["LOW", "MEDIUM", "HIGH", None]),
+        ("confidence", [0.1, 0.5, 0.55, 0.7, 1.0, 0, False]),
+        ("venue", ["bybit", "binance", 0]),
+        ("side", ["long", "short", None]),
+        ("funding", [0.0, 1, None]),
+        ("open_interest", [0, 0.0, ["a"]]),
+    ):
+        if rng.random() < 0.7:
+            dry[k] = rng.choice(vals)
+    return dry
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_compiled_matches_linear_evaluator(seed) -> None:
+    rng = random.Random(seed)
+    ruleset = _ruleset(rng, 200)
+    compiled = compile_rules(ruleset)
+    inputs = [_input(rng) for _ in range(2000)]
+    assert compiled.evaluate_many(inputs) == [evaluate(d, ruleset) for d in inputs]
+
+
+def test_repo_policy_and_irregular_inputs() -> None:
+    ruleset = load_rules("policies/sentinel/gate_v1.yaml")
+    compiled = compile_rules(ruleset)
+    for dry in ({}, {"funding": 0.0, "open_interest": 0}, {"risk_level": "HIGH"}, {"confidence": 0.3}):
+        assert compiled.evaluate(dry) == evaluate(dry, ruleset)
+
+    # the linear walk raises on a non-numeric confidence; so does the compiled form
+    with pytest.raises(TypeError):
+        evaluate({"confidence": None}, ruleset)
+    with pytest.raises(TypeError):
+        compiled.evaluate({"confidence": None})
+
+    # results are fresh objects, like evaluate()
+    a = compiled.evaluate({"risk_level": "HIGH"})
+    a["reason_codes"].append("X")
+    assert compiled.evaluate({"risk_level": "HIGH"})["reason_codes"] == ["RISK_HIGH_BLOCK"]
+
+
+def test_load_compiled_tracks_file_changes(tmp_path) -> None:
+    p = tmp_path / "policy.yaml"
+    p.write_text("version: '1.0'\nrules:\n- id: A\n  condition: {side: long}\n  action: {decision: REJECT}\n", encoding="utf-8")
+    first = load_compiled(str(p))
+    assert load_compiled(str(p)) is first
+    assert first.evaluate({"side": "long"})["decision"] == "REJECT"
+
+    p.write_text("version: '1.1'\nrules:\n- id: A\n  condition: {side: long}\n  action: {decision: HOLD}\n", encoding="utf-8")
+    second = load_compiled(str(p))
+    assert second is not first and second.sha256 != first.sha256
+    assert second.evaluate({"side": "long"})["decision"] == "HOLD"
+
+
+def test_gate_cli_batch(tmp_path) -> None:
+    inp = tmp_path / "in.jsonl"
+    rows = [{"features": {"risk_level": "HIGH"}}, {"confidence": 0.9}]
+    inp.write_text("".join(json.dumps(r) + "\n" for r in rows), encoding="utf-8")
+    out = tmp_path / "out.jsonl"
+    proc = subprocess.run(
+        [sys.executable, "-m", "sdk.gate_cli", "--batch", "--input", str(inp), "--policy", "policies/sentinel/gate_v1.yaml", "--out", str(out)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    assert proc.returncode == 0, proc.stderr
+    got = [json.loads(ln) for ln in out.read_text(encoding="utf-8").splitlines()]
+    assert [d["policy_id"] for d in got] == ["BLOCK_HIGH_RISK", "DEFAULT"]
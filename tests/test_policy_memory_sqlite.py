@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import multiprocessing
+from types import SimpleNamespace
+
+import pytest
+
+from core.engine.run_engine import _policy_caller, _run_one, run_engine_batch
+from core.policy.memory.factory import policy_memory_from_spec
+from core.policy.memory.in_memory import InMemoryPolicyMemory
+from core.policy.memory.ports import PolicyMemoryConflict, PolicyMemoryKey
+from core.policy.policy_v0_2 import compute_policy_v0_2
+from core.policy.memory.sqlite import SQLitePolicyMemory
+from tools.bench.bench_run_engine import build_preludes
+
+KEY = PolicyMemoryKey(org_id="o", site_id="s", channel="fnb")
+ENGINE_KEY = PolicyMemoryKey(org_id="org-bench", site_id="site-0", channel="childcare")  # build_preludes(1, 1)[0]
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_versioned_cas_and_bounded_history(backend, tmp_path) -> None:
+    mem = InMemoryPolicyMemory(history_limit=3) if backend == "memory" else SQLitePolicyMemory(tmp_path / "pm.db", history_limit=3)
+    assert mem.load_versioned(KEY) == (0, None)
+    assert mem.compare_and_set(KEY, 0, {"n": 1})
+    assert not mem.compare_and_set(KEY, 0, {"n": 99})
+    mem.save_scene_state(KEY, {"n": 2})
+    for n in (3, 4, 5):
+        version, _ = mem.load_versioned(KEY)
+        assert mem.compare_and_set(KEY, version, {"n": n})
+    assert mem.load_versioned(KEY) == (5, {"n": 5})
+    assert mem.load_last_scene_state(KEY) == {"n": 5}
+    assert mem.history(KEY) == [{"n": 3}, {"n": 4}, {"n": 5}]
+
+
+def test_restarted_engine_resumes_identically(tmp_path) -> None:
+    preludes = build_preludes(90, sites=4)
+    uninterrupted = run_engine_batch(preludes, memory=InMemoryPolicyMemory())
+
+    db = tmp_path / "pm.db"
+    first = SQLitePolicyMemory(db)
+    out = run_engine_batch(preludes[:40], memory=first)
+    first.close()
+    second = policy_memory_from_spec(f"sqlite:{db}")
+    out += run_engine_batch(preludes[40:], memory=second)
+
+    assert [o.decision for o in out] == [o.decision for o in uninterrupted]
+    assert [o.scene_state for o in out] == [o.scene_state for o in uninterrupted]
+
+
+def _cas_increments(path: str, n: int) -> None:
+    mem = SQLitePolicyMemory(path, timeout=60.0)
+    done = 0
+    while done < n:
+        version, state = mem.load_versioned(KEY)
+        if mem.compare_and_set(KEY, version, {"count": (state or {"count": 0})["count"] + 1}):
+            done += 1
+    mem.close()
+
+
+def test_concurrent_processes_compare_and_set(tmp_path) -> None:
+    db = str(tmp_path / "pm.db")
+    SQLitePolicyMemory(db).close()
+    procs = [multiprocessing.Process(target=_cas_increments, args=(db, 50)) for _ in range(4)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(60)
+        assert p.exitcode == 0
+
+    assert SQLitePolicyMemory(db).load_versioned(KEY) == (200, {"count": 200})
+
+
+def _counting_policy(current_decision, prev_scene_state):
+    count = ((prev_scene_state or {}).get("temporal") or {}).get("writes", 0)
+    return SimpleNamespace(decision=current_decision, temporal_patch={"writes": count + 1})
+
+
+def _engine_step(prelude, memory):
+    return _run_one(
+        prelude,
+        strict=True,
+        memory=memory,
+        policy_v0_3=_policy_caller(_counting_policy),
+        policy_v0_2=_policy_caller(compute_policy_v0_2),
+    )
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_two_engine_writers_do_not_lose_updates(backend, tmp_path) -> None:
+    # writer B saves between writer A's load and A's write; A must recompute on B's state
+    prelude = build_preludes(1, sites=1)[0]
+    base = InMemoryPolicyMemory if backend == "memory" else SQLitePolicyMemory
+    args = () if backend == "memory" else (tmp_path / "pm.db",)
+
+    class Interleaved(base):  # type: ignore[misc, valid-type]
+        loads = 0
+
+        def load_versioned(self, key):
+            loaded = super().load_versioned(key)
+            type(self).loads += 1
+            if type(self).loads == 1:
+                _engine_step(prelude, writer_b)
+            return loaded
+
+    writer_a = Interleaved(*args)
+    writer_b = base(*args) if backend == "sqlite" else writer_a
+    out = _engine_step(prelude, writer_a)
+
+    assert out.scene_state["temporal"]["writes"] == 2
+    version, state = writer_b.load_versioned(ENGINE_KEY)
+    assert (version, state["temporal"]["writes"]) == (2, 2)
+
+
+def test_engine_write_conflict_fails_closed(monkeypatch) -> None:
+    mem = InMemoryPolicyMemory()
+    monkeypatch.setattr(mem, "compare_and_set", lambda key, version, state: False)
+    with pytest.raises(PolicyMemoryConflict):
+        _engine_step(build_preludes(1, sites=1)[0], mem)
+    assert mem.load_versioned(ENGINE_KEY) == (0, None)
+
+
+def test_unknown_spec_rejected() -> None:
+    with pytest.raises(ValueError):
+        policy_memory_from_spec("redis://x")
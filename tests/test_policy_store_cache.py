@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+
+import pytest
+
+from core.policy_store import store as store_mod
+from core.policy_store.store import PolicyStore, sha256_of_obj
+
+_OLD = time.time() - 3600
+
+
+def _write(dirpath, version: int, policy: dict, *, age: bool = True) -> str:
+    path = os.path.join(str(dirpath), f"policy_v{version:04d}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(policy, f)
+    if age:
+        os.utime(path, (_OLD, _OLD))
+        os.utime(str(dirpath), (_OLD, _OLD))
+    return path
+
+
+@pytest.fixture
+def counted(monkeypatch):
+    calls = {"load": 0, "listdir": 0}
+    real_load, real_listdir = PolicyStore._load_json, os.listdir
+
+    def load(path):
+        calls["load"] += 1
+        return real_load(path)
+
+    def listdir(path):
+        calls["listdir"] += 1
+        return real_listdir(path)
+
+    monkeypatch.setattr(PolicyStore, "_load_json", staticmethod(load))
+    monkeypatch.setattr(store_mod.os, "listdir", listdir)
+    return calls
+
+
+def test_warm_loads_only_stat(tmp_path, counted) -> None:
+    _write(tmp_path, 1, {"a": 1})
+    _write(tmp_path, 2, {"a": 2})
+
+    first = PolicyStore(str(tmp_path)).latest()
+    assert first.version == 2 and first.sha256 == sha256_of_obj({"a": 2})
+    assert counted == {"load": 1, "listdir": 1}
+
+    # a second store on the same directory shares the catalog
+    other = PolicyStore(str(tmp_path))
+    assert other.latest() is first
+    assert other.get(2) is first
+    assert other.get(1).policy == {"a": 1}
+    assert other.get(1) is other.load_version(1)
+    assert other.versions() == [1, 2]
+    assert counted == {"load": 2, "listdir": 1}
+
+
+def test_changed_file_is_never_served_stale(tmp_path) -> None:
+    path = _write(tmp_path, 1, {"v": "aa"})
+    s = PolicyStore(str(tmp_path))
+    assert s.latest().policy == {"v": "aa"}
+
+    # same size, different content, different (old) mtime
+    _write(tmp_path, 1, {"v": "bb"})
+    os.utime(path, (_OLD + 10, _OLD + 10))
+    assert s.latest().policy == {"v": "bb"}
+    assert s.latest().sha256 == sha256_of_obj({"v": "bb"})
+
+    # rewritten twice within the same tick: too fresh to be cached at all
+    _write(tmp_path, 1, {"v": "cc"}, age=False)
+    assert s.get(1).policy == {"v": "cc"}
+    _write(tmp_path, 1, {"v": "dd"}, age=False)
+    assert s.get(1).policy == {"v": "dd"}
+
+
+def test_new_and_removed_versions(tmp_path) -> None:
+    _write(tmp_path, 1, {"x": 1})
+    s = PolicyStore(str(tmp_path))
+    assert s.latest().version == 1
+
+    saved = s.save_new_version({"x": 2})
+    assert s.latest().version == 2 and s.latest().sha256 == saved.sha256
+
+    os.remove(saved.path)
+    assert s.latest().version == 1
+    with pytest.raises(FileNotFoundError):
+        s.get(2)
+    with pytest.raises(FileNotFoundError):
+        s.get(7)
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from core.engine import run_engine as engine_mod
+from core.engine.run_engine import _call_policy, _policy_caller, run_engine, run_engine_batch
+from core.policy.memory.in_memory import InMemoryPolicyMemory
+from core.policy.memory.ports import PolicyMemoryKey
+from tools.bench.bench_run_engine import build_preludes
+
+
+def test_batch_matches_single_item_path() -> None:
+    preludes = build_preludes(120, sites=7)
+    mem_single = InMemoryPolicyMemory()
+    single = [run_engine(p, memory=mem_single) for p in preludes]
+
+    mem_batch = InMemoryPolicyMemory()
+    assert run_engine_batch(preludes, memory=mem_batch) == single
+    assert mem_batch._store == mem_single._store
+
+
+def test_explicit_memory_leaves_global_untouched() -> None:
+    before = dict(engine_mod._POLICY_MEMORY._store)
+    mem = InMemoryPolicyMemory()
+    run_engine_batch(build_preludes(5, sites=1), memory=mem)
+    assert engine_mod._POLICY_MEMORY._store == before
+    key = PolicyMemoryKey(org_id="org-bench", site_id="site-0", channel="fnb")
+    assert mem.load_last_scene_state(key) is not None
+
+
+def test_policy_caller_resolved_once_and_filters_kwargs() -> None:
+    def policy(channel, now_ts_iso):
+        return (channel, now_ts_iso)
+
+    assert _policy_caller(policy) is _policy_caller(policy)
+    assert _call_policy(policy, channel="fnb", now_ts_iso="t", signals=[]) == ("fnb", "t")
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import json
+import random
+
+import pytest
+
+from infra.storage.l2_audit_repo import FileBackedL2AuditRepo
+from infra.storage.scene_segments import SceneSegmentStore
+
+
+def _legacy(tmp_path, n: int = 400) -> list[dict]:
+    rng = random.Random(5)
+    items = []
+    for i in range(n):
+        day = 1 + i // 40
+        items.append({
+            "scene_id": f"scene_{i}",
+            "context": {"channel": rng.choice(["childcare", "retail", "ops/x"])} if i % 17 else {},
+            "ts_end": f"2026-01-{day:02d}T10:00:00+00:00",
+            "total_decisions": i,
+        })
+    with (tmp_path / "scene_summaries.jsonl").open("w", encoding="utf-8") as f:
+        for s in items:
+            f.write(json.dumps(s) + "\n")
+    return items
+
+
+def _drain(store: SceneSegmentStore, channel, limit: int) -> list[dict]:
+    out, cursor = [], None
+    while True:
+        items, cursor = store.page(channel, limit, cursor)
+        out.extend(items)
+        if cursor is None:
+            return out
+
+
+@pytest.mark.parametrize("limit", [1, 7, 40, 500])
+def test_pagination_matches_reverse_scan(tmp_path, limit) -> None:
+    items = _legacy(tmp_path)
+    store = SceneSegmentStore(str(tmp_path), legacy_path=str(tmp_path / "scene_summaries.jsonl"))
+
+    for ch in ("childcare", "ops/x", "missing"):
+        expected = [s for s in reversed(items) if s.get("context", {}).get("channel") == ch]
+        assert _drain(store, ch, limit) == expected
+
+    assert _drain(store, None, limit) == list(reversed(items))
+
+
+def test_first_channel_page_reads_only_newest_segment(tmp_path, monkeypatch) -> None:
+    _legacy(tmp_path)
+    store = SceneSegmentStore(str(tmp_path), legacy_path=str(tmp_path / "scene_summaries.jsonl"))
+
+    opened = []
+    orig = store._segment_lines
+    monkeypatch.setattr(store, "_segment_lines", lambda k, d: opened.append(d) or orig(k, d))
+    items, cursor = store.page("retail", 3)
+    assert len(items) == 3 and cursor is not None
+    assert opened == ["2026-01-10"]
+
+
+def test_invalid_cursor_rejected(tmp_path) -> None:
+    _legacy(tmp_path, n=5)
+    store = SceneSegmentStore(str(tmp_path), legacy_path=str(tmp_path / "scene_summaries.jsonl"))
+    with pytest.raises(ValueError):
+        store.page("retail", 5, "garbage")
+    _, cursor = store.page(None, 1)
+    with pytest.raises(ValueError):
+        store.page("retail", 5, cursor)
+
+
+def test_l2_repo_uses_segments_for_scene_index(tmp_path) -> None:
+    _legacy(tmp_path, n=20)
+    repo = FileBackedL2AuditRepo(str(tmp_path))
+    assert "scene_3" in repo.scene_segments
+    with pytest.raises(RuntimeError):
+        repo.read_scene_summary("scene_3")
+    with pytest.raises(KeyError):
+        repo.read_scene_summary("scene_missing")
+
+    repo.append_scene_summary_dict({"scene_id": "scene_new", "context": {"channel": "retail"}})
+    items, _ = repo.scene_segments.page("retail", 1)
+    assert items[0]["scene_id"] == "scene_new"
+
+    # reopening does not re-ingest lines that were already partitioned
+    reopened = FileBackedL2AuditRepo(str(tmp_path))
+    assert _drain(reopened.scene_segments, None, 50) == _drain(repo.scene_segments, None, 50)
+    assert reopened.scene_segments.read("scene_new")["context"] == {"channel": "retail"}
+    assert len(_drain(reopened.scene_segments, "retail", 50)) == len(_drain(repo.scene_segments, "retail", 50))
+
+
+def test_two_writers_on_one_directory_do_not_reingest(tmp_path) -> None:
+    a = FileBackedL2AuditRepo(str(tmp_path))
+    b = FileBackedL2AuditRepo(str(tmp_path))
+    a.append_scene_summary_dict({"scene_id": "s1", "context": {"channel": "retail"}})
+    b.append_scene_summary_dict({"scene_id": "s2", "context": {"channel": "retail"}})
+    a.append_scene_summary_dict({"scene_id": "s3", "context": {"channel": "retail"}})
+
+    fresh = SceneSegmentStore(str(tmp_path), legacy_path=str(tmp_path / "scene_summaries.jsonl"))
+    assert [s["scene_id"] for s in _drain(fresh, "retail", 50)] == ["s3", "s2", "s1"]
+    assert "s2" in a.scene_segments and "s3" in b.scene_segments
+
+
+def test_crash_before_manifest_save_is_rolled_back(tmp_path, monkeypatch) -> None:
+    items = _legacy(tmp_path, n=30)
+    legacy = str(tmp_path / "scene_summaries.jsonl")
+    crashing = SceneSegmentStore(str(tmp_path), legacy_path=legacy, sync=False)
+
+    saves = []
+    orig = crashing._save_manifest
+
+    def save_then_crash() -> None:
+        saves.append(1)
+        if len(saves) == 2:  # 1: pending sizes, 2: offset commit
+            raise OSError("crash")
+        orig()
+
+    monkeypatch.setattr(crashing, "_save_manifest", save_then_crash)
+    with pytest.raises(OSError):
+        crashing.sync_legacy()
+
+    recovered = SceneSegmentStore(str(tmp_path), legacy_path=legacy)
+    assert _drain(recovered, "retail", 50) == [s for s in reversed(items) if s.get("context", {}).get("channel") == "retail"]
+    assert recovered.read("scene_29")["scene_id"] == "scene_29"
+
+
+def test_refresh_is_read_only(tmp_path) -> None:
+    _legacy(tmp_path, n=5)
+    legacy = str(tmp_path / "scene_summaries.jsonl")
+    reader = SceneSegmentStore(str(tmp_path), legacy_path=legacy, sync=False)
+    reader.refresh()
+    assert reader.page("retail", 5) == ([], None)
+    assert not (tmp_path / "scene_segments" / "manifest.json").exists()
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+
+import pytest
+
+nacl_signing = pytest.importorskip("nacl.signing")
+
+from auralis_v1.core import signature as sig_mod
+from auralis_v1.core.signature import Ed25519Signer, SignatureConfig, get_signer, sign_hash_hex, sign_many
+
+_OLD = time.time() - 3600
+
+
+def _key_file(path, seed: bytes, fmt: str = "raw") -> str:
+    data = seed if fmt == "raw" else seed.hex().encode()
+    path.write_bytes(data)
+    os.utime(path, (_OLD, _OLD))
+    return str(path)
+
+
+def _hashes(n: int) -> list:
+    return [hashlib.sha256(str(i).encode()).hexdigest() for i in range(n)]
+
+
+def test_signatures_match_uncached_key_and_key_loaded_once(tmp_path, monkeypatch) -> None:
+    seed = bytes(range(32))
+    cfg = SignatureConfig(enabled=True, priv_path=_key_file(tmp_path / "k.hex", seed, "hex"), key_id="k1")
+    real = sig_mod._load_signing_key
+    reference = real(cfg.priv_path)  # the per-call load sign_hash_hex used to do
+
+    loads = []
+    monkeypatch.setattr(sig_mod, "_load_signing_key", lambda p: loads.append(p) or real(p))
+
+    hashes = _hashes(20)
+    singles = [sign_hash_hex(h, cfg) for h in hashes]
+    batch = sign_many(cfg, hashes)
+    for h, a, b in zip(hashes, singles, batch):
+        expected = reference.sign(bytes.fromhex(h)).signature.hex()
+        assert a["signature"] == b["signature"] == expected
+        assert a["key_id"] == b["key_id"] == "k1" and b["signed_digest"] == "hash"
+    assert len(loads) == 1
+    assert sign_hash_hex({"enabled": True, "priv_path": cfg.priv_path, "key_id": "k1"}, hashes[0])["signature"] == singles[0]["signature"]
+    assert len(loads) == 1
+
+
+def test_rotated_key_file_is_reloaded(tmp_path) -> None:
+    path = tmp_path / "k.raw"
+    cfg = SignatureConfig(enabled=True, priv_path=_key_file(path, b"\x01" * 32), key_id="k")
+    signer = Ed25519Signer(cfg)
+    h = _hashes(1)[0]
+    first = signer.sign(h)["signature"]
+
+    _key_file(path, b"\x02" * 32)
+    os.utime(path, (_OLD + 5, _OLD + 5))
+    second = signer.sign(h)["signature"]
+    assert second != first
+    assert second == nacl_signing.SigningKey(b"\x02" * 32).sign(bytes.fromhex(h)).signature.hex()
+
+
+def test_disabled_and_invalid_inputs(tmp_path) -> None:
+    assert sign_many({"enabled": False}, _hashes(3)) == [{}, {}, {}]
+    cfg = SignatureConfig(enabled=True, priv_path=_key_file(tmp_path / "k", b"\x03" * 32), key_id="k")
+    with pytest.raises(SystemExit, match="SIG_HASH_INVALID"):
+        get_signer(cfg).sign_many(_hashes(2) + ["nothex"])
+    with pytest.raises(SystemExit, match="SIG_PRIV_NOT_FOUND"):
+        Ed25519Signer(SignatureConfig(enabled=True, priv_path=str(tmp_path / "missing"), key_id="k")).sign(_hashes(1)[0])
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import json
+import os
+from datetime import date
+
+from vault.join_engine import ArtifactCache, VaultJoinEngine
+from vault.run_index import RunIndex
+
+
+def _vault(tmp_path, n: int = 40):
+    v = tmp_path / "vault"
+    idx = v / "manifests" / "runs_index.jsonl"
+    idx.parent.mkdir(parents=True)
+    lines = []
+    for i in range(n):
+        day = f"2025/12/{1 + i % 3:02d}"
+        ep = v / "executions" / day / f"exec_R{i}.json"
+        op = v / "outcomes" / day / f"outcome_R{i}.json"
+        ep.parent.mkdir(parents=True, exist_ok=True)
+        op.parent.mkdir(parents=True, exist_ok=True)
+        ep.write_text(json.dumps({"run": {"strategy_card_id": f"S{i % 4}"}}))
+        op.write_text(json.dumps({"labels": {"result": "WIN"}, "pnl": {"realized": i}}))
+        lines.append(json.dumps({"run_id": f"R{i}", "status": "COMPLETE", "exec_path": str(ep), "outcome_path": str(op)}))
+    idx.write_text("\n".join(lines) + "\n")
+    return v
+
+
+def _settle(p, age_s: int = 10) -> None:
+    # backdate past the racy window so the cache trusts the (mtime_ns, size) key
+    t = os.stat(p).st_mtime_ns - age_s * 1_000_000_000
+    os.utime(p, ns=(t, t))
+
+
+def _rows(index: RunIndex):
+    return index.rows(date(2025, 12, 1), date(2025, 12, 3))
+
+
+def test_parallel_join_matches_serial_and_keeps_order(tmp_path) -> None:
+    v = _vault(tmp_path)
+    serial = RunIndex(v)
+    serial.sync()
+    expected = [(r["run_id"], rec) for r, rec in serial.iter_records(_rows(serial))]
+
+    for p in (v / "manifests" / "runs").rglob("summary.json"):
+        p.unlink()
+    with VaultJoinEngine(max_workers=4) as eng:
+        index = RunIndex(v, joiner=eng)
+        got = [(r["run_id"], rec) for r, rec in index.iter_records(_rows(index))]
+    assert got == expected
+
+
+def test_artifact_cache_lru_disk_and_invalidation(tmp_path) -> None:
+    p = tmp_path / "a.json"
+    p.write_text(json.dumps({"v": 1}))
+    _settle(p)
+    disk = tmp_path / "cache.sqlite"
+
+    c = ArtifactCache(max_entries=2, disk_path=disk)
+    assert c.read_json(str(p)) == {"v": 1}
+    assert c.read_json(str(p)) == {"v": 1}
+    assert (c.misses, c.hits) == (1, 1)
+    c.close()
+
+    c2 = ArtifactCache(disk_path=disk)
+    assert c2.read_json(str(p)) == {"v": 1}
+    assert c2.disk_hits == 1
+
+    p.write_text(json.dumps({"v": 22}))
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert c2.read_json(str(p)) == {"v": 22}
+    assert c2.read_json(str(tmp_path / "missing.json")) is None
+    c2.close()
+
+
+def test_artifact_cache_does_not_trust_racy_mtimes(tmp_path) -> None:
+    p = tmp_path / "a.json"
+    p.write_text(json.dumps({"v": 1}))
+    disk = tmp_path / "cache.sqlite"
+
+    c = ArtifactCache(disk_path=disk)
+    assert c.read_json(str(p)) == {"v": 1}
+    st = p.stat()
+    # same-size rewrite within the same mtime tick
+    p.write_text(json.dumps({"v": 2}))
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert c.read_json(str(p)) == {"v": 2}
+    assert c.hits == 0
+    c.close()
+
+    c2 = ArtifactCache(disk_path=disk)
+    assert c2.read_json(str(p)) == {"v": 2}
+    assert c2.disk_hits == 0
+    c2.close()
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from datetime import date
+from pathlib import Path
+
+from vault import run_index
+from vault.run_index import RunIndex
+
+
+def _write(p: Path, obj: dict) -> None:
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_text(json.dumps(obj), encoding="utf-8")
+
+
+def _vault(tmp_path: Path) -> Path:
+    v = tmp_path / "vault"
+    idx = v / "manifests" / "runs_index.jsonl"
+    idx.parent.mkdir(parents=True)
+    lines = []
+    for i, day in enumerate(["2025/12/22", "2025/12/22", "2025/12/23", "2025/11/02"]):
+        rid = f"RUN{i}"
+        ep = v / "executions" / day / f"exec_{rid}.json"
+        op = v / "outcomes" / day / f"outcome_{rid}.json"
+        _write(ep, {"run": {"strategy_card_id": "S1", "judgment_card_id": f"J{i}"}})
+        _write(op, {"labels": {"result": "win", "reason": "r"}, "pnl": {"realized": i}, "excursions": {"mae": 1, "mfe": 2}})
+        for st in ("PENDING", "COMPLETE"):
+            lines.append(json.dumps({"run_id": rid, "status": st, "exec_path": str(ep), "outcome_path": str(op)}))
+    idx.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return v
+
+
+def test_sync_partitions_by_run_date(tmp_path) -> None:
+    v = _vault(tmp_path)
+    index = RunIndex(v)
+    assert index.sync() == 8
+    assert index.sync() == 0
+
+    rows = index.rows(date(2025, 12, 22), date(2025, 12, 31))
+    assert [(r["run_id"], r["status"]) for r in rows] == [
+        ("RUN0", "PENDING"), ("RUN0", "COMPLETE"),
+        ("RUN1", "PENDING"), ("RUN1", "COMPLETE"),
+        ("RUN2", "PENDING"), ("RUN2", "COMPLETE"),
+    ]
+    assert index.days(date(2025, 11, 1), date(2025, 11, 30)) == ["2025/11/02"]
+
+    # appended lines are picked up incrementally
+    with (v / "manifests" / "runs_index.jsonl").open("a", encoding="utf-8") as f:
+        f.write(json.dumps({"run_id": "RUN9", "status": "FAILED", "exec_path": str(v / "executions/2025/12/23/exec_RUN9.json")}) + "\n")
+    assert index.sync() == 1
+    assert index.rows(date(2025, 12, 23), date(2025, 12, 23))[-1]["run_id"] == "RUN9"
+
+
+def test_summary_is_never_served_stale(tmp_path) -> None:
+    v = _vault(tmp_path)
+    index = RunIndex(v)
+    index.sync()
+    rows = [r for r in index.rows(date(2025, 12, 22), date(2025, 12, 22)) if r["status"] == "COMPLETE"]
+
+    recs = index.records(rows)
+    assert recs["RUN1"].judgment_card_id == "J1"
+    assert recs["RUN1"].realized == 1.0
+    assert not recs["RUN1"].is_hard_fail
+
+    op = Path(rows[1]["outcome_path"])
+    _write(op, {"labels": {"result": "LOSS", "reason": "patched"}, "pnl": {"realized": -3.5, "ccy": "USDT"}})
+    st = op.stat()
+    os.utime(op, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    _write(v / "exceptions/2025/12/22/exception_RUN0__BAD.json", {"severity": "HARD_FAIL", "code": "BAD"})
+
+    recs = index.records(rows)
+    assert (recs["RUN1"].result, recs["RUN1"].realized, recs["RUN1"].ccy) == ("LOSS", -3.5, "USDT")
+    assert recs["RUN0"].is_hard_fail and recs["RUN0"].exc_code == "BAD"
+
+    # a fresh index over the same files serves the persisted summary
+    again = RunIndex(v).records(rows)
+    assert again == recs
+
+
+def _age(p: Path, ns: int) -> None:
+    os.utime(p, ns=(ns, ns))
+
+
+def test_exception_rewritten_in_place_is_rejoined(tmp_path) -> None:
+    v = _vault(tmp_path)
+    index = RunIndex(v)
+    index.sync()
+    rows = [r for r in index.rows(date(2025, 12, 22), date(2025, 12, 22)) if r["status"] == "COMPLETE"]
+    ex_dir = v / "exceptions/2025/12/22"
+    exc = ex_dir / "exception_RUN0__BAD.json"
+    _write(exc, {"severity": "SOFT", "code": "A"})
+    old = 1_600_000_000 * 10**9
+    for p in (exc, ex_dir, *(Path(r[k]) for r in rows for k in ("exec_path", "outcome_path"))):
+        _age(p, old)
+
+    assert index.records(rows)["RUN0"].exc_code == "A"
+
+    # same name, same size, directory mtime untouched: only the file stamp changes
+    _write(exc, {"severity": "HARD", "code": "B"})
+    _age(exc, old + 1_000_000)
+    _age(ex_dir, old)
+    rec = RunIndex(v).records(rows)["RUN0"]
+    assert (rec.exc_code, rec.exc_severity) == ("B", "HARD")
+
+
+def test_racy_stamps_are_not_trusted(tmp_path) -> None:
+    v = _vault(tmp_path)
+    index = RunIndex(v)
+    index.sync()
+    rows = [r for r in index.rows(date(2025, 12, 22), date(2025, 12, 22)) if r["status"] == "COMPLETE"]
+    ex_dir = v / "exceptions/2025/12/22"
+    exc = ex_dir / "exception_RUN0__BAD.json"
+    _write(exc, {"severity": "SOFT", "code": "A"})
+    assert index.records(rows)["RUN0"].exc_stamp == (-1, -1)  # written just now
+
+    # rewritten within the same mtime tick and size: caught because the stamp was untrusted
+    st = exc.stat()
+    _write(exc, {"severity": "HARD", "code": "B"})
+    os.utime(exc, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert index.records(rows)["RUN0"].exc_code == "B"
+
+
+def test_concurrent_syncs_partition_each_row_once(tmp_path, monkeypatch) -> None:
+    v = _vault(tmp_path)
+    write = run_index._write_json_atomic
+
+    def slow_write(path, data):
+        time.sleep(0.02)  # widen the read-manifest -> append -> write-manifest window
+        write(path, data)
+
+    monkeypatch.setattr(run_index, "_write_json_atomic", slow_write)
+    barrier = threading.Barrier(8)
+
+    def worker() -> None:
+        barrier.wait()
+        RunIndex(v).sync()
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    lines = (v / "manifests" / "runs" / "2025" / "12" / "22" / "index.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 4
+    assert len(RunIndex(v).rows(date(2025, 11, 1), date(2025, 12, 31))) == 8
+
+
+def test_rows_appended_before_a_crash_are_read_once(tmp_path) -> None:
+    v = _vault(tmp_path)
+    index = RunIndex(v)
+    index.sync()
+    # crash between the partition appends and the manifest write: the next sync re-appends
+    (v / "manifests" / "runs" / "_manifest.json").write_text('{"source_offset": 0}', encoding="utf-8")
+    assert index.sync() == 8
+
+    rows = index.rows(date(2025, 12, 22), date(2025, 12, 22))
+    assert [(r["run_id"], r["status"]) for r in rows] == [
+        ("RUN0", "PENDING"), ("RUN0", "COMPLETE"),
+        ("RUN1", "PENDING"), ("RUN1", "COMPLETE"),
+    ]
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import subprocess
+import sys
+from pathlib import Path
+
+from tools.sentinel_pipeline_runner import STAGES, PipelineConfig, SentinelPipeline
+
+TS = "20260215T120000Z"
+SYMBOLS = ["BTCUSDT", "ETHUSDT"]
+
+
+def _fake_fetch(symbol: str, tf: str, limit: int, bybit_base_url: str) -> list[dict]:
+    base = 100.0 if symbol == "BTCUSDT" else 40.0
+    step = {"15m": 0.3, "1h": 0.2, "4h": 0.1}[tf]
+    rows = []
+    for i in range(limit):
+        close = base + step * i + 3.0 * math.sin(i / 7.0)
+        rows.append({"open": close - 0.5, "high": close + 1.0, "low": close - 1.0, "close": close, "volume": 10.0 + (i % 13)})
+    return rows
+
+
+def _cfg(tmp_path: Path, name: str, **kw) -> PipelineConfig:
+    root = tmp_path / name
+    # prev state makes the events stage emit something
+    state = root / "state"
+    state.mkdir(parents=True)
+    (state / "prev_BTCUSDT.json").write_text(
+        json.dumps({"symbol": "BTCUSDT", "score": 99, "risk_level": "low", "confidence": 0.99, "ts": TS}), encoding="utf-8"
+    )
+    return PipelineConfig(
+        ts=TS,
+        symbols=SYMBOLS,
+        ci=True,
+        snap_root=root / "snapshots",
+        domain_root=root / "domain",
+        state_dir=state,
+        events_dir=root / "events",
+        outbox=root / "outbox",
+        execution_mode="paper",
+        paper_policy_file=Path("policies/sentinel/paper_orders_v1.yaml"),
+        paper_policy_sha256=hashlib.sha256(Path("policies/sentinel/paper_orders_v1.yaml").read_bytes()).hexdigest(),
+        **kw,
+    )
+
+
+def _cli(*argv: str) -> None:
+    proc = subprocess.run([sys.executable, *argv], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    assert proc.returncode == 0, proc.stdout + proc.stderr
+
+
+def _without_ts_iso(path: Path) -> dict:
+    obj = json.loads(path.read_text(encoding="utf-8"))
+    obj.pop("ts_iso")
+    return obj
+
+
+def test_runner_matches_cli_chain(tmp_path: Path) -> None:
+    cfg = _cfg(tmp_path, "runner", checkpoints=STAGES)
+    res = SentinelPipeline(cfg, fetch=_fake_fetch).run()
+    assert set(res.timings) == set(STAGES)
+    assert res.artifacts["events"]["count"] >= 1
+
+    # replay the CLI chain from the snapshots the runner persisted
+    cli = _cfg(tmp_path, "cli")
+    for s in SYMBOLS:
+        for tf in cfg.tfs:
+            _cli("tools/sentinel_build_domain_event.py", "--snapshot-file", str(cfg.snapshot_path(s)), "--ci",
+                 "--out", str(cli.domain_event_path(s, tf)))
+            # the evidence ref points at the runner's snapshot in both chains
+            assert cli.domain_event_path(s, tf).read_bytes() == cfg.domain_event_path(s, tf).read_bytes()
+
+    _cli("tools/sentinel_build_summary.py", "--ts", TS, "--symbols", ",".join(SYMBOLS), "--tfs", "15m 1h",
+         "--domain-root", str(cli.domain_root), "--out", str(cli.summary_path()))
+    _cli("tools/sentinel_build_events.py", "--summary-file", str(cli.summary_path()), "--state-dir", str(cli.state_dir),
+         "--out", str(cli.events_path()))
+    _cli("tools/sentinel_build_execution_intent.py", "--summary-file", str(cli.summary_path()), "--outbox", str(cli.outbox),
+         "--execution-mode", "paper")
+    _cli("tools/sentinel_build_paper_orders.py", "--execution-intent", str(cli.intent_path()), "--outbox", str(cli.outbox),
+         "--policy-file", str(cli.paper_policy_file), "--policy-sha256", cli.paper_policy_sha256)
+
+    runner_summary = cfg.summary_path().read_text(encoding="utf-8").replace(str(cfg.domain_root), str(cli.domain_root))
+    assert runner_summary == cli.summary_path().read_text(encoding="utf-8")
+    assert cfg.events_path().read_bytes() == cli.events_path().read_bytes()
+    assert (cfg.state_dir / "prev_BTCUSDT.json").read_bytes() == (cli.state_dir / "prev_BTCUSDT.json").read_bytes()
+
+    # ts_iso is wall-clock in both; everything else matches once paths are aligned
+    intent = _without_ts_iso(cfg.intent_path())
+    intent["evidence_refs"][0]["ref"] = str(cli.summary_path())
+    assert intent == _without_ts_iso(cli.intent_path())
+    paper = _without_ts_iso(cfg.paper_path())
+    paper["evidence_refs"][0]["ref"] = str(cli.intent_path())
+    assert paper == _without_ts_iso(cli.paper_path())
+
+
+def test_only_checkpoints_are_written(tmp_path: Path) -> None:
+    cfg = _cfg(tmp_path, "runner")
+    res = SentinelPipeline(cfg, fetch=_fake_fetch).run()
+    assert sorted(res.written) == sorted([cfg.summary_path(), cfg.events_path(), cfg.intent_path(), cfg.paper_path()])
+    assert not cfg.snap_root.exists()
+    assert not (cfg.domain_root / "BTCUSDT").exists()
+    assert res.artifacts["execution_intent"]["meta"]["build_sha"] == res.build_sha
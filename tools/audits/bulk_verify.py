@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Bulk ed25519 signature verifier for judgment / observer event JSONL
+(shared by verify_judgment_event_signatures.py and verify_observer_event_signatures.py)
+
+- the log is split into byte ranges on line boundaries (--chunk-bytes); workers
+  read + verify their own range, so the parent never holds the whole file
+- line numbers are the same as the single-pass tools: 1-based over non-empty
+  (stripped) lines of read_text().splitlines()
+- the first failing line is reported deterministically: chunks are consumed in
+  file order and each chunk reports its own first failure, so worker scheduling
+  never changes which error wins
+- chain=True (judgment layout) also checks the judgment_event.v1 hash chain
+  (verify_judgment_event_chain.py rules) in the same pass; the link across a
+  chunk boundary is checked by the parent
+- workers<=1 verifies in-process (no pool)
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from nacl.signing import VerifyKey
+
+GENESIS_HASH = "0" * 64
+RE_HASH = re.compile(r"^[0-9a-f]{64}$")
+
+LAYOUT_JUDGMENT = "judgment"
+LAYOUT_OBSERVER = "observer"
+
+DEFAULT_CHUNK_BYTES = 8 << 20
+MAX_IN_FLIGHT_PER_WORKER = 2
+
+# failure ordering within one line (mirrors the order of checks in the single-pass tools)
+_STAGE_PARSE = 0
+_STAGE_LINK = 1
+_STAGE_HASH = 2
+_STAGE_SIG = 3
+
+# (line_index_in_chunk, stage, code, detail without the "line=" prefix)
+Failure = Tuple[int, int, str, str]
+
+
+@dataclass(frozen=True)
+class VerifyResult:
+    ok: bool
+    lines: int
+    error: str = ""
+    detail: str = ""
+
+
+def _canonical_json(obj: Dict[str, Any]) -> str:
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"))
+
+
+def _sha256_hex(s: str) -> str:
+    return hashlib.sha256(s.encode("utf-8")).hexdigest()
+
+
+def extract_sig_hex(obj: Dict[str, Any]) -> Optional[str]:
+    """
+    Supports both:
+      - signature: "<hex>"
+      - signature: {"signature": "<hex>", ...}
+    """
+    sig = obj.get("signature")
+    if sig is None:
+        return None
+    if isinstance(sig, str) and sig.strip():
+        return sig.strip()
+    if isinstance(sig, dict):
+        s = sig.get("signature")
+        if isinstance(s, str) and s.strip():
+            return s.strip()
+    return None
+
+
+def _judgment_hash(obj: Dict[str, Any]) -> Optional[str]:
+    h = obj.get("hash")
+    if not isinstance(h, str) or not RE_HASH.match(h):
+        return None
+    return h
+
+
+def _observer_hash(obj: Dict[str, Any]) -> Optional[str]:
+    chain = obj.get("chain")
+    if isinstance(chain, dict):
+        h = chain.get("hash")
+        if isinstance(h, str) and h.strip():
+            return h.strip()
+    h2 = obj.get("hash")
+    if isinstance(h2, str) and h2.strip():
+        return h2.strip()
+    return None
+
+
+_HASH_EXTRACTORS: Dict[str, Callable[[Dict[str, Any]], Optional[str]]] = {
+    LAYOUT_JUDGMENT: _judgment_hash,
+    LAYOUT_OBSERVER: _observer_hash,
+}
+
+
+def _chain_failure(i: int, obj: Any, prev: Optional[str]) -> Optional[Failure]:
+    """judgment_event.v1 chain rules for one line; prev=None: link checked by the caller."""
+    if not isinstance(obj, dict):
+        return (i, _STAGE_PARSE, "NOT_OBJECT", "")
+    if obj.get("schema") != "judgment_event.v1":
+        return (i, _STAGE_PARSE, "SCHEMA_MISMATCH", f"schema={obj.get('schema')}")
+    ph = obj.get("prev_hash")
+    h = obj.get("hash")
+    if not isinstance(ph, str) or not RE_HASH.match(ph) and ph != GENESIS_HASH:
+        return (i, _STAGE_PARSE, "BAD_PREV_HASH", "")
+    if not isinstance(h, str) or not RE_HASH.match(h):
+        return (i, _STAGE_PARSE, "BAD_HASH", "")
+    if prev is not None and ph != prev:
+        return (i, _STAGE_LINK, "CHAIN_BREAK", f"expected_prev={prev} got_prev={ph}")
+    core = dict(obj)
+    core.pop("hash", None)
+    core.pop("signature", None)
+    core.pop("signature_meta", None)
+    if _sha256_hex(_canonical_json(core)) != h:
+        return (i, _STAGE_HASH, "HASH_MISMATCH", "")
+    return None
+
+
+@dataclass(frozen=True)
+class _ChunkResult:
+    n_lines: int
+    failure: Optional[Failure]
+    first_prev: Optional[str]
+    last_hash: Optional[str]
+
+
+def verify_lines(
+    lines: List[str],
+    vk: VerifyKey,
+    *,
+    layout: str,
+    sig_required: bool,
+    chain: bool,
+) -> _ChunkResult:
+    """Verify already-split non-empty lines; indices in the result are 0-based within `lines`."""
+    extract_hash = _HASH_EXTRACTORS[layout]
+    verify = vk.verify
+    fromhex = bytes.fromhex
+    prev: Optional[str] = None
+    first_prev: Optional[str] = None
+    for i, line in enumerate(lines):
+        try:
+            obj = json.loads(line)
+        except Exception:
+            return _ChunkResult(len(lines), (i, _STAGE_PARSE, "BAD_JSON", ""), first_prev, prev)
+
+        if chain:
+            bad = _chain_failure(i, obj, prev)
+            if bad is not None:
+                return _ChunkResult(len(lines), bad, first_prev, prev)
+            if i == 0:
+                first_prev = obj["prev_hash"]
+
+        h = extract_hash(obj)
+        if not h:
+            return _ChunkResult(len(lines), (i, _STAGE_SIG, "BAD_HASH", ""), first_prev, prev)
+        if chain:
+            prev = h
+
+        sig_hex = extract_sig_hex(obj)
+        if not sig_hex:
+            if sig_required:
+                return _ChunkResult(len(lines), (i, _STAGE_SIG, "MISSING_SIGNATURE", ""), first_prev, prev)
+            continue
+
+        try:
+            verify(fromhex(h), fromhex(sig_hex))
+        except Exception as e:
+            return _ChunkResult(len(lines), (i, _STAGE_SIG, "SIGNATURE_VERIFY_FAIL", f"err={e}"), first_prev, prev)
+    return _ChunkResult(len(lines), None, first_prev, prev)
+
+
+def _split_lines(data: bytes) -> List[str]:
+    # same line model as read_text(encoding="utf-8").splitlines() + strip + drop empty
+    return [ln.strip() for ln in data.decode("utf-8").splitlines() if ln.strip()]
+
+
+def iter_ranges(path: Path, chunk_bytes: int) -> Iterator[Tuple[int, int]]:
+    """Byte ranges [start, end) covering the file, each ending right after a b"\\n" (or at EOF)."""
+    size = path.stat().st_size
+    with path.open("rb") as f:
+        start = 0
+        while start < size:
+            f.seek(min(size, start + chunk_bytes))
+            f.readline()
+            end = min(size, f.tell()) if start + chunk_bytes < size else size
+            yield start, end
+            start = end
+
+
+_WORKER_VK: Optional[VerifyKey] = None
+
+
+def _init_worker(pub: bytes) -> None:
+    global _WORKER_VK
+    _WORKER_VK = VerifyKey(pub)
+
+
+def _verify_range(path: str, start: int, end: int, layout: str, sig_required: bool, chain: bool) -> _ChunkResult:
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    assert _WORKER_VK is not None
+    return verify_lines(_split_lines(data), _WORKER_VK, layout=layout, sig_required=sig_required, chain=chain)
+
+
+def verify_log(
+    path: Path,
+    pub: bytes,
+    *,
+    layout: str,
+    sig_required: bool = False,
+    chain: bool = False,
+    workers: Optional[int] = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> VerifyResult:
+    if layout not in _HASH_EXTRACTORS:
+        raise ValueError(f"unknown layout: {layout}")
+    if chain and layout != LAYOUT_JUDGMENT:
+        raise ValueError("chain check is only defined for the judgment layout")
+    VerifyKey(pub)  # bad key material fails here, not inside a worker
+    path = Path(path)
+    if not path.exists():
+        return VerifyResult(False, 0, "FILE_NOT_FOUND", str(path))
+
+    n_workers = workers if workers is not None else (os.cpu_count() or 1)
+    args = (layout, sig_required, chain)
+    if n_workers <= 1:
+        _init_worker(pub)
+        results: Iterator[_ChunkResult] = (
+            _verify_range(str(path), s, e, *args) for s, e in iter_ranges(path, chunk_bytes)
+        )
+        return _merge(results, chain, path)
+
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker, initargs=(pub,)) as ex:
+        in_flight: Deque[Any] = deque()
+        ranges = iter_ranges(path, chunk_bytes)
+
+        def ordered() -> Iterator[_ChunkResult]:
+            for s, e in ranges:
+                in_flight.append(ex.submit(_verify_range, str(path), s, e, *args))
+                if len(in_flight) >= n_workers * MAX_IN_FLIGHT_PER_WORKER:
+                    yield in_flight.popleft().result()
+            while in_flight:
+                yield in_flight.popleft().result()
+
+        try:
+            return _merge(ordered(), chain, path)
+        finally:
+            for fut in in_flight:
+                fut.cancel()
+
+
+def _merge(results: Iterator[_ChunkResult], chain: bool, path: Path) -> VerifyResult:
+    offset = 0
+    prev = GENESIS_HASH
+    for r in results:
+        failure = r.failure
+        if chain and r.n_lines and r.first_prev is not None and r.first_prev != prev:
+            link = (0, _STAGE_LINK, "CHAIN_BREAK", f"expected_prev={prev} got_prev={r.first_prev}")
+            if failure is None or link[:2] < failure[:2]:
+                failure = link
+        if failure is not None:
+            idx, _, code, detail = failure
+            line = f"line={offset + idx + 1}"
+            return VerifyResult(False, offset + r.n_lines, code, f"{line} {detail}" if detail else line)
+        offset += r.n_lines
+        if r.last_hash is not None:
+            prev = r.last_hash
+    if not offset:
+        return VerifyResult(False, 0, "EMPTY_LOG", str(path))
+    return VerifyResult(True, offset)
@@ -4,53 +4,34 @@ from __future__ import annotations
 import argparse
 import json
 import os
-import re
 import sys
 from pathlib import Path
-from typing import Any, Dict, Optional
 
 try:
-    from nacl.signing import VerifyKey
+    from nacl.signing import VerifyKey  # noqa: F401
 except Exception as e:
     print(json.dumps({"error": "SIG_DEPENDENCY_MISSING", "detail": str(e)}), file=sys.stderr)
     raise SystemExit(2)
 
-RE_HASH = re.compile(r"^[0-9a-f]{64}$")
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tools.audits.bulk_verify import DEFAULT_CHUNK_BYTES, LAYOUT_JUDGMENT, verify_log  # noqa: E402
+
 
 def _fail(code: str, detail: str = "") -> None:
     print(json.dumps({"error": code, "detail": detail}, sort_keys=True), file=sys.stderr)
     raise SystemExit(2)
 
-def _load_lines(path: Path) -> list[str]:
-    if not path.exists():
-        _fail("FILE_NOT_FOUND", str(path))
-    txt = path.read_text(encoding="utf-8")
-    lines = [ln.strip() for ln in txt.splitlines() if ln.strip()]
-    if not lines:
-        _fail("EMPTY_LOG", str(path))
-    return lines
-
-def _extract_sig_hex(obj: Dict[str, Any]) -> Optional[str]:
-    """
-    Supports both:
-      - signature: "<hex>"
-      - signature: {"signature": "<hex>", ...}
-    """
-    sig = obj.get("signature")
-    if sig is None:
-        return None
-    if isinstance(sig, str) and sig.strip():
-        return sig.strip()
-    if isinstance(sig, dict):
-        s = sig.get("signature")
-        if isinstance(s, str) and s.strip():
-            return s.strip()
-    return None
 
 def main() -> int:
     ap = argparse.ArgumentParser(description="Verify ed25519 signatures for judgment_event.v1 JSONL.")
     ap.add_argument("--path", required=True)
     ap.add_argument("--pub", required=True, help="Public key path (32 bytes raw, nacl verify key)")
+    ap.add_argument("--chain", action="store_true", help="Also verify the judgment_event.v1 hash chain in the same pass")
+    ap.add_argument("--workers", type=int, default=None, help="Verifier processes (default: CPU count; 1 = in-process)")
+    ap.add_argument("--chunk-bytes", type=int, default=DEFAULT_CHUNK_BYTES)
     args = ap.parse_args()
 
     sig_required = os.getenv("SIG_REQUIRED", "0") == "1"
@@ -59,32 +40,21 @@ def main() -> int:
     if not pub_path.exists():
         _fail("PUBKEY_NOT_FOUND", str(pub_path))
 
-    vk = VerifyKey(pub_path.read_bytes())
-    lines = _load_lines(Path(args.path))
-
-    for idx, line in enumerate(lines, start=1):
-        try:
-            obj = json.loads(line)
-        except Exception:
-            _fail("BAD_JSON", f"line={idx}")
-
-        h = obj.get("hash")
-        if not isinstance(h, str) or not RE_HASH.match(h):
-            _fail("BAD_HASH", f"line={idx}")
-
-        sig_hex = _extract_sig_hex(obj)
-        if not sig_hex:
-            if sig_required:
-                _fail("MISSING_SIGNATURE", f"line={idx}")
-            continue
-
-        try:
-            vk.verify(bytes.fromhex(h), bytes.fromhex(sig_hex))
-        except Exception as e:
-            _fail("SIGNATURE_VERIFY_FAIL", f"line={idx} err={e}")
-
-    print(f"OK: signatures verified lines={len(lines)}")
+    res = verify_log(
+        Path(args.path),
+        pub_path.read_bytes(),
+        layout=LAYOUT_JUDGMENT,
+        sig_required=sig_required,
+        chain=args.chain,
+        workers=args.workers,
+        chunk_bytes=args.chunk_bytes,
+    )
+    if not res.ok:
+        _fail(res.error, res.detail)
+
+    print(f"OK: signatures verified lines={res.lines}")
     return 0
 
+
 if __name__ == "__main__":
     raise SystemExit(main())
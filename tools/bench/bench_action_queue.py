@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark: action queue claim latency / throughput (file glob vs SQLite queue)
+
+  file       consume_pending's selection step on a pending/ dir of --file-items
+             files: glob + sort by mtime + take --batch (files are not consumed)
+  enqueue    SQLiteActionQueue.enqueue_many of --items rows (one transaction)
+  claim      claim(limit=--batch) latency while the queue holds --items rows
+  drain      claim + ack of --drain items, reported as items/s
+
+  python -m tools.bench.bench_action_queue --items 1000000 --file-items 20000 --batch 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from core.C_action.queue_store import SQLiteActionQueue
+
+CHANNELS = ["fnb", "childcare", "ops"]
+
+
+def _payload(i: int) -> dict:
+    return {
+        "queue_item_type": "DELIVERY_PLAN",
+        "channel": CHANNELS[i % len(CHANNELS)],
+        "status": "PENDING",
+        "plan_id": f"dp_{i:08d}",
+        "proposal_id": f"prop_{i}",
+        "ts_iso": "2026-01-01T00:00:00Z",
+        "plan_path": f"logs/plans/dp_{i:08d}.json",
+    }
+
+
+def _rows(n: int):
+    for i in range(n):
+        p = _payload(i)
+        yield p["channel"], p["plan_id"], f"logs/queues/{p['channel']}/pending/{p['plan_id']}.json", p
+
+
+def _pct(xs, q):
+    xs = sorted(xs)
+    return xs[min(len(xs) - 1, int(q * len(xs)))]
+
+
+def bench_file(root: Path, n: int, batch: int, rounds: int) -> list:
+    pending = root / "files" / "fnb" / "pending"
+    pending.mkdir(parents=True)
+    for i in range(n):
+        (pending / f"dp_{i:08d}.json").write_text(json.dumps(_payload(i)), encoding="utf-8")
+    pattern = os.path.join(str(root / "files"), "*", "pending", "*.json")
+    lat = []
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        sorted(glob.glob(pattern), key=os.path.getmtime)[:batch]
+        lat.append(time.perf_counter() - t0)
+    return lat
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--items", type=int, default=1_000_000)
+    ap.add_argument("--file-items", type=int, default=20_000)
+    ap.add_argument("--batch", type=int, default=50)
+    ap.add_argument("--rounds", type=int, default=200)
+    ap.add_argument("--drain", type=int, default=20_000)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as td:
+        root = Path(td)
+
+        file_lat = bench_file(root, args.file_items, args.batch, max(1, args.rounds // 20))
+
+        q = SQLiteActionQueue(root / "q.db")
+        t0 = time.perf_counter()
+        q.enqueue_many(_rows(args.items))
+        t_enqueue = time.perf_counter() - t0
+
+        lat = []
+        for _ in range(args.rounds):
+            t0 = time.perf_counter()
+            leases = q.claim(limit=args.batch)
+            lat.append(time.perf_counter() - t0)
+            for lease in leases:
+                q.nack(lease, "bench", delay_s=3600.0)
+
+        done = 0
+        t0 = time.perf_counter()
+        while done < args.drain:
+            leases = q.claim(limit=args.batch)
+            if not leases:
+                break
+            for lease in leases:
+                q.ack(lease, f"logs/queues/{lease.channel}/processed/{lease.plan_id}.json", lease.payload)
+            done += len(leases)
+        t_drain = time.perf_counter() - t0
+        q.close()
+
+    print(f"items={args.items} file_items={args.file_items} batch={args.batch}")
+    print(
+        f"file      claim p50 {statistics.median(file_lat) * 1e3:9.2f} ms  p99 {_pct(file_lat, 0.99) * 1e3:9.2f} ms"
+        f"  ({args.file_items} files)"
+    )
+    print(f"enqueue   {args.items / t_enqueue:12.0f} items/s  ({t_enqueue:.1f}s)")
+    print(f"sqlite    claim p50 {statistics.median(lat) * 1e3:9.2f} ms  p99 {_pct(lat, 0.99) * 1e3:9.2f} ms  ({args.items} rows)")
+    print(f"drain     {done / t_drain:12.0f} items/s  (claim+ack, {done} items, per-item ack transaction)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
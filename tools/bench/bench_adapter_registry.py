@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark: adapter resolution (per-call construction vs pooled registry)
+
+  legacy       the previous path: new MockAdapter per resolve + linear capability scan
+  registry     AdapterRegistry.resolve (singleton) + capability() (indexed)
+  load         --threads callers through a pooled SimulatedAdapter (--latency-ms each),
+               resolve + call + record_success per request
+
+  python -m tools.bench.bench_adapter_registry --n 1000000 --threads 16 --requests 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from core.adapters.capabilities import load_adapter_capabilities_v1
+from core.adapters.mock_adapter import MockAdapter
+from core.adapters.registry import AdapterRegistry, AdapterRegistryError
+from core.adapters.simulated_adapter import SimulatedAdapter
+
+
+def legacy_resolve(adapter_name: str):
+    if not adapter_name:
+        raise AdapterRegistryError("adapter_name is required (fail-closed)")
+    if str(adapter_name).strip().lower() in {"mock", "mock_adapter"}:
+        adapter = MockAdapter()
+    else:
+        raise AdapterRegistryError(f"unknown adapter: {adapter_name}")
+    for row in load_adapter_capabilities_v1().get("adapters", []):
+        if isinstance(row, dict) and row.get("adapter_name") == adapter.name:
+            return adapter, row
+    return adapter, None
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=1_000_000)
+    ap.add_argument("--threads", type=int, default=16)
+    ap.add_argument("--pool-size", type=int, default=4)
+    ap.add_argument("--requests", type=int, default=2000)
+    ap.add_argument("--latency-ms", type=float, default=5.0)
+    args = ap.parse_args()
+
+    reg = AdapterRegistry()
+
+    def registry_resolve(adapter_name: str):
+        return reg.resolve(adapter_name), reg.capability(adapter_name)
+
+    assert legacy_resolve("mock")[1] == registry_resolve("mock")[1]
+    for label, fn in (("legacy", legacy_resolve), ("registry", registry_resolve)):
+        gc.collect()
+        t0 = time.perf_counter()
+        for _ in range(args.n):
+            fn("mock")
+        dt = time.perf_counter() - t0
+        print(f"{label:<10} {dt:8.2f}s  {args.n / dt:12.0f} resolves/s")
+
+    reg.register("simulated", lambda: SimulatedAdapter(latency_ms=args.latency_ms), scope="pool", pool_size=args.pool_size)
+
+    def one(i: int) -> bool:
+        adapter = reg.resolve("simulated")
+        out = adapter.call({"i": i})
+        reg.record_success("simulated")
+        return out["ok"]
+
+    gc.collect()
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as ex:
+        ok = sum(ex.map(one, range(args.requests)))
+    dt = time.perf_counter() - t0
+    print(
+        f"{'load':<10} {dt:8.2f}s  {args.requests / dt:12.0f} req/s  "
+        f"(threads={args.threads} pool={args.pool_size} latency={args.latency_ms}ms ok={ok})"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
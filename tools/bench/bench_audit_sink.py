@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark: API request latency with a slow audit consumer
+
+A FastAPI endpoint emits --events-per-request audit events per request; the
+audit stream sleeps --write-delay-ms on every write+flush (a stalled stdout pipe).
+
+  sync        emit_audit_event writes + flushes inline (default behaviour)
+  background  BackgroundAuditSink (block policy, queue --queue-max), batched
+              writer thread; drain time after the last request is reported
+  drop        same, overflow=drop (reports how many events were dropped)
+
+  python -m tools.bench.bench_audit_sink --requests 300 --write-delay-ms 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import statistics
+import time
+import warnings
+
+from fastapi import FastAPI
+
+from infra.api import audit_sink
+from infra.api.audit_sink import BackgroundAuditSink, configure_audit_sink, emit_audit_event
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore")
+    from fastapi.testclient import TestClient
+
+
+class SlowStream(io.StringIO):
+    def __init__(self, delay_s: float) -> None:
+        super().__init__()
+        self.delay_s = delay_s
+
+    def flush(self) -> None:
+        time.sleep(self.delay_s)
+
+
+def _app(events_per_request: int) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/act")
+    def act() -> dict:
+        for i in range(events_per_request):
+            emit_audit_event({"event": "bench", "action": "act", "outcome": "allow", "n": i})
+        return {"ok": True}
+
+    return app
+
+
+def _pct(xs, q):
+    xs = sorted(xs)
+    return xs[min(len(xs) - 1, int(q * len(xs)))]
+
+
+def run(mode: str, args) -> None:
+    stream = SlowStream(args.write_delay_ms / 1000.0)
+    real_stdout = audit_sink.sys.stdout
+    sink = None
+    if mode == "sync":
+        audit_sink.sys.stdout = stream
+    else:
+        overflow = "drop" if mode == "drop" else "block"
+        sink = configure_audit_sink(BackgroundAuditSink(stream, maxsize=args.queue_max, overflow=overflow))
+    try:
+        client = TestClient(_app(args.events_per_request))
+        lat = []
+        for _ in range(args.requests):
+            t0 = time.perf_counter()
+            client.post("/act")
+            lat.append(time.perf_counter() - t0)
+        t0 = time.perf_counter()
+        if sink is not None:
+            sink.flush()
+        drain = time.perf_counter() - t0
+    finally:
+        audit_sink.sys.stdout = real_stdout
+        configure_audit_sink(None)
+
+    extra = f"  drain {drain * 1e3:8.1f} ms" if sink is not None else ""
+    if mode == "drop":
+        extra += f"  dropped {sink.dropped}"
+    print(
+        f"{mode:<10} p50 {statistics.median(lat) * 1e3:8.2f} ms  p99 {_pct(lat, 0.99) * 1e3:8.2f} ms"
+        f"  lines {len(stream.getvalue().splitlines())}{extra}"
+    )
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--requests", type=int, default=300)
+    ap.add_argument("--events-per-request", type=int, default=3)
+    ap.add_argument("--write-delay-ms", type=float, default=5.0)
+    ap.add_argument("--queue-max", type=int, default=10_000)
+    args = ap.parse_args()
+
+    print(f"requests={args.requests} events/request={args.events_per_request} write_delay={args.write_delay_ms}ms")
+    for mode in ("sync", "background", "drop"):
+        run(mode, args)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark: execution precondition checks over many (request, approval) pairs
+
+--pairs requests spread over --approvals distinct approvals (dict and
+attribute-style, some expired / missing the capability / without evidence):
+
+  single   validate_execution_preconditions per pair
+  batch    validate_execution_preconditions_batch (approval records normalized
+           once, set lookup for capabilities, aggregate counts by reason)
+
+  python -m tools.bench.bench_execution_preconditions --pairs 1000000 --approvals 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from core.execution_adapter.contract import ExecutionAllowed
+from core.execution_adapter.validator import validate_execution_preconditions, validate_execution_preconditions_batch
+
+NOW = datetime(2026, 1, 22, tzinfo=timezone.utc)
+CAP = "PLACE_ORDER"
+
+
+def build(n_pairs: int, n_approvals: int, seed: int = 49):
+    rng = random.Random(seed)
+    approvals = []
+    for i in range(n_approvals):
+        expires = NOW + timedelta(days=1) if rng.random() < 0.9 else NOW - timedelta(days=1)
+        caps = ["CANCEL_ORDER", "AMEND_ORDER", CAP] if rng.random() < 0.9 else ["CANCEL_ORDER"]
+        fields = {"expires_at": expires, "capabilities": caps}
+        approvals.append(fields if i % 2 else SimpleNamespace(**fields))
+    pairs = []
+    for _ in range(n_pairs):
+        request = {"evidence": ["e1"] if rng.random() < 0.95 else []}
+        pairs.append((request, rng.choice(approvals)))
+    return pairs
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pairs", type=int, default=1_000_000)
+    ap.add_argument("--approvals", type=int, default=1000)
+    args = ap.parse_args()
+
+    pairs = build(args.pairs, args.approvals)
+
+    gc.collect()
+    t0 = time.perf_counter()
+    single = [
+        validate_execution_preconditions(execution_request=r, approval=a, now_utc=NOW, required_capability=CAP)
+        for r, a in pairs
+    ]
+    t_single = time.perf_counter() - t0
+
+    gc.collect()
+    t0 = time.perf_counter()
+    batch = validate_execution_preconditions_batch(pairs, now_utc=NOW, required_capability=CAP)
+    t_batch = time.perf_counter() - t0
+
+    def key(d):
+        return ("ALLOW",) if isinstance(d, ExecutionAllowed) else (d.reason_code, d.reason_detail)
+
+    assert [key(d) for d in single] == [key(d) for d in batch.decisions], "decisions differ"
+    n = args.pairs
+    print(f"pairs={n} approvals={args.approvals} allowed={batch.allowed} blocked={batch.blocked_by_reason}")
+    print(f"single  {t_single:7.2f}s  {n / t_single:12.0f} pairs/s")
+    print(f"batch   {t_batch:7.2f}s  {n / t_batch:12.0f} pairs/s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark: idempotent execution run creation under a storm of duplicate requests
+
+--requests calls spread over --keys idempotency keys, --concurrency at a time,
+each call on its own session against a local SQLite file (schema + unique index
+as alembic run_0001). Two scenarios per mode:
+
+  retry   every key already exists with status RUN (client retries)
+  fresh   no key exists yet (concurrent first creates race on the unique index)
+
+  legacy  the previous path: INSERT, IntegrityError → ROLLBACK, SELECT, REFRESH
+  upsert  create_execution_run: INSERT … ON CONFLICT … RETURNING
+
+  python -m tools.bench.bench_execution_run_create --requests 2000 --keys 20 --concurrency 32
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import event, select, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from infra.api.endpoints.models.base import Base
+from infra.api.endpoints.models.execution_run import ExecutionRun
+from infra.api.services.execution_service import ExecutionBlocked, create_execution_run
+
+
+async def legacy_create(session, *, project_id, decision_card_id, execution_scope, idempotency_key):
+    er = ExecutionRun(
+        project_id=project_id,
+        decision_card_id=decision_card_id,
+        execution_scope=execution_scope,
+        idempotency_key=idempotency_key,
+    )
+    session.add(er)
+    try:
+        await session.commit()
+    except IntegrityError:
+        await session.rollback()
+        row = await session.execute(select(ExecutionRun).where(ExecutionRun.idempotency_key == idempotency_key))
+        er = row.scalar_one()
+    await session.refresh(er)
+    if er.status != "RUN":
+        raise ExecutionBlocked(er.blocked_reason or "unknown")
+    return er
+
+
+async def run(mode: str, scenario: str, args, db: Path) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db}", connect_args={"timeout": 60})
+    statements = [0]
+    event.listen(engine.sync_engine, "before_cursor_execute", lambda *a: statements.__setitem__(0, statements[0] + 1))
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda c: Base.metadata.create_all(c, tables=[ExecutionRun.__table__]))
+        await conn.execute(
+            text("CREATE UNIQUE INDEX ux_execution_runs_project_id_idempotency_key ON execution_runs (project_id, idempotency_key)")
+        )
+        if scenario == "retry":
+            for k in range(args.keys):
+                await conn.execute(
+                    text("INSERT INTO execution_runs (id, project_id, idempotency_key, status) VALUES (:i, 'p1', :k, 'RUN')"),
+                    {"i": f"seed-{k}", "k": f"key-{k}"},
+                )
+    maker = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    create = legacy_create if mode == "legacy" else create_execution_run
+    sem = asyncio.Semaphore(args.concurrency)
+    lat = []
+    outcomes = {"ok": 0, "blocked": 0, "error": 0}
+
+    async def one(i: int) -> None:
+        async with sem:
+            t0 = time.perf_counter()
+            try:
+                async with maker() as s:
+                    await create(s, project_id="p1", decision_card_id=None, execution_scope="automation", idempotency_key=f"key-{i % args.keys}")
+                outcomes["ok"] += 1
+            except ExecutionBlocked:
+                outcomes["blocked"] += 1
+            except Exception:
+                outcomes["error"] += 1
+            lat.append(time.perf_counter() - t0)
+
+    statements[0] = 0
+    gc.collect()
+    t0 = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(args.requests)))
+    dt = time.perf_counter() - t0
+    await engine.dispose()
+    lat.sort()
+    print(
+        f"{scenario:<6} {mode:<7} {args.requests / dt:8.0f} req/s  p50 {statistics.median(lat) * 1e3:7.2f} ms"
+        f"  p99 {lat[int(0.99 * (len(lat) - 1))] * 1e3:7.2f} ms  stmts/req {statements[0] / args.requests:4.1f}"
+        f"  {outcomes}"
+    )
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--requests", type=int, default=2000)
+    ap.add_argument("--keys", type=int, default=20)
+    ap.add_argument("--concurrency", type=int, default=32)
+    args = ap.parse_args()
+
+    print(f"requests={args.requests} keys={args.keys} concurrency={args.concurrency}")
+    with tempfile.TemporaryDirectory() as td:
+        for scenario in ("retry", "fresh"):
+            for mode in ("legacy", "upsert"):
+                asyncio.run(run(mode, scenario, args, Path(td) / f"{scenario}-{mode}.db"))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
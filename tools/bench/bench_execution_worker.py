@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark: execution worker throughput on a local SQLite file
+
+Seeds --jobs RUN executions, then drains them:
+
+  legacy      execute_job per execution (session.get + commit per job), one loop
+  batched xN  N concurrent worker_loop()s: claim --batch-size with one
+              UPDATE … RETURNING, run with --concurrency handlers, bulk finish
+
+--job-ms adds an async sleep per job (an I/O-bound adapter call).
+
+  python -m tools.bench.bench_execution_worker --jobs 5000 --job-ms 0
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from infra.api.endpoints.models.base import Base
+from infra.api.endpoints.models.execution_run import ExecutionRun
+from infra.api.workers.executor import execute_job, worker_loop
+
+
+async def _setup(db: Path, jobs: int):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db}", connect_args={"timeout": 60})
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda c: Base.metadata.create_all(c, tables=[ExecutionRun.__table__]))
+        await conn.execute(
+            text("INSERT INTO execution_runs (id, project_id, idempotency_key, status) VALUES (:i, 'p1', :i, 'RUN')"),
+            [{"i": f"run-{i:08d}"} for i in range(jobs)],
+        )
+    return engine, sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+
+async def _check(maker, jobs: int) -> None:
+    async with maker() as s:
+        n = (await s.execute(text("select count(*) from execution_runs where status='HALTED'"))).scalar_one()
+    assert n == jobs, (n, jobs)
+
+
+async def run(label: str, workers: int, args, db: Path) -> None:
+    engine, maker = await _setup(db, args.jobs)
+    delay = args.job_ms / 1000.0
+
+    async def handler(run) -> None:
+        if delay:
+            await asyncio.sleep(delay)
+
+    gc.collect()
+    t0 = time.perf_counter()
+    if workers == 0:
+        ids = [f"run-{i:08d}" for i in range(args.jobs)]
+        async with maker() as s:
+            for execution_id in ids:
+                if delay:
+                    await asyncio.sleep(delay)
+                await execute_job(execution_id, s)
+    else:
+        await asyncio.gather(
+            *(
+                worker_loop(
+                    maker,
+                    handler=handler,
+                    batch_size=args.batch_size,
+                    concurrency=args.concurrency,
+                    exit_when_idle=True,
+                )
+                for _ in range(workers)
+            )
+        )
+    dt = time.perf_counter() - t0
+    await _check(maker, args.jobs)
+    await engine.dispose()
+    print(f"{label:<12} {dt:8.2f}s  {args.jobs / dt:10.0f} jobs/s")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--jobs", type=int, default=5000)
+    ap.add_argument("--batch-size", type=int, default=64)
+    ap.add_argument("--concurrency", type=int, default=8)
+    ap.add_argument("--job-ms", type=float, default=0.0)
+    args = ap.parse_args()
+
+    print(f"jobs={args.jobs} batch={args.batch_size} concurrency={args.concurrency} job_ms={args.job_ms}")
+    with tempfile.TemporaryDirectory() as td:
+        for label, workers in (("legacy", 0), ("batched x1", 1), ("batched x4", 4), ("batched x16", 16)):
+            asyncio.run(run(label, workers, args, Path(td) / f"{workers}.db"))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
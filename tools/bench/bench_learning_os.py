@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark: learning_os window / stability / rate limit per observation
+
+  streaming  ObservationWindow(+StreamingStability) push + result() for every
+             one of --observations observations (ring buffer, O(1) per step)
+  batch      select_window + check_stability_v1 recomputed per observation on
+             --batch-observations only (O(window) per step), scaled up for the
+             per-observation comparison
+  limiter    RateLimiter.allow (sliding log) vs TokenBucketRateLimiter.allow
+             over --observations calls
+
+  python -m tools.bench.bench_learning_os --observations 10000000 --window 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import time
+
+from core.learning_os.observation_store import Observation
+from core.learning_os.rate_limiter import RateLimiter, TokenBucketRateLimiter
+from core.learning_os.stability import StreamingStability, check_stability_v1
+from core.learning_os.windowing import ObservationWindow, select_window
+
+DIRECTIONS = ["up", "up", "up", "down", "neutral", ""]
+
+
+def _observations(n: int, seed: int = 7):
+    rng = random.Random(seed)
+    dirs = [rng.choice(DIRECTIONS) for _ in range(4096)]
+    for i in range(n):
+        yield Observation(ts=float(i), direction=dirs[i & 4095])
+
+
+def bench_streaming(n: int, window: int, mode: str) -> float:
+    st = StreamingStability(k_confirmations=3, epsilon_max=0.4)
+    if mode == "events":
+        win = ObservationWindow(mode="events", n_events=window, trackers=[st])
+    else:
+        win = ObservationWindow(mode="time", t_window=window, trackers=[st])
+    push, result = win.push, st.result
+    gc.collect()
+    t0 = time.perf_counter()
+    for obs in _observations(n):
+        push(obs)
+        result()
+    return time.perf_counter() - t0
+
+
+def bench_batch(n: int, window: int) -> float:
+    seen = []
+    gc.collect()
+    t0 = time.perf_counter()
+    for obs in _observations(n):
+        seen.append(obs)
+        w = select_window(seen, mode="events", n_events=window)
+        check_stability_v1(w, k_confirmations=3, epsilon_max=0.4)
+    return time.perf_counter() - t0
+
+
+def bench_limiter(limiter, n: int) -> float:
+    allow = limiter.allow
+    keys = [f"k{i}" for i in range(64)]
+    gc.collect()
+    t0 = time.perf_counter()
+    for i in range(n):
+        allow(keys[i & 63], i * 0.01)
+    return time.perf_counter() - t0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--observations", type=int, default=10_000_000)
+    ap.add_argument("--batch-observations", type=int, default=20_000)
+    ap.add_argument("--window", type=int, default=500)
+    args = ap.parse_args()
+    n, w = args.observations, args.window
+
+    print(f"observations={n} window={w}")
+    t = bench_streaming(n, w, "events")
+    print(f"streaming events  {n / t:12.0f} obs/s  ({t:.1f}s, {t / n * 1e6:.2f} us/obs)")
+    t = bench_streaming(n, w, "time")
+    print(f"streaming time    {n / t:12.0f} obs/s  ({t:.1f}s, {t / n * 1e6:.2f} us/obs)")
+    nb = args.batch_observations
+    t = bench_batch(nb, w)
+    print(f"batch recompute   {nb / t:12.0f} obs/s  ({t / nb * 1e6:.2f} us/obs, {nb} obs)")
+    t = bench_limiter(RateLimiter(period_seconds=60, limit_x=10), n)
+    print(f"sliding log       {n / t:12.0f} allow/s")
+    t = bench_limiter(TokenBucketRateLimiter(period_seconds=60, limit_x=10), n)
+    print(f"token bucket      {n / t:12.0f} allow/s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
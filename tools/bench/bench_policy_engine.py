@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark: policy gate evaluation (linear evaluate vs CompiledPolicy.evaluate_many)
+
+Builds a synthetic ruleset (default 10k rules: risk_level / confidence_lt /
+generic exact-match mixes, like policies/sentinel/gate_v1.yaml) and 100k inputs,
+then times:
+  linear     core.policy_engine.evaluate per input, on --linear-sample inputs
+             (extrapolated: the full run is rules x inputs predicate calls)
+  compile    compile_rules over the ruleset
+  compiled   evaluate_many over all inputs
+Decisions are checked equal on the linear sample.
+
+  python -m tools.bench.bench_policy_engine --rules 10000 --inputs 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Any, Dict, List
+
+from core.policy_engine import compile_rules, evaluate
+
+VENUES = [f"venue_{i}" for i in range(50)]
+SYMBOLS = [f"SYM{i}" for i in range(500)]
+
+
+def build_ruleset(n: int, seed: int = 7) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    rules = []
+    for i in range(n):
+        r = rng.random()
+        if r < 0.05:
+            cond: Dict[str, Any] = {"risk_level": rng.choice(["HIGH", "EXTREME"])}
+        elif r < 0.10:
+            cond = {"confidence_lt": round(rng.uniform(0.05, 0.5), 3)}
+        else:
+            cond = {"symbol": rng.choice(SYMBOLS), "venue": rng.choice(VENUES)}
+            if rng.random() < 0.3:
+                cond["side"] = rng.choice(["long", "short"])
+        rules.append({
+            "id": f"RULE_{i:05d}",
+            "condition": cond,
+            "action": {"decision": rng.choice(["REJECT", "HOLD"]), "reason_code": f"R{i}"},
+        })
+    return {"version": "1.0", "rules": rules, "defaults": {"decision": "APPROVE", "override_required": False}}
+
+
+def build_inputs(n: int, seed: int = 11) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    return [
+        {
+            "symbol": rng.choice(SYMBOLS),
+            "venue": rng.choice(VENUES),
+            "side": rng.choice(["long", "short"]),
+            "risk_level": rng.choice(["LOW", "MEDIUM", "MEDIUM", "HIGH"]) if rng.random() < 0.5 else "LOW",
+            "confidence": round(rng.uniform(0.0, 1.0), 3),
+        }
+        for _ in range(n)
+    ]
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rules", type=int, default=10_000)
+    ap.add_argument("--inputs", type=int, default=100_000)
+    ap.add_argument("--linear-sample", type=int, default=1_000)
+    args = ap.parse_args()
+
+    ruleset = build_ruleset(args.rules)
+    inputs = build_inputs(args.inputs)
+    sample = inputs[: args.linear_sample]
+
+    t0 = time.perf_counter()
+    expected = [evaluate(d, ruleset) for d in sample]
+    linear = time.perf_counter() - t0
+    per_input = linear / max(1, len(sample))
+
+    t0 = time.perf_counter()
+    compiled = compile_rules(ruleset)
+    compile_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    got = compiled.evaluate_many(inputs)
+    many = time.perf_counter() - t0
+
+    if got[: len(sample)] != expected:
+        raise SystemExit("FAIL: compiled decisions differ from linear evaluate")
+
+    print(f"rules={args.rules} inputs={args.inputs}")
+    print(f"linear    {per_input * 1e6:10.1f} us/input  (~{per_input * args.inputs:.1f}s for all inputs, from {len(sample)} sampled)")
+    print(f"compile   {compile_s:10.3f} s")
+    print(f"compiled  {many / args.inputs * 1e6:10.1f} us/input  ({many:.2f}s for all inputs)")
+    print(f"speedup   {per_input * args.inputs / (many + compile_s):10.1f}x (incl. compile)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark: multi-reality mesh + equilibrium at 10 / 100 / 1,000 actors
+
+  mesh legacy     nested per-pair, per-pressure dict loop (pre-matrix engine)
+  mesh globals    build_reality_mesh (dense matrix, sorted column sums; links untouched)
+  mesh +links     build_reality_mesh and materialize every RealityLink
+  eq legacy       per-step persona attribute walk (pre-column engine, all MAX_STEPS)
+  eq              compute_equilibrium (rates high enough that it never settles early)
+
+  python -m tools.bench.bench_reality_mesh --actors 10,100,1000 --pressures 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from datetime import datetime
+from math import fabs
+from types import SimpleNamespace
+
+from core.multi_reality_os.core.engine_equilibrium import MAX_STEPS, compute_equilibrium
+from core.multi_reality_os.core.engine_mesh import build_reality_mesh
+from core.multi_reality_os.models.equilibrium_state import AgentState
+from core.multi_reality_os.models.perspective_layer import PerspectiveLayer
+from core.multi_reality_os.models.reality_link import RealityLink
+from core.multi_reality_os.models.scene_base import SceneBase
+
+
+def legacy_mesh_globals(scene, pls):
+    # the pre-matrix engine: eager RealityLink per pair, globals averaged over links
+    links = []
+    actors = list(pls.keys())
+    for i in range(len(actors)):
+        for j in range(i + 1, len(actors)):
+            pl_a, pl_b = pls[actors[i]], pls[actors[j]]
+            conflict = 0
+            align = 0
+            for k in scene.structural_pressures.keys():
+                diff = fabs(pl_a.perceived_pressures.get(k, 0) - pl_b.perceived_pressures.get(k, 0))
+                conflict += diff
+                align += 1 - diff
+            conflict /= max(len(scene.structural_pressures), 1)
+            align /= max(len(scene.structural_pressures), 1)
+            links.append(RealityLink(pl_a.pl_id, pl_b.pl_id, conflict, align))
+    avg_conflict = sum(l.conflict_level for l in links) / max(len(links), 1)
+    avg_align = sum(l.benefit_alignment for l in links) / max(len(links), 1)
+    return avg_conflict, avg_align
+
+
+def legacy_equilibrium_steps(scene, actors):
+    # step loop of the pre-column engine (no stability early-exit: full MAX_STEPS)
+    for t in range(MAX_STEPS):
+        agents_state = {}
+        for aid, persona in actors.items():
+            base_pressure = scene.structural_pressure
+            anxiety = (
+                base_pressure
+                * (1 + persona.emotional_reactivity.anxiety_sensitivity)
+                * (1 + persona.biases.catastrophizing)
+                * (persona.stress_profile.baseline_stress + t * persona.stress_profile.stress_accumulation_rate)
+            )
+            alignment = max(0.0, min(1.0, persona.social_traits.cooperation - persona.social_traits.conflict_avoidance * anxiety * 0.1))
+            if anxiety > persona.emotional_reactivity.overwhelm_threshold:
+                decision = "avoid"
+            elif alignment > 0.5:
+                decision = "consider"
+            else:
+                decision = "neutral"
+            agents_state[aid] = AgentState(anxiety=float(anxiety), decision=decision, alignment=float(alignment))
+        sum([s.anxiety for s in agents_state.values()]) / len(agents_state)
+        sum([s.alignment for s in agents_state.values()]) / len(agents_state)
+
+
+def _persona(rng):
+    p = SimpleNamespace(
+        emotional_reactivity=SimpleNamespace(anxiety_sensitivity=rng.random(), overwhelm_threshold=rng.uniform(0.5, 2.0)),
+        biases=SimpleNamespace(catastrophizing=rng.random()),
+        stress_profile=SimpleNamespace(baseline_stress=rng.random(), stress_accumulation_rate=rng.uniform(0, 0.2)),
+        social_traits=SimpleNamespace(cooperation=rng.random(), conflict_avoidance=rng.random()),
+    )
+    p.copy = lambda: p
+    return p
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return time.perf_counter() - t0, out
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--actors", default="10,100,1000")
+    ap.add_argument("--pressures", type=int, default=16)
+    args = ap.parse_args()
+
+    rng = random.Random(7)
+    keys = [f"p{k}" for k in range(args.pressures)]
+    scene = SceneBase("bench", "bench", "bench", datetime(2026, 1, 1), structural_pressures={k: rng.random() for k in keys})
+    eq_scene = SimpleNamespace(structural_pressure=0.6)
+
+    print(f"{'actors':>7} {'mesh legacy':>12} {'mesh globals':>13} {'mesh +links':>12} {'eq legacy':>10} {'eq':>10}   max|d global|")
+    for n in [int(x) for x in args.actors.split(",") if x.strip()]:
+        pls = {
+            f"a{i}": PerspectiveLayer(f"bench:a{i}", f"a{i}", perceived_pressures={k: rng.random() for k in keys})
+            for i in range(n)
+        }
+        t_legacy, (c_ref, a_ref) = _timed(lambda: legacy_mesh_globals(scene, pls))
+        t_mesh, mesh = _timed(lambda: build_reality_mesh(scene, pls))
+        t_links, _ = _timed(lambda: len(list(build_reality_mesh(scene, pls).links)))
+        dev = max(abs(mesh.global_conflict - c_ref), abs(mesh.global_alignment - a_ref))
+
+        personas = {f"a{i}": _persona(rng) for i in range(n)}
+        t_eq_legacy, _ = _timed(lambda: legacy_equilibrium_steps(eq_scene, personas))
+        t_eq, _ = _timed(lambda: compute_equilibrium(eq_scene, personas))
+        print(
+            f"{n:>7} {t_legacy * 1000:>10.1f}ms {t_mesh * 1000:>11.1f}ms {t_links * 1000:>10.1f}ms"
+            f" {t_eq_legacy * 1000:>8.1f}ms {t_eq * 1000:>8.1f}ms   {dev:.1e}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
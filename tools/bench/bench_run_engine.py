@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-item overhead of run_engine vs run_engine_batch
+
+  sig inspect   inspect.signature + kwarg filter on every policy call (the old _call_policy)
+  sig cached    the cached call adapter (_policy_caller), resolved once
+  single        run_engine per item, fresh InMemoryPolicyMemory
+  batch         run_engine_batch over all items, fresh InMemoryPolicyMemory
+Outputs of single and batch are checked equal item by item.
+
+  python -m tools.bench.bench_run_engine --items 20000 --sites 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import inspect
+import time
+from types import SimpleNamespace
+from typing import Any, List
+
+from core.engine.run_engine import _policy_caller, run_engine, run_engine_batch
+from core.policy.memory.in_memory import InMemoryPolicyMemory
+from core.policy.policy_v0_3 import compute_policy_v0_3
+
+CHANNELS = ["childcare", "fnb", "trading"]
+
+
+def build_preludes(n: int, sites: int) -> List[Any]:
+    out = []
+    for i in range(n):
+        channel = CHANNELS[i % len(CHANNELS)]
+        minute = i // sites
+        end = f"2025-12-15T{10 + minute // 60 % 12:02d}:{minute % 60:02d}:00Z"
+        meta = {
+            "org_id": "org-bench",
+            "site_id": f"site-{i % sites}",
+            "source": "meta-prelude",
+            "ts_start_iso": "2025-12-15T10:00:00Z",
+            "ts_end_iso": end,
+            "scene_id": None,
+            "channel": channel,
+        }
+        out.append(
+            SimpleNamespace(
+                meta=meta,
+                ts_start_iso=meta["ts_start_iso"],
+                ts_end_iso=end,
+                channel=channel,
+                decision={"mode": "observe_more", "severity": "medium", "rationale": ["bench"]},
+                quality={"quality_score": 0.95, "missing_ratio": 0.02, "window_sec": 300},
+                uncertainty={"uncertainty_score": 0.1, "confidence_score": 0.9},
+                features={
+                    "valence": -0.8 if i % 4 else 0.2,
+                    "arousal": 0.7,
+                    "dominant_emotion": "distress",
+                    "child_negative_emotion_score": 0.92 if i % 5 else 0.1,
+                },
+            )
+        )
+    return out
+
+
+def legacy_call_policy(fn, **candidates):
+    params = inspect.signature(fn).parameters
+    kwargs = {k: v for k, v in candidates.items() if k in params}
+    return fn(**kwargs)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--items", type=int, default=20_000)
+    ap.add_argument("--sites", type=int, default=50)
+    args = ap.parse_args()
+
+    preludes = build_preludes(args.items, args.sites)
+    n = len(preludes)
+
+    kwargs = dict(
+        channel="fnb",
+        current_decision=run_engine(preludes[0], memory=InMemoryPolicyMemory()).decision,
+        signals=[],
+        prev_scene_state=None,
+        now_ts_iso="2025-12-15T10:05:00Z",
+    )
+    t0 = time.perf_counter()
+    for _ in range(n):
+        legacy_call_policy(compute_policy_v0_3, **kwargs)
+    t_inspect = time.perf_counter() - t0
+    caller = _policy_caller(compute_policy_v0_3)
+    t0 = time.perf_counter()
+    for _ in range(n):
+        caller(**kwargs)
+    t_cached = time.perf_counter() - t0
+
+    gc.collect()
+    t0 = time.perf_counter()
+    mem = InMemoryPolicyMemory()
+    single = [run_engine(p, memory=mem) for p in preludes]
+    t_single = time.perf_counter() - t0
+
+    gc.collect()
+    t0 = time.perf_counter()
+    batch = run_engine_batch(preludes, memory=InMemoryPolicyMemory())
+    t_batch = time.perf_counter() - t0
+
+    if batch != single:
+        raise SystemExit("FAIL: run_engine_batch output differs from run_engine")
+
+    print(f"items={n} sites={args.sites}")
+    print(f"sig inspect {t_inspect / n * 1e6:8.1f} us/call")
+    print(f"sig cached  {t_cached / n * 1e6:8.1f} us/call  (policy body included in both)")
+    print(f"single      {t_single / n * 1e6:8.1f} us/item")
+    print(f"batch       {t_batch / n * 1e6:8.1f} us/item")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
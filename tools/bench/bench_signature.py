@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark: ed25519 audit signing throughput
+
+  per-call   the previous sign_hash_hex path: read + parse the key file, then sign
+  single     sign_hash_hex with the cached signer (stat per call, key parsed once)
+  batch      sign_many over --batch hashes per call
+
+  python -m tools.bench.bench_signature --n 20000 --batch 256
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import hashlib
+import os
+import tempfile
+import time
+
+from auralis_v1.core.signature import SignatureConfig, _load_signing_key, _signed_at, sign_hash_hex, sign_many
+
+
+def _per_call(cfg: SignatureConfig, hash_hex: str) -> dict:
+    key = _load_signing_key(cfg.priv_path)
+    return {
+        "signature": key.sign(bytes.fromhex(hash_hex)).signature.hex(),
+        "algorithm": "ed25519",
+        "key_id": cfg.key_id,
+        "signed_at": _signed_at(),
+        "signed_digest": "hash",
+    }
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=20_000)
+    ap.add_argument("--batch", type=int, default=256)
+    args = ap.parse_args()
+
+    hashes = [hashlib.sha256(str(i).encode()).hexdigest() for i in range(args.n)]
+    with tempfile.TemporaryDirectory() as td:
+        priv = os.path.join(td, "signing.key")
+        with open(priv, "wb") as f:
+            f.write(os.urandom(32))
+        old = time.time() - 3600
+        os.utime(priv, (old, old))
+        cfg = SignatureConfig(enabled=True, priv_path=priv, key_id="bench")
+
+        gc.collect()
+        t0 = time.perf_counter()
+        ref = [_per_call(cfg, h)["signature"] for h in hashes]
+        t_per_call = time.perf_counter() - t0
+
+        gc.collect()
+        t0 = time.perf_counter()
+        single = [sign_hash_hex(h, cfg)["signature"] for h in hashes]
+        t_single = time.perf_counter() - t0
+
+        gc.collect()
+        t0 = time.perf_counter()
+        batch = []
+        for i in range(0, len(hashes), args.batch):
+            batch.extend(s["signature"] for s in sign_many(cfg, hashes[i : i + args.batch]))
+        t_batch = time.perf_counter() - t0
+
+    assert ref == single == batch, "signatures differ"
+    n = args.n
+    print(f"n={n} batch={args.batch} (signatures identical across modes)")
+    print(f"per-call  {n / t_per_call:10.0f} sig/s")
+    print(f"single    {n / t_single:10.0f} sig/s")
+    print(f"batch     {n / t_batch:10.0f} sig/s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
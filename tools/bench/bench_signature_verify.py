@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark: judgment log signature verification (single-pass tool vs bulk verifier)
+
+Writes a synthetic signed judgment_event.v1 chain of --lines lines, then times:
+
+  legacy       the previous tool loop: read_text().splitlines() + one verify per line
+  bulk w=1     verify_log in-process, streamed in --chunk-bytes ranges
+  bulk w=N     verify_log over a process pool of --workers (default: CPU count)
+  bulk+chain   same, hash chain checked in the same pass
+
+  python -m tools.bench.bench_signature_verify --lines 10000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from nacl.signing import SigningKey, VerifyKey
+
+from tools.audits.bulk_verify import DEFAULT_CHUNK_BYTES, GENESIS_HASH, RE_HASH, extract_sig_hex, verify_log
+
+
+def write_log(path: Path, sk: SigningKey, n: int) -> None:
+    sign = sk.sign
+    prev = GENESIS_HASH
+    with path.open("w", encoding="utf-8") as f:
+        for i in range(n):
+            core = {"schema": "judgment_event.v1", "prev_hash": prev, "event_id": f"j{i}", "outcome": "allow"}
+            h = hashlib.sha256(json.dumps(core, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+            core["hash"] = h
+            core["signature"] = {"signature": sign(bytes.fromhex(h)).signature.hex(), "algorithm": "ed25519"}
+            f.write(json.dumps(core, separators=(",", ":")) + "\n")
+            prev = h
+
+
+def legacy(path: Path, pub: bytes) -> int:
+    vk = VerifyKey(pub)
+    lines = [ln.strip() for ln in path.read_text(encoding="utf-8").splitlines() if ln.strip()]
+    for line in lines:
+        obj = json.loads(line)
+        h = obj.get("hash")
+        if not isinstance(h, str) or not RE_HASH.match(h):
+            raise SystemExit("BAD_HASH")
+        sig_hex = extract_sig_hex(obj)
+        if sig_hex:
+            vk.verify(bytes.fromhex(h), bytes.fromhex(sig_hex))
+    return len(lines)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--lines", type=int, default=10_000_000)
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--chunk-bytes", type=int, default=DEFAULT_CHUNK_BYTES)
+    ap.add_argument("--skip-legacy", action="store_true", help="legacy holds the whole log in memory")
+    args = ap.parse_args()
+
+    sk = SigningKey(b"\x11" * 32)
+    pub = bytes(sk.verify_key)
+    with tempfile.TemporaryDirectory() as td:
+        path = Path(td) / "judgment_events_chain.jsonl"
+        t0 = time.perf_counter()
+        write_log(path, sk, args.lines)
+        print(f"lines={args.lines} size={path.stat().st_size / 1e6:.0f}MB written in {time.perf_counter() - t0:.1f}s")
+
+        def report(label: str, fn) -> None:
+            t0 = time.perf_counter()
+            n = fn()
+            dt = time.perf_counter() - t0
+            print(f"{label:<12} {dt:8.2f}s  {n / dt:10.0f} lines/s")
+
+        if not args.skip_legacy:
+            report("legacy", lambda: legacy(path, pub))
+        for label, w, chain in (("bulk w=1", 1, False), (f"bulk w={args.workers}", args.workers, False), ("bulk+chain", args.workers, True)):
+            def run(w=w, chain=chain) -> int:
+                res = verify_log(path, pub, layout="judgment", chain=chain, workers=w, chunk_bytes=args.chunk_bytes)
+                assert res.ok, (res.error, res.detail)
+                return res.lines
+
+            report(label, run)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
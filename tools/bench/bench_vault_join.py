@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Benchmark: vault report join (legacy serial loop vs RunIndex + VaultJoinEngine)
+
+Builds a synthetic vault (default 100k runs over 365 days) in a temp dir and times:
+  legacy        per-run safe_read_json(exec/outcome) + exceptions glob (pre-index CLIs)
+  cold          RunIndex.iter_records with a thread-pool engine, no summaries yet
+  warm          same range again (per-day summaries valid -> stat calls only)
+  disk_cache    summaries dropped, parsed artifacts served from the SQLite cache
+
+  python -m tools.bench.bench_vault_join --runs 100000 --days 365 --workers 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from vault.join_engine import ArtifactCache, VaultJoinEngine
+from vault.run_index import RunIndex
+
+_AGED_NS = time.time_ns() - 86_400 * 1_000_000_000
+
+def _age(p: Path) -> None:
+    # artifacts of a real vault are older than the cache's 2s racy window
+    os.utime(p, ns=(_AGED_NS, _AGED_NS))
+
+
+def build_vault(root: Path, runs: int, days: int, seed: int = 7) -> date:
+    rng = random.Random(seed)
+    d0 = date(2025, 1, 1)
+    idx = root / "manifests" / "runs_index.jsonl"
+    idx.parent.mkdir(parents=True, exist_ok=True)
+    with idx.open("w", encoding="utf-8") as f:
+        for i in range(runs):
+            dp = (d0 + timedelta(days=i * days // runs)).strftime("%Y/%m/%d")
+            rid = f"RUN{i:08d}"
+            ep = root / "executions" / dp / f"exec_{rid}.json"
+            op = root / "outcomes" / dp / f"outcome_{rid}.json"
+            ep.parent.mkdir(parents=True, exist_ok=True)
+            op.parent.mkdir(parents=True, exist_ok=True)
+            ep.write_text(json.dumps({"run": {"strategy_card_id": f"S{i % 7}", "judgment_card_id": f"J{i % 5}"}}))
+            op.write_text(json.dumps({
+                "labels": {"result": rng.choice(["WIN", "LOSS", "OPEN"]), "reason": rng.choice(["", "r1", "r2"])},
+                "pnl": {"realized": rng.uniform(-5, 5), "ccy": "USDT"},
+                "excursions": {"mae": rng.uniform(0, 3), "mfe": rng.uniform(0, 3)},
+            }))
+            _age(ep)
+            _age(op)
+            if rng.random() < 0.05:
+                ex = root / "exceptions" / dp / f"exception_{rid}__CODE.json"
+                ex.parent.mkdir(parents=True, exist_ok=True)
+                ex.write_text(json.dumps({"severity": "HARD_FAIL", "code": "CODE"}))
+                _age(ex)
+            for st in ("PENDING", "COMPLETE"):
+                f.write(json.dumps({"run_id": rid, "status": st, "exec_path": str(ep), "outcome_path": str(op)}) + "\n")
+    return d0
+
+
+def _safe_read_json(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return None
+
+
+def legacy_join(root: Path) -> int:
+    rows: Dict[str, Dict[str, Any]] = {}
+    with (root / "manifests" / "runs_index.jsonl").open("r", encoding="utf-8") as f:
+        for line in f:
+            r = json.loads(line)
+            rows[r["run_id"]] = r
+    n = 0
+    for r in rows.values():
+        _safe_read_json(Path(r["exec_path"]))
+        _safe_read_json(Path(r["outcome_path"]))
+        dp = r["exec_path"].split("/executions/", 1)[1].rsplit("/", 1)[0]
+        ex_dir = root / "exceptions" / dp
+        if ex_dir.exists():
+            for p in sorted(ex_dir.glob(f"exception_{r['run_id']}__*.json")):
+                if _safe_read_json(p):
+                    break
+        n += 1
+    return n
+
+
+def index_join(root: Path, d_from: date, d_to: date, engine: VaultJoinEngine) -> int:
+    index = RunIndex(root, joiner=engine)
+    index.sync()
+    last: Dict[str, Dict[str, Any]] = {}
+    for r in index.rows(d_from, d_to):
+        last[r["run_id"]] = r
+    return sum(1 for _ in index.iter_records(list(last.values())))
+
+
+def _timed(fn) -> Dict[str, Any]:
+    t0 = time.perf_counter()
+    n = fn()
+    dt = time.perf_counter() - t0
+    return {"runs": n, "sec": round(dt, 3), "runs_per_sec": round(n / dt, 1) if dt else None}
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Benchmark vault report join")
+    ap.add_argument("--runs", type=int, default=100_000)
+    ap.add_argument("--days", type=int, default=365)
+    ap.add_argument("--workers", type=int, default=16)
+    ap.add_argument("--keep", action="store_true", help="keep the synthetic vault")
+    args = ap.parse_args()
+
+    tmp = Path(tempfile.mkdtemp(prefix="bench_vault_"))
+    root = tmp / "vault"
+    try:
+        t0 = time.perf_counter()
+        d0 = build_vault(root, args.runs, args.days)
+        d1 = d0 + timedelta(days=args.days)
+        out: Dict[str, Any] = {"runs": args.runs, "days": args.days, "workers": args.workers,
+                               "build_sec": round(time.perf_counter() - t0, 1)}
+
+        out["legacy"] = _timed(lambda: legacy_join(root))
+
+        disk = root / "manifests" / "runs" / "_artifact_cache.sqlite"
+        with VaultJoinEngine(args.workers, ArtifactCache(disk_path=disk)) as eng:
+            out["cold"] = _timed(lambda: index_join(root, d0, d1, eng))
+        with VaultJoinEngine(args.workers, ArtifactCache(disk_path=disk)) as eng:
+            out["warm"] = _timed(lambda: index_join(root, d0, d1, eng))
+            out["warm"]["cache"] = eng.cache.stats()
+
+        for p in (root / "manifests" / "runs").rglob("summary.json"):
+            p.unlink()
+        with VaultJoinEngine(args.workers, ArtifactCache(disk_path=disk)) as eng:
+            out["disk_cache"] = _timed(lambda: index_join(root, d0, d1, eng))
+            out["disk_cache"]["cache"] = eng.cache.stats()
+
+        print(json.dumps(out, indent=2))
+    finally:
+        if not args.keep:
+            shutil.rmtree(tmp, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,11 +2,18 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, List, Optional, Tuple
 import re
 import argparse
 import os
 import json
 import subprocess
+import sys
+
+if __package__ is None or __package__ == "":
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from tools.gates.scan_engine import FileEntry, ScanEngine, default_cache_path, rule_version
 
 
 @dataclass(frozen=True)
@@ -146,44 +153,172 @@ def iter_scan_targets(root: Path) -> list[Path]:
     return targets
 
 
+def _match_start(pattern: str) -> Optional[Tuple[set, bool]]:
+    """
+    (characters a match of `pattern` can start with, whether every match starts
+    at a \\b), or None if that cannot be bounded — then no prefilter is used, so
+    a new pattern is never silently missed.
+    """
+    try:
+        from re import _parser as sre_parse  # type: ignore[attr-defined]  # 3.11+
+    except ImportError:  # pragma: no cover
+        import sre_parse  # type: ignore[no-redef]
+
+    def first(items: Any, boundary: bool) -> Optional[Tuple[set, bool]]:
+        for op, av in items:
+            if op is sre_parse.AT:
+                boundary = boundary or av is sre_parse.AT_BOUNDARY
+                continue  # zero-width (\b, ^, $)
+            if op is sre_parse.LITERAL:
+                return {chr(av)}, boundary
+            if op is sre_parse.SUBPATTERN:
+                return first(av[-1], boundary)
+            if op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and av[0] >= 1:
+                return first(av[2], boundary)
+            if op is sre_parse.BRANCH:
+                chars: set = set()
+                all_boundary = True
+                for branch in av[1]:
+                    r = first(branch, boundary)
+                    if r is None:
+                        return None
+                    chars |= r[0]
+                    all_boundary = all_boundary and r[1]
+                return chars, all_boundary
+            if op is sre_parse.IN and all(o is sre_parse.LITERAL for o, _ in av):
+                return {chr(v) for _, v in av}, boundary
+            return None
+        return None
+
+    try:
+        parsed = sre_parse.parse(pattern)
+    except Exception:  # pragma: no cover
+        return None
+    if parsed.state.flags & re.IGNORECASE:
+        return None
+    return first(parsed, False)
+
+
+def _combined_pattern() -> str:
+    # 모든 DENY_PATTERNS를 하나의 alternation으로 (named group → rule_id)
+    alternation = "|".join(f"(?P<{rule_id}>{rx.pattern})" for rule_id, rx in DENY_PATTERNS)
+    starts = [_match_start(rx.pattern) for _, rx in DENY_PATTERNS]
+    if not starts or any(st is None for st in starts):
+        return alternation
+    chars = sorted(set().union(*(st[0] for st in starts)))  # type: ignore[index]
+    boundary = "\\b" if all(st[1] for st in starts) else ""  # type: ignore[index]
+    # prefilter: positions that cannot start any rule are rejected before the
+    # alternation is tried (same matches, several times faster)
+    return "(?=[" + "".join(re.escape(ch) for ch in chars) + "])" + boundary + "(?:" + alternation + ")"
+
+
+# MULTILINE: 버퍼 전체 스캔에서도 ^/$가 줄 단위로 동작
+_COMBINED = re.compile(_combined_pattern(), re.MULTILINE)
+
+# str.splitlines() 줄 경계 중 "\n" 이외의 것 (→ "\n"으로 정규화)
+_LINE_BREAK_CHARS = "\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+_LINE_BREAKS = re.compile("\r\n|[" + _LINE_BREAK_CHARS + "]")
+
+
+def _scan_text(text: str) -> list[list[Any]]:
+    """
+    Deny hits for a whole file buffer (allow markers applied; path hints are applied by the caller).
+
+    Same findings as running every DENY_PATTERNS regex over each line of
+    text.splitlines(): the combined regex only locates candidate lines (a line
+    with any per-line match always yields a combined match starting in it),
+    then each candidate line is checked per rule, so overlapping rules and
+    matches that would span lines in the buffer are reported exactly as before.
+    """
+    if any(ch in text for ch in _LINE_BREAK_CHARS):
+        text = _LINE_BREAKS.sub("\n", text)
+    hits: list[list[Any]] = []
+    search = _COMBINED.search
+    pos = 0
+    lineno = 1
+    while True:
+        m = search(text, pos)
+        if m is None:
+            return hits
+        start = text.rfind("\n", 0, m.start()) + 1
+        end = text.find("\n", m.start())
+        if end < 0:
+            end = len(text)
+        lineno += text.count("\n", pos, start)
+        line = text[start:end]
+        # explicit allow marker on the same line → suppress EXEC_* findings
+        if not any(mk in line for mk in ALLOW_MARKERS):
+            # the matched group's rule is known to hit unless the match ran past this line
+            known = m.lastgroup if m.end() <= end else None
+            for rule_id, rx in DENY_PATTERNS:
+                if rule_id == known or rx.search(line):
+                    hits.append([rule_id, lineno, rx.pattern, line.strip()[:200]])
+        pos = end + 1
+        lineno += 1
+
+
+def _path_allowed(path: str) -> bool:
+    path_l = path.lower()
+    return any(h in path_l for h in ALLOW_PATH_HINTS)
+
+
 def scan_targets(paths: list[Path]) -> list[Finding]:
     findings: list[Finding] = []
     for p in paths:
-        path_l = str(p).lower()
-        allow = any(h in path_l for h in ALLOW_PATH_HINTS)
+        allow = _path_allowed(str(p))
 
-        txt = p.read_text(encoding="utf-8", errors="ignore").splitlines()
-        for i, line in enumerate(txt, start=1):
-            # explicit allow marker on the same line → suppress EXEC_* findings
-            if any(m in line for m in ALLOW_MARKERS):
-                continue
+        txt = p.read_text(encoding="utf-8", errors="ignore")
+        if allow:
+            continue
+        for rule_id, i, pattern, snippet in _scan_text(txt):
+            findings.append(Finding(rule_id, str(p), i, pattern, snippet))
+    return findings
 
-            for rule_id, rx in DENY_PATTERNS:
-                if rx.search(line):
-                    if allow:
-                        continue
-                    findings.append(Finding(rule_id, str(p), i, rx.pattern, line.strip()[:200]))
+
+class Lock2Rule:
+    """
+    scan_engine rule. apply_ignore_prefixes=True selects what iter_scan_targets
+    walks locally; False is the scan_tree (test) selection. Both share cache entries.
+    """
+
+    name = "lock2"
+    version = rule_version(__file__, [[r, rx.pattern] for r, rx in DENY_PATTERNS], ALLOW_MARKERS)
+
+    def __init__(self, apply_ignore_prefixes: bool = True) -> None:
+        self.apply_ignore_prefixes = apply_ignore_prefixes
+
+    def select(self, entry: FileEntry) -> bool:
+        if not entry.rel.endswith(".py") or _excluded(Path(entry.path)):
+            return False
+        return not (self.apply_ignore_prefixes and _ignored_relpath(entry.rel))
+
+    def scan(self, entry: FileEntry, data: bytes) -> list[list[Any]]:
+        return _scan_text(data.decode("utf-8", errors="ignore"))
+
+
+LOCK2_RULE = Lock2Rule()
+
+
+def findings_from_results(results: List[Tuple[FileEntry, Any]]) -> list[Finding]:
+    findings: list[Finding] = []
+    for entry, hits in results:
+        if _path_allowed(entry.path):
+            continue
+        for rule_id, i, pattern, snippet in hits:
+            findings.append(Finding(rule_id, entry.path, i, pattern, snippet))
     return findings
 
 
-def main() -> int:
-    ap = argparse.ArgumentParser()
-    ap.add_argument("--root", default=".", help="root directory to scan")
-    args = ap.parse_args()
-    root = Path(args.root)
+def _ci_changed_only() -> bool:
+    return os.getenv("GITHUB_ACTIONS") == "true" and os.getenv("GITHUB_EVENT_NAME") in {"pull_request", "push"}
 
-    try:
-        targets = iter_scan_targets(root)
-    except RuntimeError as e:
-        print(str(e))
-        return 1
 
+def report(findings: list[Finding], *, scanned: bool = True) -> int:
     # PR에서 스캔 대상이 없으면 OK
-    if not targets:
+    if not scanned:
         print("OK: LOCK-2 gate clean (no changed .py files to scan)")
         return 0
 
-    findings = scan_targets(targets)
     if findings:
         print("FAIL-CLOSED: LOCK-2 gate findings detected")
         for f in findings[:200]:
@@ -196,10 +331,33 @@ def main() -> int:
     return 0
 
 
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--root", default=".", help="root directory to scan")
+    ap.add_argument("--workers", type=int, default=None, help="scan processes for cache misses (default: CPU count)")
+    ap.add_argument("--no-cache", action="store_true", help="do not read/write the scan cache")
+    args = ap.parse_args()
+    root = Path(args.root)
+
+    if not _ci_changed_only():
+        # push/local: 전체 스캔 (단, ignore prefixes는 동일 적용) — shared engine + content cache
+        engine = ScanEngine(root, cache_path=None if args.no_cache else default_cache_path(root), workers=args.workers)
+        results = engine.run([LOCK2_RULE])[LOCK2_RULE.name]
+        return report(findings_from_results(results), scanned=bool(results))
+
+    try:
+        targets = iter_scan_targets(root)
+    except RuntimeError as e:
+        print(str(e))
+        return 1
+
+    return report(scan_targets(targets) if targets else [], scanned=bool(targets))
+
+
 # -------------------------------------------------------------------
 # Back-compat export for unit tests
 # -------------------------------------------------------------------
-def scan_tree(root: Path) -> list[Finding]:
+def scan_tree(root: Path, *, cache_path: Optional[Path] = None, workers: Optional[int] = None) -> list[Finding]:
     """
     Backward-compatible API for unit tests.
 
@@ -208,12 +366,9 @@ def scan_tree(root: Path) -> list[Finding]:
     - It intentionally does NOT apply IGNORE_PREFIXES, because tests commonly
       build a temporary directory tree and expect it to be fully scanned.
     """
-    targets: list[Path] = []
-    for p in root.rglob("*.py"):
-        if _excluded(p):
-            continue
-        targets.append(p)
-    return scan_targets(targets)
+    rule = Lock2Rule(apply_ignore_prefixes=False)
+    engine = ScanEngine(root, cache_path=cache_path, workers=workers)
+    return findings_from_results(engine.run([rule])[rule.name])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Shared scan engine for the static gates (static_scan, lock2_gate, zone_static_gate)
+
+- one os.walk of the tree (pre-order, directory-listing order — the order the
+  gates' own rglob/os.walk produced), pruning .git/.venv/venv/__pycache__,
+  which every gate excludes anyway
+- each gate plugs in a rule: select(entry) picks the files it scans today,
+  scan(entry, data) returns a JSON-able per-file result that depends only on
+  the file content (path-dependent policy stays in the gate)
+- results are cached per (rule name, rule version, content sha256); rule_version()
+  hashes the rule module's own source, so any change to the scan logic (not only
+  to its patterns) invalidates the cached results. A file whose
+  (size, mtime_ns) still matches the cache is not even read, so a warm run on an
+  unchanged tree is a walk + stat per file. Files modified within the last 2s are
+  re-hashed on the next run (same racy guard as the policy store cache)
+- cache misses are scanned on a process pool (in-process below MIN_POOL_FILES
+  or with workers<=1)
+- cache file: <root>/__pycache__/gate_scan_cache.json by default (never scanned,
+  git-ignored); META_GATE_SCAN_CACHE=<path> overrides, =off disables
+
+  python -m tools.gates.scan_engine --root .     (all three gates, one walk)
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Protocol, Sequence, Tuple
+
+CACHE_FORMAT = 1
+PRUNE_DIRS = frozenset({".git", ".venv", "venv", "__pycache__"})
+MIN_POOL_FILES = 64
+_RACY_NS = 2_000_000_000
+
+
+@dataclass(frozen=True)
+class FileEntry:
+    rel: str  # posix path relative to root
+    path: str  # str(Path(root) / rel), root as given by the caller
+    abspath: str
+    size: int  # -1 if stat failed
+    mtime_ns: int
+
+
+class ScanRule(Protocol):
+    name: str
+    version: str
+
+    def select(self, entry: FileEntry) -> bool: ...
+
+    def scan(self, entry: FileEntry, data: bytes) -> Any: ...
+
+
+def rule_version(module_file: str, *data: Any) -> str:
+    """Rule cache version: sha256 of the rule module's source plus its JSON-able pattern data."""
+    h = hashlib.sha256(Path(module_file).read_bytes())
+    h.update(json.dumps(data).encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+def default_cache_path(root: Path) -> Optional[Path]:
+    env = os.getenv("META_GATE_SCAN_CACHE", "").strip()
+    if env.lower() in {"0", "off", "none"}:
+        return None
+    if env:
+        return Path(env)
+    return Path(root) / "__pycache__" / "gate_scan_cache.json"
+
+
+def walk(root: Path) -> List[FileEntry]:
+    root = Path(root)
+    root_abs = os.path.abspath(str(root))
+    out: List[FileEntry] = []
+    for dirpath, dirnames, filenames in os.walk(root_abs):
+        dirnames[:] = [d for d in dirnames if d not in PRUNE_DIRS]
+        rel_dir = os.path.relpath(dirpath, root_abs)
+        for fn in filenames:
+            abspath = os.path.join(dirpath, fn)
+            try:
+                st = os.stat(abspath)
+                size, mtime_ns = st.st_size, st.st_mtime_ns
+            except OSError:
+                size = mtime_ns = -1  # e.g. dangling symlink: listed, but not a readable file
+            rel = fn if rel_dir == "." else f"{rel_dir}/{fn}".replace(os.sep, "/")
+            out.append(FileEntry(rel, str(root / rel), abspath, size, mtime_ns))
+    return out
+
+
+def _rule_key(rule: ScanRule, sha: str) -> str:
+    return f"{rule.name}@{rule.version}:{sha}"
+
+
+def _scan_file(entry: FileEntry, rules: Sequence[ScanRule]) -> Tuple[str, List[Any]]:
+    """(sha256 of the bytes actually scanned, one result per rule); "" if unreadable."""
+    try:
+        with open(entry.abspath, "rb") as f:
+            data = f.read()
+    except OSError as e:
+        # rules with read_error() report it (zone gate: ZONE_PARSE_FAIL); others fail like a direct read
+        return "", [getattr(rule, "read_error")(entry, e) if hasattr(rule, "read_error") else _raise(e) for rule in rules]
+    return hashlib.sha256(data).hexdigest(), [rule.scan(entry, data) for rule in rules]
+
+
+def _raise(e: BaseException) -> Any:
+    raise e
+
+
+def _scan_batch(batch: List[Tuple[FileEntry, Sequence[ScanRule]]]) -> List[Tuple[str, List[Any]]]:
+    return [_scan_file(e, rules) for e, rules in batch]
+
+
+class ScanCache:
+    def __init__(self, path: Optional[Path]) -> None:
+        self.path = Path(path) if path else None
+        self.files: Dict[str, List[Any]] = {}  # abspath -> [size, mtime_ns, sha]
+        self.results: Dict[str, Any] = {}
+        self._used: set = set()
+        self.dirty = False
+        if self.path is not None:
+            try:
+                obj = json.loads(self.path.read_text(encoding="utf-8"))
+                if obj.get("format") == CACHE_FORMAT:
+                    self.files = obj.get("files") or {}
+                    self.results = obj.get("results") or {}
+            except Exception:
+                pass  # missing / corrupt cache: cold run
+
+    def sha_from_stat(self, e: FileEntry) -> Optional[str]:
+        if e.size < 0:
+            return None
+        rec = self.files.get(e.abspath)
+        if rec and rec[0] == e.size and rec[1] == e.mtime_ns:
+            return rec[2]
+        return None
+
+    def record_file(self, e: FileEntry, sha: str) -> None:
+        if time.time_ns() - e.mtime_ns > _RACY_NS:
+            if self.files.get(e.abspath) != [e.size, e.mtime_ns, sha]:
+                self.files[e.abspath] = [e.size, e.mtime_ns, sha]
+                self.dirty = True
+        elif self.files.pop(e.abspath, None) is not None:
+            self.dirty = True
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        if key in self.results:
+            self._used.add(key)
+            return True, self.results[key]
+        return False, None
+
+    def put(self, key: str, value: Any) -> None:
+        self.results[key] = value
+        self._used.add(key)
+        self.dirty = True
+
+    def save(self, seen: Iterable[str], rule_names: Iterable[str]) -> None:
+        """Drop files no longer in the tree and unused results of the rules that ran."""
+        if self.path is None:
+            return
+        seen = set(seen)
+        prefixes = tuple(f"{n}@" for n in rule_names)
+        stale_files = [k for k in self.files if k not in seen]
+        stale_results = [k for k in self.results if k.startswith(prefixes) and k not in self._used]
+        if not (self.dirty or stale_files or stale_results):
+            return
+        for k in stale_files:
+            del self.files[k]
+        for k in stale_results:
+            del self.results[k]
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=str(self.path.parent), prefix=".gate_scan_", suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"format": CACHE_FORMAT, "files": self.files, "results": self.results}, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass  # cache is an optimisation only
+
+
+class ScanEngine:
+    def __init__(
+        self,
+        root: Path,
+        *,
+        cache_path: Optional[Path] = None,
+        workers: Optional[int] = None,
+    ) -> None:
+        self.root = Path(root)
+        self.cache = ScanCache(cache_path)
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.stats = {"files": 0, "stat_hits": 0, "hashed": 0, "scanned": 0}
+
+    def run(
+        self, rules: Sequence[ScanRule], entries: Optional[List[FileEntry]] = None
+    ) -> Dict[str, List[Tuple[FileEntry, Any]]]:
+        """Per rule: [(entry, result)] for the files it selects, in walk order."""
+        if entries is None:
+            entries = walk(self.root)
+        cache = self.cache
+        if cache.path is not None:
+            own = os.path.abspath(str(cache.path))
+            entries = [e for e in entries if e.abspath != own]  # never scan the cache itself
+        selected: List[Tuple[FileEntry, List[ScanRule]]] = []
+        for e in entries:
+            rs = [r for r in rules if r.select(e)]
+            if rs:
+                selected.append((e, rs))
+        self.stats["files"] = len(selected)
+
+        found: Dict[Tuple[str, str], Any] = {}  # (abspath, rule name) -> result
+        misses: List[Tuple[FileEntry, List[ScanRule]]] = []
+        for e, rs in selected:
+            sha = cache.sha_from_stat(e)
+            if sha is None:
+                try:
+                    with open(e.abspath, "rb") as f:
+                        sha = hashlib.sha256(f.read()).hexdigest()
+                except OSError:
+                    sha = ""  # let the rule scan raise / report as it does today
+                self.stats["hashed"] += 1
+            else:
+                self.stats["stat_hits"] += 1
+            missing = []
+            for r in rs:
+                hit, value = cache.get(_rule_key(r, sha)) if sha else (False, None)  # type: ignore[misc]
+                if hit:
+                    found[(e.abspath, r.name)] = value
+                else:
+                    missing.append(r)
+            if missing:
+                misses.append((e, missing))
+            elif sha:
+                cache.record_file(e, sha)
+
+        self.stats["scanned"] = len(misses)
+        for (e, rs), (sha, values) in zip(misses, self._scan_misses(misses)):
+            for r, v in zip(rs, values):
+                found[(e.abspath, r.name)] = v
+                if sha:
+                    cache.put(_rule_key(r, sha), v)
+            if sha:
+                cache.record_file(e, sha)
+
+        cache.save((e.abspath for e in entries), [r.name for r in rules])
+        out: Dict[str, List[Tuple[FileEntry, Any]]] = {r.name: [] for r in rules}
+        for e, rs in selected:
+            for r in rs:
+                out[r.name].append((e, found[(e.abspath, r.name)]))
+        return out
+
+    def _scan_misses(self, batch: List[Tuple[FileEntry, List[ScanRule]]]) -> List[Tuple[str, List[Any]]]:
+        if self.workers <= 1 or len(batch) < MIN_POOL_FILES:
+            return _scan_batch(batch)
+        size = max(16, len(batch) // (self.workers * 4))
+        chunks = [batch[i : i + size] for i in range(0, len(batch), size)]
+        with ProcessPoolExecutor(max_workers=self.workers) as ex:
+            return [vals for part in ex.map(_scan_batch, chunks) for vals in part]
+
+
+def main() -> int:
+    from tools.gates import lock2_gate, static_scan, zone_static_gate
+
+    ap = argparse.ArgumentParser(description="Run static_scan, LOCK-2 and zone gates over one tree walk")
+    ap.add_argument("--root", default=".")
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--no-cache", action="store_true")
+    args = ap.parse_args()
+
+    root = Path(args.root)
+    engine = ScanEngine(root, cache_path=None if args.no_cache else default_cache_path(root), workers=args.workers)
+    t0 = time.perf_counter()
+    results = engine.run([static_scan.STATIC_SCAN_RULE, lock2_gate.LOCK2_RULE, zone_static_gate.ZONE_RULE])
+    dt = time.perf_counter() - t0
+
+    rc = 0
+    print("== static_scan")
+    rc |= static_scan.report(static_scan.findings_from_results(results[static_scan.STATIC_SCAN_RULE.name]))
+    print("== lock2_gate")
+    rc |= lock2_gate.report(lock2_gate.findings_from_results(results[lock2_gate.LOCK2_RULE.name]))
+    print("== zone_static_gate")
+    rc |= zone_static_gate.report_root(root, results[zone_static_gate.ZONE_RULE.name])
+    s = engine.stats
+    print(
+        f"scan_engine: files={s['files']} stat_hits={s['stat_hits']} hashed={s['hashed']} "
+        f"scanned={s['scanned']} in {dt:.2f}s",
+        file=sys.stderr,
+    )
+    return rc
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, List, Optional, Tuple
 import os
 import json
 import subprocess
 import re
 
+from tools.gates.scan_engine import FileEntry, ScanEngine, rule_version
+
 
 @dataclass(frozen=True)
 class Finding:
@@ -67,23 +70,28 @@ def _git_changed_files_from_pr_event() -> list[str]:
 
 
 
+WALK_EXCLUDE_DIRS = {
+    ".git",
+    ".venv",
+    "venv",
+    "__pycache__",
+    ".pytest_cache",
+    ".mypy_cache",
+    ".ruff_cache",
+    "node_modules",
+    "dist",
+    "build",
+}
+
+SCAN_SUFFIXES = {".py", ".yml", ".yaml", ".json", ".md", ".txt"}
+
+
 def _walk_tree_targets(root: Path) -> list[Path]:
     """
     Full-tree scan target iterator (used for non-PR contexts and for tests tmp_path).
     Must exclude virtualenv/vendor/cache dirs to avoid false positives + noise.
     """
-    exclude_dirs = {
-        ".git",
-        ".venv",
-        "venv",
-        "__pycache__",
-        ".pytest_cache",
-        ".mypy_cache",
-        ".ruff_cache",
-        "node_modules",
-        "dist",
-        "build",
-    }
+    exclude_dirs = WALK_EXCLUDE_DIRS
 
     targets: list[Path] = []
     for p in root.rglob("*"):
@@ -97,13 +105,13 @@ def _walk_tree_targets(root: Path) -> list[Path]:
         if parts & exclude_dirs:
             continue
         # only scan text-ish files we care about
-        if p.suffix.lower() in {".py", ".yml", ".yaml", ".json", ".md", ".txt"}:
+        if p.suffix.lower() in SCAN_SUFFIXES:
             targets.append(p)
 
     # deterministic order
     return sorted(targets)
 
-def _iter_targets(root: Path) -> list[Path]:
+def _pr_scan_mode(root: Path) -> bool:
     workspace = os.getenv("GITHUB_WORKSPACE")
     is_actions_workspace = False
 
@@ -114,7 +122,11 @@ def _iter_targets(root: Path) -> list[Path]:
             is_actions_workspace = False
 
     # PR 최적화는 실제 GitHub Actions 워크스페이스에서만 허용
-    if os.getenv("GITHUB_EVENT_NAME") == "pull_request" and is_actions_workspace:
+    return os.getenv("GITHUB_EVENT_NAME") == "pull_request" and is_actions_workspace
+
+
+def _iter_targets(root: Path) -> list[Path]:
+    if _pr_scan_mode(root):
         changed = _git_changed_files_from_pr_event()
         if not changed:
             # FAIL-CLOSED 유지
@@ -126,7 +138,52 @@ def _iter_targets(root: Path) -> list[Path]:
     # 그 외(테스트 tmp_path 포함): 전체 트리 스캔
     return _walk_tree_targets(root)
 
-def scan_tree(root: Path) -> list[Finding]:
+def _scan_lines(lines: list[str]) -> list[list[Any]]:
+    hits: list[list[Any]] = []
+    for i, line in enumerate(lines, start=1):
+        # explicit allow marker on the same line → suppress findings
+        if any(m in line for m in ALLOW_MARKERS):
+            continue
+
+        for rule_id, rx in DENY_PATTERNS:
+            if rx.search(line):
+                hits.append([rule_id, i, rx.pattern, line.strip()[:200]])
+    return hits
+
+
+class StaticScanRule:
+    """scan_engine rule: same targets as _walk_tree_targets, per-file hits cached by content."""
+
+    name = "static_scan"
+    version = rule_version(__file__, [[r, rx.pattern] for r, rx in DENY_PATTERNS], ALLOW_MARKERS)
+
+    def select(self, entry: FileEntry) -> bool:
+        if entry.size < 0 or _ignored_relpath(entry.rel):
+            return False
+        p = Path(entry.path)
+        return not (set(p.parts) & WALK_EXCLUDE_DIRS) and p.suffix.lower() in SCAN_SUFFIXES
+
+    def scan(self, entry: FileEntry, data: bytes) -> list[list[Any]]:
+        return _scan_lines(data.decode("utf-8", errors="ignore").splitlines())
+
+
+STATIC_SCAN_RULE = StaticScanRule()
+
+
+def findings_from_results(results: List[Tuple[FileEntry, Any]]) -> list[Finding]:
+    findings: list[Finding] = []
+    # deterministic order (sorted targets, as the per-file walk did)
+    for entry, hits in sorted(results, key=lambda r: Path(r[0].path)):
+        for rule_id, i, pattern, snippet in hits:
+            findings.append(Finding(rule_id, entry.path, i, pattern, snippet))
+    return findings
+
+
+def scan_tree(root: Path, *, cache_path: Optional[Path] = None, workers: Optional[int] = None) -> list[Finding]:
+    if not _pr_scan_mode(root):
+        engine = ScanEngine(root, cache_path=cache_path, workers=workers)
+        return findings_from_results(engine.run([STATIC_SCAN_RULE])[STATIC_SCAN_RULE.name])
+
     targets = _iter_targets(root)
 
     # PR에서 스캔 대상 없으면 OK (파이썬 코드 변경 없음)
@@ -138,12 +195,17 @@ def scan_tree(root: Path) -> list[Finding]:
         if not p.is_file():
             continue
         txt = p.read_text(encoding="utf-8", errors="ignore").splitlines()
-        for i, line in enumerate(txt, start=1):
-            # explicit allow marker on the same line → suppress findings
-            if any(m in line for m in ALLOW_MARKERS):
-                continue
-
-            for rule_id, rx in DENY_PATTERNS:
-                if rx.search(line):
-                    findings.append(Finding(rule_id, str(p), i, rx.pattern, line.strip()[:200]))
+        for rule_id, i, pattern, snippet in _scan_lines(txt):
+            findings.append(Finding(rule_id, str(p), i, pattern, snippet))
     return findings
+
+
+def report(findings: list[Finding]) -> int:
+    if findings:
+        print("FAIL-CLOSED: static scan findings detected")
+        for f in findings:
+            print(f"- {f.rule_id} | {f.file}:{f.line} | {f.snippet}")
+        return 1
+
+    print("OK: static scan clean")
+    return 0
@@ -1,22 +1,19 @@
 from __future__ import annotations
 import argparse
 from pathlib import Path
-from tools.gates.static_scan import scan_tree
+from tools.gates.scan_engine import default_cache_path
+from tools.gates.static_scan import report, scan_tree
 
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--root", default=".", help="root directory to scan")
+    ap.add_argument("--workers", type=int, default=None, help="scan processes for cache misses (default: CPU count)")
+    ap.add_argument("--no-cache", action="store_true", help="do not read/write the scan cache")
     args = ap.parse_args()
 
-    findings = scan_tree(Path(args.root))
-    if findings:
-        print("FAIL-CLOSED: static scan findings detected")
-        for f in findings:
-            print(f"- {f.rule_id} | {f.file}:{f.line} | {f.snippet}")
-        return 1
-
-    print("OK: static scan clean")
-    return 0
+    root = Path(args.root)
+    findings = scan_tree(root, cache_path=None if args.no_cache else default_cache_path(root), workers=args.workers)
+    return report(findings)
 
 if __name__ == "__main__":
     raise SystemExit(main())
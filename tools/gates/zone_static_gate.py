@@ -3,10 +3,17 @@ from __future__ import annotations
 
 import argparse
 import ast
+import json
 import os
 import sys
 from dataclasses import dataclass
-from typing import Iterable, List, Set, Tuple
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+if __package__ is None or __package__ == "":
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from tools.gates.scan_engine import FileEntry, ScanEngine, default_cache_path, rule_version
 
 # Fail-closed: only INTERNAL cross-zone imports are enforced.
 # Stdlib / third-party imports are ignored.
@@ -25,39 +32,32 @@ def _norm(p: str) -> str:
     return p.replace("\\", "/")
 
 
-def _walk_py_files(root: str) -> Iterable[str]:
-    for dirpath, dirnames, filenames in os.walk(root):
-        dn = _norm(dirpath)
-        if any(x in f"/{dn}/" for x in ("/.git/", "/.venv/", "/venv/", "/__pycache__/")):
-            continue
-        for fn in filenames:
-            if fn.endswith(".py"):
-                yield os.path.join(dirpath, fn)
-
-
 def _read_text(path: str) -> str:
     with open(path, "r", encoding="utf-8") as f:
         return f.read()
 
 
-def _parse_imports(py_src: str) -> List[Tuple[int, str]]:
+def _parse_imports(py_src: str) -> List[Tuple[int, str, List[str]]]:
     """
-    Returns (lineno, module) for import and from-import.
+    Returns (lineno, module, names) for import and from-import
+    (names: the from-imported names, [] for a plain import).
     """
-    out: List[Tuple[int, str]] = []
+    out: List[Tuple[int, str, List[str]]] = []
     tree = ast.parse(py_src)
     for node in ast.walk(tree):
         if isinstance(node, ast.Import):
             for a in node.names:
-                out.append((getattr(node, "lineno", 1), a.name))
+                out.append((getattr(node, "lineno", 1), a.name, []))
         elif isinstance(node, ast.ImportFrom):
+            names = [a.name for a in node.names]
             if node.module is None:
-                out.append((getattr(node, "lineno", 1), "<RELATIVE_IMPORT>"))
+                # "from . import x" / "from .. import x": keep the level for graph resolution
+                out.append((getattr(node, "lineno", 1), "." * (node.level or 1), names))
             else:
                 mod = node.module
                 if node.level:
                     mod = "." * node.level + mod
-                out.append((getattr(node, "lineno", 1), mod))
+                out.append((getattr(node, "lineno", 1), mod, names))
     return out
 
 
@@ -140,77 +140,271 @@ def _print_findings(findings: List[Finding]) -> None:
         )
 
 
-def main() -> int:
-    ap = argparse.ArgumentParser(description="Zone Static Gate (fail-closed)")
-    ap.add_argument("--root", default=".", help="Repo root")
-    args = ap.parse_args()
+_SKIP_DIR_MARKERS = ("/.git/", "/.venv/", "/venv/", "/__pycache__/")
 
-    root = os.path.abspath(args.root)
+
+class ZoneImportRule:
+    """
+    scan_engine rule: per-file import list ({"imports": [[lineno, module, names], ...]})
+    or the parse failure ({"error": "Type:msg"}), cached by content.
+    Zone classification happens in the gate (it depends on the file path).
+    """
+
+    name = "zone_imports"
+    version = rule_version(__file__)
+
+    def select(self, entry: FileEntry) -> bool:
+        if not entry.rel.endswith(".py"):
+            return False
+        dn = _norm(os.path.dirname(entry.abspath))
+        return not any(x in f"/{dn}/" for x in _SKIP_DIR_MARKERS)
+
+    def scan(self, entry: FileEntry, data: bytes) -> Dict[str, Any]:
+        try:
+            try:
+                # text-mode read semantics: strict utf-8 + universal newlines
+                src = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+            except UnicodeDecodeError:
+                src = _read_text(entry.abspath)  # raises the same error the direct read reports
+            imports = _parse_imports(src)
+        except Exception as e:
+            return {"error": f"{type(e).__name__}:{e}"}
+        return {"imports": [[lineno, mod, names] for lineno, mod, names in imports]}
+
+    def read_error(self, entry: FileEntry, e: Exception) -> Dict[str, Any]:
+        return {"error": f"{type(e).__name__}:{e}"}
+
+
+ZONE_RULE = ZoneImportRule()
+
+
+def findings_for_file(rel: str, result: Dict[str, Any]) -> List[Finding]:
     findings: List[Finding] = []
+    file_zone = _zone_for_file(rel)
 
-    zone_doc = os.path.join(root, "docs/architecture/AURALIS_ZONE_MAP.md")
-    if not os.path.exists(zone_doc):
+    if "error" in result:
         findings.append(
             Finding(
-                "ZONE_MAP_MISSING",
-                "docs/architecture/AURALIS_ZONE_MAP.md",
+                "ZONE_PARSE_FAIL",
+                rel,
                 1,
-                "Zone map must exist for enforcement",
-                "missing",
+                "Failed to parse file (fail-closed)",
+                result["error"],
             )
         )
-        _print_findings(findings)
-        return 1
+        return findings
 
-    for abspath in _walk_py_files(root):
-        rel = _norm(os.path.relpath(abspath, root))
-        file_zone = _zone_for_file(rel)
+    for lineno, mod, *_ in result["imports"]:
+        if _is_relative(mod):
+            continue
+        if not _is_internal_module(mod):
+            continue
 
-        try:
-            src = _read_text(abspath)
-            imports = _parse_imports(src)
-        except Exception as e:
+        imp_zone = _zone_for_import(mod)
+
+        if file_zone != ZONE_UNKNOWN and imp_zone == ZONE_UNKNOWN:
             findings.append(
                 Finding(
-                    "ZONE_PARSE_FAIL",
+                    "ZONE_INTERNAL_IMPORT_UNCLASSIFIED",
                     rel,
-                    1,
-                    "Failed to parse file (fail-closed)",
-                    f"{type(e).__name__}:{e}",
+                    lineno,
+                    "Internal import could not be classified into a zone",
+                    mod,
                 )
             )
             continue
 
-        for lineno, mod in imports:
-            if _is_relative(mod):
-                continue
-            if not _is_internal_module(mod):
-                continue
-
-            imp_zone = _zone_for_import(mod)
-
-            if file_zone != ZONE_UNKNOWN and imp_zone == ZONE_UNKNOWN:
-                findings.append(
-                    Finding(
-                        "ZONE_INTERNAL_IMPORT_UNCLASSIFIED",
-                        rel,
-                        lineno,
-                        "Internal import could not be classified into a zone",
-                        mod,
-                    )
+        if (file_zone, imp_zone) in FORBIDDEN_EDGES:
+            findings.append(
+                Finding(
+                    "ZONE_EDGE_FORBIDDEN",
+                    rel,
+                    lineno,
+                    "Forbidden zone dependency detected",
+                    f"{file_zone} -> {imp_zone} via {mod}",
                 )
+            )
+    return findings
+
+
+def module_for_file(rel: str) -> str:
+    """Dotted module name of a repo-relative .py path (package __init__ -> package)."""
+    parts = _norm(rel)[: -len(".py")].split("/")
+    if parts[-1] == "__init__" and len(parts) > 1:
+        parts = parts[:-1]
+    return ".".join(parts)
+
+
+@dataclass
+class ImportEdge:
+    src: str  # importing file (repo-relative)
+    module: str  # module string as written (relative imports keep their dots)
+    line: int
+    dst: Optional[str]  # resolved in-tree file, None for stdlib / third-party / unresolved
+
+
+class ImportGraph:
+    """
+    File-level import graph built from ZoneImportRule results.
+
+    The per-file import lists are what gets persisted (scan_engine cache, keyed by
+    content sha256), so only changed files are re-parsed; the graph itself is
+    re-assembled from them on every run, which is cheap.
+    """
+
+    def __init__(self) -> None:
+        self.modules: Dict[str, str] = {}  # dotted module -> file (a package beats a same-named module)
+        self.imports: Dict[str, List[List[Any]]] = {}  # file -> ZoneImportRule import list; files in walk order
+        self.errors: Dict[str, str] = {}  # file -> parse failure
+        self.edges: Dict[str, List[ImportEdge]] = {}  # file -> outgoing edges, source order
+
+    @classmethod
+    def from_results(cls, results: Iterable[Tuple[FileEntry, Dict[str, Any]]]) -> "ImportGraph":
+        g = cls()
+        results = list(results)
+        for entry, _ in results:
+            mod = module_for_file(entry.rel)
+            if mod not in g.modules or entry.rel.endswith("__init__.py"):
+                g.modules[mod] = entry.rel
+        for entry, result in results:
+            g.imports[entry.rel] = result.get("imports", [])
+            g.edges[entry.rel] = []
+            if "error" in result:
+                g.errors[entry.rel] = result["error"]
                 continue
+            for lineno, mod, *rest in g.imports[entry.rel]:
+                names = rest[0] if rest else []
+                dsts = []
+                for name in names:
+                    # "from pkg import submodule" depends on the submodule itself
+                    sub = g._lookup(entry.rel, f"{mod}{name}" if mod.endswith(".") else f"{mod}.{name}")
+                    if sub is not None:
+                        dsts.append(sub)
+                if len(dsts) < len(names) or not names:
+                    dsts.append(g.resolve(entry.rel, mod))
+                for dst in dict.fromkeys(dsts):
+                    g.edges[entry.rel].append(ImportEdge(entry.rel, mod, lineno, dst))
+        return g
+
+    def _parts(self, src: str, name: str) -> Optional[List[str]]:
+        if not name.startswith("."):
+            return name.split(".")
+        level = len(name) - len(name.lstrip("."))
+        pkg = module_for_file(src).split(".")
+        if not src.endswith("__init__.py"):
+            pkg = pkg[:-1]
+        if level - 1 > len(pkg):
+            return None
+        rest = name.lstrip(".")
+        return pkg[: len(pkg) - (level - 1)] + (rest.split(".") if rest else [])
+
+    def _lookup(self, src: str, name: str) -> Optional[str]:
+        parts = self._parts(src, name)
+        return self.modules.get(".".join(parts)) if parts else None
+
+    def resolve(self, src: str, name: str) -> Optional[str]:
+        """File of the longest in-tree module prefix of `name` (relative names resolved against `src`)."""
+        parts = self._parts(src, name)
+        while parts:
+            dst = self.modules.get(".".join(parts))
+            if dst is not None:
+                return dst
+            parts = parts[:-1]
+        return None
+
+    def findings(self) -> List[Finding]:
+        """Direct zone violations; same findings, in the same order, as the per-file gate."""
+        out: List[Finding] = []
+        for rel, imports in self.imports.items():
+            if rel in self.errors:
+                out.extend(findings_for_file(rel, {"error": self.errors[rel]}))
+            else:
+                out.extend(findings_for_file(rel, {"imports": imports}))
+        return out
+
+    def cross_zone_paths(self) -> List[List[str]]:
+        """
+        Shortest indirect import path (>= 2 hops, as files) from each file to each
+        zone it must not depend on, when the file has no direct import into that
+        zone. Paths follow resolved in-tree edges only.
+        """
+        adj: Dict[str, List[str]] = {}
+        for rel, edges in self.edges.items():
+            adj[rel] = list(dict.fromkeys(e.dst for e in edges if e.dst and e.dst != rel))
+        paths: List[List[str]] = []
+        for src in self.edges:
+            zone = _zone_for_file(src)
+            wanted = {b for a, b in FORBIDDEN_EDGES if a == zone}
+            wanted -= {
+                _zone_for_import(mod)
+                for _, mod, *_ in self.imports[src]
+                if not _is_relative(mod) and _is_internal_module(mod)
+            }
+            parent: Dict[str, str] = {src: src}
+            queue = [src]
+            for node in queue:  # BFS; queue grows while iterating
+                if not wanted:
+                    break
+                for nxt in adj.get(node, ()):
+                    if nxt in parent:
+                        continue
+                    parent[nxt] = node
+                    z = _zone_for_file(nxt)
+                    if z in wanted and node != src:
+                        path = [nxt]
+                        while path[-1] != src:
+                            path.append(parent[path[-1]])
+                        paths.append(path[::-1])
+                        wanted.discard(z)
+                    queue.append(nxt)
+        return paths
+
+    def to_json(self) -> Dict[str, Any]:
+        nodes = []
+        for rel in self.edges:
+            node = {"file": rel, "module": module_for_file(rel), "zone": _zone_for_file(rel)}
+            if rel in self.errors:
+                node["error"] = self.errors[rel]
+            nodes.append(node)
+        edges = [
+            {"from": e.src, "to": e.dst, "module": e.module, "line": e.line}
+            for rel_edges in self.edges.values()
+            for e in rel_edges
+        ]
+        return {"nodes": nodes, "edges": edges}
+
+    def to_dot(self) -> str:
+        lines = ["digraph imports {", "  rankdir=LR;"]
+        for rel in self.edges:
+            lines.append(f'  "{rel}" [label="{module_for_file(rel)}", zone="{_zone_for_file(rel)}"];')
+        for rel, edges in self.edges.items():
+            for dst in dict.fromkeys(e.dst for e in edges if e.dst and e.dst != rel):
+                lines.append(f'  "{rel}" -> "{dst}";')
+        lines.append("}")
+        return "\n".join(lines) + "\n"
+
+
+def report_root(
+    root: Any, results: List[Tuple[FileEntry, Dict[str, Any]]], graph: Optional[ImportGraph] = None
+) -> int:
+    root = os.path.abspath(str(root))
+    findings: List[Finding] = []
 
-            if (file_zone, imp_zone) in FORBIDDEN_EDGES:
-                findings.append(
-                    Finding(
-                        "ZONE_EDGE_FORBIDDEN",
-                        rel,
-                        lineno,
-                        "Forbidden zone dependency detected",
-                        f"{file_zone} -> {imp_zone} via {mod}",
-                    )
-                )
+    zone_doc = os.path.join(root, "docs/architecture/AURALIS_ZONE_MAP.md")
+    if not os.path.exists(zone_doc):
+        findings.append(
+            Finding(
+                "ZONE_MAP_MISSING",
+                "docs/architecture/AURALIS_ZONE_MAP.md",
+                1,
+                "Zone map must exist for enforcement",
+                "missing",
+            )
+        )
+        _print_findings(findings)
+        return 1
+
+    findings.extend((graph or ImportGraph.from_results(results)).findings())
 
     if findings:
         _print_findings(findings)
@@ -220,5 +414,42 @@ def main() -> int:
     return 0
 
 
+def _print_paths(paths: List[List[str]]) -> None:
+    for path in paths:
+        zones = f"{_zone_for_file(path[0])}->{_zone_for_file(path[-1])}"
+        print(f"INFO ZONE_TRANSITIVE_PATH zones={zones} path={' -> '.join(path)}")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Zone Static Gate (fail-closed)")
+    ap.add_argument("--root", default=".", help="Repo root")
+    ap.add_argument("--workers", type=int, default=None, help="parse processes for cache misses (default: CPU count)")
+    ap.add_argument("--no-cache", action="store_true", help="do not read/write the scan cache")
+    ap.add_argument("--graph-json", default=None, help="write the import graph as JSON to this path")
+    ap.add_argument("--graph-dot", default=None, help="write the import graph as Graphviz DOT to this path")
+    ap.add_argument(
+        "--transitive", action="store_true", help="also list indirect cross-zone import paths (informational)"
+    )
+    args = ap.parse_args()
+
+    root = os.path.abspath(args.root)
+    if not os.path.exists(os.path.join(root, "docs/architecture/AURALIS_ZONE_MAP.md")):
+        return report_root(root, [])
+
+    engine = ScanEngine(
+        Path(root), cache_path=None if args.no_cache else default_cache_path(Path(root)), workers=args.workers
+    )
+    results = engine.run([ZONE_RULE])[ZONE_RULE.name]
+    graph = ImportGraph.from_results(results)
+    if args.graph_json:
+        Path(args.graph_json).write_text(json.dumps(graph.to_json(), indent=2) + "\n", encoding="utf-8")
+    if args.graph_dot:
+        Path(args.graph_dot).write_text(graph.to_dot(), encoding="utf-8")
+    rc = report_root(root, results, graph)
+    if args.transitive:
+        _print_paths(graph.cross_zone_paths())
+    return rc
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -100,7 +100,11 @@ def _from_snapshot(snapshot_file: str) -> dict:
         raw = json.loads(path.read_text(encoding="utf-8"))
     except Exception as exc:
         raise SystemExit(f"FAIL-CLOSED: cannot load --snapshot-file: {exc}") from exc
+    return values_from_snapshot(raw, path)
 
+
+def values_from_snapshot(raw: object, path: Path) -> dict:
+    """Signal values from an already-loaded sentinel snapshot (evidence points at `path`)."""
     if not isinstance(raw, dict):
         raise SystemExit("FAIL-CLOSED: --snapshot-file JSON root must be an object")
 
@@ -139,59 +143,23 @@ def _from_snapshot(snapshot_file: str) -> dict:
     }
 
 
-def main() -> int:
-    ap = argparse.ArgumentParser()
-    ap.add_argument("--snapshot-file", default=None, help="optional sentinel snapshot JSON path")
-    ap.add_argument("--symbol", default=None, help="e.g., BTCUSDT")
-    ap.add_argument("--timeframe", default="15m", help="1m|5m|15m|1h|4h|1d|other")
-    ap.add_argument("--score", type=int, default=None, help="0..100")
-    ap.add_argument("--confidence", type=float, default=None, help="0..1")
-    ap.add_argument("--risk-level", choices=["low", "medium", "high"], default=None)
-    ap.add_argument("--direction", choices=["long", "short", "neutral"])
-    ap.add_argument("--tags", action="append", default=[], help="repeatable and/or comma-separated")
-    ap.add_argument("--metrics-json", default=None, help="optional JSON object string")
-    ap.add_argument(
-        "--evidence",
-        action="append",
-        default=[],
-        help='repeatable key=value pairs, e.g. "ref_kind=FILEPATH ref=/tmp/x.json"',
-    )
-    ap.add_argument("--ci", action="store_true", help="force deterministic timestamp")
-    ap.add_argument("--out", required=True, help="output file path")
-    args = ap.parse_args()
-
-    if args.snapshot_file:
-        snapshot_values = _from_snapshot(args.snapshot_file)
-        symbol = snapshot_values["symbol"]
-        timeframe = snapshot_values["timeframe"]
-        score = snapshot_values["score"]
-        confidence = snapshot_values["confidence"]
-        risk_level = snapshot_values["risk_level"]
-        direction = snapshot_values["direction"]
-        tags = snapshot_values["tags"]
-        metrics = snapshot_values["metrics"]
-        evidence_refs = snapshot_values["evidence"]
-    else:
-        if args.symbol is None or args.score is None or args.confidence is None or args.risk_level is None:
-            raise SystemExit(
-                "FAIL-CLOSED: direct mode requires --symbol --score --confidence --risk-level"
-            )
-        symbol = args.symbol
-        timeframe = args.timeframe
-        score = args.score
-        confidence = args.confidence
-        risk_level = args.risk_level
-        direction = args.direction
-        tags = _parse_tags(args.tags)
-        metrics = _parse_metrics(args.metrics_json)
-        evidence_refs = _parse_evidence(args.evidence)
+def build_domain_event(values: dict, *, deterministic: bool, build_sha: str | None = None) -> dict:
+    """domain_event.v1 for one signal; `values` as returned by values_from_snapshot."""
+    symbol = values["symbol"]
+    timeframe = values["timeframe"]
+    score = values["score"]
+    confidence = values["confidence"]
+    risk_level = values["risk_level"]
+    direction = values["direction"]
+    tags = values["tags"]
+    metrics = values["metrics"]
+    evidence_refs = values["evidence"]
 
     if not 0 <= score <= 100:
         raise SystemExit("FAIL-CLOSED: --score must be in [0, 100]")
     if not 0 <= confidence <= 1:
         raise SystemExit("FAIL-CLOSED: --confidence must be in [0, 1]")
 
-    deterministic = _deterministic_mode(args.ci)
     if deterministic:
         ts_iso = "1970-01-01T00:00:00Z"
         ts_for_id = 0
@@ -216,8 +184,8 @@ def main() -> int:
     if metrics is not None:
         signal["metrics"] = metrics
 
-    repo_root = _repo_root()
-    build_sha = _build_sha(repo_root)
+    if build_sha is None:
+        build_sha = _build_sha(_repo_root())
 
     event = {
         "schema": "domain_event.v1",
@@ -235,6 +203,51 @@ def main() -> int:
 
     if evidence_refs:
         event["evidence_refs"] = evidence_refs
+    return event
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--snapshot-file", default=None, help="optional sentinel snapshot JSON path")
+    ap.add_argument("--symbol", default=None, help="e.g., BTCUSDT")
+    ap.add_argument("--timeframe", default="15m", help="1m|5m|15m|1h|4h|1d|other")
+    ap.add_argument("--score", type=int, default=None, help="0..100")
+    ap.add_argument("--confidence", type=float, default=None, help="0..1")
+    ap.add_argument("--risk-level", choices=["low", "medium", "high"], default=None)
+    ap.add_argument("--direction", choices=["long", "short", "neutral"])
+    ap.add_argument("--tags", action="append", default=[], help="repeatable and/or comma-separated")
+    ap.add_argument("--metrics-json", default=None, help="optional JSON object string")
+    ap.add_argument(
+        "--evidence",
+        action="append",
+        default=[],
+        help='repeatable key=value pairs, e.g. "ref_kind=FILEPATH ref=/tmp/x.json"',
+    )
+    ap.add_argument("--ci", action="store_true", help="force deterministic timestamp")
+    ap.add_argument("--out", required=True, help="output file path")
+    args = ap.parse_args()
+
+    if args.snapshot_file:
+        values = _from_snapshot(args.snapshot_file)
+    else:
+        if args.symbol is None or args.score is None or args.confidence is None or args.risk_level is None:
+            raise SystemExit(
+                "FAIL-CLOSED: direct mode requires --symbol --score --confidence --risk-level"
+            )
+        values = {
+            "symbol": args.symbol,
+            "timeframe": args.timeframe,
+            "score": args.score,
+            "confidence": args.confidence,
+            "risk_level": args.risk_level,
+            "direction": args.direction,
+            "tags": _parse_tags(args.tags),
+            "metrics": _parse_metrics(args.metrics_json),
+            "evidence": _parse_evidence(args.evidence),
+        }
+
+    event = build_domain_event(values, deterministic=_deterministic_mode(args.ci))
+    repo_root = _repo_root()
 
     out_path = Path(args.out)
     out_path.parent.mkdir(parents=True, exist_ok=True)
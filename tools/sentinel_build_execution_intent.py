@@ -284,6 +284,97 @@ def _compute_oi_delta_pct(symbol: str, ts: str, deriv_root: str = "/tmp/metaos_d
     return (cur_oi - prev_oi) / prev_oi * 100.0
 
 
+def build_execution_intent(
+    summary: dict,
+    summary_path: Path,
+    *,
+    execution_mode: str,
+    policy: dict,
+    policy_sha: str,
+    build_sha: str | None = None,
+    ts_iso: str | None = None,
+) -> dict:
+    """execution_intent.v1 for a loaded summary (evidence points at `summary_path`)."""
+    items = summary.get("items")
+    if not isinstance(items, list):
+        raise ValueError("summary.items must be a list")
+
+    ts = summary.get("ts")
+    if not isinstance(ts, str) or not ts:
+        raise ValueError("summary.ts must be non-empty string")
+
+    if build_sha is None:
+        build_sha = _build_sha(_repo_root())
+
+    intents: list[dict] = []
+
+    for item in items:
+        if not isinstance(item, dict):
+            raise ValueError("summary.items entries must be objects")
+
+        symbol = item.get("symbol")
+        if not isinstance(symbol, str) or not symbol:
+            raise ValueError("item.symbol must be non-empty string")
+
+        oi_delta_pct = item.get("oi_delta_pct")
+        if oi_delta_pct is not None and not isinstance(oi_delta_pct, (int, float)):
+            raise ValueError(f"{symbol}: item.oi_delta_pct must be numeric when present")
+        oi_delta_pct_v = float(oi_delta_pct) if oi_delta_pct is not None else _compute_oi_delta_pct(symbol, ts)
+
+        score, direction, risk, conf, snap = _select_signal(item)
+
+        triggered, reason = _evaluate_trigger(
+            execution_mode=execution_mode,
+            score=score,
+            direction=direction,
+            risk_level=risk,
+            confidence=conf,
+            oi_delta_pct=oi_delta_pct_v,
+        )
+
+        triggered, reason, quality = _apply_quality_policy(policy, item, triggered, reason)
+
+        intents.append(
+            {
+                "symbol": symbol,
+                "timeframe": item.get("timeframe"),
+                "final_score": score,
+                "final_direction": direction,
+                "final_risk_level": risk,
+                "final_confidence": conf,
+                "oi_delta_pct": oi_delta_pct_v,
+                "snapshot_path": snap,
+                "triggered": triggered,
+                "reason_code": reason,
+                "quality": quality,
+            }
+        )
+
+    event = {
+        "schema": "execution_intent.v1",
+        "domain": "SENTINEL_EXEC",
+        "kind": "INTENT",
+        "event_id": f"intent_{ts}",
+        "ts_iso": ts_iso if ts_iso is not None else _now_ts_iso(),
+        "intent": {
+            "ts": ts,
+            "execution_mode": execution_mode,
+            "dry_run": (execution_mode == "dry_run"),
+            "items": intents,
+        },
+        "meta": {
+            "producer": "sentinel.exec",
+            "version": "0",
+            "build_sha": build_sha,
+            "policy_id": policy.get("policy_id"),
+            "policy_version": policy.get("version"),
+            "policy_sha256": policy_sha,
+        },
+        "evidence_refs": [{"ref_kind": "FILEPATH", "ref": str(summary_path)}],
+    }
+    return event
+
+
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--summary-file", required=True)
@@ -329,83 +420,14 @@ def main() -> int:
         outbox_dir.mkdir(parents=True, exist_ok=True)
 
         summary = _load_json(summary_path)
-        items = summary.get("items")
-        if not isinstance(items, list):
-            raise ValueError("summary.items must be a list")
-
-        ts = summary.get("ts")
-        if not isinstance(ts, str) or not ts:
-            raise ValueError("summary.ts must be non-empty string")
-
-        repo_root = _repo_root()
-        build_sha = _build_sha(repo_root)
-
-        intents: list[dict] = []
-
-        for item in items:
-            if not isinstance(item, dict):
-                raise ValueError("summary.items entries must be objects")
-
-            symbol = item.get("symbol")
-            if not isinstance(symbol, str) or not symbol:
-                raise ValueError("item.symbol must be non-empty string")
-
-            oi_delta_pct = item.get("oi_delta_pct")
-            if oi_delta_pct is not None and not isinstance(oi_delta_pct, (int, float)):
-                raise ValueError(f"{symbol}: item.oi_delta_pct must be numeric when present")
-            oi_delta_pct_v = float(oi_delta_pct) if oi_delta_pct is not None else _compute_oi_delta_pct(symbol, ts)
-
-            score, direction, risk, conf, snap = _select_signal(item)
-
-            triggered, reason = _evaluate_trigger(
-                execution_mode=execution_mode,
-                score=score,
-                direction=direction,
-                risk_level=risk,
-                confidence=conf,
-                oi_delta_pct=oi_delta_pct_v,
-            )
-
-            triggered, reason, quality = _apply_quality_policy(policy, item, triggered, reason)
-
-            intents.append(
-                {
-                    "symbol": symbol,
-                    "timeframe": item.get("timeframe"),
-                    "final_score": score,
-                    "final_direction": direction,
-                    "final_risk_level": risk,
-                    "final_confidence": conf,
-                    "oi_delta_pct": oi_delta_pct_v,
-                    "snapshot_path": snap,
-                    "triggered": triggered,
-                    "reason_code": reason,
-                    "quality": quality,
-                }
-            )
-
-        event = {
-            "schema": "execution_intent.v1",
-            "domain": "SENTINEL_EXEC",
-            "kind": "INTENT",
-            "event_id": f"intent_{ts}",
-            "ts_iso": _now_ts_iso(),
-            "intent": {
-                "ts": ts,
-                "execution_mode": execution_mode,
-                "dry_run": (execution_mode == "dry_run"),
-                "items": intents,
-            },
-            "meta": {
-                "producer": "sentinel.exec",
-                "version": "0",
-                "build_sha": build_sha,
-                "policy_id": policy.get("policy_id"),
-                "policy_version": policy.get("version"),
-                "policy_sha256": policy_sha,
-            },
-            "evidence_refs": [{"ref_kind": "FILEPATH", "ref": str(summary_path)}],
-        }
+        event = build_execution_intent(
+            summary,
+            summary_path,
+            execution_mode=execution_mode,
+            policy=policy,
+            policy_sha=policy_sha,
+        )
+        ts = event["intent"]["ts"]
 
         out_path = outbox_dir / f"intent_{ts}.json"
         out_path.write_text(json.dumps(event, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
@@ -91,31 +91,8 @@ def _match(rule_when: dict, ctx: dict) -> bool:
         gt("oi_delta_pct_gt", ctx["oi_delta_pct"])
     )
 
-def main() -> int:
-    ap = argparse.ArgumentParser()
-    ap.add_argument("--execution-intent", required=True)
-    ap.add_argument("--outbox", required=True)
-    ap.add_argument("--policy-file", required=True)
-    ap.add_argument("--policy-sha256", required=True)
-    args = ap.parse_args()
-
-    intent_path = Path(args.execution_intent)
-    outbox_dir = Path(args.outbox)
-    policy_path = Path(args.policy_file)
-
-    if not intent_path.is_file():
-        raise ValueError(f"execution intent not found: {intent_path}")
-    if not policy_path.is_file():
-        raise ValueError(f"policy not found: {policy_path}")
-
-    sha = _policy_sha256(policy_path)
-    if sha != args.policy_sha256:
-        raise ValueError(f"policy sha256 mismatch expected={args.policy_sha256} got={sha}")
-
-    policy = _load_policy(policy_path)
-    outbox_dir.mkdir(parents=True, exist_ok=True)
-
-    ei = _load_json(intent_path)
+def build_paper_orders(ei: dict, intent_path: Path, *, policy: dict, sha: str, ts_iso: str | None = None) -> dict:
+    """paper_order_intent.v1 for a loaded execution intent (evidence points at `intent_path`)."""
     if ei.get("schema") != "execution_intent.v1":
         raise ValueError("execution_intent schema mismatch")
 
@@ -194,7 +171,7 @@ def main() -> int:
         "domain": "SENTINEL_EXEC",
         "kind": "INTENT",
         "event_id": f"paper_{ts}",
-        "ts_iso": _now_iso(),
+        "ts_iso": ts_iso if ts_iso is not None else _now_iso(),
         "intent": {
             "ts": ts,
             "execution_mode": execution_mode,
@@ -211,6 +188,37 @@ def main() -> int:
             {"ref_kind": "FILEPATH", "ref": str(intent_path)},
         ],
     }
+    return out
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--execution-intent", required=True)
+    ap.add_argument("--outbox", required=True)
+    ap.add_argument("--policy-file", required=True)
+    ap.add_argument("--policy-sha256", required=True)
+    args = ap.parse_args()
+
+    intent_path = Path(args.execution_intent)
+    outbox_dir = Path(args.outbox)
+    policy_path = Path(args.policy_file)
+
+    if not intent_path.is_file():
+        raise ValueError(f"execution intent not found: {intent_path}")
+    if not policy_path.is_file():
+        raise ValueError(f"policy not found: {policy_path}")
+
+    sha = _policy_sha256(policy_path)
+    if sha != args.policy_sha256:
+        raise ValueError(f"policy sha256 mismatch expected={args.policy_sha256} got={sha}")
+
+    policy = _load_policy(policy_path)
+    outbox_dir.mkdir(parents=True, exist_ok=True)
+
+    ei = _load_json(intent_path)
+    out = build_paper_orders(ei, intent_path, policy=policy, sha=sha)
+    ts = out["intent"]["ts"]
+    execution_mode = out["intent"]["execution_mode"]
+    orders = out["intent"]["orders"]
 
     out_path = outbox_dir / f"paper_{ts}.json"
     out_path.write_bytes(_canon(out) + b"\n")
@@ -86,7 +86,11 @@ def _read_leg(domain_root: Path, repo_root: Path, symbol: str, tf: str, ts: str)
 
     _validate_domain_event(repo_root, event_path)
     event = json.loads(event_path.read_text(encoding="utf-8"))
+    return leg_from_event(event, event_path, symbol, tf, ts)
 
+
+def leg_from_event(event: dict, event_path: Path, symbol: str, tf: str, ts: str) -> dict:
+    """Summary leg for an already-validated domain_event (as if read from `event_path`)."""
     signal = event.get("signal")
     if not isinstance(signal, dict):
         raise ValueError(f"signal must be object in {event_path}")
@@ -206,7 +210,7 @@ def _risk_dynamic_stable(cons: dict, leg_15m: dict | None, leg_1h: dict | None)
 
 
 
-def _consensus_stable(leg_15m: dict | None, leg_1h: dict | None) -> dict:
+def _consensus_stable(leg_15m: dict | None, leg_1h: dict | None, snapshots: dict | None = None) -> dict:
     # Conservative / structure-stable consensus + dynamic risk (stable v1)
 
     final = {
@@ -264,7 +268,10 @@ def _consensus_stable(leg_15m: dict | None, leg_1h: dict | None) -> dict:
             from pathlib import Path as _P
             snap_path = leg_1h.get("snapshot_path")
             if isinstance(snap_path, str) and snap_path:
-                snap = json.loads(_P(snap_path).read_text(encoding="utf-8"))
+                if snapshots is not None and snap_path in snapshots:
+                    snap = snapshots[snap_path]
+                else:
+                    snap = json.loads(_P(snap_path).read_text(encoding="utf-8"))
                 ohlc = snap.get("ohlc", snap)
                 o = ohlc.get("open"); h = ohlc.get("high"); l = ohlc.get("low")
                 if isinstance(o, (int, float)) and isinstance(h, (int, float)) and isinstance(l, (int, float)) and o != 0:
@@ -277,6 +284,77 @@ def _consensus_stable(leg_15m: dict | None, leg_1h: dict | None) -> dict:
         final["final_risk_level"] = "high" if hits >= 2 else "medium"
 
     return final
+
+
+def build_summary(
+    ts: str,
+    symbols: list[str],
+    tfs: list[str],
+    load_leg,
+    *,
+    build_sha: str | None = None,
+    snapshots: dict | None = None,
+) -> dict:
+    """
+    sentinel_summary.v0 for `symbols`; load_leg(symbol, tf) returns one leg.
+    `snapshots` maps snapshot paths to already-loaded snapshots (others are read from disk).
+    """
+    items: list[dict] = []
+    for symbol in symbols:
+        legs: dict[str, dict] = {}
+        for tf in tfs:
+            legs[tf] = load_leg(symbol, tf)
+
+        leg_15m = legs.get("15m")
+        leg_1h = legs.get("1h")
+
+        cons = _consensus_stable(leg_15m, leg_1h, snapshots)
+
+        # Backward-compatible item fields used by console_dashboard:
+        # symbol/ts_iso/score/direction/risk_level/confidence/snapshot_path/domain_event_path
+        # -> map to final values
+        ts_iso = (leg_1h or leg_15m)["ts_iso"]
+        item = {
+            "symbol": symbol,
+            "ts_iso": ts_iso,
+            "score": int(cons["final_score"]),
+            "direction": cons["final_direction"],
+            "risk_level": cons["final_risk_level"],
+            "confidence": float(cons["final_confidence"]),
+            "snapshot_path": cons["final_snapshot_path"],
+            "domain_event_path": (leg_1h or leg_15m)["domain_event_path"],
+            # extras
+            "legs": legs,
+            "final": cons,
+        }
+
+        # apply consensus FINAL -> item (dashboard reads item fields)
+        if isinstance(leg_15m, dict) and isinstance(leg_1h, dict):
+            final = _consensus_stable(leg_15m, leg_1h, snapshots)
+            if isinstance(final, dict):
+                item["score"] = int(final.get("final_score", item.get("score", 60)))
+                item["direction"] = final.get("final_direction", item.get("direction", "neutral"))
+                item["risk_level"] = final.get("final_risk_level", item.get("risk_level", "medium"))
+                item["confidence"] = float(final.get("final_confidence", item.get("confidence", 0.55)))
+        if not isinstance(item["snapshot_path"], str) or not item["snapshot_path"]:
+            raise ValueError(f"{symbol}: final snapshot_path missing")
+
+        items.append(item)
+
+    summary = {
+        "schema": "sentinel_summary.v0",
+        "ts": ts,
+        "symbols": symbols,
+        "tfs": tfs,
+        "items": items,
+        "meta": {
+            "build_sha": build_sha if build_sha is not None else _build_sha(_repo_root()),
+            "mode": "consensus_stable_v1",
+        },
+    }
+    return summary
+
+
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--ts", required=True, help="UTC yyyymmddTHHMMSSZ")
@@ -296,56 +374,12 @@ def main() -> int:
         repo_root = _repo_root()
         domain_root = Path(args.domain_root)
 
-        items: list[dict] = []
-        for symbol in symbols:
-            legs: dict[str, dict] = {}
-            for tf in tfs:
-                legs[tf] = _read_leg(domain_root, repo_root, symbol, tf, args.ts)
-
-            leg_15m = legs.get("15m")
-            leg_1h = legs.get("1h")
-
-            cons = _consensus_stable(leg_15m, leg_1h)
-
-            # Backward-compatible item fields used by console_dashboard:
-            # symbol/ts_iso/score/direction/risk_level/confidence/snapshot_path/domain_event_path
-            # -> map to final values
-            ts_iso = (leg_1h or leg_15m)["ts_iso"]
-            item = {
-                "symbol": symbol,
-                "ts_iso": ts_iso,
-                "score": int(cons["final_score"]),
-                "direction": cons["final_direction"],
-                "risk_level": cons["final_risk_level"],
-                "confidence": float(cons["final_confidence"]),
-                "snapshot_path": cons["final_snapshot_path"],
-                "domain_event_path": (leg_1h or leg_15m)["domain_event_path"],
-                # extras
-                "legs": legs,
-                "final": cons,
-            }
-
-            # apply consensus FINAL -> item (dashboard reads item fields)
-            if isinstance(leg_15m, dict) and isinstance(leg_1h, dict):
-                final = _consensus_stable(leg_15m, leg_1h)
-                if isinstance(final, dict):
-                    item["score"] = int(final.get("final_score", item.get("score", 60)))
-                    item["direction"] = final.get("final_direction", item.get("direction", "neutral"))
-                    item["risk_level"] = final.get("final_risk_level", item.get("risk_level", "medium"))
-                    item["confidence"] = float(final.get("final_confidence", item.get("confidence", 0.55)))
-            if not isinstance(item["snapshot_path"], str) or not item["snapshot_path"]:
-                raise ValueError(f"{symbol}: final snapshot_path missing")
-
-            items.append(item)
-
-        summary = {
-            "schema": "sentinel_summary.v0",
-            "ts": args.ts,
-            "symbols": symbols,
-            "tfs": tfs,
-            "items": items,
-            "meta": {"build_sha": _build_sha(repo_root), "mode": "consensus_stable_v1"},
-        }
+        summary = build_summary(
+            args.ts,
+            symbols,
+            tfs,
+            lambda symbol, tf: _read_leg(domain_root, repo_root, symbol, tf, args.ts),
+        )
 
         out_path = Path(args.out)
         out_path.parent.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+In-process sentinel pipeline (v0.1)
+
+Runs the same stage builders as the CLI chain, handing each stage's output to
+the next in memory instead of through files:
+
+  sentinel_score_snapshot_v0_2     --symbol S [--ci] --out <snap_root>/S/snapshot_<ts>.json
+  sentinel_build_domain_event      --snapshot-file <snapshot> [--ci] --out <domain_root>/S/domain_event_<ts>_<tf>.json   (per tf)
+  sentinel_build_summary           --ts <ts> --symbols .. --tfs .. --domain-root <domain_root> --out <domain_root>/_summary/summary_<ts>.json
+  sentinel_build_events            --summary-file <summary> --state-dir <state_dir> --out <events_dir>/event_<ts>.json
+  sentinel_build_execution_intent  --summary-file <summary> --outbox <outbox> --policy-file .. --execution-mode ..
+  sentinel_build_paper_orders      --execution-intent <outbox>/intent_<ts>.json --outbox <paper_outbox> ..   (with --paper-policy-file)
+
+- build_sha is resolved once per run (the CLIs each shell out to git)
+- domain events are schema-validated in process, once (the CLIs validate each
+  file twice through a subprocess)
+- only the stages listed in --checkpoints are written; paths embedded in later
+  artifacts (evidence_refs, snapshot_path, domain_event_path) are the CLI
+  chain's paths either way, so every artifact is byte-identical to the chain's
+- per-stage wall time is printed as TIMING lines
+
+The events stage still reads/writes its prev_* state files: that state is
+what the next cycle compares against, not an artifact.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parent.parent
+
+
+ROOT = _repo_root()
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from sdk.validate_domain_event import validation_error
+from tools import sentinel_build_domain_event as domain_event_stage
+from tools import sentinel_build_events as events_stage
+from tools import sentinel_build_execution_intent as intent_stage
+from tools import sentinel_build_paper_orders as paper_stage
+from tools import sentinel_build_summary as summary_stage
+from tools import sentinel_score_snapshot_v0_2 as snapshot_stage
+
+STAGES = ("snapshot", "domain_event", "summary", "events", "execution_intent", "paper_orders")
+# what downstream readers (audit append, executor POST, dashboards) pick up
+DEFAULT_CHECKPOINTS = ("summary", "events", "execution_intent", "paper_orders")
+
+
+def _pretty(obj: dict) -> bytes:
+    return (json.dumps(obj, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+
+
+def _now_ts_iso() -> str:
+    # same format as `date -u +%Y-%m-%dT%H:%M:%SZ` in the intent CLI
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+@dataclass
+class PipelineConfig:
+    ts: str
+    symbols: List[str]
+    tfs: List[str] = field(default_factory=lambda: ["15m", "1h"])
+    snapshot_tfs: List[str] = field(default_factory=lambda: ["15m", "1h", "4h"])
+    limit: int = snapshot_stage.DEFAULT_LIMIT
+    bybit_base_url: str = "https://api.bybit.com"
+    ci: bool = False
+
+    snap_root: Path = Path("/tmp/metaos_snapshots")
+    domain_root: Path = Path("/tmp/metaos_domain_events")
+    state_dir: Path = Path("/tmp/metaos_domain_events/_state")
+    events_dir: Path = Path("/tmp/_events")
+    outbox: Path = Path("/tmp/orch_outbox_live/SENTINEL_EXEC")
+
+    execution_mode: str = "dry_run"
+    policy_file: Path = ROOT / "policies" / "sentinel" / "exec_trigger_v1.yaml"
+    policy_sha256: Optional[str] = None
+    paper_policy_file: Optional[Path] = None
+    paper_policy_sha256: Optional[str] = None
+    paper_outbox: Optional[Path] = None
+
+    checkpoints: tuple = DEFAULT_CHECKPOINTS
+
+    # artifact paths, exactly as the CLI chain names them
+    def snapshot_path(self, symbol: str) -> Path:
+        return self.snap_root / symbol / f"snapshot_{self.ts}.json"
+
+    def domain_event_path(self, symbol: str, tf: str) -> Path:
+        return self.domain_root / symbol / f"domain_event_{self.ts}_{tf}.json"
+
+    def summary_path(self) -> Path:
+        return self.domain_root / "_summary" / f"summary_{self.ts}.json"
+
+    def events_path(self) -> Path:
+        return self.events_dir / f"event_{self.ts}.json"
+
+    def intent_path(self) -> Path:
+        return self.outbox / f"intent_{self.ts}.json"
+
+    def paper_path(self) -> Path:
+        return (self.paper_outbox or self.outbox) / f"paper_{self.ts}.json"
+
+
+@dataclass
+class PipelineResult:
+    build_sha: str
+    artifacts: Dict[str, Any] = field(default_factory=dict)
+    written: List[Path] = field(default_factory=list)
+    timings: Dict[str, float] = field(default_factory=dict)
+
+
+class SentinelPipeline:
+    """One run of the chain; `fetch` is forwarded to the snapshot stage (defaults to Bybit)."""
+
+    def __init__(self, cfg: PipelineConfig, fetch: Optional[Callable[..., list]] = None) -> None:
+        unknown = set(cfg.checkpoints) - set(STAGES)
+        if unknown:
+            raise ValueError(f"unknown checkpoints: {sorted(unknown)}")
+        if not summary_stage.TS_RE.fullmatch(cfg.ts):
+            raise ValueError("ts must match yyyymmddTHHMMSSZ")
+        if cfg.execution_mode not in ("dry_run", "paper", "live"):
+            raise ValueError(f"invalid execution_mode: {cfg.execution_mode}")
+        if cfg.paper_policy_file is not None and not cfg.paper_policy_sha256:
+            raise ValueError("paper orders require paper_policy_sha256")
+        self.cfg = cfg
+        self.fetch = fetch
+
+    def _timed(self, res: PipelineResult, stage: str, fn: Callable[[], Any]) -> Any:
+        t0 = time.perf_counter()
+        out = fn()
+        res.timings[stage] = res.timings.get(stage, 0.0) + (time.perf_counter() - t0)
+        return out
+
+    def _checkpoint(self, res: PipelineResult, stage: str, path: Path, body: bytes) -> None:
+        if stage not in self.cfg.checkpoints:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(body)
+        res.written.append(path)
+
+    def _load_policies(self) -> tuple:
+        cfg = self.cfg
+        if not Path(cfg.policy_file).is_file():
+            raise ValueError(f"policy file not found: {cfg.policy_file}")
+        policy_sha = intent_stage._policy_sha256(Path(cfg.policy_file))
+        if cfg.policy_sha256 is not None and policy_sha != cfg.policy_sha256.strip():
+            raise ValueError(f"policy sha256 mismatch: expected={cfg.policy_sha256} got={policy_sha}")
+        policy = intent_stage._load_trigger_policy(Path(cfg.policy_file))
+
+        paper = None
+        if cfg.paper_policy_file is not None:
+            paper_path = Path(cfg.paper_policy_file)
+            if not paper_path.is_file():
+                raise ValueError(f"policy not found: {paper_path}")
+            paper_sha = paper_stage._policy_sha256(paper_path)
+            if paper_sha != cfg.paper_policy_sha256:
+                raise ValueError(f"policy sha256 mismatch expected={cfg.paper_policy_sha256} got={paper_sha}")
+            paper = (paper_stage._load_policy(paper_path), paper_sha)
+        return policy, policy_sha, paper
+
+    def run(self) -> PipelineResult:
+        cfg = self.cfg
+        # fail closed before any network/disk work, like the first CLI would
+        policy, policy_sha, paper = self._load_policies()
+        res = PipelineResult(build_sha=snapshot_stage._build_sha(ROOT))
+        deterministic = domain_event_stage._deterministic_mode(cfg.ci)
+
+        snapshots: Dict[str, dict] = {}
+        events: Dict[tuple, dict] = {}
+        for symbol in cfg.symbols:
+            snap_path = cfg.snapshot_path(symbol)
+            snap = self._timed(res, "snapshot", lambda: snapshot_stage.build_snapshot(
+                symbol, cfg.snapshot_tfs, cfg.limit, cfg.bybit_base_url,
+                ci=cfg.ci, build_sha=res.build_sha, fetch=self.fetch,
+            ))
+            self._checkpoint(res, "snapshot", snap_path, _pretty(snap))
+            snapshots[str(snap_path)] = snap
+
+            for tf in cfg.tfs:
+                def _event() -> dict:
+                    values = domain_event_stage.values_from_snapshot(snap, snap_path)
+                    event = domain_event_stage.build_domain_event(
+                        values, deterministic=deterministic, build_sha=res.build_sha
+                    )
+                    err = validation_error(event)
+                    if err is not None:
+                        raise ValueError(f"domain_event.v1 validation failed: {err}")
+                    return event
+
+                event = self._timed(res, "domain_event", _event)
+                self._checkpoint(res, "domain_event", cfg.domain_event_path(symbol, tf), _pretty(event))
+                events[(symbol, tf)] = event
+
+        def _leg(symbol: str, tf: str) -> dict:
+            event = events.get((symbol, tf))
+            if event is None:
+                raise ValueError(f"missing domain_event file: {cfg.domain_event_path(symbol, tf)}")
+            return summary_stage.leg_from_event(event, cfg.domain_event_path(symbol, tf), symbol, tf, cfg.ts)
+
+        summary = self._timed(res, "summary", lambda: summary_stage.build_summary(
+            cfg.ts, summary_stage._parse_symbols(",".join(cfg.symbols)), summary_stage._parse_tfs(" ".join(cfg.tfs)),
+            _leg, build_sha=res.build_sha, snapshots=snapshots,
+        ))
+        self._checkpoint(res, "summary", cfg.summary_path(), _pretty(summary))
+
+        sentinel_events = self._timed(res, "events", lambda: events_stage.build_events(summary, Path(cfg.state_dir)))
+        self._checkpoint(res, "events", cfg.events_path(), _pretty(sentinel_events))
+
+        intent = self._timed(res, "execution_intent", lambda: intent_stage.build_execution_intent(
+            summary, cfg.summary_path(),
+            execution_mode=cfg.execution_mode, policy=policy, policy_sha=policy_sha,
+            build_sha=res.build_sha, ts_iso=_now_ts_iso(),
+        ))
+        self._checkpoint(res, "execution_intent", cfg.intent_path(), _pretty(intent))
+
+        res.artifacts.update(snapshots=snapshots, summary=summary, events=sentinel_events, execution_intent=intent)
+        if paper is not None:
+            paper_policy, paper_sha = paper
+            orders = self._timed(res, "paper_orders", lambda: paper_stage.build_paper_orders(
+                intent, cfg.intent_path(), policy=paper_policy, sha=paper_sha,
+            ))
+            self._checkpoint(res, "paper_orders", cfg.paper_path(), paper_stage._canon(orders) + b"\n")
+            res.artifacts["paper_orders"] = orders
+        return res
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--ts", required=True, help="UTC yyyymmddTHHMMSSZ")
+    ap.add_argument("--symbols", required=True, help="comma-separated symbols")
+    ap.add_argument("--tfs", default="15m 1h", help="space-separated summary timeframes (default: '15m 1h')")
+    ap.add_argument("--snapshot-tf", default=snapshot_stage.DEFAULT_TF, help='comma-separated, default "15m,1h,4h"')
+    ap.add_argument("--limit", type=int, default=snapshot_stage.DEFAULT_LIMIT)
+    ap.add_argument("--bybit-base-url", default=None)
+    ap.add_argument("--ci", action="store_true", help="force deterministic ts_iso")
+    ap.add_argument("--snap-root", default="/tmp/metaos_snapshots")
+    ap.add_argument("--domain-root", default="/tmp/metaos_domain_events")
+    ap.add_argument("--state-dir", default=None, help="default: <domain-root>/_state")
+    ap.add_argument("--events-dir", default="/tmp/_events")
+    ap.add_argument("--outbox", default="/tmp/orch_outbox_live/SENTINEL_EXEC")
+    ap.add_argument("--policy-file", default="policies/sentinel/exec_trigger_v1.yaml")
+    ap.add_argument("--policy-sha256", default=None)
+    ap.add_argument("--execution-mode", choices=["dry_run", "paper", "live"], default="dry_run")
+    ap.add_argument("--paper-policy-file", default=None, help="also build paper orders")
+    ap.add_argument("--paper-policy-sha256", default=None)
+    ap.add_argument("--paper-outbox", default=None, help="default: --outbox")
+    ap.add_argument(
+        "--checkpoints",
+        default=",".join(DEFAULT_CHECKPOINTS),
+        help=f"comma-separated stages to persist, from: {','.join(STAGES)}",
+    )
+    args = ap.parse_args()
+
+    if args.limit <= 0:
+        print("FAIL-CLOSED: --limit must be > 0")
+        return 1
+
+    try:
+        cfg = PipelineConfig(
+            ts=args.ts,
+            symbols=[s.strip() for s in args.symbols.split(",") if s.strip()],
+            tfs=args.tfs.split(),
+            snapshot_tfs=[s.strip() for s in args.snapshot_tf.split(",") if s.strip()],
+            limit=args.limit,
+            bybit_base_url=args.bybit_base_url or os.getenv("BYBIT_BASE_URL") or "https://api.bybit.com",
+            ci=args.ci,
+            snap_root=Path(args.snap_root),
+            domain_root=Path(args.domain_root),
+            state_dir=Path(args.state_dir) if args.state_dir else Path(args.domain_root) / "_state",
+            events_dir=Path(args.events_dir),
+            outbox=Path(args.outbox),
+            execution_mode=args.execution_mode,
+            policy_file=Path(args.policy_file),
+            policy_sha256=args.policy_sha256,
+            paper_policy_file=Path(args.paper_policy_file) if args.paper_policy_file else None,
+            paper_policy_sha256=args.paper_policy_sha256,
+            paper_outbox=Path(args.paper_outbox) if args.paper_outbox else None,
+            checkpoints=tuple(s.strip() for s in args.checkpoints.split(",") if s.strip()),
+        )
+        res = SentinelPipeline(cfg).run()
+    except (ValueError, SystemExit) as exc:
+        msg = str(exc)
+        print(msg if msg.startswith("FAIL-CLOSED:") else f"FAIL-CLOSED: {msg}")
+        return 1
+
+    for path in res.written:
+        print(f"OK: wrote {path}")
+    for stage in STAGES:
+        if stage in res.timings:
+            print(f"TIMING: stage={stage} ms={res.timings[stage] * 1000.0:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
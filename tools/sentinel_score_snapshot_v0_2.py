@@ -128,6 +128,89 @@ def _compute_tf_block(rows: list[dict], tf: str) -> tuple[dict, int]:
     return block, s_tf
 
 
+def build_snapshot(
+    symbol: str,
+    tfs: list[str],
+    limit: int,
+    bybit_base_url: str,
+    *,
+    ci: bool = False,
+    build_sha: str | None = None,
+    fetch=None,
+) -> dict:
+    """Score one symbol across `tfs`. Raises ValueError (FAIL-CLOSED) on bad data."""
+    fetch = fetch or fetch_ohlcv
+    tf_blocks: dict[str, dict] = {}
+    tf_scores: dict[str, int] = {}
+    for tf in tfs:
+        rows = fetch(symbol=symbol, tf=tf, limit=limit, bybit_base_url=bybit_base_url)
+        block, s_tf = _compute_tf_block(rows, tf)
+        tf_blocks[tf] = block
+        tf_scores[tf] = s_tf
+
+    for required in ("15m", "1h", "4h"):
+        if required not in tf_blocks:
+            raise ValueError(f"required timeframe missing for consensus: {required}")
+
+    s15 = tf_scores["15m"]
+    s1h = tf_scores["1h"]
+    s4h = tf_scores["4h"]
+    score_final = int(round((0.5 * s15) + (0.3 * s1h) + (0.2 * s4h)))
+
+    price_4h = float(tf_blocks["4h"]["price"])
+    ema200_4h = float(tf_blocks["4h"]["ema200"])
+    if s15 >= 65 and s1h >= 55 and price_4h > ema200_4h:
+        direction = "long"
+    elif s15 <= 35 and s1h <= 45 and price_4h < ema200_4h:
+        direction = "short"
+    else:
+        direction = "neutral"
+
+    if price_4h < ema200_4h or score_final < 55:
+        risk_level = "high"
+    elif score_final >= 75 and price_4h > ema200_4h:
+        risk_level = "low"
+    else:
+        risk_level = "medium"
+
+    confidence = min(1.0, max(0.0, score_final / 100.0))
+    flags: list[str] = []
+    if price_4h > ema200_4h:
+        flags.append("TF4H_ABOVE_EMA200")
+    else:
+        flags.append("TF4H_BELOW_EMA200")
+    if direction == "neutral":
+        flags.append("DIRECTION_UNCLEAR")
+
+    ts_iso = "1970-01-01T00:00:00Z" if ci else datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    if build_sha is None:
+        build_sha = _build_sha(_repo_root())
+
+    out = {
+        "schema": "sentinel_snapshot.v0",
+        "symbol": symbol,
+        "ts_iso": ts_iso,
+        "timeframes": tf_blocks,
+        "derivatives": {"funding": None, "oi_delta": None},
+        "score": {
+            "s15": s15,
+            "s1h": s1h,
+            "s4h": s4h,
+            "final": score_final,
+            "direction": direction,
+            "risk_level": risk_level,
+            "confidence": confidence,
+        },
+        "flags": flags,
+        "meta": {
+            "producer": "sentinel.scoring.v0_2",
+            "version": "0.2",
+            "build_sha": build_sha,
+        },
+    }
+    return out
+
+
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--symbol", required=True, help="e.g. BTCUSDT")
@@ -147,74 +230,9 @@ def main() -> int:
     bybit_base_url = args.bybit_base_url or os.getenv("BYBIT_BASE_URL") or "https://api.bybit.com"
 
     try:
-        tf_blocks: dict[str, dict] = {}
-        tf_scores: dict[str, int] = {}
-        for tf in tfs:
-            rows = fetch_ohlcv(symbol=args.symbol, tf=tf, limit=args.limit, bybit_base_url=bybit_base_url)
-            block, s_tf = _compute_tf_block(rows, tf)
-            tf_blocks[tf] = block
-            tf_scores[tf] = s_tf
-
-        for required in ("15m", "1h", "4h"):
-            if required not in tf_blocks:
-                raise ValueError(f"required timeframe missing for consensus: {required}")
-
-        s15 = tf_scores["15m"]
-        s1h = tf_scores["1h"]
-        s4h = tf_scores["4h"]
-        score_final = int(round((0.5 * s15) + (0.3 * s1h) + (0.2 * s4h)))
-
-        price_4h = float(tf_blocks["4h"]["price"])
-        ema200_4h = float(tf_blocks["4h"]["ema200"])
-        if s15 >= 65 and s1h >= 55 and price_4h > ema200_4h:
-            direction = "long"
-        elif s15 <= 35 and s1h <= 45 and price_4h < ema200_4h:
-            direction = "short"
-        else:
-            direction = "neutral"
-
-        if price_4h < ema200_4h or score_final < 55:
-            risk_level = "high"
-        elif score_final >= 75 and price_4h > ema200_4h:
-            risk_level = "low"
-        else:
-            risk_level = "medium"
-
-        confidence = min(1.0, max(0.0, score_final / 100.0))
-        flags: list[str] = []
-        if price_4h > ema200_4h:
-            flags.append("TF4H_ABOVE_EMA200")
-        else:
-            flags.append("TF4H_BELOW_EMA200")
-        if direction == "neutral":
-            flags.append("DIRECTION_UNCLEAR")
-
-        ts_iso = "1970-01-01T00:00:00Z" if args.ci else datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-        repo_root = _repo_root()
-        build_sha = _build_sha(repo_root)
-
-        out = {
-            "schema": "sentinel_snapshot.v0",
-            "symbol": args.symbol,
-            "ts_iso": ts_iso,
-            "timeframes": tf_blocks,
-            "derivatives": {"funding": None, "oi_delta": None},
-            "score": {
-                "s15": s15,
-                "s1h": s1h,
-                "s4h": s4h,
-                "final": score_final,
-                "direction": direction,
-                "risk_level": risk_level,
-                "confidence": confidence,
-            },
-            "flags": flags,
-            "meta": {
-                "producer": "sentinel.scoring.v0_2",
-                "version": "0.2",
-                "build_sha": build_sha,
-            },
-        }
+        out = build_snapshot(
+            args.symbol, tfs, args.limit, bybit_base_url, ci=args.ci
+        )
 
         out_path = Path(args.out)
         out_path.parent.mkdir(parents=True, exist_ok=True)
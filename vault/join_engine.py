@@ -0,0 +1,209 @@
+# vault/join_engine.py
+"""
+Parallel, cached join engine for vault reports (v0.1)
+
+- ArtifactCache: parsed JSON artifacts keyed by (path, mtime_ns, size)
+    - in-memory LRU (bounded entry count)
+    - optional on-disk cache (single SQLite file) shared across report runs
+- VaultJoinEngine: fans execution/outcome reads for many runs out over a thread
+  pool and yields joined RunRecords in submission order (plugs into RunIndex as
+  its joiner, so the report CLIs keep their single streaming loop)
+
+A changed file gets a new (mtime_ns, size) key; old keys simply age out of the LRU.
+A same-size rewrite within one mtime tick would keep its key, so a file modified
+within the last 2s is read but not cached (same racy guard as the policy store cache).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+
+from vault.run_index import RunRecord, join_run
+
+DEFAULT_LRU_ENTRIES = 200_000
+DEFAULT_WORKERS = min(8, os.cpu_count() or 4)
+
+_MISSING = object()
+
+CacheKey = Tuple[str, int, int]
+
+# a key this recent is not trusted: another same-size write in the same mtime
+# tick would not change it
+_RACY_NS = 2_000_000_000
+
+
+def _stable(mtime_ns: int) -> bool:
+    return time.time_ns() - mtime_ns > _RACY_NS
+
+
+class ArtifactCache:
+    def __init__(self, max_entries: int = DEFAULT_LRU_ENTRIES, disk_path: Optional[Path] = None) -> None:
+        self.max_entries = max_entries
+        self._lru: "OrderedDict[CacheKey, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        if disk_path is not None:
+            Path(disk_path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(disk_path), check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS artifacts ("
+                " path TEXT NOT NULL, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL,"
+                " body TEXT NOT NULL, PRIMARY KEY (path, mtime_ns, size))"
+            )
+            self._db.commit()
+
+    # ---- LRU ----
+    def _lru_get(self, key: CacheKey) -> Any:
+        with self._lock:
+            v = self._lru.get(key, _MISSING)
+            if v is not _MISSING:
+                self._lru.move_to_end(key)
+            return v
+
+    def _lru_put(self, key: CacheKey, value: Any) -> None:
+        with self._lock:
+            self._lru[key] = value
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.max_entries:
+                self._lru.popitem(last=False)
+
+    # ---- disk ----
+    def _disk_get(self, key: CacheKey) -> Any:
+        if self._db is None:
+            return _MISSING
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT body FROM artifacts WHERE path=? AND mtime_ns=? AND size=?", key
+            ).fetchone()
+        if row is None:
+            return _MISSING
+        return json.loads(row[0])
+
+    def _disk_put(self, key: CacheKey, value: Any) -> None:
+        if self._db is None:
+            return
+        body = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        with self._db_lock:
+            # one live version per path
+            self._db.execute("DELETE FROM artifacts WHERE path=?", (key[0],))
+            self._db.execute("INSERT OR REPLACE INTO artifacts VALUES (?,?,?,?)", (*key, body))
+
+    def flush(self) -> None:
+        if self._db is not None:
+            with self._db_lock:
+                self._db.commit()
+
+    def close(self) -> None:
+        if self._db is not None:
+            self.flush()
+            self._db.close()
+            self._db = None
+
+    # ---- read ----
+    def read_json(self, path: str) -> Optional[Dict[str, Any]]:
+        """Drop-in for safe_read_json: parsed JSON, or None if missing/unreadable."""
+        if not path:
+            return None
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        key = (path, st.st_mtime_ns, st.st_size)
+
+        if _stable(st.st_mtime_ns):
+            v = self._lru_get(key)
+            if v is not _MISSING:
+                self._count("hits")
+                return v
+            v = self._disk_get(key)
+            if v is not _MISSING:
+                self._count("disk_hits")
+                self._lru_put(key, v)
+                return v
+
+        self._count("misses")
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                # key the content by what was actually opened, not the earlier stat
+                fst = os.fstat(f.fileno())
+                v = json.load(f)
+        except Exception:
+            return None
+        if _stable(fst.st_mtime_ns):
+            key = (path, fst.st_mtime_ns, fst.st_size)
+            self._lru_put(key, v)
+            self._disk_put(key, v)
+        return v
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses, "lru_entries": len(self._lru)}
+
+
+class VaultJoinEngine:
+    """
+    Joiner for RunIndex: RunIndex(vault_root, joiner=VaultJoinEngine(...)).
+    Parsed artifacts are shared read-only; join_run never mutates them.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_WORKERS, cache: Optional[ArtifactCache] = None) -> None:
+        self.max_workers = max(1, int(max_workers))
+        self.cache = cache or ArtifactCache()
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def read_json(self, path: str) -> Optional[Dict[str, Any]]:
+        return self.cache.read_json(path)
+
+    def _join(self, item: Tuple[Dict[str, Any], Optional[Dict[str, Any]]]) -> RunRecord:
+        row, exr = item
+        return join_run(row, exr, read_json=self.cache.read_json)
+
+    def join_iter(
+        self, items: Sequence[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]
+    ) -> Iterator[RunRecord]:
+        """Yield joined records in the order of `items` while later ones are still being read."""
+        if self.max_workers == 1 or len(items) < 2:
+            for it in items:
+                yield self._join(it)
+        else:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="vault-join")
+            # Executor.map submits everything up front and yields results in order
+            yield from self._pool.map(self._join, items)
+        self.cache.flush()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        self.cache.close()
+
+    def __enter__(self) -> "VaultJoinEngine":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def default_engine(vault_root: Path, workers: int = DEFAULT_WORKERS, disk_cache: bool = False) -> VaultJoinEngine:
+    """Engine as wired into the report CLIs (disk cache lives under vault/manifests/runs/)."""
+    disk_path = Path(vault_root) / "manifests" / "runs" / "_artifact_cache.sqlite" if disk_cache else None
+    return VaultJoinEngine(max_workers=workers, cache=ArtifactCache(disk_path=disk_path))
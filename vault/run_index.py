@@ -0,0 +1,495 @@
+# vault/run_index.py
+"""
+Date-partitioned view of vault/manifests/runs_index.jsonl (v0.1)
+
+Layout (under vault/manifests/runs/):
+  _manifest.json                 {"source_offset": <bytes of runs_index.jsonl consumed>}
+  .lock                          flock held by sync()
+  YYYY/MM/DD/index.jsonl         raw runs_index rows for that run date (+ "_seq")
+  YYYY/MM/DD/summary.json        columnar per-run join (card ids, status, pnl, mae/mfe, HARD_FAIL)
+
+- runs_index.jsonl stays the append-only source of truth; partitions are caught up
+  from its tail by sync() (trade_logger.append_index calls it after every append).
+  sync() runs under an exclusive flock, so concurrent loggers/reports never append
+  the same tail twice; rows re-appended after a crash (before the manifest write)
+  share their "_seq" and are read back once.
+- Run date = executions/YYYY/MM/DD in exec_path (same rule as the report CLIs).
+- summary.json is a cache: each run keeps (mtime_ns, size) stamps of its execution,
+  outcome and exception files and each day keeps the exceptions dir mtime (new /
+  removed exception files). Stale entries are re-joined on read, so a patched
+  outcome or exception, or a new exception, is never served stale. A file (or the
+  exceptions dir) modified within the last 2s is stamped as untrusted and re-joined
+  on the next read (same racy guard as the policy store cache).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX: single-writer only
+    fcntl = None  # type: ignore[assignment]
+
+SUMMARY_VERSION = 2
+
+# a stamp this recent is not trusted as a cache key: another write in the same
+# timestamp tick (same size) would not change it
+_RACY_NS = 2_000_000_000
+_UNTRUSTED: Tuple[int, int] = (-1, -1)  # never equals a real stamp
+
+Stamp = Optional[Tuple[int, int]]
+ReadJson = Callable[[str], Optional[Dict[str, Any]]]
+
+
+def run_day_of(exec_path: str) -> Optional[str]:
+    """.../executions/YYYY/MM/DD/... -> "YYYY/MM/DD" (None if not a dated execution path)."""
+    try:
+        after = exec_path.split("/executions/", 1)[1]
+        y, m, d = after.split("/")[:3]
+    except Exception:
+        return None
+    if len(y) == 4 and len(m) == 2 and len(d) == 2 and (y + m + d).isdigit():
+        return f"{y}/{m}/{d}"
+    return None
+
+
+def _stamp(path: str) -> Stamp:
+    if not path:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _cache_stamp(path: str) -> Stamp:
+    """_stamp to record in summary.json: _UNTRUSTED while the mtime is within the racy window."""
+    st = _stamp(path)
+    if st is not None and time.time_ns() - st[0] <= _RACY_NS:
+        return _UNTRUSTED
+    return st
+
+
+def _read_json(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return None
+
+
+def _dedupe_seq(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Drop repeated "_seq" rows (a sync re-appended after a crash), keeping file order."""
+    seen = set()
+    out: List[Dict[str, Any]] = []
+    for r in rows:
+        seq = r.get("_seq")
+        if seq is not None:
+            if seq in seen:
+                continue
+            seen.add(seq)
+        out.append(r)
+    return out
+
+
+def _write_json_atomic(path: Path, data: Dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    body = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(body)
+    os.replace(tmp, path)
+
+
+@dataclass
+class RunRecord:
+    """
+    One joined run (execution + outcome + first exception), as the report CLIs read it.
+    Raw values are kept so each CLI applies its own defaults exactly as before.
+    """
+    run_id: str
+    status: str
+    exec_path: str
+    outcome_path: str
+
+    strategy_card_id: str
+    judgment_card_id: str
+
+    has_outcome: bool
+    result: str
+    reason: str
+    realized: float
+    ccy: Any
+    mae: Any
+    mfe: Any
+
+    exc_severity: Optional[str]   # None -> no exception file for this run
+    exc_code: Optional[str]       # None -> exception has no "code" key
+    exc_path: Optional[str]
+
+    exec_stamp: Stamp
+    outcome_stamp: Stamp
+    exc_stamp: Stamp
+
+    @property
+    def is_hard_fail(self) -> bool:
+        return self.exc_severity is not None and self.exc_severity.upper() == "HARD_FAIL"
+
+
+def join_run(
+    row: Dict[str, Any],
+    exceptions: Optional[Dict[str, Any]],
+    read_json: ReadJson = _read_json,
+) -> RunRecord:
+    """Read execution/outcome for one runs_index row (the per-run work the CLIs used to repeat)."""
+    exec_path = str(row.get("exec_path", "") or "")
+    out_path = str(row.get("outcome_path", "") or "")
+
+    exec_doc = read_json(exec_path) or {}
+    run_meta = (exec_doc.get("run", {}) or {})
+
+    outcome = read_json(out_path) if out_path else None
+    result, reason, realized, ccy, mae, mfe = "UNKNOWN", "", 0.0, None, None, None
+    if outcome:
+        labels = outcome.get("labels", {}) or {}
+        result = str(labels.get("result", "UNKNOWN"))
+        reason = str(labels.get("reason", ""))
+
+        pnl = outcome.get("pnl", {}) or {}
+        realized = float(pnl.get("realized", 0.0) or 0.0)
+        ccy = pnl.get("ccy", None) or pnl.get("currency", None)
+
+        ex = outcome.get("excursions", {}) or {}
+        mae = ex.get("mae", None)
+        mfe = ex.get("mfe", None)
+
+    exr = exceptions
+    exc_path = str(exr.get("_path", "")) if exr else None
+    return RunRecord(
+        run_id=str(row.get("run_id")),
+        status=str(row.get("status", "")),
+        exec_path=exec_path,
+        outcome_path=out_path,
+        strategy_card_id=str(run_meta.get("strategy_card_id", "unknown")),
+        judgment_card_id=str(run_meta.get("judgment_card_id", "unknown")),
+        has_outcome=bool(outcome),
+        result=result,
+        reason=reason,
+        realized=realized,
+        ccy=ccy,
+        mae=mae,
+        mfe=mfe,
+        exc_severity=(str(exr.get("severity", "")) if exr else None),
+        exc_code=(str(exr["code"]) if exr and "code" in exr else None),
+        exc_path=exc_path,
+        exec_stamp=_cache_stamp(exec_path),
+        outcome_stamp=_cache_stamp(out_path) if out_path else None,
+        exc_stamp=_cache_stamp(exc_path) if exc_path else None,
+    )
+
+
+_RECORD_FIELDS = [f.name for f in fields(RunRecord)]
+
+
+class SerialJoiner:
+    """Default joiner: one run at a time, no caching (see vault/join_engine.py)."""
+
+    read_json: ReadJson = staticmethod(_read_json)
+
+    def join_iter(
+        self, items: Sequence[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]
+    ) -> Iterator[RunRecord]:
+        for row, exr in items:
+            yield join_run(row, exr, read_json=self.read_json)
+
+
+class RunIndex:
+    def __init__(self, vault_root: Path, joiner: Any = None) -> None:
+        self.vault_root = Path(vault_root)
+        self.joiner = joiner or SerialJoiner()
+        self.source = self.vault_root / "manifests" / "runs_index.jsonl"
+        self.root = self.vault_root / "manifests" / "runs"
+        self.manifest_path = self.root / "_manifest.json"
+        self.lock_path = self.root / ".lock"
+
+    # ---- partitions ----
+    def _day_dir(self, day: str) -> Path:
+        return self.root / day
+
+    def _exceptions_dir(self, day: str) -> Path:
+        return self.vault_root / "exceptions" / day
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, "a") as lf:
+            if fcntl is not None:
+                fcntl.flock(lf.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lf.fileno(), fcntl.LOCK_UN)
+
+    def sync(self) -> int:
+        """Partition runs_index.jsonl lines appended since the last sync. Returns rows ingested."""
+        if not self.source.exists():
+            return 0
+        with self._locked():
+            # the manifest is read under the lock: a concurrent sync may just have advanced it
+            return self._sync_tail()
+
+    def _sync_tail(self) -> int:
+        manifest = _read_json(str(self.manifest_path)) or {}
+        start = int(manifest.get("source_offset", 0) or 0)
+        size = self.source.stat().st_size
+        if size < start:
+            # index was rewritten: rebuild every partition from scratch
+            self._drop_partitions()
+            start = 0
+        if size == start:
+            return 0
+
+        by_day: Dict[str, List[Dict[str, Any]]] = {}
+        pos = start
+        with open(self.source, "rb") as f:
+            f.seek(start)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # writer mid-append; pick it up next sync
+                seq = pos
+                pos += len(raw)
+                try:
+                    row = json.loads(raw.decode("utf-8"))
+                except Exception:
+                    continue
+                if not isinstance(row, dict):
+                    continue
+                day = run_day_of(str(row.get("exec_path", "") or ""))
+                if day is None:
+                    continue
+                row["_seq"] = seq
+                by_day.setdefault(day, []).append(row)
+
+        for day, rows in by_day.items():
+            d = self._day_dir(day)
+            d.mkdir(parents=True, exist_ok=True)
+            with open(d / "index.jsonl", "a", encoding="utf-8") as f:
+                for row in rows:
+                    f.write(json.dumps(row, ensure_ascii=False) + "\n")
+            self._refresh_summary(day, rows)
+
+        _write_json_atomic(self.manifest_path, {"source_offset": pos})
+        return sum(len(v) for v in by_day.values())
+
+    def _drop_partitions(self) -> None:
+        if not self.root.exists():
+            return
+        for p in sorted(self.root.rglob("*"), reverse=True):
+            if p.is_file() and p.name in ("index.jsonl", "summary.json"):
+                p.unlink()
+
+    def days(self, d_from: date, d_to: date) -> List[str]:
+        out: List[str] = []
+        d = d_from
+        while d <= d_to:
+            day = d.strftime("%Y/%m/%d")
+            if (self._day_dir(day) / "index.jsonl").exists():
+                out.append(day)
+            d += timedelta(days=1)
+        return out
+
+    def rows(self, d_from: date, d_to: date) -> List[Dict[str, Any]]:
+        """Raw runs_index rows whose run date is in [d_from, d_to], in runs_index order."""
+        out: List[Dict[str, Any]] = []
+        for day in self.days(d_from, d_to):
+            with open(self._day_dir(day) / "index.jsonl", "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        out.append(json.loads(line))
+                    except Exception:
+                        continue
+        out.sort(key=lambda r: r.get("_seq", 0))
+        out = _dedupe_seq(out)
+        for r in out:
+            r.pop("_seq", None)
+        return out
+
+    # ---- columnar summaries ----
+    def _load_summary(self, day: str) -> Tuple[Dict[str, RunRecord], Optional[int]]:
+        data = _read_json(str(self._day_dir(day) / "summary.json")) or {}
+        if data.get("version") != SUMMARY_VERSION:
+            return {}, None
+        cols = data.get("columns") or {}
+        n = len(cols.get("run_id") or [])
+        recs: Dict[str, RunRecord] = {}
+        try:
+            for i in range(n):
+                kw = {k: cols[k][i] for k in _RECORD_FIELDS}
+                for k in ("exec_stamp", "outcome_stamp", "exc_stamp"):
+                    kw[k] = tuple(kw[k]) if kw[k] is not None else None
+                recs[kw["run_id"]] = RunRecord(**kw)
+        except Exception:
+            return {}, None
+        return recs, data.get("exceptions_mtime_ns")
+
+    def _save_summary(self, day: str, recs: Dict[str, RunRecord], exc_mtime: Optional[int]) -> None:
+        cols: Dict[str, List[Any]] = {k: [] for k in _RECORD_FIELDS}
+        for rec in recs.values():
+            for k in _RECORD_FIELDS:
+                cols[k].append(getattr(rec, k))
+        _write_json_atomic(
+            self._day_dir(day) / "summary.json",
+            {"version": SUMMARY_VERSION, "exceptions_mtime_ns": exc_mtime, "columns": cols},
+        )
+
+    def _exceptions_by_run(self, day: str, run_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        # same match as load_exception_for_run: first readable exception_<RUN_ID>__*.json (sorted)
+        ex_dir = self._exceptions_dir(day)
+        try:
+            names = sorted(os.listdir(ex_dir))
+        except OSError:
+            return {}
+        out: Dict[str, Dict[str, Any]] = {}
+        for rid in run_ids:
+            prefix = f"exception_{rid}__"
+            for n in names:
+                if not (n.startswith(prefix) and n.endswith(".json")):
+                    continue
+                p = ex_dir / n
+                d = self.joiner.read_json(str(p))
+                if d:
+                    d = dict(d)
+                    d["_path"] = str(p)
+                    out[rid] = d
+                    break
+        return out
+
+    def _exceptions_mtime(self, day: str) -> Optional[int]:
+        try:
+            return self._exceptions_dir(day).stat().st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def _cache_mtime(mtime_ns: Optional[int]) -> Optional[int]:
+        # racy dir mtime: record -1 so the next read re-joins the whole day
+        if mtime_ns is not None and time.time_ns() - mtime_ns <= _RACY_NS:
+            return -1
+        return mtime_ns
+
+    def _plan_day(self, day: str, rows: List[Dict[str, Any]]) -> "_DayPlan":
+        """
+        Decide which runs of `day` need a re-join: files (execution, outcome, matched
+        exception) changed, index row changed, or all of them if the exceptions dir
+        changed. Last row per run_id wins.
+        """
+        recs, exc_mtime = self._load_summary(day)
+        cur_exc = self._exceptions_mtime(day)
+        exc_changed = cur_exc != exc_mtime
+
+        latest: Dict[str, Dict[str, Any]] = {}
+        for r in rows:
+            rid = r.get("run_id")
+            if isinstance(rid, str) and rid:
+                latest[rid] = r
+
+        stale: List[str] = []
+        for rid, r in latest.items():
+            rec = recs.get(rid)
+            if (
+                exc_changed
+                or rec is None
+                or rec.status != str(r.get("status", ""))
+                or rec.exec_path != str(r.get("exec_path", "") or "")
+                or rec.outcome_path != str(r.get("outcome_path", "") or "")
+                or rec.exec_stamp != _stamp(rec.exec_path)
+                or rec.outcome_stamp != (_stamp(rec.outcome_path) if rec.outcome_path else None)
+                or rec.exc_stamp != (_stamp(rec.exc_path) if rec.exc_path else None)
+            ):
+                stale.append(rid)
+
+        exc = self._exceptions_by_run(day, stale) if stale else {}
+        return _DayPlan(day, recs, latest, stale, exc, self._cache_mtime(cur_exc), exc_changed)
+
+    def _commit_day(self, plan: "_DayPlan") -> None:
+        if plan.stale or plan.exc_changed:
+            self._save_summary(plan.day, plan.recs, plan.exc_mtime)
+
+    def _refresh_summary(self, day: str, rows: List[Dict[str, Any]]) -> Dict[str, RunRecord]:
+        plan = self._plan_day(day, _dedupe_seq(rows))
+        items = [(plan.latest[rid], plan.exc.get(rid)) for rid in plan.stale]
+        for rid, rec in zip(plan.stale, self.joiner.join_iter(items)):
+            plan.recs[rid] = rec
+        self._commit_day(plan)
+        return {rid: plan.recs[rid] for rid in plan.latest}
+
+    def iter_records(self, rows: List[Dict[str, Any]]) -> Iterator[Tuple[Dict[str, Any], RunRecord]]:
+        """
+        Stream (row, joined record) in the order of `rows` (already filtered/deduped by
+        the caller). Summaries of every touched day are planned first so that all stale
+        joins are handed to the joiner at once; updated summaries are written at the end.
+        """
+        by_day: Dict[str, List[Dict[str, Any]]] = {}
+        for r in rows:
+            day = run_day_of(str(r.get("exec_path", "") or ""))
+            if day is not None:
+                by_day.setdefault(day, []).append(r)
+        plans = {day: self._plan_day(day, day_rows) for day, day_rows in by_day.items()}
+
+        # stale joins are queued in first-occurrence order, which is the order they are consumed in
+        keyed: List[Tuple[Dict[str, Any], _DayPlan, Any]] = []
+        items: List[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]] = []
+        queued = set()
+        for r in rows:
+            day = run_day_of(str(r.get("exec_path", "") or ""))
+            plan = plans.get(day) if day is not None else None
+            rid = r.get("run_id")
+            if plan is None or rid not in plan.latest:
+                continue
+            keyed.append((r, plan, rid))
+            if rid in plan.stale_set and (day, rid) not in queued:
+                queued.add((day, rid))
+                items.append((plan.latest[rid], plan.exc.get(rid)))
+        joined = self.joiner.join_iter(items)
+
+        resolved = set()
+        for r, plan, rid in keyed:
+            if rid in plan.stale_set and (plan.day, rid) not in resolved:
+                resolved.add((plan.day, rid))
+                plan.recs[rid] = next(joined)
+            yield r, plan.recs[rid]
+
+        for plan in plans.values():
+            self._commit_day(plan)
+
+    def records(self, rows: List[Dict[str, Any]]) -> Dict[str, RunRecord]:
+        """Joined records for already filtered/deduped runs_index rows, keyed by run_id."""
+        return {rec.run_id: rec for _, rec in self.iter_records(rows)}
+
+
+@dataclass
+class _DayPlan:
+    day: str
+    recs: Dict[str, RunRecord]
+    latest: Dict[str, Dict[str, Any]]
+    stale: List[str]
+    exc: Dict[str, Dict[str, Any]]
+    exc_mtime: Optional[int]
+    exc_changed: bool
+    stale_set: set = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.stale_set = set(self.stale)